@@ -0,0 +1,177 @@
+"""
+관리자 API
+벡터 컬렉션 스냅샷 내보내기/가져오기 (폐쇄망 서버 이전용)
+임베딩 모델 변경 시 무중단 재색인 / alias 전환 / 롤백
+지원자 의미 검색 인덱스 동기화
+"""
+import os
+import shutil
+from typing import List
+
+from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse
+
+from app.models.embedding_collection import ReindexRequest, EmbeddingCollectionResponse
+from app.services.applicant_index import applicant_index_service
+from app.services.reindex_service import reindex_service
+from app.services.snapshot_service import snapshot_service
+
+router = APIRouter(prefix="/api/admin", tags=["admin"])
+
+
+@router.get("/snapshots")
+async def list_snapshots():
+    """스냅샷 디렉토리(SNAPSHOT_DIR)의 아카이브 목록"""
+    return {"snapshots": snapshot_service.list_snapshots()}
+
+
+@router.post("/snapshots", status_code=201)
+async def create_snapshot():
+    """
+    현재 컬렉션을 스냅샷 아카이브로 내보내기
+
+    벡터, payload, 청크 본문, 임베딩 모델/차원 정보가 tar.gz로 저장됨
+    """
+    name = snapshot_service.new_snapshot_name()
+    try:
+        manifest = await run_in_threadpool(snapshot_service.export_archive, snapshot_service.snapshot_path(name))
+        return {"name": name, "manifest": manifest}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"스냅샷 내보내기 실패: {str(e)}")
+
+
+@router.get("/snapshots/{name}")
+async def download_snapshot(name: str):
+    """스냅샷 아카이브 다운로드"""
+    try:
+        path = snapshot_service.snapshot_path(name)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not os.path.exists(path):
+        raise HTTPException(status_code=404, detail="스냅샷을 찾을 수 없습니다")
+    return FileResponse(path, media_type="application/gzip", filename=name)
+
+
+@router.post("/snapshots/upload", status_code=201)
+async def upload_snapshot(file: UploadFile = File(...)):
+    """다른 서버에서 내보낸 스냅샷 아카이브를 스냅샷 디렉토리에 업로드 (가져오기는 별도 요청)"""
+    try:
+        path = snapshot_service.snapshot_path(os.path.basename(file.filename or ""))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    os.makedirs(snapshot_service.snapshot_dir, exist_ok=True)
+    tmp_path = f"{path}.partial"
+    try:
+        with open(tmp_path, "wb") as target:
+            await run_in_threadpool(shutil.copyfileobj, file.file, target, 1024 * 1024)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return {"name": os.path.basename(path), "size": os.path.getsize(path)}
+
+
+@router.post("/snapshots/{name}/import")
+async def import_snapshot(name: str):
+    """
+    스냅샷 아카이브를 현재 컬렉션으로 가져오기 (재임베딩 없이 병렬 업서트)
+
+    임베딩 모델 이름/벡터 차원이 현재 서버 설정과 다르면 400
+    """
+    try:
+        path = snapshot_service.snapshot_path(name)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not os.path.exists(path):
+        raise HTTPException(status_code=404, detail="스냅샷을 찾을 수 없습니다")
+
+    try:
+        return await run_in_threadpool(snapshot_service.import_archive, path)
+    except ValueError as e:  # SnapshotValidationError 포함
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"스냅샷 가져오기 실패: {str(e)}")
+
+
+@router.get("/embedding-collections", response_model=List[EmbeddingCollectionResponse])
+async def list_embedding_collections():
+    """컬렉션 버전 목록 (최신순, active가 현재 검색 대상)"""
+    versions = await run_in_threadpool(reindex_service.list_versions)
+    return [reindex_service.to_response(version) for version in versions]
+
+
+@router.post("/reindex", response_model=EmbeddingCollectionResponse, status_code=202)
+async def start_reindex(request: ReindexRequest):
+    """
+    새 임베딩 모델로 재색인 시작 (백그라운드)
+
+    재색인 중에도 검색/업로드는 기존 컬렉션으로 계속 처리되며,
+    완료되면 alias가 새 컬렉션으로 전환된다. 진행률은 GET /reindex/{id}로 확인
+
+    재색인 중 변경 추적은 이 프로세스에서만 동작하므로 백엔드를 프로세스 1개로 운영하는 동안 실행하고,
+    다른 레플리카는 전환 후 재시작한다
+    """
+    try:
+        version = await run_in_threadpool(
+            reindex_service.start, request.embedding_model, request.batch_size, request.throttle_ms
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return reindex_service.to_response(version)
+
+
+@router.get("/reindex/{version_id}", response_model=EmbeddingCollectionResponse)
+async def get_reindex_status(version_id: int):
+    """재색인 진행 상태 조회"""
+    version = await run_in_threadpool(reindex_service.get, version_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="컬렉션 버전을 찾을 수 없습니다")
+    return reindex_service.to_response(version)
+
+
+@router.post("/reindex/cancel")
+async def cancel_reindex():
+    """진행 중인 재색인 취소 (만들던 컬렉션은 삭제되고 기존 컬렉션 유지)"""
+    if not reindex_service.cancel():
+        raise HTTPException(status_code=409, detail="진행 중인 재색인 작업이 없습니다")
+    return {"message": "재색인 취소를 요청했습니다"}
+
+
+@router.post("/reindex/rollback", response_model=EmbeddingCollectionResponse)
+async def rollback_reindex():
+    """alias를 직전 컬렉션(이전 임베딩 모델)으로 되돌림"""
+    try:
+        version = await run_in_threadpool(reindex_service.rollback)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return reindex_service.to_response(version)
+
+
+@router.get("/applicant-index")
+async def get_applicant_index_status():
+    """지원자 인덱스 상태 (포인트 수, 워터마크 - 인덱스된 최대 applicant_id, 마지막 동기화 결과)"""
+    try:
+        return await run_in_threadpool(applicant_index_service.get_status)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"지원자 인덱스 조회 실패: {str(e)}")
+
+
+@router.post("/applicant-index/sync", status_code=202)
+async def sync_applicant_index(full: bool = False):
+    """
+    applicant_info → 지원자 인덱스 동기화 (백그라운드)
+
+    - full=false: 워터마크 이후 새로 추가된 지원자만 임베딩
+    - full=true: 모든 지원자를 비교하여 수정된 필드만 다시 임베딩하고 삭제된 지원자 제거
+    """
+    try:
+        started = applicant_index_service.start_sync(full=full)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not started:
+        raise HTTPException(status_code=409, detail="지원자 인덱스 동기화가 이미 진행 중입니다")
+    return {"message": "지원자 인덱스 동기화를 시작했습니다", "full": full}
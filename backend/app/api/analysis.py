@@ -1,8 +1,12 @@
-from fastapi import APIRouter, HTTPException, Depends
+from typing import Dict, List, Optional
+
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from sqlmodel import Session
 
 from app.services.ollama_service import ollama_service
+from app.services.applicant_index import ApplicantIndexStale, applicant_index_service
 from app.models.applicant import Applicant
 from app.database import get_session
 
@@ -27,6 +31,22 @@ class InterviewQuestionsResponse(BaseModel):
     questions: list[str]
 
 
+class ApplicantMatch(BaseModel):
+    """의미 검색으로 찾은 지원자"""
+    applicant_id: int
+    score: float
+    matched_field: str  # 가장 유사한 필드 (reason, experience, skill)
+    field_scores: Dict[str, float]
+    preview: Dict[str, str]  # 필드별 앞부분
+
+
+class ApplicantSearchResponse(BaseModel):
+    """지원자 의미 검색 응답 모델"""
+    query: Optional[str] = None
+    applicant_id: Optional[int] = None  # 유사 지원자 검색의 기준 지원자
+    results: List[ApplicantMatch]
+
+
 @router.post("/summarize/{applicant_id}", response_model=SummaryResponse)
 async def summarize_applicant(
     applicant_id: int,
@@ -115,3 +135,57 @@ async def generate_interview_questions(
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"면접 질문 생성 실패: {str(e)}")
+
+
+@router.get("/search", response_model=ApplicantSearchResponse)
+async def search_applicants(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(20, ge=1, le=200),
+    fields: Optional[List[str]] = Query(None)
+):
+    """
+    자연어로 지원자 검색 API (LLM 호출 없음)
+
+    지원 동기/경력/기술 필드별 임베딩 인덱스에서 질의와 가장 유사한 지원자를 찾습니다.
+
+    - q: 검색 질의 (예: "Kubernetes 운영 경험")
+    - limit: 최대 지원자 수
+    - fields: 검색할 필드 (reason, experience, skill - 여러 번 지정 가능, 기본 전체)
+    """
+    try:
+        results = await run_in_threadpool(applicant_index_service.search, q, limit, fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ApplicantIndexStale as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"지원자 검색 실패: {str(e)}")
+    return ApplicantSearchResponse(query=q, results=results)
+
+
+@router.get("/similar/{applicant_id}", response_model=ApplicantSearchResponse)
+async def find_similar_applicants(
+    applicant_id: int,
+    limit: int = Query(10, ge=1, le=200),
+    fields: Optional[List[str]] = Query(None)
+):
+    """
+    비슷한 지원자 찾기 API (LLM 호출 없음)
+
+    기준 지원자의 필드별 임베딩과 같은 필드끼리 비교하여 평균 유사도가 높은 지원자를 찾습니다.
+
+    - applicant_id: 기준 지원자 ID
+    - limit: 최대 지원자 수
+    - fields: 비교할 필드 (reason, experience, skill - 기본 전체)
+    """
+    try:
+        results = await run_in_threadpool(applicant_index_service.similar, applicant_id, limit, fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ApplicantIndexStale as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"유사 지원자 검색 실패: {str(e)}")
+    if results is None:
+        raise HTTPException(status_code=404, detail="지원자 인덱스에 없는 지원자입니다 (동기화 필요)")
+    return ApplicantSearchResponse(applicant_id=applicant_id, results=results)
@@ -33,8 +33,10 @@ async def chat(
     5. 질의와 응답을 query_logs 테이블에 자동 저장
 
     - query: 사용자 질의
+    - filters: RAG 검색 범위 제한 (filename, doc_type, applicant_id, uploaded_after/before 등)
     """
     query = request.query
+    filters = request.filters.model_dump(exclude_none=True) if request.filters else None
     answer = None
     intent_value = None
 
@@ -46,12 +48,13 @@ async def chat(
         # 2. 의도별 처리 (모든 서비스에 session 전달하여 Few-shot 예제 활용)
         if intent == QueryIntent.RAG_SEARCH:
             # RAG 검색
-            result = await rag_service.answer_question(query, top_k=3, session=session)
+            result = await rag_service.answer_question(query, top_k=3, session=session, filters=filters)
             answer = result["answer"]
             response = ChatResponse(
                 answer=answer,
                 intent=intent_value,
-                sources=result.get("sources", [])
+                sources=result.get("sources", []),
+                rerank=result.get("rerank")
             )
 
         elif intent == QueryIntent.SQL_QUERY:
@@ -104,8 +107,10 @@ async def chat_enhanced(
     5. 결과에 분해 사유 + 연관성 분석 포함
 
     - query: 사용자 질의
+    - filters: RAG 검색 범위 제한 (filename, doc_type, applicant_id, uploaded_after/before 등)
     """
     query = request.query
+    filters = request.filters.model_dump(exclude_none=True) if request.filters else None
     answer = None
     intent_value = None
 
@@ -126,7 +131,8 @@ async def chat_enhanced(
                 original_query=query,
                 search_query=search_query,
                 top_k=3,
-                session=session
+                session=session,
+                filters=filters
             )
 
             answer = result["answer"]
@@ -139,7 +145,8 @@ async def chat_enhanced(
                     "reasoning": "",
                     "confidence": 0.0,
                     "matched_sections": []
-                }))
+                })),
+                rerank=result.get("rerank")
             )
 
         elif intent == QueryIntent.SQL_QUERY or decomposition_result.get("needs_db_query"):
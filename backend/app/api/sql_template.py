@@ -0,0 +1,119 @@
+"""SQL template CRUD API endpoints."""
+import asyncio
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException
+from sqlmodel import Session, select
+from app.database import get_session
+from app.models.sql_template import (
+    SqlTemplate,
+    SqlTemplateResponse,
+    SqlTemplateCreate,
+    SqlTemplateUpdate,
+    SqlTemplateMatchRequest,
+    SqlTemplateMatchResponse
+)
+from app.services.sql_templates import sql_template_service
+
+router = APIRouter(prefix="/api/sql-templates", tags=["SQL Template Management"])
+
+
+def _validate(template: SqlTemplate) -> None:
+    try:
+        sql_template_service.validate_template(template)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/", response_model=List[SqlTemplateResponse])
+async def get_all_sql_templates(session: Session = Depends(get_session)):
+    """모든 SQL 템플릿 목록 조회 (우선순위 순)."""
+    statement = select(SqlTemplate).order_by(SqlTemplate.priority.desc(), SqlTemplate.id)
+    templates = session.exec(statement).all()
+    return templates
+
+
+@router.get("/stats")
+async def get_sql_template_stats():
+    """템플릿 매칭 통계 (정규식/임베딩 적중, LLM 경로로 넘어간 횟수)."""
+    return sql_template_service.get_stats()
+
+
+@router.post("/match", response_model=SqlTemplateMatchResponse)
+async def match_sql_template(request: SqlTemplateMatchRequest):
+    """질의가 어떤 템플릿과 매칭되는지 확인 (execute=true면 실행 후 답변까지 생성)."""
+    match = await asyncio.to_thread(sql_template_service.match, request.query)
+    if not match:
+        return SqlTemplateMatchResponse(matched=False)
+
+    response = SqlTemplateMatchResponse(
+        matched=True,
+        template=match.template.name,
+        method=match.method,
+        score=match.score,
+        params=match.params
+    )
+    if request.execute:
+        try:
+            execution = await asyncio.to_thread(sql_template_service.execute, match)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        response.answer = execution["answer"]
+        response.results = execution["rows"]
+    return response
+
+
+@router.get("/{template_id}", response_model=SqlTemplateResponse)
+async def get_sql_template(template_id: int, session: Session = Depends(get_session)):
+    """특정 SQL 템플릿 조회."""
+    template = session.get(SqlTemplate, template_id)
+    if not template:
+        raise HTTPException(status_code=404, detail=f"SQL template with id {template_id} not found")
+    return template
+
+
+@router.post("/", response_model=SqlTemplateResponse, status_code=201)
+async def create_sql_template(template_data: SqlTemplateCreate, session: Session = Depends(get_session)):
+    """SQL 템플릿 생성 (질의 패턴-SQL-답변 매핑, 저장 전 SQL/파라미터 검증)."""
+    template = SqlTemplate(**template_data.model_dump())
+    _validate(template)
+    session.add(template)
+    session.commit()
+    session.refresh(template)
+    sql_template_service.invalidate()
+    return template
+
+
+@router.put("/{template_id}", response_model=SqlTemplateResponse)
+async def update_sql_template(
+    template_id: int,
+    template_data: SqlTemplateUpdate,
+    session: Session = Depends(get_session)
+):
+    """SQL 템플릿 수정."""
+    template = session.get(SqlTemplate, template_id)
+    if not template:
+        raise HTTPException(status_code=404, detail=f"SQL template with id {template_id} not found")
+
+    update_data = template_data.model_dump(exclude_unset=True)
+    for key, value in update_data.items():
+        setattr(template, key, value)
+    _validate(template)
+
+    session.add(template)
+    session.commit()
+    session.refresh(template)
+    sql_template_service.invalidate()
+    return template
+
+
+@router.delete("/{template_id}", status_code=204)
+async def delete_sql_template(template_id: int, session: Session = Depends(get_session)):
+    """SQL 템플릿 삭제."""
+    template = session.get(SqlTemplate, template_id)
+    if not template:
+        raise HTTPException(status_code=404, detail=f"SQL template with id {template_id} not found")
+
+    session.delete(template)
+    session.commit()
+    sql_template_service.invalidate()
+    return None
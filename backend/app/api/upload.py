@@ -1,105 +1,278 @@
 """
 파일 업로드 API
-문서를 업로드하여 Qdrant 벡터 DB에 저장
+문서를 업로드하여 벡터 저장소(Qdrant 또는 pgvector)에 저장
 """
-from fastapi import APIRouter, UploadFile, File, HTTPException
+import json
+import os
+import shutil
 from datetime import datetime
-import hashlib
+from typing import List, Optional
 
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlmodel import Session, select
+
+from app.database import get_session
 from app.models.chat import UploadResponse
-from app.services.qdrant_service import qdrant_service
-from app.utils.text_extractor import TextExtractor
+from app.models.ingest_job import (
+    IngestJob,
+    IngestJobFile,
+    IngestJobResponse,
+    IngestJobDetailResponse,
+    BatchUploadResponse
+)
+from app.services.vector_store import vector_store
+from app.services.ingestion_service import ingestion_service, UploadTooLargeError
+from app.services.ingest_queue import ingest_queue
 
 router = APIRouter(prefix="/api/upload", tags=["upload"])
 
 
 @router.post("/", response_model=UploadResponse)
-async def upload_document(file: UploadFile = File(...)):
+async def upload_document(
+    file: UploadFile = File(...),
+    applicant_id: Optional[int] = Form(None),
+    replace_doc_id: Optional[str] = Form(None),
+    replace: bool = Form(False)
+):
     """
     문서 파일을 업로드하여 벡터 DB에 저장
 
     지원 형식: PDF, DOCX, TXT, XLSX
 
+    업로드는 임시 파일로 스풀링되고(최대 크기: MAX_UPLOAD_SIZE_MB),
+    텍스트 추출/임베딩은 페이지·행 단위 스트리밍으로 처리됨
+
+    같은 지원자의 내용이 같은 파일이 이미 있으면 저장을 생략하고(duplicate=true),
+    교체를 지정하면 기존 문서의 바뀐 청크만 다시 임베딩하여 갱신함
+    (지정하지 않으면 파일명이 같아도 새 문서로 저장)
+
     - file: 업로드할 파일
+    - applicant_id: 관련 지원자 ID (선택, 검색 필터용)
+    - replace_doc_id: 교체할 문서 ID (선택)
+    - replace: true면 같은 지원자 + 같은 파일명의 문서를 교체 (선택)
     """
+    path = None
     try:
-        # 1. 파일에서 텍스트 추출
-        file_content = await file.read()
-        text = TextExtractor.extract_text(file_content, file.filename)
-
-        if not text or len(text.strip()) < 10:
-            raise HTTPException(status_code=400, detail="추출된 텍스트가 너무 짧습니다")
-
-        # 2. 문서 ID 생성 (파일명 + 타임스탬프 해시)
-        doc_id_raw = f"{file.filename}_{datetime.now().isoformat()}"
-        doc_id = hashlib.md5(doc_id_raw.encode()).hexdigest()
-
-        # 3. 메타데이터 구성
-        metadata = {
-            "filename": file.filename,
-            "upload_time": datetime.now().isoformat(),
-            "file_size": len(file_content),
-        }
+        # 1. 업로드 스트림을 임시 파일에 저장 (최대 크기 검사, 내용 해시 계산)
+        path, file_size, content_hash = await ingestion_service.spool_upload(file)
 
-        # 4. Qdrant에 저장
-        qdrant_service.add_document(
-            doc_id=doc_id,
-            text=text,
-            metadata=metadata
+        # 2. 추출 → 청크 분할 → 배치 임베딩/저장 (이벤트 루프를 막지 않도록 스레드풀에서 실행)
+        result = await run_in_threadpool(
+            ingestion_service.ingest_file, path, file.filename, file_size,
+            metadata={"applicant_id": applicant_id} if applicant_id is not None else None,
+            content_hash=content_hash,
+            replace_doc_id=replace_doc_id,
+            replace=replace
         )
 
         return UploadResponse(
-            message="파일이 성공적으로 업로드되었습니다",
+            message="이미 저장된 파일입니다" if result["duplicate"] else "파일이 성공적으로 업로드되었습니다",
             filename=file.filename,
-            doc_id=doc_id,
-            text_length=len(text)
+            doc_id=result["doc_id"],
+            text_length=result["text_length"],
+            chunk_count=result["chunk_count"],
+            chunks_reused=result["chunks_reused"],
+            chunks_embedded=result["chunks_embedded"],
+            duplicate=result["duplicate"]
         )
 
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"파일 업로드 실패: {str(e)}")
+    finally:
+        if path and os.path.exists(path):
+            os.remove(path)
+
+
+@router.post("/batch", response_model=BatchUploadResponse, status_code=202)
+async def upload_batch(files: List[UploadFile] = File(...)):
+    """
+    여러 문서 파일 또는 ZIP 파일을 일괄 업로드 (백그라운드 처리)
+
+    파일은 작업(job)으로 등록되어 워커 풀에서 추출/임베딩/저장되며,
+    진행 상황은 GET /api/upload/jobs/{job_id}로 조회
+
+    - files: 업로드할 파일 목록 (PDF, DOCX, TXT, XLSX, ZIP)
+    """
+    job_id = ingest_queue.new_job_id()
+    job_files, skipped = [], []
+    try:
+        for index, file in enumerate(files):
+            filename = file.filename or f"file_{index}"
+            path, size, _ = await ingestion_service.spool_upload(file)
+
+            if filename.lower().endswith(".zip"):
+                try:
+                    extracted, archive_skipped = await run_in_threadpool(
+                        ingest_queue.expand_archive, job_id, path
+                    )
+                finally:
+                    os.remove(path)
+                job_files.extend(extracted)
+                skipped.extend(f"{filename}/{name}" for name in archive_skipped)
+            elif ingest_queue.is_supported(filename):
+                target = os.path.join(ingest_queue.job_dir(job_id), f"u{index:06d}_{os.path.basename(path)}")
+                shutil.move(path, target)
+                job_files.append((filename, target, size))
+            else:
+                os.remove(path)
+                skipped.append(filename)
+
+        if not job_files:
+            raise HTTPException(status_code=400, detail="처리할 수 있는 문서 파일이 없습니다")
+
+        job = await run_in_threadpool(ingest_queue.create_job, job_id, job_files)
+    except HTTPException:
+        shutil.rmtree(ingest_queue.job_dir(job_id), ignore_errors=True)
+        raise
+    except UploadTooLargeError as e:
+        shutil.rmtree(ingest_queue.job_dir(job_id), ignore_errors=True)
+        raise HTTPException(status_code=413, detail=str(e))
+    except ValueError as e:
+        shutil.rmtree(ingest_queue.job_dir(job_id), ignore_errors=True)
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        shutil.rmtree(ingest_queue.job_dir(job_id), ignore_errors=True)
+        raise HTTPException(status_code=500, detail=f"일괄 업로드 실패: {str(e)}")
+
+    return BatchUploadResponse(
+        message="일괄 업로드 작업이 등록되었습니다",
+        job_id=job.id,
+        total_files=job.total_files,
+        skipped_files=skipped
+    )
+
+
+@router.get("/jobs", response_model=List[IngestJobResponse])
+async def get_jobs(
+    limit: int = Query(20, ge=1, le=200),
+    session: Session = Depends(get_session)
+):
+    """일괄 업로드 작업 목록 조회 (최신순)"""
+    jobs = session.exec(select(IngestJob).order_by(IngestJob.created_at.desc()).limit(limit)).all()
+    return [ingest_queue.job_to_dict(job) for job in jobs]
+
+
+@router.get("/jobs/{job_id}", response_model=IngestJobDetailResponse)
+async def get_job(job_id: str, session: Session = Depends(get_session)):
+    """일괄 업로드 작업 상태 및 파일별 진행 상황 조회"""
+    job = session.get(IngestJob, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+
+    files = session.exec(
+        select(IngestJobFile).where(IngestJobFile.job_id == job_id).order_by(IngestJobFile.id)
+    ).all()
+    return {**ingest_queue.job_to_dict(job), "files": files}
+
+
+@router.post("/jobs/{job_id}/retry")
+async def retry_job(job_id: str, session: Session = Depends(get_session)):
+    """일괄 업로드 작업의 실패 파일 재처리"""
+    job = session.get(IngestJob, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+
+    retried = await run_in_threadpool(ingest_queue.retry_failed, job_id)
+    return {
+        "message": f"실패한 파일 {retried}개를 다시 처리합니다",
+        "job_id": job_id,
+        "retried_files": retried
+    }
 
 
 @router.get("/stats")
 async def get_upload_stats():
     """업로드된 문서 통계 및 컬렉션 정보"""
     try:
-        collection_info = qdrant_service.get_collection_info()
+        collection_info = vector_store.get_collection_info()
         return collection_info
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"통계 조회 실패: {str(e)}")
 
 
+def _document_filters(
+    filename: Optional[str] = None,
+    doc_type: Optional[str] = None,
+    applicant_id: Optional[int] = None,
+    uploaded_after: Optional[datetime] = None,
+    uploaded_before: Optional[datetime] = None
+) -> dict:
+    """문서 목록/내보내기 공통 메타데이터 필터 (쿼리 파라미터)"""
+    return {
+        "filename": filename,
+        "doc_type": doc_type,
+        "applicant_id": applicant_id,
+        "uploaded_after": uploaded_after,
+        "uploaded_before": uploaded_before,
+    }
+
+
 @router.get("/documents")
 async def get_documents(
-    limit: int = 100,
-    offset: int = 0
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    filters: dict = Depends(_document_filters)
 ):
     """
-    저장된 문서 목록 조회
+    저장된 문서 목록 조회 (커서 기반 페이징)
 
     - limit: 반환할 최대 문서 수 (기본 100)
-    - offset: 건너뛸 문서 수 (페이징용)
+    - cursor: 이전 응답의 next_cursor (없으면 첫 페이지, 응답의 next_cursor가 null이면 마지막 페이지)
+    - filename, doc_type, applicant_id: 메타데이터 일치 필터
+    - uploaded_after, uploaded_before: 업로드 시각 범위 필터
     """
     try:
-        documents = qdrant_service.get_all_documents(limit=limit, offset=offset)
-        total = qdrant_service.count_documents()
+        documents, next_cursor = vector_store.get_all_documents(limit=limit, cursor=cursor, filters=filters)
+        total = vector_store.count_documents(filters=filters)
         return {
             "total": total,
             "limit": limit,
-            "offset": offset,
+            "next_cursor": next_cursor,
             "documents": documents
         }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"문서 조회 실패: {str(e)}")
 
 
+@router.get("/documents/export")
+async def export_documents(
+    include_text: bool = True,
+    filters: dict = Depends(_document_filters)
+):
+    """
+    컬렉션의 모든 청크를 NDJSON으로 스트리밍 내보내기 (백업/감사용)
+
+    한 줄에 청크 1개 (id, doc_id, text, payload), 페이지 단위로 읽어 바로 전송하므로
+    컬렉션 크기와 무관하게 메모리 사용량이 일정함
+
+    - include_text: 청크 전문 포함 여부 (false면 payload의 스니펫/메타데이터만)
+    - filename, doc_type, applicant_id, uploaded_after, uploaded_before: 메타데이터 필터
+    """
+    def generate():
+        for chunk in vector_store.iter_chunks(filters=filters, include_text=include_text):
+            yield json.dumps(chunk, ensure_ascii=False, default=str) + "\n"
+
+    filename = f"documents-{datetime.now().strftime('%Y%m%d-%H%M%S')}.ndjson"
+    return StreamingResponse(
+        generate(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
 @router.get("/documents/{doc_id}")
 async def get_document(doc_id: str):
     """특정 문서 상세 조회"""
     try:
-        document = qdrant_service.get_document_by_id(doc_id)
+        document = vector_store.get_document_by_id(doc_id)
         if not document:
             raise HTTPException(status_code=404, detail="문서를 찾을 수 없습니다")
         return document
@@ -114,12 +287,12 @@ async def delete_document(doc_id: str):
     """문서 삭제"""
     try:
         # 문서 존재 확인
-        document = qdrant_service.get_document_by_id(doc_id)
+        document = vector_store.get_document_by_id(doc_id)
         if not document:
             raise HTTPException(status_code=404, detail="문서를 찾을 수 없습니다")
 
         # 삭제
-        qdrant_service.delete_document(doc_id)
+        vector_store.delete_document(doc_id)
         return {
             "message": "문서가 성공적으로 삭제되었습니다",
             "doc_id": doc_id
@@ -0,0 +1,121 @@
+"""
+관리용 CLI
+사용법: python -m app.cli <명령> [옵션]
+
+    collection-info           현재 컬렉션 설정/통계 출력
+    apply-collection-config   환경 변수의 양자화/HNSW 설정을 기존 컬렉션에 반영
+    snapshot-export [경로]     컬렉션을 스냅샷 아카이브(tar.gz)로 내보내기
+    snapshot-import <경로>     스냅샷 아카이브를 현재 컬렉션으로 가져오기 (재임베딩 없음)
+    quantize-embedding-model <원본> [대상]
+                              ONNX 임베딩 모델을 int8 동적 양자화 (EMBEDDING_MODEL=onnx:<대상>으로 사용)
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+from typing import Any, Callable, Dict
+
+from app.services.qdrant_service import qdrant_service
+from app.services.snapshot_service import snapshot_service
+
+
+def _print(result: Any) -> None:
+    print(json.dumps(result, ensure_ascii=False, indent=2, default=str))
+
+
+def cmd_collection_info(args: argparse.Namespace) -> None:
+    """컬렉션 설정/통계 출력"""
+    _print(qdrant_service.get_collection_info())
+
+
+def cmd_apply_collection_config(args: argparse.Namespace) -> None:
+    """양자화/HNSW/on-disk 설정을 기존 컬렉션에 반영"""
+    before = qdrant_service.get_collection_info()
+    applied = qdrant_service.apply_collection_config()
+    _print({"before": before, "applied": applied})
+    print("✅ 설정 반영 요청 완료 - Qdrant가 백그라운드에서 인덱스를 재구성합니다 (collection-info의 status로 확인)")
+
+
+def cmd_snapshot_export(args: argparse.Namespace) -> None:
+    """컬렉션 스냅샷 내보내기"""
+    path = args.output or snapshot_service.snapshot_path(snapshot_service.new_snapshot_name())
+    manifest = snapshot_service.export_archive(path)
+    _print({"path": path, "manifest": manifest})
+
+
+def cmd_snapshot_import(args: argparse.Namespace) -> None:
+    """스냅샷 가져오기 (진행률 출력)"""
+    def progress(done: int, total: int) -> None:
+        print(f"\r   {done}/{total} 포인트", end="", flush=True)
+
+    result = snapshot_service.import_archive(
+        args.path, workers=args.workers, batch_size=args.batch_size, progress=progress
+    )
+    print()
+    _print(result)
+
+
+def cmd_quantize_embedding_model(args: argparse.Namespace) -> None:
+    """ONNX 임베딩 모델 int8 동적 양자화 (토크나이저/풀링 설정은 그대로 복사)"""
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+    from app.services.embedding_backends import OnnxEmbeddingBackend
+
+    source_file = OnnxEmbeddingBackend.find_model_file(args.source)
+    target = args.target or f"{args.source.rstrip(os.sep)}-int8"
+    if os.path.abspath(target) != os.path.abspath(args.source):
+        shutil.copytree(args.source, target, dirs_exist_ok=True,
+                        ignore=shutil.ignore_patterns("*.onnx", "*.onnx_data"))
+    target_file = os.path.join(target, "model_quantized.onnx")
+    quantize_dynamic(source_file, target_file, weight_type=QuantType.QInt8)
+    _print({
+        "source": source_file,
+        "target": target_file,
+        "source_mb": round(os.path.getsize(source_file) / (1024 * 1024), 1),
+        "target_mb": round(os.path.getsize(target_file) / (1024 * 1024), 1),
+        "embedding_model": f"onnx:{target}",
+    })
+
+
+COMMANDS: Dict[str, Callable[[argparse.Namespace], None]] = {
+    "collection-info": cmd_collection_info,
+    "apply-collection-config": cmd_apply_collection_config,
+    "snapshot-export": cmd_snapshot_export,
+    "snapshot-import": cmd_snapshot_import,
+    "quantize-embedding-model": cmd_quantize_embedding_model,
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="LLM 프로젝트 관리 명령")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("collection-info", help="컬렉션 설정/통계 출력")
+    subparsers.add_parser("apply-collection-config", help="양자화/HNSW 설정을 기존 컬렉션에 반영")
+
+    export_parser = subparsers.add_parser("snapshot-export", help="컬렉션을 스냅샷 아카이브로 내보내기")
+    export_parser.add_argument("output", nargs="?", help="아카이브 경로 (기본: SNAPSHOT_DIR/<컬렉션>-<시각>.tar.gz)")
+
+    import_parser = subparsers.add_parser("snapshot-import", help="스냅샷 아카이브 가져오기")
+    import_parser.add_argument("path", help="아카이브 경로")
+    import_parser.add_argument("--workers", type=int, default=None, help="동시 업서트 수")
+    import_parser.add_argument("--batch-size", type=int, default=None, help="업서트 1회당 포인트 수")
+
+    quantize_parser = subparsers.add_parser("quantize-embedding-model", help="ONNX 임베딩 모델 int8 양자화")
+    quantize_parser.add_argument("source", help="ONNX 모델 디렉토리 (model.onnx + tokenizer.json)")
+    quantize_parser.add_argument("target", nargs="?", help="출력 디렉토리 (기본: <원본>-int8)")
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        COMMANDS[args.command](args)
+    except ValueError as e:
+        # 스냅샷 검증 실패 등 사용자 입력 오류
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,69 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+
+_import_started = time.perf_counter()
+
+from app.api import analysis, chat, upload, intent, fewshot, query_log, admin, sql_template
+from app.services.vector_store import vector_store
+from app.services.reranker import reranker
+from app.services.startup import service_warmup
+from app.services.ingest_queue import ingest_queue
+from app.services.reindex_service import reindex_service
+from app.services.applicant_index import applicant_index_service
+from app.services.cache_versions import cache_versions
+from app.services.extraction_cache import extraction_cache
+from app.services.sql_templates import sql_template_service
+from app.services.sql_result_cache import sql_result_cache
+from app.utils.pdf_pages import pdf_page_pool
+
+print(f"✅ [startup] 모듈 import 완료 ({(time.perf_counter() - _import_started) * 1000:.1f}ms)")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    애플리케이션 수명 주기 관리
+    무거운 초기화(벡터 저장소 연결, 임베딩 모델 로드, Ollama preload)는
+    백그라운드 워밍업으로 실행하여 워커 기동과 /health 응답을 막지 않음
+    """
+    service_warmup.start()
+    # 재시작 전 미완료된 일괄 업로드 작업 재개 (DB 조회는 스레드에서 수행)
+    asyncio.create_task(_resume_ingest_jobs())
+    # 재시작으로 중단된 재색인 작업 정리
+    asyncio.create_task(_recover_reindex())
+    # applicant_info 변경을 지원자 의미 검색 인덱스에 반영 (인덱스를 둘 Qdrant가 없으면 건너뜀)
+    await applicant_index_service.start()
+    yield
+    await applicant_index_service.stop()
+    await service_warmup.stop()
+    ingest_queue.shutdown()
+    pdf_page_pool.shutdown()
+
 
-from app.api import analysis, chat, upload, intent, fewshot, query_log
+async def _resume_ingest_jobs():
+    try:
+        await asyncio.to_thread(ingest_queue.resume)
+    except Exception as e:
+        print(f"⚠️  [ingest] 미완료 작업 재개 실패: {e}")
+
+
+async def _recover_reindex():
+    try:
+        await asyncio.to_thread(reindex_service.recover)
+    except Exception as e:
+        print(f"⚠️  [reindex] 중단된 작업 정리 실패: {e}")
 
 
 app = FastAPI(
     title="지원자 자기소개서 분석 및 RAG 채팅 API",
     description="PostgreSQL 지원자 분석, RAG 기반 문서 검색 및 채팅 서비스",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan
 )
 
 # CORS 설정 (폐쇄망 환경 대응)
@@ -31,6 +87,8 @@ app.include_router(upload.router)       # 신규 업로드 API
 app.include_router(intent.router)       # Intent 관리 API
 app.include_router(query_log.router)    # 질의 로그 관리 API (신규)
 app.include_router(fewshot.router)      # Few-shot 관리 API
+app.include_router(admin.router)        # 관리자 API (스냅샷, 재색인)
+app.include_router(sql_template.router) # SQL 템플릿 관리 API
 
 @app.get("/")
 async def root():
@@ -42,10 +100,37 @@ async def root():
             "RAG 기반 문서 검색",
             "자연어 SQL 쿼리",
             "Intent 관리 (쿼리 의도 분류)",
-            "Few-shot 관리 (예제 학습 데이터)"
+            "Few-shot 관리 (예제 학습 데이터)",
+            "SQL 템플릿 관리 (자주 묻는 질의는 LLM 없이 즉시 응답)",
+            "벡터 컬렉션 스냅샷 내보내기/가져오기",
+            "임베딩 모델 변경 시 무중단 재색인 (alias 전환/롤백)",
+            "벡터 저장소 선택 (Qdrant / PostgreSQL pgvector)",
+            "검색 결과 캐시 (서버 간 버전 기반 무효화)",
+            "SQL 결과 캐시 (테이블 변경 트리거 기반 무효화)",
+            "지원자 의미 검색 / 유사 지원자 찾기 (필드별 임베딩)"
         ]
     }
 
 @app.get("/health")
 async def health_check():
+    """Liveness: 프로세스가 요청을 처리할 수 있는지 여부"""
     return {"status": "healthy"}
+
+@app.get("/ready")
+async def readiness_check():
+    """Readiness: 의존 서비스 연결 및 모델 워밍업 완료 여부"""
+    status = service_warmup.get_status()
+    return JSONResponse(status_code=200 if status["ready"] else 503, content=status)
+
+
+@app.get("/metrics")
+async def metrics():
+    """캐시 히트율 등 서비스 내부 지표"""
+    return {
+        "embedding_cache": vector_store.embedding_cache.get_stats(),
+        "retrieval_cache": {**vector_store.retrieval_cache.get_stats(), "versions": cache_versions.get_stats()},
+        "extraction_cache": extraction_cache.get_stats(),
+        "sql_templates": sql_template_service.get_stats(),
+        "sql_result_cache": sql_result_cache.get_stats(),
+        "reranker": reranker.get_stats()
+    }
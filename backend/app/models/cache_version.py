@@ -0,0 +1,18 @@
+"""캐시 버전 모델 - 여러 서버(레플리카)가 공유하는 캐시 무효화 카운터"""
+from datetime import datetime
+from sqlmodel import Field, SQLModel, Column, String, BigInteger, DateTime
+from sqlalchemy import text
+import os
+
+
+class CacheVersion(SQLModel, table=True):
+    """캐시 이름별 버전 테이블 (데이터가 바뀔 때마다 version 증가 + pg_notify)"""
+    __tablename__ = "cache_versions"
+    __table_args__ = {"schema": os.getenv("DB_SCHEMA", "public")}
+
+    name: str = Field(sa_column=Column(String(255), primary_key=True))  # 예: qdrant:documents
+    version: int = Field(default=0, sa_column=Column(BigInteger, nullable=False, server_default=text("0")))
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column=Column(DateTime, nullable=False, server_default=text("CURRENT_TIMESTAMP"))
+    )
@@ -1,13 +1,25 @@
 """
 채팅 및 문서 업로드 관련 Pydantic 모델
 """
+from datetime import datetime
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
 
 
+class DocumentFilter(BaseModel):
+    """문서 검색 메타데이터 필터 (지정한 조건을 모두 만족하는 청크만 검색)"""
+    doc_id: Optional[str] = None
+    filename: Optional[str] = None
+    doc_type: Optional[str] = None  # 파일 확장자 (pdf, docx, txt, xlsx 등)
+    applicant_id: Optional[int] = None
+    uploaded_after: Optional[datetime] = None
+    uploaded_before: Optional[datetime] = None
+
+
 class ChatRequest(BaseModel):
     """채팅 요청 모델"""
     query: str
+    filters: Optional[DocumentFilter] = None  # RAG 검색 범위 제한
 
 
 class QueryDecomposition(BaseModel):
@@ -35,6 +47,8 @@ class ChatResponse(BaseModel):
     # Multi-stage RAG 추가 필드
     decomposition: Optional[QueryDecomposition] = None
     relevance_analysis: Optional[RelevanceAnalysis] = None
+    # 재순위 단계 통계 (지연 시간, 채점 후보 수, 예산 초과 여부)
+    rerank: Optional[Dict[str, Any]] = None
 
 
 class UploadResponse(BaseModel):
@@ -43,3 +57,7 @@ class UploadResponse(BaseModel):
     filename: str
     doc_id: str
     text_length: int
+    chunk_count: int = 1
+    chunks_reused: int = 0  # 내용이 같아 기존 벡터를 재사용한 청크 수
+    chunks_embedded: int = 0  # 새로 임베딩한 청크 수
+    duplicate: bool = False  # 동일한 파일이 이미 저장되어 있어 저장을 생략한 경우
@@ -0,0 +1,20 @@
+"""문서 청크 본문 모델 - Qdrant payload 대신 압축하여 저장"""
+from datetime import datetime
+from sqlmodel import Field, SQLModel, Column, String, Integer, DateTime, LargeBinary
+from sqlalchemy import text
+import os
+
+
+class DocumentChunk(SQLModel, table=True):
+    """문서 청크 본문 테이블 (point_id = Qdrant 포인트 ID)"""
+    __tablename__ = "document_chunks"
+    __table_args__ = {"schema": os.getenv("DB_SCHEMA", "public")}
+
+    point_id: str = Field(sa_column=Column(String(36), primary_key=True))
+    doc_id: str = Field(sa_column=Column(String(64), nullable=False, index=True))
+    chunk_index: int = Field(default=0, sa_column=Column(Integer, nullable=False, server_default=text("0")))
+    content: bytes = Field(sa_column=Column(LargeBinary, nullable=False))  # zlib 압축된 UTF-8 텍스트
+    created_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column=Column(DateTime, nullable=False, server_default=text("CURRENT_TIMESTAMP"))
+    )
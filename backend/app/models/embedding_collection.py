@@ -0,0 +1,59 @@
+"""임베딩 컬렉션 버전 모델 - 재색인 진행 상태와 alias 전환/롤백 이력 유지"""
+from datetime import datetime
+from typing import Optional
+from sqlmodel import Field, SQLModel, Column, String, Text, Integer, BigInteger, DateTime
+from sqlalchemy import text
+import os
+
+
+class EmbeddingCollection(SQLModel, table=True):
+    """버전별 Qdrant 컬렉션 테이블 (alias_name이 검색/업로드에 사용하는 이름)"""
+    __tablename__ = "embedding_collections"
+    __table_args__ = {"schema": os.getenv("DB_SCHEMA", "public")}
+
+    id: Optional[int] = Field(default=None, sa_column=Column(BigInteger, primary_key=True, autoincrement=True))
+    collection_name: str = Field(sa_column=Column(String(255), nullable=False, unique=True))  # 실제 Qdrant 컬렉션
+    alias_name: str = Field(sa_column=Column(String(255), nullable=False))
+    embedding_model: str = Field(sa_column=Column(String(255), nullable=False))
+    vector_size: int = Field(sa_column=Column(Integer, nullable=False))
+    status: str = Field(default="building", sa_column=Column(String(20), nullable=False, server_default=text("'building'")))  # building, active, retired, failed, cancelled, deleted
+    total_points: int = Field(default=0, sa_column=Column(Integer, nullable=False, server_default=text("0")))
+    processed_points: int = Field(default=0, sa_column=Column(Integer, nullable=False, server_default=text("0")))
+    skipped_points: int = Field(default=0, sa_column=Column(Integer, nullable=False, server_default=text("0")))  # 본문이 없어 재임베딩하지 못한 포인트
+    error: Optional[str] = Field(default=None, sa_column=Column(Text))
+    created_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column=Column(DateTime, nullable=False, server_default=text("CURRENT_TIMESTAMP"))
+    )
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column=Column(DateTime, nullable=False, server_default=text("CURRENT_TIMESTAMP"))
+    )
+    activated_at: Optional[datetime] = Field(default=None, sa_column=Column(DateTime))
+
+
+# API 요청/응답 모델
+
+class ReindexRequest(SQLModel):
+    """재색인 시작 요청"""
+    embedding_model: str  # EMBEDDING_MODEL 형식 (FastEmbed 이름, onnx:<경로>, ollama:<모델>)
+    batch_size: Optional[int] = None  # 임베딩/업서트 1회당 포인트 수 (기본: REINDEX_BATCH_SIZE)
+    throttle_ms: Optional[int] = None  # 배치 사이 대기 시간 (기본: REINDEX_THROTTLE_MS)
+
+
+class EmbeddingCollectionResponse(SQLModel):
+    """컬렉션 버전 / 재색인 진행 상태 응답"""
+    id: int
+    collection_name: str
+    alias_name: str
+    embedding_model: str
+    vector_size: int
+    status: str
+    total_points: int
+    processed_points: int
+    skipped_points: int
+    progress: float = 0.0  # 0.0 ~ 1.0 (처리 포인트 / 전체)
+    error: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+    activated_at: Optional[datetime]
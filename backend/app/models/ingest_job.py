@@ -0,0 +1,91 @@
+"""문서 일괄 수집(ingestion) 작업 모델 - 재시작 후에도 작업 상태 유지"""
+from datetime import datetime
+from typing import Optional, List
+from sqlmodel import Field, SQLModel, Column, String, Text, Integer, BigInteger, DateTime
+from sqlalchemy import text
+import os
+
+
+class IngestJob(SQLModel, table=True):
+    """일괄 업로드 작업 테이블"""
+    __tablename__ = "ingest_jobs"
+    __table_args__ = {"schema": os.getenv("DB_SCHEMA", "public")}
+
+    id: str = Field(sa_column=Column(String(32), primary_key=True))  # UUID hex
+    status: str = Field(default="pending", sa_column=Column(String(20), nullable=False, server_default=text("'pending'")))  # pending, running, completed, partial, failed
+    total_files: int = Field(default=0, sa_column=Column(Integer, nullable=False, server_default=text("0")))
+    processed_files: int = Field(default=0, sa_column=Column(Integer, nullable=False, server_default=text("0")))
+    failed_files: int = Field(default=0, sa_column=Column(Integer, nullable=False, server_default=text("0")))
+    created_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column=Column(DateTime, nullable=False, server_default=text("CURRENT_TIMESTAMP"))
+    )
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column=Column(DateTime, nullable=False, server_default=text("CURRENT_TIMESTAMP"))
+    )
+
+
+class IngestJobFile(SQLModel, table=True):
+    """일괄 업로드 작업의 파일별 처리 상태 테이블"""
+    __tablename__ = "ingest_job_files"
+    __table_args__ = {"schema": os.getenv("DB_SCHEMA", "public")}
+
+    id: Optional[int] = Field(default=None, sa_column=Column(BigInteger, primary_key=True, autoincrement=True))
+    job_id: str = Field(sa_column=Column(String(32), nullable=False))  # ingest_jobs.id 참조
+    filename: str = Field(sa_column=Column(String(500), nullable=False))
+    spool_path: str = Field(sa_column=Column(Text, nullable=False))  # 처리 대기 중인 임시 파일 경로
+    file_size: int = Field(default=0, sa_column=Column(BigInteger, nullable=False, server_default=text("0")))
+    status: str = Field(default="pending", sa_column=Column(String(20), nullable=False, server_default=text("'pending'")))  # pending, running, completed, failed
+    attempts: int = Field(default=0, sa_column=Column(Integer, nullable=False, server_default=text("0")))
+    doc_id: Optional[str] = Field(default=None, sa_column=Column(String(64)))
+    chunk_count: Optional[int] = Field(default=None, sa_column=Column(Integer))
+    error: Optional[str] = Field(default=None, sa_column=Column(Text))
+    created_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column=Column(DateTime, nullable=False, server_default=text("CURRENT_TIMESTAMP"))
+    )
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column=Column(DateTime, nullable=False, server_default=text("CURRENT_TIMESTAMP"))
+    )
+
+
+# API 응답 모델
+
+class IngestJobFileResponse(SQLModel):
+    """작업 파일 상태 응답"""
+    id: int
+    filename: str
+    file_size: int
+    status: str
+    attempts: int
+    doc_id: Optional[str]
+    chunk_count: Optional[int]
+    error: Optional[str]
+    updated_at: datetime
+
+
+class IngestJobResponse(SQLModel):
+    """작업 상태 응답"""
+    id: str
+    status: str
+    total_files: int
+    processed_files: int
+    failed_files: int
+    progress: float = 0.0  # 0.0 ~ 1.0 (처리 완료 + 실패 / 전체)
+    created_at: datetime
+    updated_at: datetime
+
+
+class IngestJobDetailResponse(IngestJobResponse):
+    """작업 상세 응답 (파일별 상태 포함)"""
+    files: List[IngestJobFileResponse] = []
+
+
+class BatchUploadResponse(SQLModel):
+    """일괄 업로드 응답"""
+    message: str
+    job_id: str
+    total_files: int
+    skipped_files: List[str] = []  # 지원하지 않는 형식 등으로 제외된 파일
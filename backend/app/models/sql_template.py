@@ -0,0 +1,101 @@
+"""SQL template models - 자주 나오는 자연어 질의를 LLM 없이 처리하는 파라미터화 SQL."""
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from sqlmodel import Field, SQLModel, Column, String, DateTime, Boolean, Integer, Text, JSON
+from sqlalchemy import text
+import os
+
+
+class SqlTemplate(SQLModel, table=True):
+    """자연어 질의 패턴 → 파라미터화 SQL + 답변 템플릿 매핑 테이블."""
+    __tablename__ = "sql_templates"
+    __table_args__ = {"schema": os.getenv("DB_SCHEMA", "public")}
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str = Field(sa_column=Column(String(100), nullable=False, unique=True))
+    # 질의 정규식 (이름 있는 그룹 → SQL 파라미터, 예: (?P<id>\d+)\s*번\s*지원자)
+    pattern: Optional[str] = Field(default=None, sa_column=Column(Text))
+    # 임베딩 유사도 매칭용 예시 질의 (파라미터가 있고 모두 기본값으로 채워지는 템플릿만 사용, 숫자가 든 질의는 제외)
+    example_queries: List[str] = Field(default_factory=list, sa_column=Column(JSON, nullable=False, server_default=text("'[]'")))
+    # 읽기 전용 SELECT (%(이름)s 형식 파라미터, 문자열 안의 %는 %%로 작성)
+    sql_text: str = Field(sa_column=Column(Text, nullable=False))
+    # 파라미터 타입 (int, float, str - 기본 str) 및 기본값
+    param_types: Dict[str, str] = Field(default_factory=dict, sa_column=Column(JSON, nullable=False, server_default=text("'{}'")))
+    param_defaults: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON, nullable=False, server_default=text("'{}'")))
+    # 답변 템플릿 ({파라미터}, {첫 행 컬럼}, {row_count}, {rows} 사용 가능)
+    answer_template: str = Field(sa_column=Column(Text, nullable=False))
+    priority: int = Field(default=0, sa_column=Column(Integer, nullable=False, server_default=text("0")))
+    is_active: bool = Field(default=True, sa_column=Column(Boolean, nullable=False, server_default=text("true")))
+    description: Optional[str] = Field(default=None, sa_column=Column(String(500)))
+    created_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column=Column(DateTime, nullable=False, server_default=text("CURRENT_TIMESTAMP"))
+    )
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column=Column(DateTime, nullable=False, server_default=text("CURRENT_TIMESTAMP"), onupdate=text("CURRENT_TIMESTAMP"))
+    )
+
+
+# Pydantic response models for API
+
+class SqlTemplateResponse(SQLModel):
+    """SQL 템플릿 API 응답 모델."""
+    id: int
+    name: str
+    pattern: Optional[str]
+    example_queries: List[str]
+    sql_text: str
+    param_types: Dict[str, str]
+    param_defaults: Dict[str, Any]
+    answer_template: str
+    priority: int
+    is_active: bool
+    description: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+
+
+class SqlTemplateCreate(SQLModel):
+    """SQL 템플릿 생성 요청 모델."""
+    name: str
+    pattern: Optional[str] = None
+    example_queries: List[str] = []
+    sql_text: str
+    param_types: Dict[str, str] = {}
+    param_defaults: Dict[str, Any] = {}
+    answer_template: str
+    priority: int = 0
+    is_active: bool = True
+    description: Optional[str] = None
+
+
+class SqlTemplateUpdate(SQLModel):
+    """SQL 템플릿 수정 요청 모델."""
+    name: Optional[str] = None
+    pattern: Optional[str] = None
+    example_queries: Optional[List[str]] = None
+    sql_text: Optional[str] = None
+    param_types: Optional[Dict[str, str]] = None
+    param_defaults: Optional[Dict[str, Any]] = None
+    answer_template: Optional[str] = None
+    priority: Optional[int] = None
+    is_active: Optional[bool] = None
+    description: Optional[str] = None
+
+
+class SqlTemplateMatchRequest(SQLModel):
+    """SQL 템플릿 매칭 테스트 요청 모델."""
+    query: str
+    execute: bool = False
+
+
+class SqlTemplateMatchResponse(SQLModel):
+    """SQL 템플릿 매칭 테스트 응답 모델."""
+    matched: bool
+    template: Optional[str] = None
+    method: Optional[str] = None  # regex, embedding
+    score: Optional[float] = None
+    params: Dict[str, Any] = {}
+    answer: Optional[str] = None
+    results: Optional[List[Dict[str, Any]]] = None
@@ -0,0 +1,496 @@
+"""
+지원자 의미 검색 인덱스
+applicant_info의 지원 동기(reason)/경력(experience)/기술(skill)을 필드별 named vector로
+Qdrant 컬렉션(APPLICANT_COLLECTION_NAME)에 저장하고, LLM 호출 없이 자연어 질의나
+특정 지원자와 비슷한 지원자를 찾는다.
+
+applicant_info 변경은 캐시 트리거(migrations/009)가 올리는 테이블 버전("table:<스키마>.applicant_info",
+app.services.cache_versions)으로 감지한다.
+    - 전체 동기화: 모든 행을 훑어 내용이 바뀐 필드만 다시 임베딩하고 삭제된 지원자를 제거
+      (시작 시, 테이블 버전이 바뀔 때마다 APPLICANT_CHANGE_CHECK_SECONDS 안에 자동 실행)
+    - 증분 동기화: 인덱스의 최대 applicant_id 이후 행만 임베딩 (APPLICANT_SYNC_INTERVAL마다 자동 실행)
+트리거가 없는 DB에서는 버전이 바뀌지 않으므로 수정/삭제는 수동 전체 동기화로만 반영된다.
+
+Qdrant는 APPLICANT_QDRANT_URL(서버 주소 또는 :memory:/path: 내장 모드)을 사용하며, 비워두면
+VECTOR_STORE=qdrant일 때 문서 컬렉션과 같은 클라이언트를 공유한다. VECTOR_STORE=pgvector이고
+APPLICANT_QDRANT_URL이 없으면 인덱스를 사용하지 않는다 (자동 동기화 미실행, API는 400).
+
+포인트 ID = applicant_id, 임베딩 모델은 문서 검색과 같은 모델(vector_store)을 사용한다.
+검색 모델이 바뀌면(재색인 전환/롤백) 인덱스를 새 모델로 다시 만들고, 그동안 검색은 거부한다.
+"""
+import asyncio
+import hashlib
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from qdrant_client import QdrantClient
+from qdrant_client.models import (
+    Distance, VectorParams, PointStruct, NamedVector, SearchRequest, Filter, HasIdCondition,
+    OrderBy, Direction, PayloadSchemaType, PointIdsList
+)
+from sqlmodel import Session, select
+
+from app.database import engine
+from app.models.applicant import Applicant
+from app.services.cache_versions import cache_versions
+from app.services.qdrant_service import create_qdrant_client, is_local_url, qdrant_service
+from app.services.sql_result_cache import sql_result_cache
+from app.services.vector_store import vector_store
+
+# 임베딩하는 applicant_info 필드 (named vector 이름)
+APPLICANT_FIELDS = ("reason", "experience", "skill")
+
+
+class ApplicantIndexStale(Exception):
+    """인덱스의 임베딩 모델이 현재 검색 모델과 달라 다시 만드는 중"""
+
+
+class ApplicantIndexService:
+    """지원자 필드별 임베딩 인덱스 동기화 및 의미 검색"""
+
+    def __init__(self):
+        self.collection_name = os.getenv("APPLICANT_COLLECTION_NAME", "applicants")
+        # 지원자 인덱스 전용 Qdrant (비워두면 VECTOR_STORE=qdrant의 클라이언트 공유)
+        self.qdrant_url = os.getenv("APPLICANT_QDRANT_URL", "")
+        # 자동 증분 동기화 간격 (초, 0이면 사용 안 함 - /api/admin/applicant-index/sync로 수동 실행)
+        self.sync_interval = float(os.getenv("APPLICANT_SYNC_INTERVAL", "300"))
+        # applicant_info 테이블 버전 확인 간격 (초, 버전이 바뀌면 전체 동기화로 수정/삭제 반영)
+        self.change_check_interval = float(os.getenv("APPLICANT_CHANGE_CHECK_SECONDS", "10"))
+        self.batch_size = int(os.getenv("APPLICANT_SYNC_BATCH_SIZE", "64"))
+        # 필드별로 가져올 후보 수 (필드 점수를 합칠 때 사용)
+        self.candidates = int(os.getenv("APPLICANT_SEARCH_CANDIDATES", "100"))
+        self.snippet_length = int(os.getenv("PAYLOAD_SNIPPET_LENGTH", "200"))
+
+        self.last_sync: Optional[Dict[str, Any]] = None
+        # 마지막 전체 동기화 시작 시점의 applicant_info 테이블 버전
+        self._synced_versions: Optional[Tuple[int, ...]] = None
+        # 인덱스 벡터를 만든 임베딩 모델 (None이면 다음 검색 때 조회)
+        self._indexed_model: Optional[str] = None
+        self._sync_lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._client: Optional[QdrantClient] = None
+        self._client_lock = threading.Lock()
+
+    @property
+    def available(self) -> bool:
+        """인덱스를 둘 Qdrant가 있는지 (APPLICANT_QDRANT_URL 설정 또는 VECTOR_STORE=qdrant)"""
+        return bool(self.qdrant_url) or vector_store.name == "qdrant"
+
+    def require_available(self) -> None:
+        """
+        Raises:
+            ValueError: 인덱스를 둘 Qdrant가 없는 경우
+        """
+        if not self.available:
+            raise ValueError(
+                f"지원자 인덱스는 VECTOR_STORE=qdrant 또는 APPLICANT_QDRANT_URL 설정이 필요합니다 (현재: {vector_store.name})"
+            )
+
+    @property
+    def _shares_document_client(self) -> bool:
+        return vector_store.name == "qdrant" and (not self.qdrant_url or self.qdrant_url == qdrant_service.qdrant_url)
+
+    @property
+    def is_local(self) -> bool:
+        return qdrant_service.is_local if self._shares_document_client else is_local_url(self.qdrant_url)
+
+    @property
+    def client(self) -> QdrantClient:
+        """
+        지원자 인덱스 Qdrant 클라이언트
+
+        Raises:
+            ValueError: 인덱스를 둘 Qdrant가 없는 경우
+        """
+        self.require_available()
+        if self._shares_document_client:
+            return qdrant_service.client
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = create_qdrant_client(self.qdrant_url)
+        return self._client
+
+    # ===== 컬렉션 관리 =====
+
+    def _ensure_collection(self, client: QdrantClient) -> None:
+        """
+        컬렉션이 없거나 임베딩 모델이 바뀌었으면 (재)생성
+
+        모델이 바뀌면 기존 벡터와 질의 벡터를 비교할 수 없으므로 비우고 처음부터 다시 채운다.
+        """
+        vector_size = vector_store.vector_size
+        if client.collection_exists(self.collection_name):
+            vectors = client.get_collection(self.collection_name).config.params.vectors
+            sizes = {params.size for params in vectors.values()} if isinstance(vectors, dict) else set()
+            sample, _ = client.scroll(self.collection_name, limit=1, with_payload=["embedding_model"])
+            model = (sample[0].payload or {}).get("embedding_model") if sample else vector_store.embedding_model_name
+            if sizes == {vector_size} and model == vector_store.embedding_model_name:
+                self._indexed_model = model
+                return
+            print(f"🔄 [applicants] 임베딩 모델 변경으로 인덱스 재생성: {model} → {vector_store.embedding_model_name}")
+            client.delete_collection(self.collection_name)
+
+        client.create_collection(
+            collection_name=self.collection_name,
+            vectors_config={
+                field: VectorParams(size=vector_size, distance=Distance.COSINE) for field in APPLICANT_FIELDS
+            },
+        )
+        if not self.is_local:
+            # 워터마크 조회(order_by)에 필요 (내장 모드는 인덱스 없이 동작)
+            client.create_payload_index(self.collection_name, "applicant_id", field_schema=PayloadSchemaType.INTEGER)
+        self._indexed_model = vector_store.embedding_model_name
+        print(f"✅ [applicants] 지원자 인덱스 생성: {self.collection_name} (dim={vector_size})")
+
+    def _check_model(self, client: QdrantClient) -> None:
+        """
+        인덱스 모델이 현재 검색 모델과 같은지 확인 (다르면 재생성을 시작)
+
+        Raises:
+            ApplicantIndexStale: 인덱스를 다시 만드는 중
+        """
+        indexed = self._indexed_model
+        if indexed is None:
+            sample, _ = client.scroll(self.collection_name, limit=1, with_payload=["embedding_model"])
+            indexed = (sample[0].payload or {}).get("embedding_model") if sample else vector_store.embedding_model_name
+            self._indexed_model = indexed
+        if indexed != vector_store.embedding_model_name:
+            self.start_sync(full=True)
+            raise ApplicantIndexStale(
+                f"검색 모델이 바뀌어 지원자 인덱스를 다시 만드는 중입니다 ({indexed} → {vector_store.embedding_model_name})"
+            )
+
+    def table_versions(self) -> Tuple[int, ...]:
+        """applicant_info 테이블 버전 (트리거가 변경마다 올림)"""
+        return tuple(cache_versions.get(name)[0] for name in sql_result_cache.version_names([Applicant.__tablename__]))
+
+    def watermark(self, client: Optional[QdrantClient] = None) -> int:
+        """인덱스에 있는 가장 큰 applicant_id (비어 있으면 0)"""
+        client = client or self.client
+        points, _ = client.scroll(
+            self.collection_name,
+            limit=1,
+            order_by=OrderBy(key="applicant_id", direction=Direction.DESC),
+            with_payload=["applicant_id"],
+        )
+        return int(points[0].payload["applicant_id"]) if points else 0
+
+    @staticmethod
+    def field_hash(value: str) -> str:
+        return hashlib.sha256(value.encode("utf-8")).hexdigest()[:16]
+
+    # ===== 동기화 =====
+
+    def sync(self, full: bool = False) -> Dict[str, Any]:
+        """
+        applicant_info → 지원자 인덱스 동기화
+
+        Args:
+            full: True면 모든 행을 비교 (수정/삭제 반영), False면 워터마크 이후 새 행만
+
+        Returns:
+            mode, scanned, embedded_fields, deleted, watermark, elapsed_ms
+
+        Raises:
+            ValueError: 이미 동기화가 진행 중인 경우
+        """
+        if not self._sync_lock.acquire(blocking=False):
+            raise ValueError("지원자 인덱스 동기화가 이미 진행 중입니다")
+        try:
+            started = time.perf_counter()
+            # 스캔 전에 읽어 두어, 스캔 중 변경은 다음 확인에서 다시 전체 동기화
+            versions = self.table_versions() if full else None
+            client = self.client
+            self._ensure_collection(client)
+            after = 0 if full else self.watermark(client)
+            scanned = 0
+            embedded = 0
+            seen_ids = set()
+
+            while True:
+                with Session(engine) as session:
+                    applicants = session.exec(
+                        select(Applicant).where(Applicant.id > after).order_by(Applicant.id).limit(self.batch_size)
+                    ).all()
+                if not applicants:
+                    break
+                embedded += self._index_batch(client, applicants)
+                scanned += len(applicants)
+                seen_ids.update(applicant.id for applicant in applicants)
+                after = applicants[-1].id
+
+            deleted = self._delete_missing(client, seen_ids) if full else 0
+            if full:
+                self._synced_versions = versions
+            self.last_sync = {
+                "mode": "full" if full else "incremental",
+                "scanned": scanned,
+                "embedded_fields": embedded,
+                "deleted": deleted,
+                "watermark": self.watermark(client),
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+                "finished_at": datetime.now().isoformat(),
+            }
+            if scanned or deleted:
+                print(f"✅ [applicants] 동기화 완료: {self.last_sync}")
+            return self.last_sync
+        finally:
+            self._sync_lock.release()
+
+    def _index_batch(self, client: QdrantClient, applicants: List[Applicant]) -> int:
+        """
+        지원자 배치 임베딩/업서트 (필드 내용 해시가 같으면 기존 벡터 재사용)
+
+        Returns:
+            새로 임베딩한 필드 수
+        """
+        existing = {
+            int(point.id): point
+            for point in client.retrieve(
+                self.collection_name, ids=[applicant.id for applicant in applicants],
+                with_payload=True, with_vectors=True
+            )
+        }
+        vectors: Dict[int, Dict[str, Any]] = {}
+        payloads: Dict[int, Dict[str, Any]] = {}
+        to_embed = []  # (applicant_id, 필드, 텍스트)
+        for applicant in applicants:
+            previous = existing.get(applicant.id)
+            previous_payload = previous.payload if previous else {}
+            previous_vectors = previous.vector if previous and isinstance(previous.vector, dict) else {}
+            vectors[applicant.id] = {}
+            payloads[applicant.id] = {"applicant_id": applicant.id, "embedding_model": vector_store.embedding_model_name}
+            for field in APPLICANT_FIELDS:
+                value = (getattr(applicant, field) or "").strip()
+                if not value:
+                    continue
+                value_hash = self.field_hash(value)
+                payloads[applicant.id][f"{field}_hash"] = value_hash
+                payloads[applicant.id][field] = value[:self.snippet_length]
+                if previous_payload.get(f"{field}_hash") == value_hash and field in previous_vectors:
+                    vectors[applicant.id][field] = previous_vectors[field]
+                else:
+                    to_embed.append((applicant.id, field, value))
+
+        if to_embed:
+            for (applicant_id, field, _), vector in zip(to_embed, vector_store.embed_texts([text for _, _, text in to_embed])):
+                vectors[applicant_id][field] = vector.tolist()
+
+        client.upsert(self.collection_name, points=[
+            PointStruct(id=applicant.id, vector=vectors[applicant.id], payload=payloads[applicant.id])
+            for applicant in applicants
+        ])
+        return len(to_embed)
+
+    def _delete_missing(self, client: QdrantClient, seen_ids: set) -> int:
+        """applicant_info에서 삭제된 지원자 포인트 제거"""
+        missing = []
+        offset = None
+        while True:
+            points, offset = client.scroll(self.collection_name, limit=1000, offset=offset, with_payload=False)
+            missing.extend(point.id for point in points if int(point.id) not in seen_ids)
+            if offset is None:
+                break
+        if missing:
+            client.delete(self.collection_name, points_selector=PointIdsList(points=missing))
+        return len(missing)
+
+    def start_sync(self, full: bool = False) -> bool:
+        """
+        백그라운드 스레드에서 동기화 시작
+
+        Returns:
+            시작 여부 (이미 진행 중이면 False)
+
+        Raises:
+            ValueError: 인덱스를 둘 Qdrant가 없는 경우
+        """
+        self.require_available()
+        if self._sync_lock.locked():
+            return False
+        threading.Thread(target=self._sync_quietly, args=(full,), daemon=True).start()
+        return True
+
+    def _sync_quietly(self, full: bool) -> None:
+        try:
+            self.sync(full=full)
+        except ValueError:
+            pass
+        except Exception as e:
+            print(f"❌ [applicants] 동기화 실패: {e}")
+
+    async def start(self) -> None:
+        """자동 동기화 시작 (APPLICANT_SYNC_INTERVAL=0이거나 인덱스를 둘 Qdrant가 없으면 실행하지 않음)"""
+        if not self.available:
+            print(f"⚠️  [applicants] 지원자 인덱스 비활성: VECTOR_STORE={vector_store.name} "
+                  f"(사용하려면 APPLICANT_QDRANT_URL 설정)")
+            return
+        if self.sync_interval > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        """테이블 버전이 바뀌면(시작 시 포함) 전체 동기화, 그 외에는 APPLICANT_SYNC_INTERVAL마다 증분 동기화"""
+        last_run: Optional[float] = None
+        while True:
+            try:
+                full = await asyncio.to_thread(self.table_versions) != self._synced_versions
+                if full or last_run is None or time.monotonic() - last_run >= self.sync_interval:
+                    await asyncio.to_thread(self.sync, full)
+                    last_run = time.monotonic()
+            except ValueError:
+                # 수동 동기화가 진행 중
+                pass
+            except Exception as e:
+                print(f"⚠️  [applicants] 자동 동기화 실패: {e}")
+            await asyncio.sleep(min(self.sync_interval, self.change_check_interval))
+
+    def get_status(self) -> Dict[str, Any]:
+        """인덱스 상태 (포인트 수, 워터마크, 마지막 동기화 결과)"""
+        if not self.available:
+            return {"collection": self.collection_name, "available": False, "vector_store": vector_store.name}
+        client = self.client
+        if not client.collection_exists(self.collection_name):
+            return {"collection": self.collection_name, "points_count": 0, "watermark": 0,
+                    "syncing": self._sync_lock.locked(), "last_sync": self.last_sync}
+        return {
+            "collection": self.collection_name,
+            "points_count": client.count(self.collection_name, exact=True).count,
+            "watermark": self.watermark(client),
+            "embedding_model": self._indexed_model or vector_store.embedding_model_name,
+            "table_versions": self._synced_versions,
+            "syncing": self._sync_lock.locked(),
+            "last_sync": self.last_sync,
+        }
+
+    # ===== 검색 =====
+
+    @staticmethod
+    def _resolve_fields(fields: Optional[List[str]]) -> List[str]:
+        """
+        Raises:
+            ValueError: 지원하지 않는 필드
+        """
+        if not fields:
+            return list(APPLICANT_FIELDS)
+        unknown = [field for field in fields if field not in APPLICANT_FIELDS]
+        if unknown:
+            raise ValueError(f"지원하지 않는 필드: {', '.join(unknown)} ({', '.join(APPLICANT_FIELDS)} 중 선택)")
+        return list(fields)
+
+    def _search_fields(
+        self,
+        vectors: Dict[str, List[float]],
+        exclude_id: Optional[int] = None
+    ) -> Dict[int, Dict[str, Any]]:
+        """필드별 named vector 검색을 한 번의 배치 요청으로 수행 → {지원자 ID: {field_scores, payload}}"""
+        query_filter = Filter(must_not=[HasIdCondition(has_id=[exclude_id])]) if exclude_id is not None else None
+        fields = list(vectors)
+        results = self.client.search_batch(self.collection_name, requests=[
+            SearchRequest(
+                vector=NamedVector(name=field, vector=vectors[field]),
+                filter=query_filter,
+                limit=self.candidates,
+                with_payload=True,
+            )
+            for field in fields
+        ])
+        merged: Dict[int, Dict[str, Any]] = {}
+        for field, hits in zip(fields, results):
+            for hit in hits:
+                entry = merged.setdefault(int(hit.id), {"field_scores": {}, "payload": hit.payload or {}})
+                entry["field_scores"][field] = hit.score
+        return merged
+
+    @staticmethod
+    def _to_result(applicant_id: int, entry: Dict[str, Any], score: float) -> Dict[str, Any]:
+        payload = entry["payload"]
+        field_scores = entry["field_scores"]
+        return {
+            "applicant_id": applicant_id,
+            "score": score,
+            "matched_field": max(field_scores, key=field_scores.get),
+            "field_scores": field_scores,
+            "preview": {field: payload[field] for field in APPLICANT_FIELDS if field in payload},
+        }
+
+    def search(self, query: str, limit: int = 20, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        자연어 질의로 지원자 검색 (예: "Kubernetes 운영 경험")
+
+        지원자 점수는 선택한 필드 중 가장 높은 유사도 (한 필드만 맞아도 찾도록)
+
+        Args:
+            query: 검색 질의
+            limit: 반환할 최대 지원자 수
+            fields: 검색할 필드 (기본: reason, experience, skill 전체)
+
+        Returns:
+            지원자 리스트 (applicant_id, score, matched_field, field_scores, preview)
+
+        Raises:
+            ValueError: 지원하지 않는 필드
+            ApplicantIndexStale: 검색 모델이 바뀌어 인덱스를 다시 만드는 중
+        """
+        fields = self._resolve_fields(fields)
+        if not self.client.collection_exists(self.collection_name):
+            return []
+        self._check_model(self.client)
+        query_vector = vector_store.embed_query(query).tolist()
+        merged = self._search_fields({field: query_vector for field in fields})
+        ranked = sorted(merged.items(), key=lambda item: max(item[1]["field_scores"].values()), reverse=True)
+        return [
+            self._to_result(applicant_id, entry, max(entry["field_scores"].values()))
+            for applicant_id, entry in ranked[:limit]
+        ]
+
+    def similar(self, applicant_id: int, limit: int = 10, fields: Optional[List[str]] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        지원자와 비슷한 지원자 검색 (같은 필드끼리 비교)
+
+        지원자 점수는 기준 지원자에게 있는 필드들의 유사도 평균 (후보에 없는 필드는 0점)
+
+        Args:
+            applicant_id: 기준 지원자 ID
+            limit: 반환할 최대 지원자 수
+            fields: 비교할 필드 (기본: 전체)
+
+        Returns:
+            지원자 리스트 (search()와 같은 형식), 기준 지원자가 인덱스에 없으면 None
+
+        Raises:
+            ValueError: 지원하지 않는 필드
+            ApplicantIndexStale: 검색 모델이 바뀌어 인덱스를 다시 만드는 중
+        """
+        fields = self._resolve_fields(fields)
+        if not self.client.collection_exists(self.collection_name):
+            return None
+        self._check_model(self.client)
+        points = self.client.retrieve(self.collection_name, ids=[applicant_id], with_vectors=fields)
+        if not points:
+            return None
+        source_vectors = {field: vector for field, vector in (points[0].vector or {}).items() if field in fields}
+        if not source_vectors:
+            return []
+        merged = self._search_fields(source_vectors, exclude_id=applicant_id)
+        scored = [
+            (candidate_id, entry, sum(entry["field_scores"].values()) / len(source_vectors))
+            for candidate_id, entry in merged.items()
+        ]
+        scored.sort(key=lambda item: item[2], reverse=True)
+        return [self._to_result(candidate_id, entry, score) for candidate_id, entry, score in scored[:limit]]
+
+
+# 싱글톤 인스턴스
+applicant_index_service = ApplicantIndexService()
@@ -0,0 +1,165 @@
+"""
+캐시 버전 카운터 (레플리카 간 캐시 무효화)
+데이터를 바꾸는 쪽이 PostgreSQL(cache_versions)의 버전을 올리고 pg_notify로 알리면,
+각 서버는 LISTEN으로 받은 최신 버전을 캐시 키에 포함시켜 이전 버전 캐시를 자동으로 무시한다.
+
+LISTEN 연결이 없거나 끊긴 경우 CACHE_VERSION_POLL_SECONDS마다 버전을 다시 조회한다.
+"""
+import os
+import select
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import text
+
+from app.database import engine
+
+
+class CacheVersionService:
+    """이름별 캐시 버전 조회/증가 및 다른 서버의 변경 알림 수신"""
+
+    # pg_notify 채널 (payload: "<이름>:<버전>")
+    CHANNEL = "cache_versions"
+
+    def __init__(self):
+        self.schema = os.getenv("DB_SCHEMA", "public")
+        # LISTEN 미사용/연결 끊김 시 버전 재조회 간격 (초, 다른 서버 변경이 반영되기까지 최대 지연)
+        self.poll_interval = float(os.getenv("CACHE_VERSION_POLL_SECONDS", "5"))
+        self.listen_enabled = os.getenv("CACHE_VERSION_LISTEN", "true").lower() == "true"
+
+        self._versions: Dict[str, int] = {}
+        # DB 갱신이 실패해도 이 서버의 캐시는 바로 무효화되도록 로컬 변경 횟수를 함께 키에 사용
+        self._local_epochs: Dict[str, int] = {}
+        self._checked_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+        self._listener: Optional[threading.Thread] = None
+        self._listening = False
+        self.bumps = 0
+        self.notifications = 0
+        self.errors = 0
+
+    @property
+    def _table(self) -> str:
+        return f'"{self.schema}".cache_versions'
+
+    def get(self, name: str) -> Tuple[int, int]:
+        """
+        현재 캐시 버전
+
+        Returns:
+            (공유 버전, 로컬 변경 횟수) - 둘 중 하나라도 바뀌면 캐시 키가 달라짐
+        """
+        self._ensure_listener()
+        checked_at = self._checked_at.get(name)
+        if checked_at is None or (not self._listening and time.monotonic() - checked_at >= self.poll_interval):
+            self._refresh(name)
+        return self._versions.get(name, 0), self._local_epochs.get(name, 0)
+
+    def _refresh(self, name: str) -> None:
+        self._checked_at[name] = time.monotonic()
+        try:
+            with engine.connect() as connection:
+                version = connection.execute(
+                    text(f"SELECT version FROM {self._table} WHERE name = :name"), {"name": name}
+                ).scalar()
+        except Exception:
+            self.errors += 1
+            return
+        self._set_version(name, version or 0)
+
+    def _set_version(self, name: str, version: int) -> None:
+        with self._lock:
+            # 알림 순서가 뒤바뀌어도 버전은 되돌리지 않음
+            self._versions[name] = max(self._versions.get(name, 0), int(version))
+
+    def bump(self, name: str) -> None:
+        """
+        데이터 변경 후 캐시 버전 증가 (이 서버는 즉시, 다른 서버는 알림/재조회 시 무효화)
+
+        DB 오류는 로그만 남기고 무시 (검색/업로드를 실패시키지 않음)
+        """
+        with self._lock:
+            self._local_epochs[name] = self._local_epochs.get(name, 0) + 1
+            self.bumps += 1
+        try:
+            with engine.begin() as connection:
+                version = connection.execute(text(
+                    f"INSERT INTO {self._table} (name, version, updated_at) VALUES (:name, 1, CURRENT_TIMESTAMP) "
+                    f"ON CONFLICT (name) DO UPDATE SET version = cache_versions.version + 1, "
+                    f"updated_at = CURRENT_TIMESTAMP RETURNING version"
+                ), {"name": name}).scalar()
+                if engine.dialect.name == "postgresql":
+                    connection.execute(
+                        text("SELECT pg_notify(:channel, :payload)"),
+                        {"channel": self.CHANNEL, "payload": f"{name}:{version}"}
+                    )
+        except Exception as e:
+            self.errors += 1
+            print(f"⚠️  [cache] 캐시 버전 갱신 실패 ({name}, 이 서버만 무효화): {e}")
+            return
+        self._set_version(name, version)
+
+    # ===== 다른 서버 변경 알림 수신 =====
+
+    def _ensure_listener(self) -> None:
+        if self._listener is not None or not self.listen_enabled or engine.dialect.name != "postgresql":
+            return
+        with self._lock:
+            if self._listener is not None:
+                return
+            self._listener = threading.Thread(target=self._listen, name="cache-version-listener", daemon=True)
+            self._listener.start()
+
+    def _listen(self) -> None:
+        """LISTEN 전용 연결로 알림을 받아 버전 갱신 (연결이 끊기면 재연결)"""
+        while True:
+            connection = None
+            try:
+                # 풀에서 분리한 전용 연결 (autocommit이어야 알림을 바로 받음)
+                connection = engine.raw_connection()
+                connection.detach()
+                dbapi_connection = connection.driver_connection
+                dbapi_connection.autocommit = True
+                with dbapi_connection.cursor() as cursor:
+                    cursor.execute(f"LISTEN {self.CHANNEL}")
+                # 연결 전 변경분은 알림으로 받지 못하므로 알려진 버전을 한 번 다시 조회
+                for name in list(self._versions):
+                    self._refresh(name)
+                self._listening = True
+                while True:
+                    readable, _, _ = select.select([dbapi_connection], [], [], 60)
+                    if not readable:
+                        continue
+                    dbapi_connection.poll()
+                    while dbapi_connection.notifies:
+                        notify = dbapi_connection.notifies.pop(0)
+                        name, _, version = notify.payload.rpartition(":")
+                        if name and version.isdigit():
+                            self._set_version(name, int(version))
+                            self.notifications += 1
+            except Exception as e:
+                self.errors += 1
+                print(f"⚠️  [cache] 캐시 버전 알림 수신 중단, 재연결 대기: {e}")
+            finally:
+                self._listening = False
+                if connection is not None:
+                    try:
+                        connection.close()
+                    except Exception:
+                        pass
+            time.sleep(self.poll_interval)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "versions": dict(self._versions),
+            "listening": self._listening,
+            "bumps": self.bumps,
+            "notifications": self.notifications,
+            "errors": self.errors,
+        }
+
+
+# 싱글톤 인스턴스
+cache_versions = CacheVersionService()
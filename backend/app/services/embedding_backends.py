@@ -0,0 +1,228 @@
+"""
+임베딩 백엔드
+QdrantService가 사용하는 임베딩 모델을 교체 가능하게 분리 (품질 ↔ 속도 선택)
+
+EMBEDDING_MODEL 형식:
+    <FastEmbed 모델 이름>                  FastEmbed (기본, 예: sentence-transformers/paraphrase-multilingual-mpnet-base-v2)
+    onnx:<모델 디렉토리>                   로컬 ONNX 모델 (model.onnx 또는 int8 양자화 model_quantized.onnx + tokenizer.json)
+    ollama:<모델 이름>                     Ollama /api/embed (예: ollama:nomic-embed-text)
+
+벡터 차원은 모델에서 추론한다.
+"""
+import json
+import os
+from typing import Iterator, List, Optional, Tuple
+
+import httpx
+import numpy as np
+
+# fastembed / onnxruntime / tokenizers는 해당 백엔드를 사용할 때만 import
+
+
+class EmbeddingBackend:
+    """임베딩 백엔드 공통 인터페이스"""
+
+    name = "base"
+
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+        self._dimension: Optional[int] = None
+
+    def embed(self, texts: List[str], batch_size: int = 32) -> Iterator[np.ndarray]:
+        """텍스트별 float32 임베딩 (L2 정규화)"""
+        raise NotImplementedError
+
+    @property
+    def dimension(self) -> int:
+        """벡터 차원 (기본 구현: 더미 임베딩 1회)"""
+        if self._dimension is None:
+            self._dimension = len(next(iter(self.embed(["dimension"]))))
+        return self._dimension
+
+
+class FastEmbedBackend(EmbeddingBackend):
+    """FastEmbed TextEmbedding (FASTEMBED_CACHE_PATH에서 오프라인 로드)"""
+
+    name = "fastembed"
+
+    def __init__(self, model_name: str, cache_dir: str, threads: Optional[int] = None):
+        super().__init__(model_name)
+        from fastembed import TextEmbedding
+
+        # FastEmbed 임베딩 모델 로드 (경량, 다국어 지원)
+        # 캐시 경로가 설정되어 있으면 해당 경로에서 모델 로드
+        try:
+            self._model = TextEmbedding(model_name=model_name, cache_dir=cache_dir, threads=threads)
+            print(f"✅ FastEmbed 모델 로드 성공: {model_name}")
+            print(f"   캐시 디렉토리: {cache_dir}")
+        except Exception as e:
+            print(f"❌ FastEmbed 모델 로드 실패: {e}")
+            print(f"   캐시 디렉토리: {cache_dir}")
+            print(f"   캐시 내용 확인:")
+            if os.path.exists(cache_dir):
+                import subprocess
+                result = subprocess.run(["find", cache_dir, "-type", "f"],
+                                        capture_output=True, text=True)
+                print(result.stdout)
+            raise
+
+        self._dimension = self.supported_dimension(model_name)
+
+    def embed(self, texts: List[str], batch_size: int = 32) -> Iterator[np.ndarray]:
+        return self._model.embed(texts, batch_size=batch_size)
+
+    @staticmethod
+    def supported_dimension(model_name: str) -> Optional[int]:
+        """FastEmbed 지원 모델 목록의 벡터 차원 (모델을 로드하지 않음)"""
+        from fastembed import TextEmbedding
+
+        for description in TextEmbedding.list_supported_models():
+            if description["model"].lower() == model_name.lower():
+                return int(description["dim"])
+        return None
+
+
+class OnnxEmbeddingBackend(EmbeddingBackend):
+    """
+    로컬 ONNX 임베딩 모델 (sentence-transformers를 ONNX로 내보낸 디렉토리)
+
+    model_quantized.onnx(int8)가 있으면 우선 사용한다 (python -m app.cli quantize-embedding-model로 생성).
+    풀링 방식은 1_Pooling/config.json(sentence-transformers 형식)을 따르고, 없으면 EMBEDDING_POOLING(기본 mean).
+    """
+
+    name = "onnx"
+
+    # 모델 디렉토리에서 찾을 ONNX 파일 (앞에 있을수록 우선)
+    MODEL_FILES = ("model_quantized.onnx", "model.onnx", "onnx/model_quantized.onnx", "onnx/model.onnx")
+
+    def __init__(self, model_path: str, threads: Optional[int] = None):
+        super().__init__(model_path)
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+
+        self.model_path = model_path
+        self.max_length = int(os.getenv("EMBEDDING_MAX_LENGTH", "512"))
+        self.pooling = self._read_pooling(model_path)
+
+        model_file = self.find_model_file(model_path)
+        options = ort.SessionOptions()
+        if threads:
+            options.intra_op_num_threads = threads
+        self._session = ort.InferenceSession(model_file, sess_options=options, providers=["CPUExecutionProvider"])
+        self._input_names = [model_input.name for model_input in self._session.get_inputs()]
+
+        tokenizer = Tokenizer.from_file(os.path.join(model_path, "tokenizer.json"))
+        tokenizer.enable_truncation(max_length=self.max_length)
+        tokenizer.enable_padding()
+        self._tokenizer = tokenizer
+
+        output_dim = self._session.get_outputs()[0].shape[-1]
+        if isinstance(output_dim, int):
+            self._dimension = output_dim
+        print(f"✅ ONNX 임베딩 모델 로드 성공: {model_file} (pooling={self.pooling})")
+
+    @classmethod
+    def find_model_file(cls, model_path: str) -> str:
+        for name in cls.MODEL_FILES:
+            path = os.path.join(model_path, name)
+            if os.path.exists(path):
+                return path
+        raise FileNotFoundError(f"ONNX 임베딩 모델을 찾을 수 없습니다: {model_path}")
+
+    @staticmethod
+    def _read_pooling(model_path: str) -> str:
+        config_path = os.path.join(model_path, "1_Pooling", "config.json")
+        if os.path.exists(config_path):
+            with open(config_path, encoding="utf-8") as f:
+                config = json.load(f)
+            if config.get("pooling_mode_cls_token"):
+                return "cls"
+            return "mean"
+        return os.getenv("EMBEDDING_POOLING", "mean").lower()
+
+    def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        encodings = self._tokenizer.encode_batch(texts)
+        input_ids = np.array([e.ids for e in encodings], dtype=np.int64)
+        attention_mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+        features = {
+            "input_ids": input_ids,
+            "attention_mask": attention_mask,
+            "token_type_ids": np.zeros_like(input_ids),
+        }
+        output = self._session.run(None, {name: features[name] for name in self._input_names})[0]
+        if output.ndim == 3:
+            # 토큰 임베딩 (batch, seq, dim) → 문장 임베딩
+            if self.pooling == "cls":
+                output = output[:, 0]
+            else:
+                mask = attention_mask[:, :, None].astype(np.float32)
+                output = (output * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+        output = output.astype(np.float32)
+        return output / np.maximum(np.linalg.norm(output, axis=1, keepdims=True), 1e-12)
+
+    def embed(self, texts: List[str], batch_size: int = 32) -> Iterator[np.ndarray]:
+        for start in range(0, len(texts), batch_size):
+            yield from self._embed_batch(texts[start:start + batch_size])
+
+
+class OllamaEmbeddingBackend(EmbeddingBackend):
+    """Ollama /api/embed (LLM과 같은 Ollama 서버의 임베딩 모델 사용)"""
+
+    name = "ollama"
+
+    def __init__(self, model_name: str):
+        super().__init__(model_name)
+        self.base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+        self.keep_alive = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+        self._client = httpx.Client(timeout=120.0)
+        # 모델이 없으면 여기서 실패하도록 차원 확인
+        print(f"✅ Ollama 임베딩 모델 연결: {model_name} (dim={self.dimension})")
+
+    def embed(self, texts: List[str], batch_size: int = 32) -> Iterator[np.ndarray]:
+        for start in range(0, len(texts), batch_size):
+            response = self._client.post(f"{self.base_url}/api/embed", json={
+                "model": self.model_name,
+                "input": texts[start:start + batch_size],
+                "keep_alive": self.keep_alive,
+            })
+            response.raise_for_status()
+            for embedding in response.json()["embeddings"]:
+                vector = np.asarray(embedding, dtype=np.float32)
+                yield vector / (np.linalg.norm(vector) or 1.0)
+
+
+BACKENDS = ("fastembed", "onnx", "ollama")
+
+
+def parse_model_spec(spec: str) -> Tuple[str, str]:
+    """EMBEDDING_MODEL 값을 (백엔드, 모델) 로 분리 (접두어가 없으면 FastEmbed)"""
+    prefix, separator, rest = spec.partition(":")
+    if separator and prefix.lower() in BACKENDS:
+        return prefix.lower(), rest
+    return "fastembed", spec
+
+
+def create_embedding_backend(spec: str, cache_dir: str, threads: Optional[int] = None) -> EmbeddingBackend:
+    """
+    EMBEDDING_MODEL 형식의 모델 지정으로 임베딩 백엔드 생성 (모델 로드 포함)
+
+    Args:
+        spec: 모델 지정 (모듈 docstring 참고)
+        cache_dir: FastEmbed 캐시 경로 (onnx: 상대 경로의 기준 디렉토리)
+        threads: ONNX 추론 스레드 수 (Ollama는 서버 설정을 따름)
+    """
+    backend, model = parse_model_spec(spec)
+    if backend == "onnx":
+        path = model if os.path.isabs(model) else os.path.join(cache_dir, model)
+        return OnnxEmbeddingBackend(path, threads=threads)
+    if backend == "ollama":
+        return OllamaEmbeddingBackend(model)
+    return FastEmbedBackend(model, cache_dir, threads=threads)
+
+
+def known_dimension(spec: str) -> Optional[int]:
+    """모델을 로드하지 않고 알 수 있는 벡터 차원 (FastEmbed 지원 모델만, 그 외 None)"""
+    backend, model = parse_model_spec(spec)
+    if backend == "fastembed":
+        return FastEmbedBackend.supported_dimension(model)
+    return None
@@ -0,0 +1,195 @@
+"""
+쿼리 임베딩 캐시
+모델명 + 정규화된 텍스트를 키로 float32 벡터를 저장
+- 1차: 메모리 LRU (바이트 크기 기반 제거)
+- 2차 (선택): 메모리 맵 파일 기반 영구 캐시 (재시작/워커 간 공유)
+"""
+import hashlib
+import os
+import re
+import threading
+import unicodedata
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from app.utils.lru_cache import SizedLRUCache
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """
+    캐시 키용 텍스트 정규화
+    유니코드 NFKC 정규화 + 공백 축약 (대소문자는 임베딩 결과에 영향이 있어 유지)
+    """
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+
+class MmapEmbeddingTier:
+    """
+    메모리 맵 파일 기반 고정 크기 임베딩 캐시 (direct-mapped)
+
+    키 해시로 슬롯을 결정하고 충돌 시 덮어쓴다.
+    - {prefix}.keys: 슬롯별 SHA-256 키 (32 bytes)
+    - {prefix}.vecs: 슬롯별 float32 벡터
+    """
+
+    KEY_SIZE = 32
+
+    def __init__(self, cache_dir: str, model_name: str, dim: int, slots: int):
+        os.makedirs(cache_dir, exist_ok=True)
+        slug = re.sub(r"[^A-Za-z0-9_.-]", "_", model_name)
+        prefix = os.path.join(cache_dir, f"{slug}-{dim}-{slots}")
+        self.dim = dim
+        self.slots = slots
+        self._lock = threading.Lock()
+        self._keys = self._open(f"{prefix}.keys", np.uint8, (slots, self.KEY_SIZE))
+        self._vecs = self._open(f"{prefix}.vecs", np.float32, (slots, dim))
+
+    @staticmethod
+    def _open(path: str, dtype, shape: Tuple[int, int]) -> np.memmap:
+        mode = "r+" if os.path.exists(path) else "w+"
+        return np.memmap(path, dtype=dtype, mode=mode, shape=shape)
+
+    def _slot(self, key: bytes) -> int:
+        return int.from_bytes(key[:8], "little") % self.slots
+
+    def get(self, key: bytes) -> Optional[np.ndarray]:
+        slot = self._slot(key)
+        key_arr = np.frombuffer(key, dtype=np.uint8)
+        if not np.array_equal(self._keys[slot], key_arr):
+            return None
+        vector = np.array(self._vecs[slot], dtype=np.float32)
+        # 읽는 도중 다른 워커가 슬롯을 덮어썼으면 무효 처리
+        if not np.array_equal(self._keys[slot], key_arr):
+            return None
+        return vector
+
+    def put(self, key: bytes, vector: np.ndarray) -> None:
+        if vector.shape[0] != self.dim:
+            return
+        slot = self._slot(key)
+        with self._lock:
+            # 키를 먼저 비우고 벡터 → 키 순서로 기록 (부분 기록된 슬롯이 히트되지 않도록)
+            self._keys[slot] = 0
+            self._vecs[slot] = vector
+            self._keys[slot] = np.frombuffer(key, dtype=np.uint8)
+
+    def flush(self) -> None:
+        self._vecs.flush()
+        self._keys.flush()
+
+
+class EmbeddingCache:
+    """쿼리 임베딩 캐시 (메모리 LRU + 선택적 mmap 영구 계층)"""
+
+    def __init__(
+        self,
+        max_bytes: Optional[int] = None,
+        cache_dir: Optional[str] = None,
+        disk_slots: Optional[int] = None
+    ):
+        if max_bytes is None:
+            max_bytes = int(float(os.getenv("EMBEDDING_CACHE_MAX_MB", "64")) * 1024 * 1024)
+        self.cache_dir = cache_dir if cache_dir is not None else os.getenv("EMBEDDING_CACHE_DIR", "")
+        self.disk_slots = disk_slots or int(os.getenv("EMBEDDING_CACHE_DISK_SLOTS", "16384"))
+
+        self._memory = SizedLRUCache(max_bytes=max_bytes, sizeof=lambda v: v.nbytes)
+        self._disk_tiers: Dict[str, MmapEmbeddingTier] = {}
+        self._disk_lock = threading.Lock()
+        self.disk_hits = 0
+        self.disk_misses = 0
+
+    @staticmethod
+    def make_key(model_name: str, text: str) -> bytes:
+        """모델명 + 정규화 텍스트 기반 캐시 키 (SHA-256)"""
+        raw = f"{model_name}\x00{normalize_text(text)}"
+        return hashlib.sha256(raw.encode("utf-8")).digest()
+
+    def _disk_tier(self, model_name: str, dim: Optional[int] = None) -> Optional[MmapEmbeddingTier]:
+        """
+        모델별 영구 캐시 계층 조회/생성
+
+        dim이 없으면 기존 캐시 파일에서 차원을 찾아 연다 (재시작 후 조회용).
+        """
+        if not self.cache_dir:
+            return None
+        tier = self._disk_tiers.get(model_name)
+        if tier is not None and (dim is None or tier.dim == dim):
+            return tier
+
+        with self._disk_lock:
+            tier = self._disk_tiers.get(model_name)
+            if tier is not None and (dim is None or tier.dim == dim):
+                return tier
+            if dim is None:
+                dim = self._find_disk_dim(model_name)
+                if dim is None:
+                    return None
+            try:
+                tier = MmapEmbeddingTier(self.cache_dir, model_name, dim, self.disk_slots)
+            except OSError as e:
+                print(f"⚠️  임베딩 영구 캐시 초기화 실패 (메모리 캐시만 사용): {e}")
+                self.cache_dir = ""
+                return None
+            self._disk_tiers[model_name] = tier
+            return tier
+
+    def _find_disk_dim(self, model_name: str) -> Optional[int]:
+        """기존 캐시 파일명({slug}-{dim}-{slots}.keys)에서 벡터 차원 추출"""
+        slug = re.sub(r"[^A-Za-z0-9_.-]", "_", model_name)
+        suffix = f"-{self.disk_slots}.keys"
+        try:
+            for name in os.listdir(self.cache_dir):
+                if name.startswith(f"{slug}-") and name.endswith(suffix):
+                    dim = name[len(slug) + 1:-len(suffix)]
+                    if dim.isdigit():
+                        return int(dim)
+        except OSError:
+            return None
+        return None
+
+    def get(self, model_name: str, text: str) -> Optional[np.ndarray]:
+        """캐시된 임베딩 조회 (메모리 → 디스크 순)"""
+        key = self.make_key(model_name, text)
+        vector = self._memory.get(key)
+        if vector is not None:
+            return vector
+
+        tier = self._disk_tier(model_name)
+        if tier is None:
+            return None
+        vector = tier.get(key)
+        if vector is None:
+            self.disk_misses += 1
+            return None
+        self.disk_hits += 1
+        self._memory.put(key, vector)
+        return vector
+
+    def put(self, model_name: str, text: str, vector: Any) -> np.ndarray:
+        """임베딩 저장 (float32로 변환 후 메모리/디스크에 기록)"""
+        vector = np.ascontiguousarray(vector, dtype=np.float32)
+        key = self.make_key(model_name, text)
+        self._memory.put(key, vector)
+
+        tier = self._disk_tier(model_name, vector.shape[0])
+        if tier is not None:
+            tier.put(key, vector)
+        return vector
+
+    def clear(self) -> None:
+        """메모리 캐시 비우기 (영구 계층은 유지)"""
+        self._memory.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 히트율 및 사용량 통계"""
+        stats = self._memory.get_stats()
+        lookups = stats["hits"] + stats["misses"]
+        stats["disk_enabled"] = bool(self.cache_dir)
+        stats["disk_hits"] = self.disk_hits
+        stats["disk_misses"] = self.disk_misses
+        stats["overall_hit_rate"] = round((stats["hits"] + self.disk_hits) / lookups, 4) if lookups else 0.0
+        return stats
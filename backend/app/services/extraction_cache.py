@@ -0,0 +1,189 @@
+"""
+문서 텍스트 추출 캐시
+파일 내용 SHA-256 + 추출기 버전을 키로 추출 결과(페이지/문단/블록 조각 또는 XLSX 행 레코드)를
+디스크에 gzip JSON Lines로 저장한다. 같은 파일을 다시 색인하면(삭제 후 재업로드, 일괄 업로드 재처리 등)
+PDF/XLSX 파싱을 건너뛰고 저장된 조각을 순차로 읽는다.
+
+- 추출이 끝까지 완료된 경우에만 캐시 파일을 확정 (중간 실패/중단 시 임시 파일 삭제)
+- EXTRACTION_CACHE_MAX_MB를 넘으면 가장 오래 사용하지 않은 파일부터 삭제
+"""
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, Optional, Union
+
+from app.utils.text_extractor import TextExtractor
+
+
+class ExtractionCache:
+    """파일 내용 해시 기반 추출 결과 디스크 캐시"""
+
+    SUFFIX = ".jsonl.gz"
+
+    def __init__(self):
+        # 캐시 디렉토리 (빈 값이면 캐시 사용 안 함, 재시작 후에도 유지되도록 볼륨 마운트 권장)
+        self.cache_dir = os.getenv("EXTRACTION_CACHE_DIR", "/app/extraction_cache")
+        self.max_bytes = int(float(os.getenv("EXTRACTION_CACHE_MAX_MB", "1024")) * 1024 * 1024)
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.cache_dir)
+
+    def cache_key(self, content_hash: str, filename: str, kind: str) -> str:
+        """
+        캐시 키 (SHA-256)
+
+        추출 결과에 영향을 주는 값(추출기 버전, 확장자, 레코드 묶음 행 수)을 모두 포함한다.
+        """
+        parts = [
+            content_hash,
+            TextExtractor.EXTRACTOR_VERSION,
+            TextExtractor.get_extension(filename),
+            kind,
+            str(TextExtractor.XLSX_ROWS_PER_RECORD) if kind == "records" else "",
+        ]
+        return hashlib.sha256("\x00".join(parts).encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key + self.SUFFIX)
+
+    # ===== 조회/저장 =====
+
+    def iter_text(self, file: Union[BinaryIO, bytes], filename: str, content_hash: str) -> Iterator[str]:
+        """
+        TextExtractor.iter_text()와 같은 텍스트 조각 스트림 (캐시 우선)
+
+        Args:
+            file: 파일 객체
+            filename: 파일명 (확장자 확인용)
+            content_hash: 파일 SHA-256
+        """
+        if not self.enabled:
+            return TextExtractor.iter_text(file, filename)
+        return self._cached(self.cache_key(content_hash, filename, "text"),
+                            lambda: TextExtractor.iter_text(file, filename))
+
+    def iter_records(
+        self, file: Union[BinaryIO, bytes], filename: str, content_hash: str
+    ) -> Optional[Iterator[Dict[str, Any]]]:
+        """TextExtractor.iter_records()와 같은 행 레코드 스트림 (캐시 우선, 표 형식이 아니면 None)"""
+        if TextExtractor.get_extension(filename) not in TextExtractor.TABULAR_EXTENSIONS:
+            return None
+        if not self.enabled:
+            return TextExtractor.iter_records(file, filename)
+        return self._cached(self.cache_key(content_hash, filename, "records"),
+                            lambda: TextExtractor.iter_records(file, filename))
+
+    def _cached(self, key: str, extract) -> Iterator[Any]:
+        path = self._path(key)
+        try:
+            # 파일을 여기서 열어 두어야 읽는 도중 다른 워커가 제거해도 끝까지 읽을 수 있음
+            f = gzip.open(path, "rt", encoding="utf-8")
+        except OSError:
+            # 캐시 없음 (또는 다른 워커가 방금 제거)
+            pass
+        else:
+            try:
+                # 최근 사용 시각 갱신 (용량 초과 시 제거 순서)
+                os.utime(path)
+            except OSError:
+                pass
+            self.hits += 1
+            return self._read(f)
+
+        self.misses += 1
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp_", suffix=self.SUFFIX)
+            os.close(fd)
+        except OSError as e:
+            # 디렉토리 권한/용량 문제: 캐시 없이 추출
+            print(f"⚠️  [extraction-cache] 캐시 파일 생성 실패, 캐시 없이 추출: {e}")
+            return extract()
+        return self._write_through(path, temp_path, extract())
+
+    @staticmethod
+    def _read(f) -> Iterator[Any]:
+        with f:
+            for line in f:
+                yield json.loads(line)
+
+    def _write_through(self, path: str, temp_path: str, items: Iterable[Any]) -> Iterator[Any]:
+        """추출 결과를 그대로 생성하면서 임시 파일에 기록하고, 끝까지 완료되면 캐시 파일로 확정"""
+        completed = False
+        try:
+            with gzip.open(temp_path, "wt", encoding="utf-8") as f:
+                for item in items:
+                    f.write(json.dumps(item, ensure_ascii=False, default=str))
+                    f.write("\n")
+                    yield item
+            completed = True
+        finally:
+            if completed:
+                os.replace(temp_path, path)
+                self.writes += 1
+                self._account(os.path.getsize(path))
+            else:
+                os.remove(temp_path)
+
+    # ===== 용량 관리 =====
+
+    def _entries(self):
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith(self.SUFFIX) and not name.startswith(".tmp_"):
+                    path = os.path.join(root, name)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    yield path, stat.st_size, stat.st_mtime
+
+    def _account(self, added: int) -> None:
+        """새 캐시 파일 크기를 반영하고 최대 크기를 넘으면 오래된 파일부터 제거"""
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _, size, _ in self._entries())
+            else:
+                self._total_bytes += added
+            if self._total_bytes <= self.max_bytes:
+                return
+            # 다른 워커가 쓴 파일도 포함하도록 디렉토리를 다시 읽어 계산
+            entries = sorted(self._entries(), key=lambda entry: entry[2])
+            total = sum(size for _, size, _ in entries)
+            for path, size, _ in entries:
+                if total <= self.max_bytes * 0.9:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                self.evictions += 1
+            self._total_bytes = total
+
+    def get_stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+
+# 싱글톤 인스턴스
+extraction_cache = ExtractionCache()
@@ -0,0 +1,283 @@
+"""
+문서 일괄 수집(ingestion) 작업 큐
+여러 파일/ZIP 업로드를 작업(job)으로 등록하고 워커 풀에서 백그라운드로 처리
+작업/파일 상태는 PostgreSQL에 저장되어 서버 재시작 후 미완료 파일을 이어서 처리
+"""
+import os
+import shutil
+import uuid
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlmodel import Session, select, func, update
+
+from app.database import engine
+from app.models.ingest_job import IngestJob, IngestJobFile
+from app.services.ingestion_service import ingestion_service
+from app.utils.text_extractor import TextExtractor
+
+
+# 지원하는 문서 확장자 (ZIP 내부 파일 필터링용)
+SUPPORTED_EXTENSIONS = {"pdf", "docx", "doc", "txt", "xlsx", "xls"}
+
+
+class IngestJobQueue:
+    """일괄 업로드 작업을 워커 풀로 처리하는 큐"""
+
+    def __init__(self):
+        # 작업 파일 보관 디렉토리 (재시작 후 재처리를 위해 영구 볼륨 권장)
+        self.spool_dir = os.getenv("INGEST_SPOOL_DIR", "/app/ingest_spool")
+        self.workers = int(os.getenv("INGEST_WORKERS", "2"))
+        # running 상태로 이 시간 이상 갱신되지 않은 파일은 중단된 것으로 보고 재처리
+        self.stale_seconds = int(os.getenv("INGEST_STALE_SECONDS", "600"))
+        # ZIP 압축 해제 최대 크기 (압축 폭탄 방지)
+        self.max_archive_bytes = int(float(os.getenv("MAX_ARCHIVE_EXTRACT_MB", "2048")) * 1024 * 1024)
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="ingest")
+        return self._executor
+
+    def shutdown(self) -> None:
+        """워커 풀 종료 (처리 중인 파일은 재시작 시 재처리됨)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    # ===== 작업 등록 =====
+
+    def job_dir(self, job_id: str) -> str:
+        return os.path.join(self.spool_dir, job_id)
+
+    def new_job_id(self) -> str:
+        job_id = uuid.uuid4().hex
+        os.makedirs(self.job_dir(job_id), exist_ok=True)
+        return job_id
+
+    @staticmethod
+    def is_supported(filename: str) -> bool:
+        return TextExtractor.get_extension(filename) in SUPPORTED_EXTENSIONS
+
+    @staticmethod
+    def _zip_member_name(info: zipfile.ZipInfo) -> str:
+        """ZIP 내부 파일명 (UTF-8 플래그가 없으면 CP949로 재해석 - 한글 윈도우 압축 파일)"""
+        if info.flag_bits & 0x800:
+            return info.filename
+        try:
+            return info.filename.encode("cp437").decode("cp949")
+        except (UnicodeEncodeError, UnicodeDecodeError):
+            return info.filename
+
+    def expand_archive(self, job_id: str, archive_path: str) -> Tuple[List[Tuple[str, str, int]], List[str]]:
+        """
+        ZIP 파일을 작업 디렉토리에 풀어 지원 형식 파일만 반환
+
+        Returns:
+            ([(파일명, 경로, 크기)], [제외된 파일명])
+        """
+        files, skipped = [], []
+        extracted_bytes = 0
+        try:
+            with zipfile.ZipFile(archive_path) as archive:
+                for index, info in enumerate(archive.infolist()):
+                    if info.is_dir():
+                        continue
+                    name = self._zip_member_name(info)
+                    basename = os.path.basename(name)
+                    if name.startswith("__MACOSX/") or basename.startswith("."):
+                        continue
+                    if not self.is_supported(basename):
+                        skipped.append(name)
+                        continue
+
+                    extracted_bytes += info.file_size
+                    if extracted_bytes > self.max_archive_bytes:
+                        raise ValueError("압축 해제 크기가 최대 허용 크기를 초과합니다")
+
+                    # 경로 조작 방지: 디렉토리 구조는 버리고 순번 + 확장자로 저장
+                    target = os.path.join(self.job_dir(job_id), f"{index:06d}.{TextExtractor.get_extension(basename)}")
+                    with archive.open(info) as source, open(target, "wb") as dest:
+                        shutil.copyfileobj(source, dest, 1024 * 1024)
+                    files.append((name, target, info.file_size))
+        except zipfile.BadZipFile as e:
+            raise ValueError(f"ZIP 파일을 읽을 수 없습니다: {str(e)}")
+        return files, skipped
+
+    def create_job(self, job_id: str, files: List[Tuple[str, str, int]]) -> IngestJob:
+        """
+        작업과 파일 목록을 DB에 등록하고 워커 풀에 제출
+
+        Args:
+            job_id: new_job_id()로 생성한 작업 ID
+            files: [(파일명, 작업 디렉토리 내 경로, 크기)]
+        """
+        with Session(engine) as session:
+            job = IngestJob(id=job_id, status="pending", total_files=len(files))
+            session.add(job)
+            session.flush()
+            file_rows = [
+                IngestJobFile(job_id=job_id, filename=filename, spool_path=path, file_size=size)
+                for filename, path, size in files
+            ]
+            session.add_all(file_rows)
+            session.commit()
+            session.refresh(job)
+            file_ids = [row.id for row in file_rows]
+
+        for file_id in file_ids:
+            self.executor.submit(self._process_file, file_id)
+        return job
+
+    # ===== 작업 처리 =====
+
+    def _claim_file(self, session: Session, file_id: int) -> Optional[IngestJobFile]:
+        """pending 상태인 파일을 running으로 변경 (여러 워커/프로세스 간 중복 처리 방지)"""
+        result = session.exec(
+            update(IngestJobFile)
+            .where(IngestJobFile.id == file_id, IngestJobFile.status == "pending")
+            .values(status="running", attempts=IngestJobFile.attempts + 1, updated_at=datetime.utcnow())
+        )
+        session.commit()
+        if result.rowcount != 1:
+            return None
+        return session.get(IngestJobFile, file_id)
+
+    def _process_file(self, file_id: int) -> None:
+        """파일 1개 처리 (워커 스레드에서 실행)"""
+        try:
+            self._process_file_inner(file_id)
+        except Exception as e:
+            # DB 오류 등: 파일은 running 상태로 남고 INGEST_STALE_SECONDS 이후 resume()에서 재처리
+            print(f"❌ [ingest] 파일 {file_id} 처리 중 오류: {e}")
+
+    def _process_file_inner(self, file_id: int) -> None:
+        with Session(engine) as session:
+            job_file = self._claim_file(session, file_id)
+            if job_file is None:
+                return
+            self._refresh_job(session, job_file.job_id)
+
+            try:
+                result = ingestion_service.ingest_file(
+                    job_file.spool_path, job_file.filename, job_file.file_size
+                )
+                job_file.status = "completed"
+                job_file.doc_id = result["doc_id"]
+                job_file.chunk_count = result["chunk_count"]
+                job_file.error = None
+            except Exception as e:
+                job_file.status = "failed"
+                job_file.error = str(e)
+                print(f"⚠️  [ingest] {job_file.filename} 처리 실패: {e}")
+
+            job_file.updated_at = datetime.utcnow()
+            session.add(job_file)
+            session.commit()
+
+            if job_file.status == "completed" and os.path.exists(job_file.spool_path):
+                os.remove(job_file.spool_path)
+            self._refresh_job(session, job_file.job_id)
+
+    def _refresh_job(self, session: Session, job_id: str) -> None:
+        """파일 상태를 집계하여 작업 진행률/상태 갱신"""
+        counts = dict(session.exec(
+            select(IngestJobFile.status, func.count())
+            .where(IngestJobFile.job_id == job_id)
+            .group_by(IngestJobFile.status)
+        ).all())
+
+        job = session.get(IngestJob, job_id)
+        if job is None:
+            return
+        completed = counts.get("completed", 0)
+        failed = counts.get("failed", 0)
+        in_progress = counts.get("pending", 0) + counts.get("running", 0)
+
+        job.processed_files = completed
+        job.failed_files = failed
+        if in_progress:
+            job.status = "running" if counts.get("running", 0) or completed or failed else "pending"
+        elif failed and completed:
+            job.status = "partial"
+        elif failed:
+            job.status = "failed"
+        else:
+            job.status = "completed"
+        job.updated_at = datetime.utcnow()
+        session.add(job)
+        session.commit()
+
+        if not in_progress and not failed:
+            shutil.rmtree(self.job_dir(job_id), ignore_errors=True)
+
+    def retry_failed(self, job_id: str) -> int:
+        """
+        실패한 파일을 다시 처리 대기열에 등록
+
+        Returns:
+            재시도 등록된 파일 수 (임시 파일이 남아있는 파일만)
+        """
+        with Session(engine) as session:
+            failed_files = session.exec(
+                select(IngestJobFile).where(IngestJobFile.job_id == job_id, IngestJobFile.status == "failed")
+            ).all()
+
+            retry_ids = []
+            for job_file in failed_files:
+                if not os.path.exists(job_file.spool_path):
+                    continue
+                job_file.status = "pending"
+                job_file.updated_at = datetime.utcnow()
+                session.add(job_file)
+                retry_ids.append(job_file.id)
+            session.commit()
+            if retry_ids:
+                self._refresh_job(session, job_id)
+
+        for file_id in retry_ids:
+            self.executor.submit(self._process_file, file_id)
+        return len(retry_ids)
+
+    def resume(self) -> int:
+        """
+        서버 시작 시 미완료 파일을 다시 대기열에 등록
+        (running 상태로 오래 갱신되지 않은 파일은 중단된 것으로 간주)
+
+        Returns:
+            재등록된 파일 수
+        """
+        stale_before = datetime.utcnow() - timedelta(seconds=self.stale_seconds)
+        with Session(engine) as session:
+            session.exec(
+                update(IngestJobFile)
+                .where(IngestJobFile.status == "running", IngestJobFile.updated_at < stale_before)
+                .values(status="pending", updated_at=datetime.utcnow())
+            )
+            session.commit()
+            pending_ids = session.exec(
+                select(IngestJobFile.id).where(IngestJobFile.status == "pending").order_by(IngestJobFile.id)
+            ).all()
+
+        for file_id in pending_ids:
+            self.executor.submit(self._process_file, file_id)
+        if pending_ids:
+            print(f"✅ [ingest] 미완료 파일 {len(pending_ids)}개 재처리 등록")
+        return len(pending_ids)
+
+    # ===== 조회 =====
+
+    @staticmethod
+    def job_to_dict(job: IngestJob) -> Dict[str, Any]:
+        done = job.processed_files + job.failed_files
+        return {
+            **job.model_dump(),
+            "progress": round(done / job.total_files, 4) if job.total_files else 1.0,
+        }
+
+
+# 싱글톤 인스턴스
+ingest_queue = IngestJobQueue()
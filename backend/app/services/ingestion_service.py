@@ -0,0 +1,228 @@
+"""
+문서 수집(ingestion) 서비스
+업로드 파일을 임시 파일로 스풀링한 뒤 추출 → 청크 분할 → 임베딩/저장을
+스트리밍으로 처리하여 파일 크기와 무관하게 메모리 사용량을 제한
+"""
+import hashlib
+import itertools
+import os
+import tempfile
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import UploadFile
+
+from app.services.extraction_cache import extraction_cache
+from app.services.vector_store import vector_store
+from app.utils.text_extractor import TextExtractor
+
+
+class UploadTooLargeError(Exception):
+    """업로드 파일이 최대 허용 크기를 초과한 경우"""
+
+
+class DocumentIngestionService:
+    """업로드 파일을 스트리밍 방식으로 벡터 DB에 저장하는 서비스"""
+
+    # 업로드 스트림 읽기 단위 (bytes)
+    SPOOL_BLOCK_SIZE = 1024 * 1024
+
+    def __init__(self):
+        self.vector_store = vector_store
+        self.extraction_cache = extraction_cache
+        self.max_upload_bytes = int(float(os.getenv("MAX_UPLOAD_SIZE_MB", "100")) * 1024 * 1024)
+        # 임시 파일 경로 (비워두면 시스템 기본 임시 디렉토리)
+        self.spool_dir = os.getenv("UPLOAD_SPOOL_DIR") or None
+
+    async def spool_upload(self, file: UploadFile) -> Tuple[str, int, str]:
+        """
+        업로드 스트림을 블록 단위로 임시 파일에 저장 (최대 크기 검사, SHA-256 계산 포함)
+
+        Args:
+            file: 업로드 파일
+
+        Returns:
+            (임시 파일 경로, 파일 크기, 파일 SHA-256)
+
+        Raises:
+            UploadTooLargeError: 최대 업로드 크기 초과
+        """
+        suffix = os.path.splitext(file.filename or "")[1]
+        fd, path = tempfile.mkstemp(prefix="upload_", suffix=suffix, dir=self.spool_dir)
+        size = 0
+        digest = hashlib.sha256()
+        try:
+            with os.fdopen(fd, "wb") as spool:
+                while True:
+                    block = await file.read(self.SPOOL_BLOCK_SIZE)
+                    if not block:
+                        break
+                    size += len(block)
+                    if size > self.max_upload_bytes:
+                        raise UploadTooLargeError(
+                            f"파일 크기가 최대 허용 크기({self.max_upload_bytes // (1024 * 1024)}MB)를 초과합니다"
+                        )
+                    digest.update(block)
+                    spool.write(block)
+        except BaseException:
+            os.remove(path)
+            raise
+        return path, size, digest.hexdigest()
+
+    @classmethod
+    def file_sha256(cls, path: str) -> str:
+        """파일 SHA-256 (블록 단위로 읽어 계산)"""
+        digest = hashlib.sha256()
+        with open(path, "rb") as file:
+            while True:
+                block = file.read(cls.SPOOL_BLOCK_SIZE)
+                if not block:
+                    break
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _resolve_doc_id(
+        self,
+        filename: str,
+        content_hash: str,
+        applicant_id: Optional[int] = None,
+        replace_doc_id: Optional[str] = None,
+        replace: bool = False
+    ) -> Tuple[str, bool]:
+        """
+        업로드 파일의 문서 ID 결정
+
+        기존 문서의 새 버전으로 처리하는 것은 호출 측이 명시한 경우뿐이다.
+        (파일명만 같은 다른 지원자의 문서, 예: 여러 지원자의 "이력서.pdf"를 덮어쓰지 않도록)
+
+        Args:
+            applicant_id: 업로드 파일의 지원자 ID
+            replace_doc_id: 교체할 문서 ID
+            replace: True면 같은 지원자 + 같은 파일명의 문서를 교체
+
+        Returns:
+            (문서 ID, 기존 문서 갱신 여부)
+            교체 대상이 없으면 파일 내용 해시로 새 문서 ID를 만든다.
+
+        Raises:
+            ValueError: replace_doc_id 문서가 없는 경우
+        """
+        if replace_doc_id:
+            if not self.vector_store.document_exists(replace_doc_id):
+                raise ValueError(f"교체할 문서를 찾을 수 없습니다: {replace_doc_id}")
+            return replace_doc_id, True
+
+        if replace:
+            previous = self.vector_store.find_document_by_filename(filename, applicant_id=applicant_id)
+            if previous:
+                return previous["doc_id"], True
+
+        doc_id = content_hash[:32]
+        if self.vector_store.document_exists(doc_id):
+            # 같은 내용으로 만들어진 문서가 이후 다른 내용으로 갱신된 경우
+            doc_id = uuid.uuid4().hex
+        return doc_id, False
+
+    def ingest_file(
+        self,
+        path: str,
+        filename: str,
+        file_size: int,
+        metadata: Optional[Dict[str, Any]] = None,
+        content_hash: Optional[str] = None,
+        replace_doc_id: Optional[str] = None,
+        replace: bool = False
+    ) -> Dict[str, Any]:
+        """
+        스풀링된 파일을 추출 → 청크 분할 → 배치 임베딩/업서트 (동기, 스레드풀에서 호출)
+
+        같은 지원자의 파일 내용(SHA-256)이 같은 문서가 이미 있으면 저장하지 않고 기존 문서를 반환하고,
+        교체를 명시한 경우(replace_doc_id, replace) 바뀐 청크만 임베딩하여 기존 문서를 증분 재색인한다.
+
+        Args:
+            path: 임시 파일 경로
+            filename: 원본 파일명
+            file_size: 파일 크기 (bytes)
+            metadata: 추가 메타데이터
+            content_hash: 파일 SHA-256 (없으면 파일을 읽어 계산)
+            replace_doc_id: 교체할 문서 ID (새 버전으로 저장)
+            replace: True면 같은 지원자 + 같은 파일명의 기존 문서를 교체 (없으면 새 문서)
+
+        Returns:
+            doc_id, text_length, chunk_count, chunks_reused, chunks_embedded, duplicate
+
+        Raises:
+            ValueError: 지원하지 않는 형식, 추출 실패, 텍스트가 너무 짧은 경우, 교체할 문서가 없는 경우
+        """
+        content_hash = content_hash or self.file_sha256(path)
+        applicant_id = (metadata or {}).get("applicant_id")
+
+        # 같은 지원자의 동일한 파일이 이미 저장되어 있으면 no-op
+        existing = self.vector_store.find_document_by_hash(content_hash, applicant_id=applicant_id)
+        if existing and (not replace_doc_id or existing["doc_id"] == replace_doc_id):
+            chunk_count = existing.get("chunk_count", 1)
+            return {
+                "doc_id": existing["doc_id"],
+                "text_length": existing.get("text_length", 0),
+                "chunk_count": chunk_count,
+                "chunks_reused": chunk_count,
+                "chunks_embedded": 0,
+                "duplicate": True,
+            }
+
+        doc_id, is_update = self._resolve_doc_id(filename, content_hash, applicant_id, replace_doc_id, replace)
+
+        doc_metadata = {
+            **(metadata or {}),
+            "filename": filename,
+            "doc_type": TextExtractor.get_extension(filename),
+            "upload_time": datetime.now(timezone.utc).isoformat(),
+            "file_size": file_size,
+        }
+
+        stored = False
+        try:
+            with open(path, "rb") as file:
+                # 표 형식(XLSX)은 행 단위 레코드를 각각 청크로 색인 (시트/행 번호 메타데이터 포함)
+                # 이전에 추출한 적 있는 파일은 추출 캐시에서 읽음 (파싱 생략)
+                records = self.extraction_cache.iter_records(file, filename, content_hash)
+                if records is not None:
+                    chunk_stream = self.vector_store.chunker.iter_record_chunks(records)
+                else:
+                    segments = self.extraction_cache.iter_text(file, filename, content_hash)
+                    separator = TextExtractor.segment_separator(filename)
+                    chunk_stream = self.vector_store.chunker.iter_chunks(segments, separator=separator)
+
+                # 너무 짧은 텍스트는 저장(기존 버전 갱신) 전에 걸러내도록 앞부분 청크를 먼저 확인
+                head = []
+                for chunk in chunk_stream:
+                    head.append(chunk)
+                    if chunk["end"] >= 10:
+                        break
+                if not head or head[-1]["end"] < 10:
+                    raise ValueError("추출된 텍스트가 너무 짧습니다")
+
+                stored = True
+                stats = self.vector_store.add_document_chunks(
+                    doc_id,
+                    itertools.chain(head, chunk_stream),
+                    doc_metadata,
+                    doc_payload={"content_hash": content_hash}
+                )
+        except Exception:
+            # 새 문서의 일부 배치가 이미 저장된 경우 정리
+            # (기존 문서 갱신 중 실패하면 이전 청크를 남겨두고, 재업로드 시 재사용)
+            if stored and not is_update:
+                self.vector_store.delete_document(doc_id)
+            raise
+
+        return {
+            "doc_id": doc_id,
+            **stats,
+            "duplicate": False,
+        }
+
+
+# 싱글톤 인스턴스
+ingestion_service = DocumentIngestionService()
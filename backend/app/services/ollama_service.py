@@ -10,6 +10,21 @@ class OllamaService:
     def __init__(self):
         self.base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
         self.model = os.getenv("OLLAMA_MODEL", "llama2")
+        # 모델을 메모리에 유지할 시간 (Ollama keep_alive 형식, 예: 30m, -1)
+        self.keep_alive = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+
+    async def preload(self) -> None:
+        """모델을 미리 메모리에 로드 (빈 프롬프트 요청 시 Ollama가 모델만 로드)"""
+        url = f"{self.base_url}/api/generate"
+
+        payload = {
+            "model": self.model,
+            "keep_alive": self.keep_alive
+        }
+
+        async with httpx.AsyncClient(timeout=300.0) as client:
+            response = await client.post(url, json=payload)
+            response.raise_for_status()
 
     async def generate(self, prompt: str) -> str:
         """Ollama API를 호출하여 텍스트 생성"""
@@ -0,0 +1,612 @@
+"""
+pgvector 벡터 저장소
+문서 청크 임베딩을 기존 PostgreSQL(pgvector 확장)에 저장하고 검색한다 (VECTOR_STORE=pgvector).
+
+Qdrant 없이 운영 DB 하나로 검색을 처리하며, 메타데이터 필터와 지원자 정보(applicant_info) 조인을
+하나의 쿼리로 수행한다. 하이브리드(희소 벡터) 검색, 스냅샷, 재색인은 Qdrant 전용이다.
+"""
+import csv
+import io
+import json
+import os
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import text
+
+from app.database import engine
+from app.services.vector_store_base import VectorStore, to_utc
+
+# 업로드 메타데이터 중 필터/조회용 컬럼으로 따로 저장하는 필드 (나머지는 payload JSONB)
+PROMOTED_FIELDS = ("filename", "doc_type", "applicant_id", "upload_time", "content_hash")
+
+# COPY 적재 컬럼 순서
+COPY_COLUMNS = ("point_id", "doc_id", "chunk_index", "embedding", *PROMOTED_FIELDS, "payload")
+
+
+class PgVectorStore(VectorStore):
+    """
+    PostgreSQL pgvector 기반 벡터 저장소
+
+    테이블은 첫 사용 시점(또는 warmup)에 임베딩 차원에 맞춰 생성하며,
+    벡터 인덱스는 PGVECTOR_INDEX(hnsw, ivfflat, none)로 선택한다.
+    """
+
+    name = "pgvector"
+
+    def __init__(self):
+        super().__init__()
+        self.schema = os.getenv("DB_SCHEMA", "public")
+        self.table_name = os.getenv("PGVECTOR_TABLE", "document_vectors")
+
+        # 벡터 인덱스 (hnsw: 검색 품질/속도 우선, ivfflat: 생성이 빠르고 메모리 적음, none: 전수 검색)
+        self.index_type = os.getenv("PGVECTOR_INDEX", "hnsw").lower()
+        if self.index_type not in ("hnsw", "ivfflat", "none"):
+            raise ValueError(f"지원하지 않는 PGVECTOR_INDEX: {self.index_type}")
+        self.hnsw_m = int(os.getenv("PGVECTOR_HNSW_M", "16"))
+        self.hnsw_ef_construction = int(os.getenv("PGVECTOR_HNSW_EF_CONSTRUCTION", "64"))
+        # IVFFlat 리스트 수 (권장: 행 수 / 1000, 데이터가 어느 정도 쌓인 뒤 인덱스를 만들어야 recall이 유지됨)
+        self.ivfflat_lists = int(os.getenv("PGVECTOR_IVFFLAT_LISTS", "100"))
+
+        # 검색 시 탐색 폭 (비워두면 pgvector 기본값 - hnsw.ef_search=40, ivfflat.probes=1)
+        self.ef_search = int(os.getenv("PGVECTOR_EF_SEARCH")) if os.getenv("PGVECTOR_EF_SEARCH") else None
+        self.ivfflat_probes = int(os.getenv("PGVECTOR_IVFFLAT_PROBES")) if os.getenv("PGVECTOR_IVFFLAT_PROBES") else None
+        # 필터 검색에서 인덱스 후보가 필터로 걸러져 결과가 모자랄 때 계속 탐색 (pgvector 0.8+, off/strict_order/relaxed_order)
+        self.iterative_scan = os.getenv("PGVECTOR_ITERATIVE_SCAN", "off").lower()
+
+        self._ready = False
+        self._ready_lock = threading.Lock()
+
+    @property
+    def table(self) -> str:
+        return f'"{self.schema}"."{self.table_name}"'
+
+    @property
+    def cache_namespace(self) -> str:
+        return f"pgvector:{self.schema}.{self.table_name}"
+
+    # ===== 테이블 관리 =====
+
+    def connect(self) -> None:
+        """pgvector 테이블/인덱스 확인 및 생성 (warmup용)"""
+        if self._ready:
+            return
+        with self._ready_lock:
+            if self._ready:
+                return
+            with engine.begin() as connection:
+                self._ensure_table(connection)
+            self._ready = True
+
+    def _ensure_table(self, connection) -> None:
+        """
+        테이블이 없으면 현재 임베딩 차원으로 생성 (있으면 테이블의 벡터 차원 사용)
+
+        Raises:
+            RuntimeError: pgvector 확장을 사용할 수 없는 경우
+        """
+        try:
+            connection.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+        except Exception as e:
+            raise RuntimeError(
+                f"pgvector 확장을 사용할 수 없습니다 (pgvector가 설치된 PostgreSQL 필요): {e}"
+            ) from e
+
+        # vector(N) 컬럼의 atttypmod = 차원
+        existing = connection.execute(text(
+            "SELECT a.atttypmod FROM pg_attribute a "
+            "JOIN pg_class c ON c.oid = a.attrelid JOIN pg_namespace n ON n.oid = c.relnamespace "
+            "WHERE n.nspname = :schema AND c.relname = :table AND a.attname = 'embedding'"
+        ), {"schema": self.schema, "table": self.table_name}).scalar()
+        if existing and existing > 0:
+            self._vector_size = existing
+        else:
+            connection.execute(text(f"""
+                CREATE TABLE IF NOT EXISTS {self.table} (
+                    point_id VARCHAR(36) PRIMARY KEY,
+                    doc_id VARCHAR(255) NOT NULL,
+                    chunk_index INTEGER NOT NULL DEFAULT 0,
+                    embedding vector({int(self.vector_size)}) NOT NULL,
+                    filename VARCHAR(500),
+                    doc_type VARCHAR(50),
+                    applicant_id INTEGER,
+                    upload_time TIMESTAMP,
+                    content_hash VARCHAR(64),
+                    payload JSONB NOT NULL DEFAULT '{{}}'::jsonb
+                )
+            """))
+            print(f"✅ pgvector 테이블 생성: {self.schema}.{self.table_name} (dim={self.vector_size})")
+
+        # 목록/중복 확인은 문서당 첫 청크(chunk_index = 0)만 조회하므로 부분 인덱스 사용
+        for name, definition in (
+            ("doc_id", "(doc_id, chunk_index)"),
+            ("filename", "(filename) WHERE chunk_index = 0"),
+            ("content_hash", "(content_hash) WHERE chunk_index = 0"),
+            ("applicant_id", "(applicant_id)"),
+            ("upload_time", "(upload_time)"),
+        ):
+            connection.execute(text(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_{name} ON {self.table} {definition}"
+            ))
+
+        if self.index_type == "hnsw":
+            connection.execute(text(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_embedding_hnsw ON {self.table} "
+                f"USING hnsw (embedding vector_cosine_ops) "
+                f"WITH (m = {self.hnsw_m}, ef_construction = {self.hnsw_ef_construction})"
+            ))
+        elif self.index_type == "ivfflat":
+            connection.execute(text(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_embedding_ivfflat ON {self.table} "
+                f"USING ivfflat (embedding vector_cosine_ops) WITH (lists = {self.ivfflat_lists})"
+            ))
+
+    def _begin(self):
+        """테이블 확인 후 트랜잭션 시작"""
+        self.connect()
+        return engine.begin()
+
+    @staticmethod
+    def vector_literal(vector) -> str:
+        """벡터를 pgvector 텍스트 형식('[x,y,...]')으로 변환 (pgvector 파이썬 패키지 없이 전달)"""
+        return "[" + ",".join(repr(float(value)) for value in vector) + "]"
+
+    # ===== 필터 =====
+
+    @staticmethod
+    def build_where(filters: Optional[Dict[str, Any]], alias: str = "v") -> Tuple[List[str], Dict[str, Any]]:
+        """
+        메타데이터 필터 조건을 SQL WHERE 조건으로 변환 (QdrantService.build_filter()와 같은 키)
+
+        Args:
+            filters: doc_id, filename, doc_type, applicant_id (값 또는 리스트),
+                     uploaded_after, uploaded_before (datetime 또는 ISO 문자열, 시간대가 없으면 UTC)
+            alias: 벡터 테이블 별칭
+
+        Returns:
+            (조건 리스트, 바인딩 파라미터)
+        """
+        clauses: List[str] = []
+        params: Dict[str, Any] = {}
+        for key in ("doc_id", "filename", "doc_type", "applicant_id"):
+            value = (filters or {}).get(key)
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple, set)):
+                clauses.append(f"{alias}.{key} = ANY(:f_{key})")
+                params[f"f_{key}"] = list(value)
+            else:
+                clauses.append(f"{alias}.{key} = :f_{key}")
+                params[f"f_{key}"] = value
+        # upload_time 컬럼은 UTC 시각 (TIMESTAMP, 시간대 없음)
+        if (filters or {}).get("uploaded_after"):
+            clauses.append(f"{alias}.upload_time >= CAST(:f_uploaded_after AS TIMESTAMP)")
+            params["f_uploaded_after"] = to_utc(filters["uploaded_after"]).replace(tzinfo=None)
+        if (filters or {}).get("uploaded_before"):
+            clauses.append(f"{alias}.upload_time <= CAST(:f_uploaded_before AS TIMESTAMP)")
+            params["f_uploaded_before"] = to_utc(filters["uploaded_before"]).replace(tzinfo=None)
+        return clauses, params
+
+    @staticmethod
+    def _where_sql(clauses: List[str]) -> str:
+        return f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+    # ===== 저장 =====
+
+    def add_document_chunks(
+        self,
+        doc_id: str,
+        chunks: Iterable[Dict[str, Any]],
+        metadata: Dict[str, Any] = None,
+        doc_payload: Dict[str, Any] = None
+    ) -> Dict[str, int]:
+        """
+        청크 스트림을 배치 단위로 임베딩하여 저장 (증분 재색인, 배치마다 COPY 적재)
+
+        청크 ID/재사용 규칙은 QdrantService.add_document_chunks()와 같다.
+
+        Args:
+            doc_id: 문서 고유 ID
+            chunks: TextChunker가 생성한 청크 (text, start, end)
+            metadata: 모든 청크에 공통으로 저장할 메타데이터
+            doc_payload: 색인이 끝난 뒤 기록할 문서 단위 메타데이터 (content_hash 등)
+
+        Returns:
+            chunk_count, text_length, chunks_reused, chunks_embedded
+        """
+        self.connect()
+        base_payload = metadata or {}
+        chunk_count = 0
+        text_length = 0
+        reused = 0
+        embedded = 0
+        seen_ids: List[str] = []
+        # 같은 내용의 청크가 문서 내 여러 번 나오는 경우 구분용
+        occurrences: Dict[str, int] = {}
+        batch: List[Dict[str, Any]] = []
+
+        def flush():
+            nonlocal reused, embedded
+            # 내용이 같은 기존 청크는 벡터를 재사용 (임베딩 생략, 텍스트 형식 그대로 다시 적재)
+            with engine.connect() as connection:
+                existing = dict(connection.execute(
+                    text(f"SELECT point_id, CAST(embedding AS TEXT) FROM {self.table} WHERE point_id = ANY(:ids)"),
+                    {"ids": [chunk["point_id"] for chunk in batch]}
+                ).all())
+            new_chunks = [chunk for chunk in batch if chunk["point_id"] not in existing]
+            if new_chunks:
+                vectors = self.embed_texts([chunk["text"] for chunk in new_chunks])
+                for chunk, vector in zip(new_chunks, vectors):
+                    existing[chunk["point_id"]] = self.vector_literal(vector)
+
+            rows = []
+            for chunk in batch:
+                payload = {
+                    **base_payload,
+                    # 레코드 청크(XLSX 행 등)의 시트/행 번호
+                    **chunk.get("metadata", {}),
+                    "doc_id": doc_id,
+                    "chunk_index": chunk["index"],
+                    "chunk_hash": chunk["hash"],
+                    "char_start": chunk["start"],
+                    "char_end": chunk["end"],
+                    "snippet": chunk["text"][:self.snippet_length],
+                }
+                rows.append((chunk["point_id"], doc_id, chunk["index"], existing[chunk["point_id"]], payload))
+            # 본문을 먼저 저장해야 검색 결과에서 항상 본문을 조회할 수 있음
+            self.text_store.put_chunks(doc_id, [(chunk["point_id"], chunk["index"], chunk["text"]) for chunk in batch])
+            self._copy_rows(rows)
+            embedded += len(new_chunks)
+            reused += len(batch) - len(new_chunks)
+            batch.clear()
+
+        for chunk in chunks:
+            chunk_hash = self.content_hash(chunk["text"])
+            occurrence = occurrences.get(chunk_hash, 0)
+            occurrences[chunk_hash] = occurrence + 1
+            point_id = self.chunk_point_id(doc_id, f"{chunk_hash}:{occurrence}")
+            batch.append({**chunk, "index": chunk_count, "hash": chunk_hash, "point_id": point_id})
+            seen_ids.append(point_id)
+            chunk_count += 1
+            text_length = chunk["end"]
+            if len(batch) >= self.embedding_batch_size:
+                flush()
+        if batch:
+            flush()
+
+        if chunk_count:
+            final_payload = {**(doc_payload or {}), "chunk_count": chunk_count, "text_length": text_length}
+            with engine.begin() as connection:
+                # 이전 버전에만 있던 청크 삭제
+                connection.execute(
+                    text(f"DELETE FROM {self.table} WHERE doc_id = :doc_id AND NOT (point_id = ANY(:keep))"),
+                    {"doc_id": doc_id, "keep": seen_ids}
+                )
+                # 전체 청크 수/텍스트 길이/문서 해시는 스트림이 끝나야 확정되므로 마지막에 일괄 기록
+                # (중간에 실패하면 content_hash가 기록되지 않아 재업로드 시 중복으로 판단되지 않음)
+                connection.execute(
+                    text(
+                        f"UPDATE {self.table} SET payload = payload || CAST(:payload AS JSONB), "
+                        f"content_hash = COALESCE(:content_hash, content_hash) WHERE doc_id = :doc_id"
+                    ),
+                    {
+                        "payload": json.dumps(final_payload, ensure_ascii=False, default=str),
+                        "content_hash": final_payload.get("content_hash"),
+                        "doc_id": doc_id,
+                    }
+                )
+            self.text_store.delete_document(doc_id, keep_point_ids=seen_ids)
+        self.invalidate_search_cache()
+        return {
+            "chunk_count": chunk_count,
+            "text_length": text_length,
+            "chunks_reused": reused,
+            "chunks_embedded": embedded,
+        }
+
+    def _copy_rows(self, rows: List[Tuple[str, str, int, str, Dict[str, Any]]]) -> None:
+        """
+        청크 행을 COPY로 임시 테이블에 적재한 뒤 한 번에 upsert
+
+        Args:
+            rows: [(포인트 ID, 문서 ID, 청크 순번, 벡터 텍스트, payload)]
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for point_id, doc_id, chunk_index, embedding, payload in rows:
+            promoted = [payload.get(field) for field in PROMOTED_FIELDS]
+            writer.writerow([
+                point_id, doc_id, chunk_index, embedding,
+                # csv에서 따옴표 없는 빈 값은 NULL
+                *["" if value is None else value for value in promoted],
+                json.dumps(payload, ensure_ascii=False, default=str),
+            ])
+        buffer.seek(0)
+
+        columns = ", ".join(COPY_COLUMNS)
+        updates = ", ".join(f"{column} = EXCLUDED.{column}" for column in COPY_COLUMNS if column != "point_id")
+        raw = engine.raw_connection()
+        try:
+            cursor = raw.cursor()
+            cursor.execute(
+                f"CREATE TEMP TABLE IF NOT EXISTS _vector_load "
+                f"(LIKE {self.table} INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+            )
+            cursor.copy_expert(f"COPY _vector_load ({columns}) FROM STDIN WITH (FORMAT csv)", buffer)
+            cursor.execute(
+                f"INSERT INTO {self.table} ({columns}) SELECT {columns} FROM _vector_load "
+                f"ON CONFLICT (point_id) DO UPDATE SET {updates}"
+            )
+            raw.commit()
+        except Exception:
+            raw.rollback()
+            raise
+        finally:
+            raw.close()
+
+    def delete_document(self, doc_id: str) -> None:
+        """문서의 모든 청크 삭제"""
+        with self._begin() as connection:
+            connection.execute(text(f"DELETE FROM {self.table} WHERE doc_id = :doc_id"), {"doc_id": doc_id})
+        self.text_store.delete_document(doc_id)
+        self.invalidate_search_cache()
+
+    # ===== 조회 =====
+
+    def _find_document(self, column: str, value: str, applicant_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """컬럼 값과 지원자가 일치하는 문서의 대표(첫) 청크 payload 조회 (applicant_id None이면 지원자 없는 문서만)"""
+        with self._begin() as connection:
+            row = connection.execute(
+                text(
+                    f"SELECT doc_id, payload FROM {self.table} WHERE {column} = :value "
+                    f"AND applicant_id IS NOT DISTINCT FROM CAST(:applicant_id AS INTEGER) AND chunk_index = 0 LIMIT 1"
+                ),
+                {"value": value, "applicant_id": applicant_id}
+            ).first()
+        if row is None:
+            return None
+        return {**row.payload, "doc_id": row.doc_id}
+
+    def find_document_by_hash(self, content_hash: str, applicant_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """같은 지원자의 원본 파일 SHA-256이 같은 문서 조회"""
+        return self._find_document("content_hash", content_hash, applicant_id)
+
+    def find_document_by_filename(self, filename: str, applicant_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """같은 지원자의 파일명이 같은 문서 조회 (replace=true 재업로드 시 새 버전으로 처리)"""
+        return self._find_document("filename", filename, applicant_id)
+
+    def document_exists(self, doc_id: str) -> bool:
+        """문서 ID로 저장된 청크가 있는지 확인"""
+        with self._begin() as connection:
+            return connection.execute(
+                text(f"SELECT 1 FROM {self.table} WHERE doc_id = :doc_id LIMIT 1"), {"doc_id": doc_id}
+            ).first() is not None
+
+    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        쿼리와 유사한 문서 검색 (코사인 거리, 메타데이터 필터 + 지원자 정보 조인을 한 쿼리로 처리)
+
+        applicant_id가 있는 청크는 applicant_info를 조인해 metadata에 applicant_skill을 함께 반환한다.
+
+        Args:
+            query: 검색 쿼리
+            limit: 반환할 최대 결과 수
+            filters: 메타데이터 필터 (build_where() 참고)
+
+        Returns:
+            검색 결과 리스트 (각 결과는 id, text(스니펫), score, metadata 포함)
+        """
+        query_vector = self.embed_query(query)
+        return self.cached_search(
+            query_vector, limit, filters,
+            lambda: self._search(self.vector_literal(query_vector), limit, filters)
+        )
+
+    def _search(self, query_vector: str, limit: int, filters: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        clauses, params = self.build_where(filters)
+        params.update({"query_vector": query_vector, "limit": limit})
+
+        with self._begin() as connection:
+            # 탐색 폭은 이 트랜잭션에만 적용
+            if self.ef_search:
+                connection.execute(text(f"SET LOCAL hnsw.ef_search = {int(self.ef_search)}"))
+            if self.ivfflat_probes:
+                connection.execute(text(f"SET LOCAL ivfflat.probes = {int(self.ivfflat_probes)}"))
+            if clauses and self.iterative_scan != "off":
+                connection.execute(text(f"SET LOCAL {self.index_type}.iterative_scan = '{self.iterative_scan}'"))
+            rows = connection.execute(text(f"""
+                SELECT v.point_id, v.payload, a.skill AS applicant_skill,
+                       1 - (v.embedding <=> CAST(:query_vector AS vector)) AS score
+                FROM {self.table} v
+                LEFT JOIN "{self.schema}".applicant_info a ON a.id = v.applicant_id
+                {self._where_sql(clauses)}
+                ORDER BY v.embedding <=> CAST(:query_vector AS vector)
+                LIMIT :limit
+            """), params).all()
+
+        results = []
+        for row in rows:
+            payload = dict(row.payload or {})
+            snippet = payload.pop("snippet", "")
+            if row.applicant_skill:
+                payload["applicant_skill"] = row.applicant_skill
+            results.append({"id": row.point_id, "text": snippet, "score": float(row.score), "metadata": payload})
+        return results
+
+    def count_documents(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        """저장된 문서 개수 반환 (청크가 아닌 원본 문서 기준, 메타데이터 필터 적용 가능)"""
+        clauses, params = self.build_where(filters)
+        try:
+            with self._begin() as connection:
+                return connection.execute(
+                    text(f"SELECT COUNT(*) FROM {self.table} v {self._where_sql(['v.chunk_index = 0', *clauses])}"),
+                    params
+                ).scalar() or 0
+        except Exception:
+            # 에러 발생 시 0 반환 (테이블 없음 or 접근 불가)
+            return 0
+
+    @staticmethod
+    def _row_to_document(doc_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "id": doc_id,
+            "text": payload.get("snippet", ""),
+            "metadata": {k: v for k, v in payload.items() if k != "snippet"}
+        }
+
+    def get_all_documents(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        저장된 문서 조회 (point_id 기준 keyset 페이징 - 깊은 페이지도 앞 페이지를 다시 읽지 않음)
+
+        Args:
+            limit: 반환할 최대 문서 수
+            cursor: 이전 페이지 응답의 next_cursor (없으면 첫 페이지)
+            filters: 메타데이터 필터 (build_where() 참고)
+
+        Returns:
+            (문서 리스트 - 각 문서는 id, text, metadata 포함, 다음 페이지 커서 - 마지막 페이지면 None)
+
+        Raises:
+            ValueError: 올바르지 않은 커서
+        """
+        after = self.decode_cursor(cursor)
+        clauses, params = self.build_where(filters)
+        clauses.insert(0, "v.chunk_index = 0")
+        if after is not None:
+            clauses.append("v.point_id > :after")
+            params["after"] = str(after)
+        params["limit"] = limit + 1
+        try:
+            with self._begin() as connection:
+                rows = connection.execute(text(
+                    f"SELECT v.point_id, v.doc_id, v.payload FROM {self.table} v "
+                    f"{self._where_sql(clauses)} ORDER BY v.point_id LIMIT :limit"
+                ), params).all()
+        except Exception:
+            # 에러 발생 시 빈 리스트 반환 (테이블 없음 or 접근 불가)
+            return [], None
+
+        next_offset = rows[limit - 1].point_id if len(rows) > limit else None
+        documents = [self._row_to_document(row.doc_id, row.payload or {}) for row in rows[:limit]]
+        return documents, self.encode_cursor(next_offset)
+
+    def iter_chunks(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        include_text: bool = True,
+        batch_size: int = 256
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        모든 청크를 순차 조회 (내보내기용, 메모리 사용량은 batch_size로 제한)
+
+        Args:
+            filters: 메타데이터 필터 (build_where() 참고)
+            include_text: 본문 저장소에서 청크 전문을 함께 조회할지 여부
+            batch_size: 1회 조회 행 수
+
+        Returns:
+            청크 iterator (id, doc_id, text, payload)
+        """
+        after = None
+        while True:
+            clauses, params = self.build_where(filters)
+            if after is not None:
+                clauses.append("v.point_id > :after")
+                params["after"] = after
+            params["limit"] = batch_size
+            with self._begin() as connection:
+                rows = connection.execute(text(
+                    f"SELECT v.point_id, v.doc_id, v.payload FROM {self.table} v "
+                    f"{self._where_sql(clauses)} ORDER BY v.point_id LIMIT :limit"
+                ), params).all()
+            texts = self.text_store.get_texts([row.point_id for row in rows]) if include_text else {}
+            for row in rows:
+                yield {
+                    "id": row.point_id,
+                    "doc_id": row.doc_id,
+                    **({"text": texts.get(row.point_id)} if include_text else {}),
+                    "payload": dict(row.payload or {}),
+                }
+            if len(rows) < batch_size:
+                break
+            after = rows[-1].point_id
+
+    def get_document_chunks(self, doc_id: str) -> List[Dict[str, Any]]:
+        """문서의 모든 청크 payload를 순서대로 조회 (text는 본문 저장소에서 채움)"""
+        with self._begin() as connection:
+            rows = connection.execute(
+                text(f"SELECT point_id, payload FROM {self.table} WHERE doc_id = :doc_id ORDER BY chunk_index"),
+                {"doc_id": doc_id}
+            ).all()
+        texts = self.text_store.get_texts([row.point_id for row in rows])
+        chunks = []
+        for row in rows:
+            chunk = dict(row.payload or {})
+            chunk["text"] = texts.get(row.point_id, chunk.get("snippet", ""))
+            chunks.append(chunk)
+        return chunks
+
+    def get_document_by_id(self, doc_id: str) -> Optional[Dict[str, Any]]:
+        """
+        특정 문서 조회 (청크를 결합하여 전체 텍스트 복원)
+
+        Args:
+            doc_id: 문서 ID
+
+        Returns:
+            문서 정보 (id, text, metadata), 없으면 None
+        """
+        chunks = self.get_document_chunks(doc_id)
+        if not chunks:
+            return None
+        metadata = {
+            k: v for k, v in chunks[0].items()
+            if k not in ("text", "snippet", "chunk_index", "chunk_hash", "char_start", "char_end")
+        }
+        return {
+            "id": doc_id,
+            "text": self._join_chunks(chunks),
+            "metadata": metadata
+        }
+
+    def get_collection_info(self) -> Dict[str, Any]:
+        """
+        벡터 테이블 정보 조회 (QdrantService.get_collection_info()와 같은 키)
+
+        Returns:
+            테이블 통계 정보
+        """
+        try:
+            with self._begin() as connection:
+                points_count = connection.execute(text(f"SELECT COUNT(*) FROM {self.table}")).scalar() or 0
+            return {
+                "name": self.table_name,
+                "collection": f"{self.schema}.{self.table_name}",
+                "storage": "pgvector",
+                "embedding_model": self.embedding_model_name,
+                "points_count": points_count,
+                "documents_count": self.count_documents(),
+                "vector_size": self.vector_size,
+                "distance": "COSINE",
+                "index": self.index_type,
+                "hnsw": {"m": self.hnsw_m, "ef_construction": self.hnsw_ef_construction} if self.index_type == "hnsw" else None,
+                "status": "green"
+            }
+        except Exception as e:
+            # 테이블 정보 조회 실패 시 기본 정보 반환
+            return {
+                "name": self.table_name,
+                "points_count": 0,
+                "vector_size": self.vector_size,
+                "distance": "COSINE",
+                "error": str(e)
+            }
+
+
+# 싱글톤 인스턴스
+pgvector_store = PgVectorStore()
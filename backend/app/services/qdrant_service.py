@@ -3,188 +3,938 @@ Qdrant 벡터 데이터베이스 연동 서비스
 문서 임베딩 저장 및 검색 기능 제공
 """
 import os
-from typing import List, Dict, Any
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+import numpy as np
 from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams, PointStruct
-from fastembed import TextEmbedding
+from qdrant_client.models import (
+    Distance, VectorParams, PointStruct, Filter, FieldCondition, MatchValue, Range, FilterSelector,
+    HasIdCondition, PayloadSelectorExclude, PayloadSelectorInclude, SparseVectorParams, Modifier,
+    NamedSparseVector, SearchRequest, HnswConfigDiff, ScalarQuantization, ScalarQuantizationConfig,
+    ScalarType, BinaryQuantization, BinaryQuantizationConfig, Disabled, SearchParams,
+    QuantizationSearchParams, VectorParamsDiff, PayloadSchemaType, DatetimeRange, MatchAny,
+    CreateAlias, CreateAliasOperation, IsEmptyCondition, PayloadField
+)
 from dotenv import load_dotenv
 
+from app.services.sparse_encoder import sparse_encoder
+from app.services.vector_store_base import VectorStore, to_utc
+
 load_dotenv()
 
-# 오프라인 모드 강제 (폐쇄망 환경에서 HuggingFace Hub 접속 차단)
-# 반드시 TextEmbedding import 전에 설정되어야 함
-os.environ["HF_HUB_OFFLINE"] = "1"
-os.environ["TRANSFORMERS_OFFLINE"] = "1"
-os.environ["HF_DATASETS_OFFLINE"] = "1"
 
+# 업로드 시 기록하는 메타데이터 중 필터/조회에 쓰는 필드의 payload 인덱스
+PAYLOAD_INDEXES = {
+    "doc_id": PayloadSchemaType.KEYWORD,
+    "filename": PayloadSchemaType.KEYWORD,
+    "doc_type": PayloadSchemaType.KEYWORD,
+    "upload_time": PayloadSchemaType.DATETIME,
+    "applicant_id": PayloadSchemaType.INTEGER,
+    "chunk_index": PayloadSchemaType.INTEGER,
+    "content_hash": PayloadSchemaType.KEYWORD,
+}
+
+
+class SharedLock:
+    """
+    공유/배타 잠금 (쓰기 작업은 공유로 동시에 실행, alias 전환은 배타로 실행)
+
+    배타 잠금을 기다리는 동안에는 새 공유 잠금을 막아 전환이 무한정 밀리지 않게 한다.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._shared = 0
+        self._exclusive = False
+        self._waiting_exclusive = 0
+
+    @contextmanager
+    def shared(self):
+        with self._condition:
+            while self._exclusive or self._waiting_exclusive:
+                self._condition.wait()
+            self._shared += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._shared -= 1
+                self._condition.notify_all()
+
+    @contextmanager
+    def exclusive(self):
+        with self._condition:
+            self._waiting_exclusive += 1
+            while self._exclusive or self._shared:
+                self._condition.wait()
+            self._waiting_exclusive -= 1
+            self._exclusive = True
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._exclusive = False
+                self._condition.notify_all()
+
+
+class LocalClientLock:
+    """
+    내장(local) 모드 QdrantClient의 모든 호출을 하나의 잠금으로 직렬화
+
+    local 모드는 numpy 기반 전수 검색으로 동작하며 스레드 안전하지 않으므로
+    업로드 워커/스냅샷 가져오기 등 여러 스레드에서 함께 쓸 때 필요하다.
+    """
+
+    def __init__(self, client: QdrantClient):
+        self._client = client
+        self._lock = threading.RLock()
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self._client, name)
+        if not callable(attribute):
+            return attribute
+
+        def locked(*args, **kwargs):
+            with self._lock:
+                return attribute(*args, **kwargs)
+        return locked
+
+
+def create_qdrant_client(url: str) -> QdrantClient:
+    """
+    주소에 따라 서버 또는 내장 모드 클라이언트 생성
+
+    내장 모드는 Qdrant 컨테이너 없이 프로세스 안에서 같은 API로 동작한다 (payload 인덱스,
+    양자화/HNSW 설정은 사용하지 않음). path: 디렉토리는 한 프로세스(클라이언트)만 열 수 있으므로
+    서버 실행 중에는 CLI 명령을 같은 디렉토리로 실행할 수 없다.
+
+    Args:
+        url: 서버 주소, ":memory:" (메모리, 테스트용) 또는 "path:<디렉토리>" (디스크, 단일 서버용)
+    """
+    if url == ":memory:":
+        return LocalClientLock(QdrantClient(location=":memory:"))
+    if url.startswith("path:"):
+        path = url[len("path:"):]
+        os.makedirs(path, exist_ok=True)
+        print(f"✅ Qdrant 내장 모드 사용: {path}")
+        return LocalClientLock(QdrantClient(path=path))
+    return QdrantClient(url=url)
+
+
+def is_local_url(url: str) -> bool:
+    """내장 모드 주소인지"""
+    return url == ":memory:" or url.startswith("path:")
+
+
+class QdrantService(VectorStore):
+    """
+    Qdrant 벡터 DB와 임베딩 모델을 관리하는 서비스
+
+    생성 시에는 설정만 읽고, Qdrant 연결과 임베딩 모델 로드는
+    첫 사용 시점(또는 warmup) 에 지연 수행한다.
+    """
 
-class QdrantService:
-    """Qdrant 벡터 DB와 임베딩 모델을 관리하는 서비스"""
+    name = "qdrant"
 
     def __init__(self):
+        super().__init__()
+        # 서버 주소, 또는 내장 모드 - ":memory:" (메모리, 테스트용) / "path:<디렉토리>" (디스크, 단일 서버용)
         self.qdrant_url = os.getenv("QDRANT_URL", "http://localhost:6333")
+        self.is_local = is_local_url(self.qdrant_url)
         self.collection_name = os.getenv("QDRANT_COLLECTION_NAME", "documents")
-        # FastEmbed 다국어 모델 (한국어 포함)
-        self.embedding_model_name = os.getenv("EMBEDDING_MODEL", "sentence-transformers/paraphrase-multilingual-mpnet-base-v2")
 
-        # FastEmbed 캐시 경로 설정 (폐쇄망 환경)
-        fastembed_cache = os.getenv("FASTEMBED_CACHE_PATH", "/app/fastembed_cache")
+        # 하이브리드 검색 (밀집 + 희소 어휘 벡터, Reciprocal Rank Fusion으로 결합)
+        self.sparse_vector_name = "text-sparse"
+        self.sparse_encoder = sparse_encoder
+        self.hybrid_search = os.getenv("HYBRID_SEARCH", "true").lower() == "true"
+        self.rrf_k = int(os.getenv("RRF_K", "60"))
+        # 밀집/희소 검색 각각에서 가져올 후보 수 (limit보다 작으면 limit 사용)
+        self.hybrid_candidates = int(os.getenv("HYBRID_CANDIDATES", "20"))
+        self.sparse_enabled = False  # 컬렉션에 희소 벡터 설정이 있는지 (_ensure_collection에서 확인)
 
-        # Qdrant 클라이언트 초기화
-        self.client = QdrantClient(url=self.qdrant_url)
+        # 벡터 양자화 / HNSW 설정 (기존 컬렉션은 apply_collection_config()로 반영)
+        self.quantization = os.getenv("QDRANT_QUANTIZATION", "none").lower()  # none, scalar, binary
+        if self.quantization not in ("none", "scalar", "binary"):
+            raise ValueError(f"지원하지 않는 QDRANT_QUANTIZATION: {self.quantization}")
+        self.quantization_always_ram = os.getenv("QDRANT_QUANTIZATION_ALWAYS_RAM", "true").lower() == "true"
+        # 원본 float32 벡터를 디스크에 보관 (양자화 벡터만 RAM에 유지)
+        self.vectors_on_disk = os.getenv("QDRANT_VECTORS_ON_DISK", "false").lower() == "true"
+        self.hnsw_m = int(os.getenv("QDRANT_HNSW_M", "16"))
+        self.hnsw_ef_construct = int(os.getenv("QDRANT_HNSW_EF_CONSTRUCT", "100"))
+        self.hnsw_on_disk = os.getenv("QDRANT_HNSW_ON_DISK", "false").lower() == "true"
+        # 검색 시 HNSW 탐색 폭 (비워두면 Qdrant 기본값)
+        self.search_ef = int(os.getenv("QDRANT_SEARCH_EF")) if os.getenv("QDRANT_SEARCH_EF") else None
+        # 양자화 검색 후 원본 벡터로 재채점 / 후보 확대 배율
+        self.quantization_rescore = os.getenv("QDRANT_QUANTIZATION_RESCORE", "true").lower() == "true"
+        self.quantization_oversampling = float(os.getenv("QDRANT_QUANTIZATION_OVERSAMPLING", "2.0"))
 
-        # FastEmbed 임베딩 모델 로드 (경량, 다국어 지원)
-        # 캐시 경로가 설정되어 있으면 해당 경로에서 모델 로드
-        try:
-            self.embedding_model = TextEmbedding(
-                model_name=self.embedding_model_name,
-                cache_dir=fastembed_cache
+        self._client = None
+        self._client_lock = threading.Lock()
+
+        # 재색인 중 alias 전환 시 진행 중인 쓰기가 끝날 때까지 대기하기 위한 잠금
+        self.write_gate = SharedLock()
+        # 재색인 중 변경된 문서 ID (None이면 추적하지 않음)
+        self._changed_docs: Optional[set] = None
+        self._changed_lock = threading.Lock()
+
+    @property
+    def client(self) -> QdrantClient:
+        """Qdrant 클라이언트 (첫 접근 시 연결 및 컬렉션 확인)"""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    client = self._create_client()
+                    # 컬렉션 생성 (없는 경우) - 실패 시 다음 접근에서 재시도
+                    self._ensure_collection(client)
+                    self._load_active_version(client)
+                    self._client = client
+        return self._client
+
+    def _create_client(self) -> QdrantClient:
+        """QDRANT_URL에 따라 서버 또는 내장 모드 클라이언트 생성 (create_qdrant_client 참고)"""
+        return create_qdrant_client(self.qdrant_url)
+
+    def connect(self) -> None:
+        """Qdrant 연결 및 컬렉션 확인 (warmup용)"""
+        self.client.get_collection(self.collection_name)
+
+    def _ensure_collection(self, client: QdrantClient):
+        """
+        컬렉션이 없으면 생성 (밀집 벡터 + 희소 어휘 벡터)
+
+        새로 만드는 컬렉션은 버전 이름(<이름>_<시각>)으로 만들고 QDRANT_COLLECTION_NAME을
+        alias로 연결한다. 재색인 후 alias만 바꾸면 검색/업로드 대상이 원자적으로 전환됨
+        """
+        if not client.collection_exists(self.collection_name):
+            versioned_name = self.versioned_collection_name()
+            self.create_collection(client, versioned_name, self.vector_size)
+            client.update_collection_aliases(change_aliases_operations=[
+                CreateAliasOperation(create_alias=CreateAlias(
+                    collection_name=versioned_name, alias_name=self.collection_name
+                ))
+            ])
+            self.sparse_enabled = True
+            return
+
+        collection_info = client.get_collection(self.collection_name)
+        # 희소 벡터 설정 이전에 만들어진 컬렉션은 밀집 검색만 사용
+        sparse_config = collection_info.config.params.sparse_vectors or {}
+        self.sparse_enabled = self.sparse_vector_name in sparse_config
+        if not self.sparse_enabled:
+            print(f"⚠️  컬렉션 '{self.collection_name}'에 희소 벡터 설정이 없어 밀집 검색만 사용합니다 (재색인 필요)")
+        vector_params = collection_info.config.params.vectors
+        if hasattr(vector_params, "size"):
+            self._vector_size = vector_params.size
+        elif isinstance(vector_params, dict) and "" in vector_params:
+            self._vector_size = vector_params[""].size
+        self._ensure_payload_indexes(client, self.collection_name, existing=set(collection_info.payload_schema or {}))
+
+    def versioned_collection_name(self) -> str:
+        """alias 뒤에 둘 실제 컬렉션 이름 (<QDRANT_COLLECTION_NAME>_<UTC 시각>)"""
+        return f"{self.collection_name}_{datetime.utcnow().strftime('%Y%m%d%H%M%S%f')}"
+
+    def create_collection(self, client: QdrantClient, collection_name: str, vector_size: int) -> None:
+        """현재 양자화/HNSW 설정과 payload 인덱스를 갖춘 컬렉션 생성"""
+        client.create_collection(
+            collection_name=collection_name,
+            vectors_config=VectorParams(
+                size=vector_size, distance=Distance.COSINE, on_disk=self.vectors_on_disk
+            ),
+            sparse_vectors_config={
+                self.sparse_vector_name: SparseVectorParams(modifier=Modifier.IDF)
+            },
+            hnsw_config=self.hnsw_config(),
+            quantization_config=self.quantization_config(),
+        )
+        self._ensure_payload_indexes(client, collection_name, existing=set())
+
+    def _ensure_payload_indexes(self, client: QdrantClient, collection_name: str, existing: set):
+        """필터에 사용하는 payload 필드 인덱스 생성 (기존 컬렉션은 없는 인덱스만 추가)"""
+        if self.is_local:
+            # 내장 모드는 payload 인덱스를 지원하지 않음 (필터는 전수 검사로 동작)
+            return
+        for field_name, schema in PAYLOAD_INDEXES.items():
+            if field_name in existing:
+                continue
+            client.create_payload_index(
+                collection_name=collection_name,
+                field_name=field_name,
+                field_schema=schema
             )
-            print(f"✅ FastEmbed 모델 로드 성공: {self.embedding_model_name}")
-            print(f"   캐시 디렉토리: {fastembed_cache}")
+
+    def resolve_collection(self, client: Optional[QdrantClient] = None) -> str:
+        """QDRANT_COLLECTION_NAME이 가리키는 실제 컬렉션 이름 (alias가 아니면 그대로)"""
+        client = client or self.client
+        for alias in client.get_aliases().aliases:
+            if alias.alias_name == self.collection_name:
+                return alias.collection_name
+        return self.collection_name
+
+    def _load_active_version(self, client: QdrantClient) -> None:
+        """
+        재색인으로 전환된 컬렉션이면 등록된 임베딩 모델을 사용
+
+        EMBEDDING_MODEL과 다르면 컬렉션 등록 정보를 우선한다 (재시작 후에도 전환 상태 유지).
+        이미 EMBEDDING_MODEL 모델이 로드되어 있어도(워밍업 순서, 클라이언트 연결 전 embed_query 등)
+        버리고 등록된 모델을 다시 로드한다.
+
+        Raises:
+            RuntimeError: PostgreSQL 연결 실패 (클라이언트 연결을 실패시켜 다음 접근/워밍업에서 재시도)
+        """
+        from sqlalchemy.exc import OperationalError
+        from app.services.reindex_service import reindex_service
+
+        try:
+            version = reindex_service.get_by_name(self.resolve_collection(client))
+        except OperationalError as e:
+            # 등록 정보를 확인하지 못한 채 EMBEDDING_MODEL로 검색하면 다른 모델로 색인된 컬렉션을 잘못 조회할 수 있음
+            raise RuntimeError(f"임베딩 컬렉션 등록 정보 조회 실패 (PostgreSQL 연결 후 재시도): {e}")
         except Exception as e:
-            print(f"❌ FastEmbed 모델 로드 실패: {e}")
-            print(f"   캐시 디렉토리: {fastembed_cache}")
-            print(f"   캐시 내용 확인:")
-            if os.path.exists(fastembed_cache):
-                import subprocess
-                result = subprocess.run(["find", fastembed_cache, "-type", "f"],
-                                      capture_output=True, text=True)
-                print(result.stdout)
-            raise
-
-        self.vector_size = 768  # paraphrase-multilingual-mpnet-base-v2 벡터 크기
-
-        # 컬렉션 생성 (없는 경우)
-        self._ensure_collection()
-
-    def _ensure_collection(self):
-        """컬렉션이 없으면 생성"""
-        collections = self.client.get_collections().collections
-        collection_names = [col.name for col in collections]
-
-        if self.collection_name not in collection_names:
-            self.client.create_collection(
-                collection_name=self.collection_name,
-                vectors_config=VectorParams(size=self.vector_size, distance=Distance.COSINE),
+            # 등록 테이블이 없는 경우 등 (재색인을 사용한 적 없는 설치)
+            print(f"⚠️  임베딩 컬렉션 등록 정보 조회 실패 (EMBEDDING_MODEL 사용): {e}")
+            return
+        if version is None or version.embedding_model == self.embedding_model_name:
+            return
+        print(f"⚠️  컬렉션 '{version.collection_name}'은 {version.embedding_model} 모델로 색인되어 해당 모델을 사용합니다 "
+              f"(EMBEDDING_MODEL={self.embedding_model_name})")
+        with self._model_lock:
+            self.embedding_model_name = version.embedding_model
+            # 이전 모델이 로드되어 있으면 버리고 첫 사용 시 등록된 모델로 다시 로드
+            self._embedding_model = None
+            self._vector_size = version.vector_size
+
+    def hnsw_config(self) -> HnswConfigDiff:
+        """HNSW 인덱스 설정 (m: 노드당 연결 수, ef_construct: 인덱스 생성 시 탐색 폭)"""
+        return HnswConfigDiff(m=self.hnsw_m, ef_construct=self.hnsw_ef_construct, on_disk=self.hnsw_on_disk)
+
+    def quantization_config(self):
+        """벡터 양자화 설정 (scalar: int8, 약 4배 절감 / binary: 1bit, 약 32배 절감)"""
+        if self.quantization == "scalar":
+            return ScalarQuantization(scalar=ScalarQuantizationConfig(
+                type=ScalarType.INT8, quantile=0.99, always_ram=self.quantization_always_ram
+            ))
+        if self.quantization == "binary":
+            return BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=self.quantization_always_ram))
+        return None
+
+    def search_params(self) -> Optional[SearchParams]:
+        """검색 파라미터 (HNSW ef, 양자화 재채점)"""
+        if self.search_ef is None and self.quantization == "none":
+            return None
+        quantization = None
+        if self.quantization != "none":
+            quantization = QuantizationSearchParams(
+                rescore=self.quantization_rescore, oversampling=self.quantization_oversampling
             )
+        return SearchParams(hnsw_ef=self.search_ef, quantization=quantization)
+
+    def apply_collection_config(self) -> Dict[str, Any]:
+        """
+        기존 컬렉션에 현재 양자화/HNSW/on-disk 설정을 반영 (마이그레이션)
+
+        Qdrant가 백그라운드에서 인덱스/양자화 벡터를 다시 만들며, 그동안에도 검색은 가능하다.
+
+        Returns:
+            적용한 설정
+        """
+        self.client.update_collection(
+            collection_name=self.collection_name,
+            vectors_config={"": VectorParamsDiff(on_disk=self.vectors_on_disk)},
+            hnsw_config=self.hnsw_config(),
+            quantization_config=self.quantization_config() or Disabled.DISABLED,
+        )
+        return {
+            "collection": self.collection_name,
+            "quantization": self.quantization,
+            "vectors_on_disk": self.vectors_on_disk,
+            "hnsw": {"m": self.hnsw_m, "ef_construct": self.hnsw_ef_construct, "on_disk": self.hnsw_on_disk},
+        }
+
+    @staticmethod
+    def _doc_filter(doc_id: str) -> Filter:
+        """특정 문서의 청크만 선택하는 필터"""
+        return Filter(must=[FieldCondition(key="doc_id", match=MatchValue(value=doc_id))])
+
+    # 검색/목록 조회 시 payload에서 제외할 필드 (청크 분할/본문 분리 이전 포인트의 전문)
+    _SLIM_PAYLOAD = PayloadSelectorExclude(exclude=["text"])
+
+    @staticmethod
+    def _first_chunk_filter(filters: Optional[Dict[str, Any]] = None) -> Filter:
+        """문서당 대표 포인트(첫 청크 또는 청크 분할 이전 문서)만 선택하는 필터"""
+        metadata_filter = QdrantService.build_filter(filters)
+        return Filter(
+            must=metadata_filter.must if metadata_filter else None,
+            must_not=[FieldCondition(key="chunk_index", range=Range(gt=0))]
+        )
+
+    @staticmethod
+    def build_filter(filters: Optional[Dict[str, Any]]) -> Optional[Filter]:
+        """
+        메타데이터 필터 조건을 Qdrant 필터로 변환 (payload 인덱스 사용)
+
+        Args:
+            filters: doc_id, filename, doc_type, applicant_id (값 또는 리스트),
+                     uploaded_after, uploaded_before (datetime 또는 ISO 문자열, 시간대가 없으면 UTC)
+
+        Returns:
+            Qdrant 필터 (조건이 없으면 None)
+        """
+        if not filters:
+            return None
+        must = []
+        for key in ("doc_id", "filename", "doc_type", "applicant_id"):
+            value = filters.get(key)
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple, set)):
+                must.append(FieldCondition(key=key, match=MatchAny(any=list(value))))
+            else:
+                must.append(FieldCondition(key=key, match=MatchValue(value=value)))
+        if filters.get("uploaded_after") or filters.get("uploaded_before"):
+            must.append(FieldCondition(key="upload_time", range=DatetimeRange(
+                gte=to_utc(filters["uploaded_after"]) if filters.get("uploaded_after") else None,
+                lte=to_utc(filters["uploaded_before"]) if filters.get("uploaded_before") else None
+            )))
+        return Filter(must=must) if must else None
+
+    @staticmethod
+    def _dense_vector(vector) -> List[float]:
+        """포인트 벡터에서 밀집 벡터만 추출 (희소 벡터가 함께 있으면 이름 없는 기본 벡터)"""
+        return vector.get("") if isinstance(vector, dict) else vector
 
-    def add_document(self, doc_id: str, text: str, metadata: Dict[str, Any] = None) -> None:
+    def add_document_chunks(
+        self,
+        doc_id: str,
+        chunks: Iterable[Dict[str, Any]],
+        metadata: Dict[str, Any] = None,
+        doc_payload: Dict[str, Any] = None
+    ) -> Dict[str, int]:
         """
-        문서를 벡터화하여 Qdrant에 저장
+        청크 스트림을 배치 단위로 임베딩하여 Qdrant에 저장 (증분 재색인)
+
+        청크 포인트 ID는 청크 내용 해시로 정해지므로, 같은 문서를 다시 색인하면
+        내용이 바뀌지 않은 청크는 기존 벡터를 재사용하고 바뀐 청크만 임베딩한다.
+        새 버전에 없는 기존 청크는 마지막에 삭제한다.
+        EMBEDDING_BATCH_SIZE개씩 처리하므로 메모리 사용량은 배치 크기로 제한됨
 
         Args:
             doc_id: 문서 고유 ID
-            text: 문서 텍스트
-            metadata: 추가 메타데이터 (파일명, 업로드 시간 등)
+            chunks: TextChunker가 생성한 청크 (text, start, end)
+            metadata: 모든 청크에 공통으로 저장할 메타데이터
+            doc_payload: 색인이 끝난 뒤 기록할 문서 단위 메타데이터 (content_hash 등)
+
+        Returns:
+            chunk_count, text_length, chunks_reused, chunks_embedded
         """
-        # 텍스트를 임베딩 벡터로 변환 (FastEmbed은 generator 반환)
-        embeddings = list(self.embedding_model.embed([text]))
-        vector = embeddings[0].tolist()
+        # 재색인 alias 전환 중에는 전환이 끝날 때까지 대기
+        with self.write_gate.shared():
+            result = self._add_document_chunks(doc_id, chunks, metadata, doc_payload)
+            self._record_change(doc_id)
+        self.invalidate_search_cache()
+        return result
 
-        # 메타데이터 기본값 설정
-        payload = metadata or {}
-        payload["text"] = text
+    def _add_document_chunks(
+        self,
+        doc_id: str,
+        chunks: Iterable[Dict[str, Any]],
+        metadata: Dict[str, Any] = None,
+        doc_payload: Dict[str, Any] = None
+    ) -> Dict[str, int]:
+        base_payload = metadata or {}
+        chunk_count = 0
+        text_length = 0
+        reused = 0
+        embedded = 0
+        seen_ids: List[str] = []
+        # 같은 내용의 청크가 문서 내 여러 번 나오는 경우 구분용
+        occurrences: Dict[str, int] = {}
+        batch: List[Dict[str, Any]] = []
 
-        # Qdrant에 저장
-        self.client.upsert(
-            collection_name=self.collection_name,
-            points=[
-                PointStruct(
-                    id=doc_id,
+        def flush():
+            nonlocal reused, embedded
+            ids = [chunk["point_id"] for chunk in batch]
+            # 내용이 같은 기존 청크는 밀집 벡터를 재사용 (임베딩 생략)
+            existing = {
+                str(point.id): self._dense_vector(point.vector)
+                for point in self.client.retrieve(
+                    collection_name=self.collection_name,
+                    ids=ids,
+                    with_payload=False,
+                    with_vectors=True
+                )
+            }
+            new_chunks = [chunk for chunk in batch if chunk["point_id"] not in existing]
+            if new_chunks:
+                vectors = self.embed_texts([chunk["text"] for chunk in new_chunks])
+                for chunk, vector in zip(new_chunks, vectors):
+                    existing[chunk["point_id"]] = vector.tolist()
+
+            points = []
+            for chunk in batch:
+                payload = {
+                    **base_payload,
+                    # 레코드 청크(XLSX 행 등)의 시트/행 번호
+                    **chunk.get("metadata", {}),
+                    "doc_id": doc_id,
+                    "chunk_index": chunk["index"],
+                    "chunk_hash": chunk["hash"],
+                    "char_start": chunk["start"],
+                    "char_end": chunk["end"],
+                    "snippet": chunk["text"][:self.snippet_length],
+                }
+                vector = existing[chunk["point_id"]]
+                if self.sparse_enabled:
+                    # 희소 벡터는 모델 없이 계산되므로 재사용하지 않고 항상 새로 계산
+                    vector = {"": vector, self.sparse_vector_name: self.sparse_encoder.encode_document(chunk["text"])}
+                points.append(PointStruct(
+                    id=chunk["point_id"],
                     vector=vector,
                     payload=payload
-                )
-            ]
+                ))
+            # 본문을 먼저 저장해야 검색 결과에서 항상 본문을 조회할 수 있음
+            self.text_store.put_chunks(doc_id, [(chunk["point_id"], chunk["index"], chunk["text"]) for chunk in batch])
+            self.client.upsert(collection_name=self.collection_name, points=points)
+            embedded += len(new_chunks)
+            reused += len(batch) - len(new_chunks)
+            batch.clear()
+
+        for chunk in chunks:
+            chunk_hash = self.content_hash(chunk["text"])
+            occurrence = occurrences.get(chunk_hash, 0)
+            occurrences[chunk_hash] = occurrence + 1
+            point_id = self.chunk_point_id(doc_id, f"{chunk_hash}:{occurrence}")
+            batch.append({**chunk, "index": chunk_count, "hash": chunk_hash, "point_id": point_id})
+            seen_ids.append(point_id)
+            chunk_count += 1
+            text_length = chunk["end"]
+            if len(batch) >= self.embedding_batch_size:
+                flush()
+        if batch:
+            flush()
+
+        if chunk_count:
+            # 이전 버전에만 있던 청크 삭제 (청크 분할 이전의 단일 포인트 포함)
+            self.client.delete(
+                collection_name=self.collection_name,
+                points_selector=FilterSelector(filter=Filter(
+                    should=[
+                        FieldCondition(key="doc_id", match=MatchValue(value=doc_id)),
+                        HasIdCondition(has_id=[doc_id]),
+                    ],
+                    must_not=[HasIdCondition(has_id=seen_ids)]
+                ))
+            )
+            self.text_store.delete_document(doc_id, keep_point_ids=seen_ids)
+            # 전체 청크 수/텍스트 길이/문서 해시는 스트림이 끝나야 확정되므로 마지막에 일괄 기록
+            # (중간에 실패하면 content_hash가 기록되지 않아 재업로드 시 중복으로 판단되지 않음)
+            self.client.set_payload(
+                collection_name=self.collection_name,
+                payload={**(doc_payload or {}), "chunk_count": chunk_count, "text_length": text_length},
+                points=self._doc_filter(doc_id)
+            )
+        return {
+            "chunk_count": chunk_count,
+            "text_length": text_length,
+            "chunks_reused": reused,
+            "chunks_embedded": embedded,
+        }
+
+    def _find_document(self, key: str, value: str, applicant_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        payload 필드 값과 지원자가 일치하는 문서의 대표 포인트 조회
+
+        Args:
+            applicant_id: 지원자 ID (None이면 지원자가 지정되지 않은 문서만)
+
+        Returns:
+            대표 포인트 payload (doc_id가 없는 레거시 단일 포인트는 포인트 ID를 doc_id로 채움)
+        """
+        must = [FieldCondition(key=key, match=MatchValue(value=value))]
+        if applicant_id is None:
+            must.append(IsEmptyCondition(is_empty=PayloadField(key="applicant_id")))
+        else:
+            must.append(FieldCondition(key="applicant_id", match=MatchValue(value=applicant_id)))
+        points, _ = self.client.scroll(
+            collection_name=self.collection_name,
+            scroll_filter=Filter(
+                must=must,
+                must_not=[FieldCondition(key="chunk_index", range=Range(gt=0))]
+            ),
+            limit=1,
+            with_payload=self._SLIM_PAYLOAD,
+            with_vectors=False
+        )
+        if not points:
+            return None
+        return {"doc_id": str(points[0].id), **(points[0].payload or {})}
+
+    def find_document_by_hash(self, content_hash: str, applicant_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """같은 지원자의 원본 파일 SHA-256이 같은 문서 조회"""
+        return self._find_document("content_hash", content_hash, applicant_id)
+
+    def find_document_by_filename(self, filename: str, applicant_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """같은 지원자의 파일명이 같은 문서 조회 (replace=true 재업로드 시 새 버전으로 처리)"""
+        return self._find_document("filename", filename, applicant_id)
+
+    def document_exists(self, doc_id: str) -> bool:
+        """문서 ID로 저장된 청크가 있는지 확인"""
+        result = self.client.count(
+            collection_name=self.collection_name,
+            count_filter=self._doc_filter(doc_id),
+            exact=True
         )
+        return result.count > 0
 
-    def search(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+    @property
+    def cache_namespace(self) -> str:
+        return f"qdrant:{self.collection_name}"
+
+    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         쿼리와 유사한 문서 검색
 
+        하이브리드 검색이 켜져 있으면 밀집/희소 검색을 한 번의 배치 요청으로 수행하고
+        Reciprocal Rank Fusion으로 순위를 결합한다.
+
         Args:
             query: 검색 쿼리
             limit: 반환할 최대 결과 수
+            filters: 메타데이터 필터 (build_filter() 참고)
 
         Returns:
-            검색 결과 리스트 (각 결과는 text, score, metadata 포함)
+            검색 결과 리스트 (각 결과는 id, text, score, metadata 포함,
+            하이브리드 검색 시 fusion_score 추가 - score는 밀집 유사도)
         """
-        # 쿼리를 임베딩 벡터로 변환 (FastEmbed)
-        embeddings = list(self.embedding_model.embed([query]))
-        query_vector = embeddings[0].tolist()
+        # 쿼리를 임베딩 벡터로 변환 (FastEmbed, 캐시 적용)
+        query_vector = self.embed_query(query)
+
+        # 컬렉션의 희소 벡터 지원 여부(sparse_enabled)는 클라이언트 초기화 시 확인됨
+        client = self.client
+        hybrid = self.hybrid_search and self.sparse_enabled
+        # 하이브리드 검색은 희소 벡터가 질의 텍스트에서 나오므로 텍스트도 캐시 키에 포함
+        return self.cached_search(
+            query_vector, limit, filters,
+            lambda: self._search(client, query, query_vector.tolist(), limit, filters, hybrid),
+            variant=query.strip() if hybrid else ""
+        )
+
+    def _search(
+        self,
+        client,
+        query: str,
+        query_vector: List[float],
+        limit: int,
+        filters: Optional[Dict[str, Any]],
+        hybrid: bool
+    ) -> List[Dict[str, Any]]:
+        query_filter = self.build_filter(filters)
+        if hybrid:
+            return self._hybrid_search(query, query_vector, limit, query_filter)
 
-        # Qdrant에서 유사 문서 검색
-        search_result = self.client.search(
+        # Qdrant에서 유사 문서 검색 (본문 제외 - 스니펫/메타데이터만 전송)
+        search_result = client.search(
             collection_name=self.collection_name,
             query_vector=query_vector,
-            limit=limit
+            query_filter=query_filter,
+            limit=limit,
+            with_payload=self._SLIM_PAYLOAD,
+            search_params=self.search_params()
         )
 
-        # 결과 포맷팅
-        results = []
-        for hit in search_result:
-            results.append({
-                "text": hit.payload.get("text", ""),
-                "score": hit.score,
-                "metadata": {k: v for k, v in hit.payload.items() if k != "text"}
-            })
+        # 결과 포맷팅 (text는 스니펫, 전문은 hydrate_texts()로 조회)
+        return [self._hit_to_result(hit, hit.score) for hit in search_result]
+
+    @staticmethod
+    def _hit_to_result(hit, score: float) -> Dict[str, Any]:
+        payload = hit.payload or {}
+        return {
+            "id": str(hit.id),
+            "text": payload.get("snippet", ""),
+            "score": score,
+            "metadata": {k: v for k, v in payload.items() if k != "snippet"}
+        }
+
+    def _hybrid_search(
+        self,
+        query: str,
+        query_vector: List[float],
+        limit: int,
+        query_filter: Optional[Filter] = None
+    ) -> List[Dict[str, Any]]:
+        """밀집 + 희소 검색 결과를 Reciprocal Rank Fusion으로 결합"""
+        candidates = max(limit, self.hybrid_candidates)
+        params = self.search_params()
+        dense_hits, sparse_hits = self.client.search_batch(
+            collection_name=self.collection_name,
+            requests=[
+                SearchRequest(
+                    vector=query_vector, filter=query_filter, limit=candidates,
+                    with_payload=self._SLIM_PAYLOAD, params=params
+                ),
+                SearchRequest(
+                    vector=NamedSparseVector(
+                        name=self.sparse_vector_name,
+                        vector=self.sparse_encoder.encode_query(query)
+                    ),
+                    filter=query_filter,
+                    limit=candidates,
+                    with_payload=self._SLIM_PAYLOAD
+                ),
+            ]
+        )
+
+        # RRF: 각 결과 목록에서의 순위 r에 대해 1 / (k + r) 합산
+        fused: Dict[str, float] = {}
+        hits: Dict[str, Any] = {}
+        for ranked in (dense_hits, sparse_hits):
+            for rank, hit in enumerate(ranked, 1):
+                point_id = str(hit.id)
+                fused[point_id] = fused.get(point_id, 0.0) + 1.0 / (self.rrf_k + rank)
+                hits.setdefault(point_id, hit)
+        top_ids = sorted(fused, key=fused.get, reverse=True)[:limit]
+
+        # score는 밀집 유사도로 유지 (희소 검색에서만 나온 결과는 벡터를 조회해 계산)
+        dense_scores = {str(hit.id): hit.score for hit in dense_hits}
+        missing = [point_id for point_id in top_ids if point_id not in dense_scores]
+        if missing:
+            query_array = np.asarray(query_vector, dtype=np.float32)
+            query_array /= np.linalg.norm(query_array) or 1.0
+            for point in self.client.retrieve(
+                collection_name=self.collection_name,
+                ids=missing,
+                with_payload=False,
+                with_vectors=True
+            ):
+                vector = np.asarray(self._dense_vector(point.vector), dtype=np.float32)
+                dense_scores[str(point.id)] = float(vector @ query_array / (np.linalg.norm(vector) or 1.0))
 
+        results = []
+        for point_id in top_ids:
+            result = self._hit_to_result(hits[point_id], dense_scores.get(point_id, 0.0))
+            result["fusion_score"] = fused[point_id]
+            results.append(result)
         return results
 
-    def delete_document(self, doc_id: str) -> None:
-        """문서 삭제"""
-        self.client.delete(
+    def _legacy_texts(self, point_ids: List[str]) -> Dict[str, str]:
+        """본문 저장소 도입 이전 포인트의 payload 전문 조회"""
+        if not point_ids:
+            return {}
+        points = self.client.retrieve(
             collection_name=self.collection_name,
-            points_selector=[doc_id]
+            ids=point_ids,
+            with_payload=PayloadSelectorInclude(include=["text"]),
+            with_vectors=False
         )
+        return {str(point.id): (point.payload or {}).get("text", "") for point in points}
+
+    def hydrate_texts(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        검색 결과의 text를 청크 전문으로 교체 (프롬프트에 넣을 결과에만 호출)
+
+        Args:
+            results: search() 결과
+
+        Returns:
+            같은 리스트 (text가 전문으로 채워짐)
+        """
+        point_ids = [result["id"] for result in results]
+        texts = self.text_store.get_texts(point_ids)
+        texts.update(self._legacy_texts([point_id for point_id in point_ids if point_id not in texts]))
+        for result in results:
+            result["text"] = texts.get(result["id"], result["text"])
+        return results
+
+    def delete_document(self, doc_id: str) -> None:
+        """문서 삭제 (모든 청크 + 청크 분할 이전에 단일 포인트로 저장된 문서)"""
+        with self.write_gate.shared():
+            self.client.delete(
+                collection_name=self.collection_name,
+                points_selector=FilterSelector(filter=self.document_points_filter(doc_id))
+            )
+            self.text_store.delete_document(doc_id)
+            self._record_change(doc_id)
+        self.invalidate_search_cache()
+
+    @staticmethod
+    def document_points_filter(doc_id: str) -> Filter:
+        """문서의 모든 청크 + 청크 분할 이전에 단일 포인트로 저장된 문서를 선택하는 필터"""
+        return Filter(should=[
+            FieldCondition(key="doc_id", match=MatchValue(value=doc_id)),
+            HasIdCondition(has_id=[doc_id]),
+        ])
+
+    def start_change_tracking(self) -> None:
+        """
+        재색인 중 업로드/삭제된 문서 ID 기록 시작
+
+        이 프로세스 메모리에만 기록하므로, 재색인 중에는 이 프로세스만 문서를 쓸 수 있다
+        (단일 writer - 다른 워커/레플리카의 업로드/삭제는 전환 시 새 컬렉션에 반영되지 않음, reindex_service 참고)
+        """
+        with self._changed_lock:
+            self._changed_docs = set()
+
+    def stop_change_tracking(self) -> None:
+        with self._changed_lock:
+            self._changed_docs = None
+
+    def drain_changes(self) -> List[str]:
+        """기록된 변경 문서 ID를 꺼내고 목록을 비움"""
+        with self._changed_lock:
+            if not self._changed_docs:
+                return []
+            changed = list(self._changed_docs)
+            self._changed_docs.clear()
+            return changed
 
-    def count_documents(self) -> int:
-        """저장된 문서 개수 반환"""
+    def _record_change(self, doc_id: str) -> None:
+        with self._changed_lock:
+            if self._changed_docs is not None:
+                self._changed_docs.add(doc_id)
+
+    def count_documents(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        """저장된 문서 개수 반환 (청크가 아닌 원본 문서 기준, 메타데이터 필터 적용 가능)"""
         try:
-            collection_info = self.client.get_collection(self.collection_name)
-            return collection_info.points_count or 0
+            result = self.client.count(
+                collection_name=self.collection_name,
+                count_filter=self._first_chunk_filter(filters),
+                exact=True
+            )
+            return result.count
         except Exception:
             # 에러 발생 시 0 반환 (컬렉션 없음 or 접근 불가)
             return 0
 
-    def get_all_documents(self, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _point_to_document(point, text: str = None) -> Dict[str, Any]:
+        """포인트를 문서 응답 형식으로 변환 (id는 원본 문서 ID)"""
+        payload = point.payload or {}
+        return {
+            "id": payload.get("doc_id", str(point.id)),
+            "text": text if text is not None else payload.get("snippet", payload.get("text", "")),
+            "metadata": {k: v for k, v in payload.items() if k not in ("text", "snippet")}
+        }
+
+    def get_all_documents(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
         """
-        저장된 모든 문서 조회 (페이징 지원)
+        저장된 문서 조회 (커서 기반 페이징)
+
+        문서당 첫 청크만 조회하며, text는 첫 청크 스니펫(미리보기)
+        scroll의 next_page_offset에서 이어서 읽으므로 깊은 페이지도 앞 페이지를 다시 읽지 않음
 
         Args:
             limit: 반환할 최대 문서 수
-            offset: 건너뛸 문서 수
+            cursor: 이전 페이지 응답의 next_cursor (없으면 첫 페이지)
+            filters: 메타데이터 필터 (build_filter() 참고)
 
         Returns:
-            문서 리스트 (각 문서는 id, text, metadata 포함)
+            (문서 리스트 - 각 문서는 id, text, metadata 포함, 다음 페이지 커서 - 마지막 페이지면 None)
+
+        Raises:
+            ValueError: 올바르지 않은 커서
         """
+        offset = self.decode_cursor(cursor)
         try:
             # Qdrant scroll API로 문서 조회
-            scroll_result = self.client.scroll(
+            points, next_offset = self.client.scroll(
                 collection_name=self.collection_name,
+                scroll_filter=self._first_chunk_filter(filters),
                 limit=limit,
                 offset=offset,
-                with_payload=True,
+                with_payload=self._SLIM_PAYLOAD,  # 본문 제외 (용량 절약)
                 with_vectors=False  # 벡터는 불필요 (용량 절약)
             )
+        except Exception:
+            # 에러 발생 시 빈 리스트 반환 (컬렉션 없음 or 접근 불가)
+            return [], None
+
+        # 스니펫이 없는 이전 형식 포인트만 전문을 받아 미리보기 생성
+        legacy = self._legacy_texts([str(p.id) for p in points if "snippet" not in (p.payload or {})])
+        documents = [
+            self._point_to_document(
+                point,
+                legacy[str(point.id)][:self.snippet_length] if str(point.id) in legacy else None
+            )
+            for point in points
+        ]
+        return documents, self.encode_cursor(next_offset)
+
+    def iter_chunks(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        include_text: bool = True,
+        batch_size: int = 256
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        컬렉션의 모든 청크를 순차 조회 (내보내기용, 메모리 사용량은 batch_size로 제한)
+
+        Args:
+            filters: 메타데이터 필터 (build_filter() 참고)
+            include_text: 본문 저장소에서 청크 전문을 함께 조회할지 여부
+            batch_size: scroll 1회당 포인트 수
 
-            documents = []
-            for point in scroll_result[0]:  # scroll_result는 (points, next_offset) 튜플
-                doc = {
+        Returns:
+            청크 iterator (id, doc_id, text, payload)
+        """
+        next_offset = None
+        while True:
+            points, next_offset = self.client.scroll(
+                collection_name=self.collection_name,
+                scroll_filter=self.build_filter(filters),
+                limit=batch_size,
+                offset=next_offset,
+                with_payload=True,
+                with_vectors=False
+            )
+            texts = {}
+            if include_text:
+                texts = self.text_store.get_texts([str(p.id) for p in points if "text" not in (p.payload or {})])
+            for point in points:
+                payload = dict(point.payload or {})
+                text = payload.pop("text", None)
+                if include_text and text is None:
+                    text = texts.get(str(point.id))
+                yield {
                     "id": str(point.id),
-                    "text": point.payload.get("text", ""),
-                    "metadata": {k: v for k, v in point.payload.items() if k != "text"}
+                    "doc_id": payload.get("doc_id", str(point.id)),
+                    **({"text": text} if include_text else {}),
+                    "payload": payload,
                 }
-                documents.append(doc)
+            if next_offset is None:
+                break
 
-            return documents
-        except Exception:
-            # 에러 발생 시 빈 리스트 반환 (컬렉션 없음 or 접근 불가)
-            return []
+    def get_document_chunks(self, doc_id: str) -> List[Dict[str, Any]]:
+        """문서의 모든 청크 payload를 순서대로 조회 (text는 본문 저장소에서 채움)"""
+        chunks = []
+        next_offset = None
+        while True:
+            points, next_offset = self.client.scroll(
+                collection_name=self.collection_name,
+                scroll_filter=self._doc_filter(doc_id),
+                limit=256,
+                offset=next_offset,
+                with_payload=True,
+                with_vectors=False
+            )
+            texts = self.text_store.get_texts([str(point.id) for point in points if "text" not in point.payload])
+            for point in points:
+                chunk = dict(point.payload)
+                if "text" not in chunk:
+                    chunk["text"] = texts.get(str(point.id), chunk.get("snippet", ""))
+                chunks.append(chunk)
+            if next_offset is None:
+                break
+        return sorted(chunks, key=lambda chunk: chunk.get("chunk_index", 0))
 
     def get_document_by_id(self, doc_id: str) -> Dict[str, Any]:
         """
-        특정 문서 조회
+        특정 문서 조회 (청크를 결합하여 전체 텍스트 복원)
 
         Args:
             doc_id: 문서 ID
@@ -192,22 +942,44 @@ class QdrantService:
         Returns:
             문서 정보 (id, text, metadata)
         """
-        points = self.client.retrieve(
-            collection_name=self.collection_name,
-            ids=[doc_id],
-            with_payload=True,
-            with_vectors=False
-        )
+        chunks = self.get_document_chunks(doc_id)
+        if chunks:
+            metadata = {
+                k: v for k, v in chunks[0].items()
+                if k not in ("text", "snippet", "chunk_index", "chunk_hash", "char_start", "char_end")
+            }
+            return {
+                "id": doc_id,
+                "text": self._join_chunks(chunks),
+                "metadata": metadata
+            }
+
+        # 청크 분할 이전에 단일 포인트로 저장된 문서
+        try:
+            points = self.client.retrieve(
+                collection_name=self.collection_name,
+                ids=[doc_id],
+                with_payload=True,
+                with_vectors=False
+            )
+        except Exception:
+            # 포인트 ID 형식이 아닌 경우
+            return None
 
         if not points:
             return None
 
-        point = points[0]
-        return {
-            "id": str(point.id),
-            "text": point.payload.get("text", ""),
-            "metadata": {k: v for k, v in point.payload.items() if k != "text"}
-        }
+        return self._point_to_document(points[0])
+
+    @staticmethod
+    def _quantization_name(config) -> str:
+        """컬렉션 양자화 설정 이름 (none, scalar, binary, product)"""
+        if config is None:
+            return "none"
+        for name in ("scalar", "binary", "product"):
+            if getattr(config, name, None) is not None:
+                return name
+        return "none"
 
     def get_collection_info(self) -> Dict[str, Any]:
         """
@@ -237,9 +1009,19 @@ class QdrantService:
 
             return {
                 "name": self.collection_name,
+                "collection": self.resolve_collection(),  # alias가 가리키는 실제 컬렉션
+                "storage": "local" if self.is_local else "server",
+                "embedding_model": self.embedding_model_name,
                 "points_count": collection_info.points_count or 0,
+                "documents_count": self.count_documents(),
                 "vector_size": vector_size,
-                "distance": distance
+                "distance": distance,
+                "quantization": self._quantization_name(collection_info.config.quantization_config),
+                "hnsw": {
+                    "m": collection_info.config.hnsw_config.m,
+                    "ef_construct": collection_info.config.hnsw_config.ef_construct
+                },
+                "status": str(getattr(collection_info.status, "value", collection_info.status))
             }
         except Exception as e:
             # 컬렉션 정보 조회 실패 시 기본 정보 반환
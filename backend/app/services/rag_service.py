@@ -1,11 +1,13 @@
 """
 RAG (Retrieval-Augmented Generation) 서비스
-Qdrant에서 관련 문서를 검색하고 Ollama LLM으로 답변 생성
+벡터 저장소(Qdrant 또는 pgvector)에서 관련 문서를 검색하고 Ollama LLM으로 답변 생성
 """
-from typing import List, Dict, Any, Optional
+import asyncio
+from typing import List, Dict, Any, Optional, Tuple
 from sqlmodel import Session, select
-from app.services.qdrant_service import qdrant_service
+from app.services.vector_store import vector_store
 from app.services.ollama_service import ollama_service
+from app.services.reranker import reranker
 from app.models.few_shot import FewShot
 
 
@@ -13,14 +15,51 @@ class RAGService:
     """RAG 기반 질의응답 서비스"""
 
     def __init__(self):
-        self.qdrant = qdrant_service
+        self.vector_store = vector_store
         self.ollama = ollama_service
+        self.reranker = reranker
+
+    async def _retrieve(
+        self,
+        query: str,
+        top_k: int,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        관련 청크 검색 (재순위가 켜져 있으면 후보를 넉넉히 가져와 cross-encoder로 상위 top_k 선별)
+
+        검색 결과에는 스니펫만 있으므로 청크 전문으로 채운 뒤 재순위/프롬프트에 사용한다.
+
+        Args:
+            query: 검색 질의
+            top_k: 반환할 결과 수
+            filters: 메타데이터 필터 (doc_id, filename, doc_type, applicant_id, uploaded_after/before)
+
+        Returns:
+            (text가 청크 전문인 검색 결과, 재순위 통계 - 재순위를 사용하지 않으면 None)
+        """
+        if not self.reranker.enabled:
+            results = self.vector_store.search(query=query, limit=top_k, filters=filters)
+            return self.vector_store.hydrate_texts(results), None
+
+        candidates = self.vector_store.search(query=query, limit=max(top_k, self.reranker.candidates), filters=filters)
+        if not candidates:
+            return candidates, None
+        # cross-encoder는 스니펫이 아닌 청크 전문으로 채점
+        self.vector_store.hydrate_texts(candidates)
+        try:
+            return await asyncio.to_thread(self.reranker.rerank, query, candidates, top_k)
+        except Exception as e:
+            # 모델 누락 등: 검색 순위 그대로 사용
+            print(f"⚠️  재순위 실패, 검색 순위 사용: {e}")
+            return candidates[:top_k], {"error": str(e)}
 
     async def answer_question(
         self,
         question: str,
         top_k: int = 3,
-        session: Optional[Session] = None
+        session: Optional[Session] = None,
+        filters: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         질문에 대해 RAG 방식으로 답변 생성
@@ -29,12 +68,13 @@ class RAGService:
             question: 사용자 질문
             top_k: 검색할 관련 문서 개수
             session: DB 세션 (Few-shot 예제 조회용, optional)
+            filters: 검색 범위를 제한할 메타데이터 필터 (optional)
 
         Returns:
             답변 및 참조 문서 정보
         """
-        # 1. Qdrant에서 관련 문서 검색
-        search_results = self.qdrant.search(query=question, limit=top_k)
+        # 1. 벡터 저장소에서 관련 문서 검색 (+ 재순위)
+        search_results, rerank_stats = await self._retrieve(question, top_k, filters)
 
         if not search_results:
             return {
@@ -43,7 +83,7 @@ class RAGService:
                 "has_sources": False
             }
 
-        # 2. 검색된 문서를 컨텍스트로 결합
+        # 2. 검색된 청크 전문을 컨텍스트로 결합
         context = self._build_context(search_results)
 
         # 3. Few-shot 예제 가져오기 (session이 제공된 경우)
@@ -64,7 +104,8 @@ class RAGService:
                 }
                 for result in search_results
             ],
-            "has_sources": True
+            "has_sources": True,
+            "rerank": rerank_stats
         }
 
     async def answer_question_with_analysis(
@@ -72,7 +113,8 @@ class RAGService:
         original_query: str,
         search_query: str,
         top_k: int = 3,
-        session: Optional[Session] = None
+        session: Optional[Session] = None,
+        filters: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         질문에 대해 RAG 방식으로 답변 생성 + 연관성 분석 포함
@@ -82,12 +124,13 @@ class RAGService:
             search_query: 검색용 질의 (비정형 질의)
             top_k: 검색할 관련 문서 개수
             session: DB 세션 (Few-shot 예제 조회용, optional)
+            filters: 검색 범위를 제한할 메타데이터 필터 (optional)
 
         Returns:
             답변, 참조 문서, 연관성 분석 정보
         """
-        # 1. Qdrant에서 관련 문서 검색
-        search_results = self.qdrant.search(query=search_query, limit=top_k)
+        # 1. 벡터 저장소에서 관련 문서 검색 (+ 재순위)
+        search_results, rerank_stats = await self._retrieve(search_query, top_k, filters)
 
         if not search_results:
             return {
@@ -101,7 +144,7 @@ class RAGService:
                 }
             }
 
-        # 2. 검색된 문서를 컨텍스트로 결합
+        # 2. 검색된 청크 전문을 컨텍스트로 결합
         context = self._build_context(search_results)
 
         # 3. Few-shot 예제 가져오기
@@ -131,7 +174,8 @@ class RAGService:
                 for result in search_results
             ],
             "has_sources": True,
-            "relevance_analysis": relevance_analysis
+            "relevance_analysis": relevance_analysis,
+            "rerank": rerank_stats
         }
 
     async def _analyze_relevance(
@@ -147,7 +191,7 @@ class RAGService:
         Args:
             original_query: 원본 사용자 질의
             search_query: 검색에 사용된 질의
-            search_results: Qdrant 검색 결과
+            search_results: 벡터 검색 결과
             answer: 생성된 답변
 
         Returns:
@@ -219,10 +263,12 @@ class RAGService:
         ])
 
     def _build_context(self, search_results: List[Dict[str, Any]]) -> str:
-        """검색 결과를 컨텍스트 문자열로 결합"""
+        """검색 결과(관련 청크)를 컨텍스트 문자열로 결합"""
         contexts = []
         for idx, result in enumerate(search_results, 1):
-            contexts.append(f"[문서 {idx}]\n{result['text']}\n")
+            filename = result["metadata"].get("filename")
+            header = f"[문서 {idx}] {filename}" if filename else f"[문서 {idx}]"
+            contexts.append(f"{header}\n{result['text']}\n")
         return "\n".join(contexts)
 
     def _get_active_fewshots(
@@ -0,0 +1,449 @@
+"""
+무중단 재색인 (임베딩 모델 변경)
+새 임베딩 모델로 버전 컬렉션(<QDRANT_COLLECTION_NAME>_<시각>)을 백그라운드에서 채우는 동안
+검색/업로드는 alias(QDRANT_COLLECTION_NAME)가 가리키는 기존 컬렉션을 그대로 사용하고,
+완료되면 alias를 새 컬렉션으로 원자적으로 전환한다. 이전 컬렉션은 롤백을 위해 보관한다.
+
+컬렉션 버전/진행 상태는 PostgreSQL(embedding_collections)에 저장된다.
+
+단일 writer 전제: 재색인 중 업로드/삭제 추적(qdrant_service.start_change_tracking), 전환 시 쓰기 잠금(write_gate),
+검색 모델 교체(activate_model)는 재색인을 실행한 프로세스 안에서만 동작한다. 재색인 중에는 백엔드를
+프로세스 1개(uvicorn 워커 1개, 레플리카 1개)로 운영하고, 다른 프로세스는 전환 후 재시작해야 새 모델을 사용한다.
+"""
+import os
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from qdrant_client import QdrantClient
+from qdrant_client.models import (
+    PointStruct, FilterSelector, CreateAlias, CreateAliasOperation, DeleteAlias, DeleteAliasOperation
+)
+from sqlmodel import Session, select
+
+from app.database import engine
+from app.models.embedding_collection import EmbeddingCollection, EmbeddingCollectionResponse
+from app.services.applicant_index import applicant_index_service
+from app.services.qdrant_service import qdrant_service
+from app.services.vector_store import require_qdrant
+
+
+class ReindexCancelled(Exception):
+    """재색인 작업 취소"""
+
+
+class ReindexService:
+    """임베딩 컬렉션 버전 관리 및 백그라운드 재색인"""
+
+    def __init__(self):
+        self.qdrant = qdrant_service
+        # 임베딩/업서트 1회당 포인트 수
+        self.batch_size = int(os.getenv("REINDEX_BATCH_SIZE", "64"))
+        # 배치 사이 대기 시간 (ms) - 실시간 검색/업로드가 CPU를 쓸 수 있도록 양보
+        self.throttle_ms = int(os.getenv("REINDEX_THROTTLE_MS", "100"))
+        # 재색인용 모델의 ONNX 추론 스레드 수 (0이면 onnxruntime 기본값)
+        self.threads = int(os.getenv("REINDEX_THREADS", "2")) or None
+        # 전환 후 롤백용으로 보관할 이전 컬렉션 수 (초과분은 삭제)
+        self.keep_previous = int(os.getenv("REINDEX_KEEP_PREVIOUS", "1"))
+        # uvicorn 워커 수 (여러 워커면 다른 워커의 쓰기를 추적할 수 없어 재색인 거부)
+        self.web_concurrency = int(os.getenv("WEB_CONCURRENCY", "1"))
+
+        self._thread: Optional[threading.Thread] = None
+        self._cancel = threading.Event()
+        self._lock = threading.Lock()
+
+    # ===== 등록 정보 =====
+
+    def get(self, version_id: int) -> Optional[EmbeddingCollection]:
+        with Session(engine) as session:
+            return session.get(EmbeddingCollection, version_id)
+
+    def get_by_name(self, collection_name: str) -> Optional[EmbeddingCollection]:
+        """실제 컬렉션 이름으로 조회"""
+        with Session(engine) as session:
+            return session.exec(
+                select(EmbeddingCollection).where(EmbeddingCollection.collection_name == collection_name)
+            ).first()
+
+    def list_versions(self) -> List[EmbeddingCollection]:
+        """현재 alias의 컬렉션 버전 목록 (최신순)"""
+        with Session(engine) as session:
+            return session.exec(
+                select(EmbeddingCollection)
+                .where(EmbeddingCollection.alias_name == self.qdrant.collection_name)
+                .order_by(EmbeddingCollection.created_at.desc())
+            ).all()
+
+    def _update(self, version_id: int, **values: Any) -> None:
+        with Session(engine) as session:
+            version = session.get(EmbeddingCollection, version_id)
+            if version is None:
+                return
+            for key, value in values.items():
+                setattr(version, key, value)
+            version.updated_at = datetime.utcnow()
+            session.add(version)
+            session.commit()
+
+    def _register_current(self, client: QdrantClient) -> EmbeddingCollection:
+        """현재 alias가 가리키는 컬렉션을 active로 등록 (등록 정보 도입 이전에 만든 컬렉션 포함)"""
+        collection_name = self.qdrant.resolve_collection(client)
+        with Session(engine) as session:
+            version = session.exec(
+                select(EmbeddingCollection).where(EmbeddingCollection.collection_name == collection_name)
+            ).first()
+            if version is None:
+                version = EmbeddingCollection(
+                    collection_name=collection_name,
+                    alias_name=self.qdrant.collection_name,
+                    embedding_model=self.qdrant.embedding_model_name,
+                    vector_size=self.qdrant.vector_size,
+                    status="active",
+                    activated_at=datetime.utcnow(),
+                )
+            elif version.status != "active":
+                version.status = "active"
+                version.activated_at = datetime.utcnow()
+            else:
+                return version
+            version.updated_at = datetime.utcnow()
+            session.add(version)
+            session.commit()
+            session.refresh(version)
+            return version
+
+    @staticmethod
+    def to_response(version: EmbeddingCollection) -> EmbeddingCollectionResponse:
+        progress = 0.0
+        if version.status == "active" or version.status == "retired":
+            progress = 1.0
+        elif version.total_points:
+            progress = min(1.0, version.processed_points / version.total_points)
+        return EmbeddingCollectionResponse(**version.model_dump(), progress=progress)
+
+    def recover(self) -> None:
+        """재시작으로 중단된 재색인 작업 정리 (미완성 컬렉션 삭제 후 failed 처리)"""
+        with Session(engine) as session:
+            interrupted = session.exec(
+                select(EmbeddingCollection).where(EmbeddingCollection.status == "building")
+            ).all()
+        for version in interrupted:
+            self._drop_collection(version.collection_name)
+            self._update(version.id, status="failed", error="서버 재시작으로 중단됨")
+            print(f"⚠️  [reindex] 중단된 재색인 정리: {version.collection_name}")
+
+    def _drop_collection(self, collection_name: str) -> None:
+        try:
+            self.qdrant.client.delete_collection(collection_name)
+        except Exception as e:
+            print(f"⚠️  [reindex] 컬렉션 삭제 실패 ({collection_name}): {e}")
+
+    # ===== 재색인 =====
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(
+        self,
+        embedding_model: str,
+        batch_size: Optional[int] = None,
+        throttle_ms: Optional[int] = None
+    ) -> EmbeddingCollection:
+        """
+        새 임베딩 모델로 재색인 시작 (백그라운드 스레드)
+
+        Args:
+            embedding_model: EMBEDDING_MODEL 형식의 모델 지정 (FastEmbed 이름, onnx:<경로>, ollama:<모델>)
+            batch_size: 임베딩/업서트 1회당 포인트 수
+            throttle_ms: 배치 사이 대기 시간
+
+        Returns:
+            building 상태의 새 컬렉션 버전
+
+        Raises:
+            ValueError: 이미 진행 중인 작업이 있거나 모델을 로드할 수 없는 경우 (또는 VECTOR_STORE가 qdrant가 아님,
+                        여러 워커로 실행 중인 경우)
+        """
+        require_qdrant("재색인")
+        if self.web_concurrency > 1:
+            raise ValueError(
+                f"재색인은 단일 프로세스에서만 실행할 수 있습니다 (WEB_CONCURRENCY={self.web_concurrency}, "
+                f"다른 워커의 업로드/삭제가 새 컬렉션에 반영되지 않음)"
+            )
+        with self._lock:
+            if self.is_running():
+                raise ValueError("이미 진행 중인 재색인 작업이 있습니다")
+            with Session(engine) as session:
+                building = session.exec(
+                    select(EmbeddingCollection).where(EmbeddingCollection.status == "building")
+                ).first()
+            if building is not None:
+                raise ValueError(f"다른 프로세스에서 재색인이 진행 중입니다: {building.collection_name}")
+
+            try:
+                model = self.qdrant.load_embedding_model(embedding_model, threads=self.threads)
+            except Exception as e:
+                raise ValueError(f"임베딩 모델을 로드할 수 없습니다: {str(e)}")
+            vector_size = model.dimension
+
+            client = self.qdrant.client
+            self._register_current(client)
+            with Session(engine) as session:
+                version = EmbeddingCollection(
+                    collection_name=self.qdrant.versioned_collection_name(),
+                    alias_name=self.qdrant.collection_name,
+                    embedding_model=embedding_model,
+                    vector_size=vector_size,
+                    status="building",
+                )
+                session.add(version)
+                session.commit()
+                session.refresh(version)
+
+            self._cancel.clear()
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(version, model, batch_size or self.batch_size,
+                      self.throttle_ms if throttle_ms is None else throttle_ms),
+                name="reindex",
+                daemon=True
+            )
+            self._thread.start()
+            return version
+
+    def cancel(self) -> bool:
+        """진행 중인 재색인 취소 (미완성 컬렉션은 삭제됨)"""
+        if not self.is_running():
+            return False
+        self._cancel.set()
+        return True
+
+    def _run(self, version: EmbeddingCollection, model, batch_size: int, throttle_ms: int) -> None:
+        """재색인 작업 본체 (백그라운드 스레드)"""
+        client = self.qdrant.client
+        target = version.collection_name
+        started = time.perf_counter()
+        self.qdrant.start_change_tracking()
+        try:
+            # alias 전환 전에도 기존 컬렉션을 직접 읽도록 실제 이름으로 고정
+            source = self.qdrant.resolve_collection(client)
+            self.qdrant.create_collection(client, target, version.vector_size)
+            total = client.count(collection_name=source, exact=True).count
+            self._update(version.id, total_points=total)
+            print(f"🔄 [reindex] {source} → {target} ({version.embedding_model}, 포인트 {total}개)")
+
+            processed = skipped = 0
+            next_offset = None
+            while True:
+                if self._cancel.is_set():
+                    raise ReindexCancelled()
+                points, next_offset = client.scroll(
+                    collection_name=source,
+                    limit=batch_size,
+                    offset=next_offset,
+                    with_payload=True,
+                    with_vectors=False
+                )
+                skipped += self._copy_points(client, points, target, model)
+                processed += len(points)
+                self._update(version.id, processed_points=processed, skipped_points=skipped)
+                if next_offset is None:
+                    break
+                if throttle_ms:
+                    time.sleep(throttle_ms / 1000)
+
+            # 복사 중 업로드/삭제된 문서 반영 (전환 시 쓰기 대기 시간을 줄이기 위해 미리 여러 번 수행)
+            for _ in range(3):
+                changed = self.qdrant.drain_changes()
+                if not changed:
+                    break
+                skipped += self._sync_documents(client, source, target, model, changed)
+
+            # 실시간 검색용 모델은 스레드 제한 없이 새로 로드 (재색인용 모델은 스레드 제한됨)
+            live_model = self.qdrant.load_embedding_model(version.embedding_model)
+            with self.qdrant.write_gate.exclusive():
+                skipped += self._sync_documents(client, source, target, model, self.qdrant.drain_changes())
+                self._switch_alias(client, source, version, live_model)
+            self._update(version.id, skipped_points=skipped)
+            print(f"✅ [reindex] 전환 완료: {self.qdrant.collection_name} → {target} "
+                  f"({time.perf_counter() - started:.1f}s, 본문 없음 {skipped}개)")
+        except ReindexCancelled:
+            self._drop_collection(target)
+            self._update(version.id, status="cancelled")
+            print(f"⚠️  [reindex] 취소됨: {target}")
+        except Exception as e:
+            self._drop_collection(target)
+            self._update(version.id, status="failed", error=str(e))
+            print(f"❌ [reindex] 실패: {e}")
+        finally:
+            self.qdrant.stop_change_tracking()
+
+    def _copy_points(self, client: QdrantClient, points: List[Any], target: str, model) -> int:
+        """
+        포인트를 새 모델로 임베딩하여 대상 컬렉션에 저장 (payload, 포인트 ID 유지)
+
+        본문 저장소 도입 이전 포인트는 payload 전문을 본문 저장소로 옮기고 스니펫만 남긴다.
+
+        Returns:
+            본문이 없어 건너뛴 포인트 수
+        """
+        if not points:
+            return 0
+        texts = self.qdrant.text_store.get_texts(
+            [str(point.id) for point in points if "text" not in (point.payload or {})]
+        )
+        legacy_rows: Dict[str, List[Tuple[str, int, str]]] = defaultdict(list)
+        records: List[Tuple[str, str, Dict[str, Any]]] = []
+        skipped = 0
+        for point in points:
+            point_id = str(point.id)
+            payload = dict(point.payload or {})
+            text = payload.pop("text", None)
+            if text is None:
+                text = texts.get(point_id)
+            else:
+                # 청크 분할 이전의 단일 포인트 문서는 포인트 ID가 문서 ID
+                doc_id = payload.setdefault("doc_id", point_id)
+                payload.setdefault("chunk_index", 0)
+                legacy_rows[doc_id].append((point_id, payload["chunk_index"], text))
+            if not text:
+                skipped += 1
+                continue
+            payload.setdefault("snippet", text[:self.qdrant.snippet_length])
+            records.append((point_id, text, payload))
+
+        for doc_id, rows in legacy_rows.items():
+            self.qdrant.text_store.put_chunks(doc_id, rows)
+        if records:
+            vectors = model.embed([text for _, text, _ in records], batch_size=self.qdrant.embedding_batch_size)
+            client.upsert(
+                collection_name=target,
+                points=[
+                    PointStruct(
+                        id=point_id,
+                        vector={
+                            "": vector.tolist(),
+                            self.qdrant.sparse_vector_name: self.qdrant.sparse_encoder.encode_document(text)
+                        },
+                        payload=payload
+                    )
+                    for (point_id, text, payload), vector in zip(records, vectors)
+                ],
+                wait=True
+            )
+        return skipped
+
+    def _sync_documents(self, client: QdrantClient, source: str, target: str, model, doc_ids: List[str]) -> int:
+        """원본 컬렉션의 문서를 대상 컬렉션에 다시 복사 (재색인 중 변경/삭제된 문서)"""
+        skipped = 0
+        for doc_id in doc_ids:
+            doc_filter = self.qdrant.document_points_filter(doc_id)
+            client.delete(collection_name=target, points_selector=FilterSelector(filter=doc_filter))
+            next_offset = None
+            while True:
+                points, next_offset = client.scroll(
+                    collection_name=source,
+                    scroll_filter=doc_filter,
+                    limit=self.batch_size,
+                    offset=next_offset,
+                    with_payload=True,
+                    with_vectors=False
+                )
+                skipped += self._copy_points(client, points, target, model)
+                if next_offset is None:
+                    break
+        return skipped
+
+    def _switch_alias(self, client: QdrantClient, source: str, version: EmbeddingCollection, model) -> None:
+        """
+        alias를 새 컬렉션으로 전환하고 검색용 모델 교체 (write_gate 배타 잠금 안에서 호출)
+
+        alias 도입 이전 컬렉션(이름 = alias)은 alias를 만들기 위해 기존 컬렉션을 먼저 삭제해야 하므로
+        이 경우에만 삭제~alias 생성 사이 잠깐 검색이 실패할 수 있고 롤백할 수 없다.
+        """
+        alias = self.qdrant.collection_name
+        create = CreateAliasOperation(create_alias=CreateAlias(collection_name=version.collection_name, alias_name=alias))
+        if source == alias:
+            client.delete_collection(source)
+            client.update_collection_aliases(change_aliases_operations=[create])
+        else:
+            # 삭제+생성을 한 요청으로 보내 원자적으로 전환
+            client.update_collection_aliases(change_aliases_operations=[
+                DeleteAliasOperation(delete_alias=DeleteAlias(alias_name=alias)),
+                create,
+            ])
+        self.qdrant.activate_model(version.embedding_model, model, version.vector_size)
+        self.qdrant.sparse_enabled = True
+        # 지원자 인덱스도 새 모델로 다시 만듦 (완료 전 지원자 검색은 503)
+        applicant_index_service.start_sync(full=True)
+
+        now = datetime.utcnow()
+        previous = self.get_by_name(source)
+        if previous is not None:
+            self._update(previous.id, status="deleted" if source == alias else "retired")
+        self._update(version.id, status="active", activated_at=now)
+        self._drop_old_versions(client)
+
+    def _drop_old_versions(self, client: QdrantClient) -> None:
+        """롤백용으로 보관할 수(REINDEX_KEEP_PREVIOUS)를 넘는 이전 컬렉션 삭제"""
+        with Session(engine) as session:
+            retired = session.exec(
+                select(EmbeddingCollection)
+                .where(EmbeddingCollection.alias_name == self.qdrant.collection_name,
+                       EmbeddingCollection.status == "retired")
+                .order_by(EmbeddingCollection.activated_at.desc())
+            ).all()
+        for version in retired[self.keep_previous:]:
+            self._drop_collection(version.collection_name)
+            self._update(version.id, status="deleted")
+
+    # ===== 롤백 =====
+
+    def rollback(self) -> EmbeddingCollection:
+        """
+        alias를 직전 컬렉션으로 되돌림 (이전 임베딩 모델로 복귀)
+
+        전환 이후 업로드된 문서는 이전 모델로 임베딩하여 이전 컬렉션에 반영한다.
+        전환 이후 삭제된 문서는 이전 컬렉션에 남아 있으므로 다시 삭제해야 한다.
+
+        Returns:
+            다시 active가 된 컬렉션 버전
+
+        Raises:
+            ValueError: 재색인 진행 중이거나 되돌릴 컬렉션이 없는 경우 (또는 VECTOR_STORE가 qdrant가 아님)
+        """
+        require_qdrant("재색인 롤백")
+        with self._lock:
+            if self.is_running():
+                raise ValueError("재색인 진행 중에는 롤백할 수 없습니다")
+            client = self.qdrant.client
+            current = self._register_current(client)
+            with Session(engine) as session:
+                previous = session.exec(
+                    select(EmbeddingCollection)
+                    .where(EmbeddingCollection.alias_name == self.qdrant.collection_name,
+                           EmbeddingCollection.status == "retired")
+                    .order_by(EmbeddingCollection.activated_at.desc())
+                ).first()
+            if previous is None or not client.collection_exists(previous.collection_name):
+                raise ValueError("되돌릴 이전 컬렉션이 없습니다")
+
+            model = self.qdrant.load_embedding_model(previous.embedding_model)
+            with self.qdrant.write_gate.exclusive():
+                # activated_at과 upload_time 모두 UTC
+                switched_at = current.activated_at.replace(tzinfo=timezone.utc)
+                changed = sorted({
+                    chunk["doc_id"]
+                    for chunk in self.qdrant.iter_chunks({"uploaded_after": switched_at}, include_text=False)
+                })
+                self._sync_documents(client, current.collection_name, previous.collection_name, model, changed)
+                self._switch_alias(client, current.collection_name, previous, model)
+            print(f"✅ [reindex] 롤백 완료: {self.qdrant.collection_name} → {previous.collection_name} "
+                  f"(전환 후 업로드 문서 {len(changed)}개 반영)")
+            return self.get(previous.id)
+
+
+# 싱글톤 인스턴스
+reindex_service = ReindexService()
@@ -0,0 +1,173 @@
+"""
+로컬 ONNX Cross-Encoder 재순위(rerank) 서비스
+검색 후보를 넉넉히 가져온 뒤 (질의, 청크) 쌍을 cross-encoder로 채점하여
+상위 몇 개만 LLM 프롬프트에 넣는다.
+
+모델은 FastEmbed 캐시 옆 디렉토리(model.onnx + tokenizer.json)에서 오프라인으로 로드하며,
+지연 예산(RERANK_BUDGET_MS)을 넘기면 남은 후보는 검색 순위를 그대로 사용한다.
+"""
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# onnxruntime / tokenizers는 재순위가 켜진 경우에만 사용 시점에 import
+
+
+class CrossEncoderReranker:
+    """ONNX cross-encoder 재순위기"""
+
+    # 모델 디렉토리에서 찾을 ONNX 파일 (앞에 있을수록 우선)
+    MODEL_FILES = ("model_quantized.onnx", "model.onnx", "onnx/model_quantized.onnx", "onnx/model.onnx")
+
+    def __init__(self):
+        self.enabled = os.getenv("RERANK_ENABLED", "false").lower() == "true"
+        fastembed_cache = os.getenv("FASTEMBED_CACHE_PATH", "/app/fastembed_cache")
+        self.model_path = os.getenv("RERANKER_MODEL_PATH") or os.path.join(fastembed_cache, "reranker")
+        # 재순위 대상 후보 수 (검색 단계에서 가져올 개수)
+        self.candidates = int(os.getenv("RERANK_CANDIDATES", "30"))
+        # 재순위 지연 예산 (ms, 초과 시 남은 후보는 채점하지 않음)
+        self.budget_ms = float(os.getenv("RERANK_BUDGET_MS", "1500"))
+        self.batch_size = int(os.getenv("RERANK_BATCH_SIZE", "8"))
+        self.max_length = int(os.getenv("RERANK_MAX_LENGTH", "256"))
+        self.threads = int(os.getenv("RERANK_THREADS", "0"))  # 0: onnxruntime 기본값
+
+        self._session = None
+        self._tokenizer = None
+        self._input_names: List[str] = []
+        self._load_lock = threading.Lock()
+
+        self._stats_lock = threading.Lock()
+        self._calls = 0
+        self._total_latency_ms = 0.0
+        self._budget_exceeded = 0
+        self._last_latency_ms: Optional[float] = None
+
+    def _find_model_file(self) -> str:
+        for name in self.MODEL_FILES:
+            path = os.path.join(self.model_path, name)
+            if os.path.exists(path):
+                return path
+        raise FileNotFoundError(f"재순위 모델을 찾을 수 없습니다: {self.model_path}")
+
+    def _load(self) -> None:
+        """ONNX 세션 및 토크나이저 로드 (첫 사용 시)"""
+        if self._session is not None:
+            return
+        with self._load_lock:
+            if self._session is not None:
+                return
+            import onnxruntime as ort
+            from tokenizers import Tokenizer
+
+            model_file = self._find_model_file()
+            options = ort.SessionOptions()
+            if self.threads:
+                options.intra_op_num_threads = self.threads
+            session = ort.InferenceSession(model_file, sess_options=options, providers=["CPUExecutionProvider"])
+
+            tokenizer = Tokenizer.from_file(os.path.join(self.model_path, "tokenizer.json"))
+            tokenizer.enable_truncation(max_length=self.max_length)
+            tokenizer.enable_padding()
+
+            self._input_names = [model_input.name for model_input in session.get_inputs()]
+            self._tokenizer = tokenizer
+            self._session = session
+            print(f"✅ 재순위 모델 로드 성공: {model_file}")
+
+    def warmup(self) -> None:
+        """모델 로드 후 더미 채점 1회 실행 (startup 워밍업용)"""
+        self._load()
+        self._score("warmup", ["warmup"])
+
+    def _score(self, query: str, texts: List[str]) -> np.ndarray:
+        """(질의, 텍스트) 쌍의 관련도 점수"""
+        encodings = self._tokenizer.encode_batch([(query, text) for text in texts])
+        features = {
+            "input_ids": np.array([e.ids for e in encodings], dtype=np.int64),
+            "attention_mask": np.array([e.attention_mask for e in encodings], dtype=np.int64),
+            "token_type_ids": np.array([e.type_ids for e in encodings], dtype=np.int64),
+        }
+        logits = self._session.run(None, {name: features[name] for name in self._input_names})[0]
+        # 출력이 (n, 1)이면 관련도 logit, (n, 2)이면 관련 클래스 logit 사용
+        return logits[:, -1] if logits.ndim == 2 else logits
+
+    def rerank(
+        self,
+        query: str,
+        candidates: List[Dict[str, Any]],
+        top_n: int
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        검색 후보를 cross-encoder 점수로 재정렬하여 상위 top_n개 반환
+
+        후보는 검색 순위대로 배치 채점하며, 지연 예산을 넘기면 채점을 멈추고
+        채점된 후보(재순위 점수순) 뒤에 나머지 후보(검색 순위)를 이어 붙인다.
+
+        Args:
+            query: 검색 질의
+            candidates: search() 결과 (hydrate_texts()로 text를 청크 전문으로 채운 것)
+            top_n: 반환할 결과 수
+
+        Returns:
+            (재정렬된 상위 결과 - rerank_score 추가, 재순위 통계)
+        """
+        started = time.perf_counter()
+        self._load()
+        # 예산은 채점 시간 기준 (첫 호출의 모델 로드 시간은 제외, 보고되는 지연에는 포함)
+        scoring_started = time.perf_counter()
+
+        scored: List[Tuple[float, Dict[str, Any]]] = []
+        budget_exceeded = False
+        for start in range(0, len(candidates), self.batch_size):
+            if (time.perf_counter() - scoring_started) * 1000 > self.budget_ms:
+                budget_exceeded = True
+                break
+            batch = candidates[start:start + self.batch_size]
+            scores = self._score(query, [candidate["text"] for candidate in batch])
+            scored.extend(zip(scores.tolist(), batch))
+
+        scored.sort(key=lambda item: item[0], reverse=True)
+        results = []
+        for score, candidate in scored:
+            candidate["rerank_score"] = score
+            results.append(candidate)
+        results.extend(candidates[len(scored):])
+
+        latency_ms = round((time.perf_counter() - started) * 1000, 1)
+        self._record(latency_ms, budget_exceeded)
+        stats = {
+            "latency_ms": latency_ms,
+            "budget_ms": self.budget_ms,
+            "candidates": len(candidates),
+            "scored": len(scored),
+            "budget_exceeded": budget_exceeded,
+        }
+        return results[:top_n], stats
+
+    def _record(self, latency_ms: float, budget_exceeded: bool) -> None:
+        with self._stats_lock:
+            self._calls += 1
+            self._total_latency_ms += latency_ms
+            self._last_latency_ms = latency_ms
+            if budget_exceeded:
+                self._budget_exceeded += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """재순위 지연 시간 통계 (/metrics용)"""
+        with self._stats_lock:
+            return {
+                "enabled": self.enabled,
+                "loaded": self._session is not None,
+                "calls": self._calls,
+                "avg_latency_ms": round(self._total_latency_ms / self._calls, 1) if self._calls else 0.0,
+                "last_latency_ms": self._last_latency_ms,
+                "budget_ms": self.budget_ms,
+                "budget_exceeded": self._budget_exceeded,
+            }
+
+
+# 싱글톤 인스턴스
+reranker = CrossEncoderReranker()
@@ -0,0 +1,105 @@
+"""
+검색 결과 캐시
+쿼리 임베딩 해시 + limit + 필터 + 컬렉션 캐시 버전을 키로 벡터 검색 결과를 저장한다.
+문서가 추가/삭제되면 캐시 버전(app.services.cache_versions)이 올라가 이전 결과는 더 이상 조회되지 않고
+LRU에서 자연스럽게 밀려난다.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from app.utils.lru_cache import SizedLRUCache
+
+
+class RetrievalCache:
+    """검색 결과 LRU 캐시 (히트율 + 절약한 검색 시간 통계)"""
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        if max_bytes is None:
+            max_bytes = int(float(os.getenv("RETRIEVAL_CACHE_MAX_MB", "32")) * 1024 * 1024)
+        self.enabled = os.getenv("RETRIEVAL_CACHE_ENABLED", "true").lower() == "true"
+        self._memory = SizedLRUCache(max_bytes=max_bytes)
+        self._stats_lock = threading.Lock()
+        self.saved_ms = 0.0
+        self.search_ms = 0.0
+
+    @staticmethod
+    def make_key(
+        namespace: str,
+        version: Any,
+        model_name: str,
+        query_vector: np.ndarray,
+        limit: int,
+        filters: Optional[Dict[str, Any]] = None,
+        variant: str = ""
+    ) -> bytes:
+        """
+        캐시 키 (SHA-256)
+
+        Args:
+            namespace: 컬렉션/테이블 식별자
+            version: 캐시 버전 (cache_versions.get())
+            model_name: 임베딩 모델
+            query_vector: 쿼리 임베딩
+            limit: 결과 수
+            filters: 메타데이터 필터 (값이 None인 키는 무시)
+            variant: 벡터 외에 결과에 영향을 주는 값 (예: 하이브리드 검색의 질의 텍스트)
+        """
+        digest = hashlib.sha256()
+        digest.update(f"{namespace}\x00{version}\x00{model_name}\x00{limit}\x00{variant}\x00".encode("utf-8"))
+        normalized = {k: v for k, v in (filters or {}).items() if v is not None}
+        digest.update(json.dumps(normalized, sort_keys=True, default=str, ensure_ascii=False).encode("utf-8"))
+        digest.update(np.ascontiguousarray(query_vector, dtype=np.float32).tobytes())
+        return digest.digest()
+
+    @staticmethod
+    def _copy(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # 호출 측이 결과를 수정(hydrate_texts 등)해도 캐시된 값은 바뀌지 않도록 복사
+        return [{**result, "metadata": dict(result.get("metadata") or {})} for result in results]
+
+    @staticmethod
+    def _estimate_size(results: List[Dict[str, Any]]) -> int:
+        return len(json.dumps(results, default=str, ensure_ascii=False).encode("utf-8"))
+
+    def get_or_search(self, key: bytes, search: Callable[[], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        캐시된 결과 반환, 없으면 검색 후 저장
+
+        Args:
+            key: make_key() 결과
+            search: 실제 검색 함수
+        """
+        if not self.enabled:
+            return search()
+
+        entry = self._memory.get(key)
+        if entry is not None:
+            results, cost_ms = entry
+            with self._stats_lock:
+                self.saved_ms += cost_ms
+            return self._copy(results)
+
+        started = time.perf_counter()
+        results = search()
+        cost_ms = (time.perf_counter() - started) * 1000
+        with self._stats_lock:
+            self.search_ms += cost_ms
+        self._memory.put(key, (self._copy(results), cost_ms), size=self._estimate_size(results))
+        return results
+
+    def clear(self) -> None:
+        self._memory.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 히트율, 사용량, 절약한 검색 시간"""
+        stats = self._memory.get_stats()
+        stats["enabled"] = self.enabled
+        stats["saved_ms"] = round(self.saved_ms, 1)
+        stats["avg_saved_ms"] = round(self.saved_ms / stats["hits"], 2) if stats["hits"] else 0.0
+        stats["avg_search_ms"] = round(self.search_ms / stats["misses"], 2) if stats["misses"] else 0.0
+        return stats
@@ -0,0 +1,333 @@
+"""
+벡터 컬렉션 스냅샷 내보내기/가져오기
+폐쇄망 서버 이전 시 문서를 다시 업로드/임베딩하지 않도록
+벡터, payload, 청크 본문, 임베딩 모델 정보를 tar.gz 아카이브로 옮긴다.
+
+아카이브 구성:
+    manifest.json          형식 버전, 임베딩 모델/차원, 포인트 수 등
+    points-00000.ndjson    포인트 1개당 한 줄 (id, vector_b64, sparse, payload, text)
+    points-00001.ndjson    ... (POINTS_PER_PART개 단위로 분할)
+"""
+import base64
+import io
+import json
+import os
+import tarfile
+import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from importlib import metadata as package_metadata
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+from qdrant_client.models import PointStruct, SparseVector
+
+from app.services.qdrant_service import qdrant_service
+from app.services.vector_store import require_qdrant
+
+
+# 아카이브 형식 버전 (호환되지 않는 변경 시 증가)
+FORMAT_VERSION = 1
+
+
+def _package_version(name: str) -> Optional[str]:
+    try:
+        return package_metadata.version(name)
+    except package_metadata.PackageNotFoundError:
+        return None
+
+
+class SnapshotValidationError(ValueError):
+    """아카이브가 현재 서버 설정(임베딩 모델/차원)과 호환되지 않는 경우"""
+
+
+class CollectionSnapshotService:
+    """Qdrant 컬렉션 + 청크 본문 스냅샷 서비스"""
+
+    # 아카이브 내 ndjson 파일 1개당 포인트 수
+    POINTS_PER_PART = 10000
+
+    def __init__(self):
+        self.qdrant = qdrant_service
+        self.snapshot_dir = os.getenv("SNAPSHOT_DIR", "/app/snapshots")
+        self.import_workers = int(os.getenv("SNAPSHOT_IMPORT_WORKERS", "4"))
+        self.import_batch_size = int(os.getenv("SNAPSHOT_IMPORT_BATCH_SIZE", "256"))
+
+    # ===== 내보내기 =====
+
+    def build_manifest(self, points_count: int, parts: List[str]) -> Dict[str, Any]:
+        return {
+            "format_version": FORMAT_VERSION,
+            "created_at": datetime.now().isoformat(),
+            "collection": self.qdrant.collection_name,
+            "embedding_model": self.qdrant.embedding_model_name,
+            "vector_size": self.qdrant.vector_size,
+            "distance": "COSINE",
+            "sparse_vector": self.qdrant.sparse_vector_name if self.qdrant.sparse_enabled else None,
+            "chunk_size": self.qdrant.chunker.chunk_size,
+            "chunk_overlap": self.qdrant.chunker.chunk_overlap,
+            "points_count": points_count,
+            "parts": parts,
+            "versions": {
+                "fastembed": _package_version("fastembed"),
+                "qdrant_client": _package_version("qdrant-client"),
+            },
+        }
+
+    def _iter_points(self, batch_size: int = 256) -> Iterator[Dict[str, Any]]:
+        """컬렉션 포인트를 벡터/본문 포함 레코드로 순차 변환"""
+        client = self.qdrant.client
+        next_offset = None
+        while True:
+            points, next_offset = client.scroll(
+                collection_name=self.qdrant.collection_name,
+                limit=batch_size,
+                offset=next_offset,
+                with_payload=True,
+                with_vectors=True
+            )
+            texts = self.qdrant.text_store.get_texts(
+                [str(point.id) for point in points if "text" not in (point.payload or {})]
+            )
+            for point in points:
+                vector = point.vector
+                sparse = vector.get(self.qdrant.sparse_vector_name) if isinstance(vector, dict) else None
+                dense = np.asarray(self.qdrant._dense_vector(vector), dtype=np.float32)
+                payload = dict(point.payload or {})
+                yield {
+                    "id": str(point.id),
+                    # float32 원본 바이트 (JSON 숫자 배열보다 작고 정밀도 손실 없음)
+                    "vector_b64": base64.b64encode(dense.tobytes()).decode("ascii"),
+                    "sparse": {"indices": sparse.indices, "values": sparse.values} if sparse else None,
+                    "payload": payload,
+                    "text": payload.pop("text", None) or texts.get(str(point.id)),
+                }
+            if next_offset is None:
+                break
+
+    def export_archive(self, path: str) -> Dict[str, Any]:
+        """
+        컬렉션을 tar.gz 아카이브로 내보내기 (파트 단위로 임시 파일에 쓴 뒤 추가하여 메모리 사용량 제한)
+
+        Args:
+            path: 생성할 아카이브 경로
+
+        Returns:
+            manifest
+
+        Raises:
+            ValueError: VECTOR_STORE가 qdrant가 아닌 경우
+        """
+        require_qdrant("스냅샷")
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.partial"
+        parts: List[str] = []
+        points_count = 0
+
+        with tarfile.open(tmp_path, "w:gz") as archive:
+            part = None
+
+            def close_part():
+                part.flush()
+                info = archive.gettarinfo(part.name, arcname=parts[-1])
+                part.seek(0)
+                archive.addfile(info, part)
+                part.close()
+
+            try:
+                for record in self._iter_points():
+                    if points_count % self.POINTS_PER_PART == 0:
+                        if part is not None:
+                            close_part()
+                        parts.append(f"points-{len(parts):05d}.ndjson")
+                        part = tempfile.NamedTemporaryFile(mode="w+b", suffix=".ndjson", delete=True)
+                    part.write(json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n")
+                    points_count += 1
+                if part is not None:
+                    close_part()
+            except BaseException:
+                if part is not None:
+                    part.close()
+                raise
+
+            manifest = self.build_manifest(points_count, parts)
+            data = json.dumps(manifest, ensure_ascii=False, indent=2).encode("utf-8")
+            info = tarfile.TarInfo("manifest.json")
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+
+        os.replace(tmp_path, path)
+        print(f"✅ [snapshot] 내보내기 완료: {path} (포인트 {points_count}개)")
+        return manifest
+
+    # ===== 가져오기 =====
+
+    @staticmethod
+    def read_manifest(archive: tarfile.TarFile) -> Dict[str, Any]:
+        try:
+            member = archive.extractfile("manifest.json")
+        except KeyError:
+            raise SnapshotValidationError("manifest.json이 없는 아카이브입니다")
+        return json.loads(member.read())
+
+    def validate_manifest(self, manifest: Dict[str, Any]) -> None:
+        """
+        아카이브의 임베딩 모델/차원이 현재 서버 설정과 같은지 확인
+
+        Raises:
+            SnapshotValidationError: 형식 버전, 모델 이름, 벡터 차원이 다른 경우
+        """
+        if manifest.get("format_version") != FORMAT_VERSION:
+            raise SnapshotValidationError(f"지원하지 않는 스냅샷 형식 버전: {manifest.get('format_version')}")
+        if manifest.get("embedding_model") != self.qdrant.embedding_model_name:
+            raise SnapshotValidationError(
+                f"임베딩 모델이 다릅니다 (스냅샷: {manifest.get('embedding_model')}, "
+                f"서버: {self.qdrant.embedding_model_name})"
+            )
+        if manifest.get("vector_size") != self.qdrant.vector_size:
+            raise SnapshotValidationError(
+                f"벡터 차원이 다릅니다 (스냅샷: {manifest.get('vector_size')}, 서버: {self.qdrant.vector_size})"
+            )
+
+    def _to_point(self, record: Dict[str, Any]) -> PointStruct:
+        dense = np.frombuffer(base64.b64decode(record["vector_b64"]), dtype=np.float32).tolist()
+        if record.get("text") and "snippet" not in record["payload"]:
+            # 본문 저장소 도입 이전 포인트: payload 전문 대신 스니펫 기록
+            record["payload"]["snippet"] = record["text"][:self.qdrant.snippet_length]
+        if not self.qdrant.sparse_enabled:
+            return PointStruct(id=record["id"], vector=dense, payload=record["payload"])
+
+        sparse = record.get("sparse")
+        if sparse:
+            sparse_vector = SparseVector(indices=sparse["indices"], values=sparse["values"])
+        else:
+            # 희소 벡터가 없는 스냅샷은 본문으로 다시 계산 (모델 불필요)
+            sparse_vector = self.qdrant.sparse_encoder.encode_document(record.get("text") or "")
+        return PointStruct(
+            id=record["id"],
+            vector={"": dense, self.qdrant.sparse_vector_name: sparse_vector},
+            payload=record["payload"]
+        )
+
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> int:
+        """본문 저장 후 포인트 업서트 (검색 결과에서 본문을 항상 찾을 수 있도록 본문 먼저)"""
+        by_doc: Dict[str, List] = {}
+        for record in batch:
+            if record.get("text") is None:
+                continue
+            payload = record["payload"]
+            by_doc.setdefault(payload.get("doc_id", record["id"]), []).append(
+                (record["id"], payload.get("chunk_index", 0), record["text"])
+            )
+        for doc_id, chunks in by_doc.items():
+            self.qdrant.text_store.put_chunks(doc_id, chunks)
+
+        self.qdrant.client.upsert(
+            collection_name=self.qdrant.collection_name,
+            points=[self._to_point(record) for record in batch],
+            wait=True
+        )
+        return len(batch)
+
+    def import_archive(
+        self,
+        path: str,
+        workers: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        progress: Optional[Callable[[int, int], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        스냅샷 아카이브를 현재 컬렉션으로 가져오기 (배치 병렬 업서트, 재임베딩 없음)
+
+        같은 포인트 ID는 덮어쓰므로 중단 후 다시 실행해도 안전함
+
+        Args:
+            path: 아카이브 경로
+            workers: 동시 업서트 수 (기본 SNAPSHOT_IMPORT_WORKERS)
+            batch_size: 업서트 1회당 포인트 수 (기본 SNAPSHOT_IMPORT_BATCH_SIZE)
+            progress: 진행 콜백 (가져온 포인트 수, 전체 포인트 수)
+
+        Returns:
+            manifest, imported
+
+        Raises:
+            SnapshotValidationError: 임베딩 모델/차원 불일치 등
+            ValueError: VECTOR_STORE가 qdrant가 아닌 경우
+        """
+        require_qdrant("스냅샷")
+        workers = workers or self.import_workers
+        batch_size = batch_size or self.import_batch_size
+
+        with tarfile.open(path, "r:gz") as archive:
+            manifest = self.read_manifest(archive)
+            self.validate_manifest(manifest)
+            # 컬렉션 생성/희소 벡터 지원 여부 확인
+            _ = self.qdrant.client
+
+            imported = 0
+            total = manifest.get("points_count", 0)
+            in_flight = deque()
+
+            def wait_oldest():
+                nonlocal imported
+                # 실패한 배치가 있으면 예외 전파
+                imported += in_flight.popleft().result()
+                if progress:
+                    progress(imported, total)
+
+            try:
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="snapshot-import") as executor:
+                    def submit(batch):
+                        # 메모리 사용량 제한: 진행 중인 배치가 workers * 2개를 넘으면 가장 오래된 배치 완료 대기
+                        while len(in_flight) >= workers * 2:
+                            wait_oldest()
+                        in_flight.append(executor.submit(self._write_batch, batch))
+
+                    for part_name in manifest.get("parts", []):
+                        batch = []
+                        for line in archive.extractfile(part_name):
+                            batch.append(json.loads(line))
+                            if len(batch) >= batch_size:
+                                submit(batch)
+                                batch = []
+                        if batch:
+                            submit(batch)
+                    while in_flight:
+                        wait_oldest()
+            finally:
+                # 일부만 가져온 경우에도 컬렉션이 바뀌었으므로 검색 결과 캐시 무효화
+                self.qdrant.invalidate_search_cache()
+
+        print(f"✅ [snapshot] 가져오기 완료: {path} (포인트 {imported}개)")
+        return {"manifest": manifest, "imported": imported}
+
+    # ===== 파일 관리 =====
+
+    def snapshot_path(self, name: str) -> str:
+        """스냅샷 디렉토리 내 아카이브 경로 (경로 조작 방지)"""
+        if os.path.basename(name) != name or not name.endswith(".tar.gz"):
+            raise ValueError("올바르지 않은 스냅샷 이름입니다")
+        return os.path.join(self.snapshot_dir, name)
+
+    def new_snapshot_name(self) -> str:
+        return f"{self.qdrant.collection_name}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.tar.gz"
+
+    def list_snapshots(self) -> List[Dict[str, Any]]:
+        if not os.path.isdir(self.snapshot_dir):
+            return []
+        snapshots = []
+        for name in sorted(os.listdir(self.snapshot_dir), reverse=True):
+            if not name.endswith(".tar.gz"):
+                continue
+            stat = os.stat(os.path.join(self.snapshot_dir, name))
+            snapshots.append({
+                "name": name,
+                "size": stat.st_size,
+                "created_at": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+            })
+        return snapshots
+
+
+# 싱글톤 인스턴스
+snapshot_service = CollectionSnapshotService()
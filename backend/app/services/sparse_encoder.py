@@ -0,0 +1,79 @@
+"""
+희소(sparse) 어휘 벡터 인코더
+밀집 임베딩이 놓치는 이름, 기술 용어(Kubernetes, FastAPI), 숫자의 정확 일치를 잡기 위한
+BM25 방식 어휘 벡터를 만든다.
+
+- 영문/숫자: 단어 단위 토큰 (소문자)
+- 한글: 음절 bigram (조사가 붙은 어절도 부분 일치되도록) + 1음절 어절은 그대로
+- 토큰은 crc32 해시로 차원 인덱스에 대응 (사전 불필요)
+- 문서 가중치는 BM25 TF 포화식, IDF는 Qdrant 컬렉션(Modifier.IDF)에서 계산
+"""
+import os
+import re
+import unicodedata
+import zlib
+from collections import Counter
+from typing import Dict, List
+
+from qdrant_client.models import SparseVector
+
+
+# 영문/숫자 토큰 (c++, node.js, 3.11 같은 표기 포함)
+_WORD_RE = re.compile(r"[0-9a-z]+(?:[.+#][0-9a-z]+)*\+*")
+# 한글 어절
+_HANGUL_RE = re.compile(r"[가-힣]+")
+
+
+class SparseEncoder:
+    """BM25 방식 희소 벡터 인코더"""
+
+    def __init__(self):
+        # BM25 파라미터 (k1: TF 포화 정도, b: 문서 길이 정규화 강도)
+        self.k1 = float(os.getenv("SPARSE_BM25_K1", "1.2"))
+        self.b = float(os.getenv("SPARSE_BM25_B", "0.75"))
+        # 평균 청크 토큰 수 (CHUNK_SIZE=200 기준 근사값)
+        self.avg_doc_length = float(os.getenv("SPARSE_AVG_DOC_LENGTH", "150"))
+
+    @staticmethod
+    def tokenize(text: str) -> List[str]:
+        """텍스트를 어휘 토큰 목록으로 변환"""
+        text = unicodedata.normalize("NFKC", text).lower()
+        tokens = [f"w:{word}" for word in _WORD_RE.findall(text)]
+        for word in _HANGUL_RE.findall(text):
+            if len(word) == 1:
+                tokens.append(f"h:{word}")
+            else:
+                tokens.extend(f"h:{word[i:i + 2]}" for i in range(len(word) - 1))
+        return tokens
+
+    @staticmethod
+    def _index(token: str) -> int:
+        return zlib.crc32(token.encode("utf-8"))
+
+    @classmethod
+    def _to_sparse(cls, weights: Dict[str, float]) -> SparseVector:
+        # 해시 충돌로 같은 인덱스가 된 토큰은 가중치 합산
+        merged: Dict[int, float] = {}
+        for token, weight in weights.items():
+            index = cls._index(token)
+            merged[index] = merged.get(index, 0.0) + weight
+        indices = sorted(merged)
+        return SparseVector(indices=indices, values=[merged[i] for i in indices])
+
+    def encode_document(self, text: str) -> SparseVector:
+        """문서(청크) 희소 벡터 (BM25 TF 가중치)"""
+        counts = Counter(self.tokenize(text))
+        length = sum(counts.values())
+        norm = self.k1 * (1 - self.b + self.b * length / self.avg_doc_length)
+        return self._to_sparse({
+            token: tf * (self.k1 + 1) / (tf + norm)
+            for token, tf in counts.items()
+        })
+
+    def encode_query(self, text: str) -> SparseVector:
+        """질의 희소 벡터 (토큰별 가중치 1, IDF는 Qdrant에서 적용)"""
+        return self._to_sparse({token: 1.0 for token in set(self.tokenize(text))})
+
+
+# 싱글톤 인스턴스
+sparse_encoder = SparseEncoder()
@@ -1,12 +1,18 @@
 """
 SQL Agent - 자연어 질의를 SQL로 변환하고 실행
 PostgreSQL 데이터베이스 조회 및 결과 해석
+
+자주 나오는 질의는 SQL 템플릿(app.services.sql_templates)으로 LLM 호출 없이 처리하고,
+매칭되지 않은 질의만 LLM으로 SQL을 생성한다.
 """
+import asyncio
 from typing import Dict, Any, List, Optional
 from sqlmodel import Session, select
 from app.services.ollama_service import ollama_service
-from app.models.applicant import Applicant
+from app.services.sql_executor import sql_executor
+from app.services.sql_templates import sql_template_service
 from app.models.few_shot import FewShot
+from app.utils.sql_validator import extract_sql
 
 
 class SQLAgent:
@@ -14,6 +20,8 @@ class SQLAgent:
 
     def __init__(self):
         self.ollama = ollama_service
+        self.executor = sql_executor
+        self.templates = sql_template_service
 
     async def execute_query(self, query: str, session: Session) -> Dict[str, Any]:
         """
@@ -26,30 +34,61 @@ class SQLAgent:
         Returns:
             실행 결과 및 자연어 답변
         """
+        # 0. SQL 템플릿 빠른 경로 (LLM 호출 없음)
+        template_result = await self._execute_template(query)
+        if template_result:
+            return template_result
+
         # 1. Few-shot 예제 가져오기
         few_shots = self._get_active_fewshots(session, intent_type="sql_query")
 
         # 2. 자연어 -> SQL 변환 (Few-shot 포함)
         sql_info = await self._generate_sql(query, few_shots)
 
-        # 3. SQL 실행
+        # 3. SQL 검증 및 실행 (DB 호출은 스레드에서 수행)
         try:
-            results = self._execute_sql(sql_info, session)
+            execution = await asyncio.to_thread(self._execute_sql, sql_info, session)
         except Exception as e:
             return {
                 "answer": f"쿼리 실행 중 오류가 발생했습니다: {str(e)}",
                 "sql": sql_info.get("sql", ""),
                 "error": str(e)
             }
+        results = execution["rows"]
 
         # 4. 결과를 자연어로 해석 (Few-shot 포함)
         answer = await self._interpret_results(query, results, few_shots)
 
         return {
             "answer": answer,
-            "sql": sql_info.get("sql", ""),
+            "sql": execution["sql"],
             "results": results,
-            "count": len(results)
+            "count": len(results),
+            "truncated": execution["truncated"],
+            "cached": execution["cached"]
+        }
+
+    async def _execute_template(self, query: str) -> Optional[Dict[str, Any]]:
+        """
+        SQL 템플릿으로 처리 (매칭 실패/실행 실패 시 None → LLM 경로)
+        """
+        try:
+            match = await asyncio.to_thread(self.templates.match, query)
+            if not match:
+                return None
+            execution = await asyncio.to_thread(self.templates.execute, match)
+        except Exception as e:
+            print(f"⚠️  [sql-template] 템플릿 처리 실패, LLM 경로 사용: {e}")
+            return None
+
+        return {
+            "answer": execution["answer"],
+            "sql": execution["sql"],
+            "results": execution["rows"],
+            "count": execution["row_count"],
+            "truncated": execution["truncated"],
+            "cached": execution["cached"],
+            "template": match.template.name
         }
 
     def _get_active_fewshots(
@@ -103,65 +142,25 @@ class SQLAgent:
 
 자연어 질의: {query}
 
-SQL 쿼리만 작성하세요 (SELECT 문):""")
+SQL 쿼리만 작성하세요 (applicant_info 테이블에 대한 SELECT 문 1개, 개수/통계는 COUNT, GROUP BY 등 SQL 집계 사용):""")
 
         prompt = "\n".join(prompt_parts)
         sql = await self.ollama.generate(prompt)
 
-        # SQL 정제 (주석, 설명 제거)
-        sql_lines = [line.strip() for line in sql.split('\n') if line.strip() and not line.strip().startswith('--')]
-        clean_sql = ' '.join(sql_lines)
-
-        return {"sql": clean_sql}
+        # SQL 정제 (코드 블록, 앞뒤 설명, 끝의 세미콜론 제거)
+        return {"sql": extract_sql(sql)}
 
-    def _execute_sql(self, sql_info: Dict[str, str], session: Session) -> List[Dict[str, Any]]:
+    def _execute_sql(self, sql_info: Dict[str, str], session: Session) -> Dict[str, Any]:
         """
-        간단한 SQL 실행 (보안을 위해 제한적으로 구현)
+        생성된 SQL을 검증 후 실행 (app.services.sql_executor)
+
+        허용 테이블에 대한 읽기 전용 SELECT만 실행하며, 행 수/실행 시간/예상 비용이 제한된다.
+        집계(COUNT 등)는 PostgreSQL에서 계산한다.
 
-        현재는 미리 정의된 쿼리 패턴만 지원
-        실제 운영에서는 더 정교한 SQL 파싱 및 검증 필요
+        Raises:
+            ValueError: 허용되지 않는 SQL 또는 실행 실패
         """
-        query_lower = sql_info.get("sql", "").lower()
-
-        # 단순 전체 조회
-        if "select" in query_lower and "from applicant_info" in query_lower:
-            # 제한적 실행: 최대 10개만 조회
-            statement = select(Applicant).limit(10)
-            applicants = session.exec(statement).all()
-
-            return [
-                {
-                    "id": app.id,
-                    "reason": app.reason[:100] + "..." if app.reason and len(app.reason) > 100 else app.reason,
-                    "experience": app.experience[:100] + "..." if app.experience and len(app.experience) > 100 else app.experience,
-                    "skill": app.skill[:100] + "..." if app.skill and len(app.skill) > 100 else app.skill
-                }
-                for app in applicants
-            ]
-
-        # COUNT 쿼리
-        elif "count" in query_lower:
-            statement = select(Applicant)
-            count = len(session.exec(statement).all())
-            return [{"count": count}]
-
-        # ID로 조회
-        elif "where id" in query_lower or "id =" in query_lower:
-            # ID 추출 (간단한 패턴)
-            import re
-            match = re.search(r'id\s*=\s*(\d+)', query_lower)
-            if match:
-                applicant_id = int(match.group(1))
-                applicant = session.get(Applicant, applicant_id)
-                if applicant:
-                    return [{
-                        "id": applicant.id,
-                        "reason": applicant.reason,
-                        "experience": applicant.experience,
-                        "skill": applicant.skill
-                    }]
-
-        return []
+        return self.executor.execute(sql_info.get("sql", ""))
 
     async def _interpret_results(self, query: str, results: List[Dict[str, Any]], few_shots: List[FewShot] = None) -> str:
         """SQL 실행 결과를 자연어로 해석 (Few-shot 예제 포함)"""
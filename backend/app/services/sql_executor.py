@@ -0,0 +1,170 @@
+"""
+SQL 안전 실행기
+SQLAgent가 생성한 SQL을 검증(app.utils.sql_validator)한 뒤 PostgreSQL에서 직접 실행한다.
+
+- 읽기 전용 트랜잭션 + statement_timeout (실행 후 항상 롤백)
+- 조회 전용 DB 역할(SQL_EXECUTOR_ROLE, migrations/010)로 전환 후 실행 - 앱 계정이 슈퍼유저여도
+  서버 파일 읽기(pg_read_file 등)나 허용 테이블 밖 조회는 DB 권한에서 거부됨
+- 결과 행 수 제한: 원래 쿼리를 서브쿼리로 감싸 LIMIT을 강제 (SQL_MAX_ROWS + 1개로 잘림 여부 판단)
+- EXPLAIN 예상 비용이 SQL_MAX_COST를 넘으면 실행하지 않음
+- 서버 측 커서(named cursor)로 필요한 행만 가져옴 (집계는 PostgreSQL이 계산)
+- 같은 SQL + 파라미터 결과는 테이블 버전이 바뀔 때까지 캐시 (app.services.sql_result_cache)
+"""
+import os
+import time
+import uuid
+from typing import Any, Dict, Optional
+
+from app.database import engine
+from app.services.sql_result_cache import sql_result_cache
+from app.utils.sql_validator import SQLValidator, SQLValidationError, ValidatedSQL
+
+
+class SQLExecutionError(ValueError):
+    """SQL 실행 실패 (시간 초과, 문법 오류 등)"""
+
+
+class SafeSQLExecutor:
+    """검증된 읽기 전용 SELECT만 제한된 자원으로 실행"""
+
+    def __init__(self):
+        self.schema = os.getenv("DB_SCHEMA", "public")
+        # 조회를 허용할 테이블 (쉼표 구분)
+        allowed_tables = os.getenv("SQL_ALLOWED_TABLES", "applicant_info").split(",")
+        self.validator = SQLValidator(allowed_tables, allowed_schemas={"public", self.schema})
+        # 쿼리 실행 시간 제한 (밀리초)
+        self.statement_timeout_ms = int(os.getenv("SQL_STATEMENT_TIMEOUT_MS", "5000"))
+        # 반환할 최대 행 수
+        self.max_rows = int(os.getenv("SQL_MAX_ROWS", "100"))
+        # EXPLAIN 예상 비용 상한 (0이면 확인 안 함)
+        self.max_cost = float(os.getenv("SQL_MAX_COST", "100000"))
+        # 서버 측 커서에서 한 번에 가져올 행 수
+        self.fetch_size = int(os.getenv("SQL_FETCH_SIZE", "100"))
+        # 결과 셀 최대 길이 (긴 텍스트는 잘라서 반환, 0이면 자르지 않음)
+        self.max_value_length = int(os.getenv("SQL_MAX_VALUE_LENGTH", "500"))
+        # 쿼리를 실행할 조회 전용 역할 (SELECT 권한은 SQL_ALLOWED_TABLES에만 부여, migrations/010)
+        # 비워두면 앱 계정 권한으로 실행하며, 이때 앱 계정이 슈퍼유저면 실행을 거부
+        self.role = os.getenv("SQL_EXECUTOR_ROLE", "sql_agent_reader")
+        self.result_cache = sql_result_cache
+
+    def validate(self, sql: str) -> ValidatedSQL:
+        """
+        SQL 검증 (실행하지 않음)
+
+        Raises:
+            SQLValidationError: 허용되지 않는 SQL
+        """
+        return self.validator.validate(sql)
+
+    def _limited_sql(self, validated: ValidatedSQL, limit: int) -> str:
+        # 원래 쿼리의 ORDER BY/LIMIT은 서브쿼리 안에서 그대로 적용됨
+        return f"SELECT * FROM ({validated.sql}) AS limited_query LIMIT {int(limit)}"
+
+    def _truncate(self, value: Any) -> Any:
+        if self.max_value_length and isinstance(value, str) and len(value) > self.max_value_length:
+            return value[:self.max_value_length] + "..."
+        return value
+
+    def _drop_privileges(self, cursor) -> None:
+        """
+        트랜잭션 동안 조회 전용 역할로 전환 (역할 미설정 시 슈퍼유저 계정이면 거부)
+
+        Raises:
+            SQLExecutionError: 슈퍼유저 계정으로 역할 없이 실행하려는 경우
+        """
+        if self.role:
+            cursor.execute('SET LOCAL ROLE "{}"'.format(self.role.replace('"', '""')))
+            return
+        cursor.execute("SELECT rolsuper FROM pg_roles WHERE rolname = current_user")
+        row = cursor.fetchone()
+        if row and row[0]:
+            raise SQLExecutionError(
+                "슈퍼유저 계정으로는 자연어 SQL을 실행할 수 없습니다 "
+                "(SQL_EXECUTOR_ROLE에 조회 전용 역할을 설정하세요, migrations/010 참고)"
+            )
+
+    def execute(self, sql: str, params: Optional[Dict[str, Any]] = None, max_rows: Optional[int] = None) -> Dict[str, Any]:
+        """
+        SQL 검증 후 실행
+
+        Args:
+            sql: 실행할 SELECT 문 (%(name)s 형식 파라미터 사용 가능)
+            params: 쿼리 파라미터
+            max_rows: 최대 행 수 (기본 SQL_MAX_ROWS, 그보다 크게 지정할 수 없음)
+
+        Returns:
+            sql(검증된 원문), columns, rows(dict 리스트), row_count, truncated, estimated_cost, elapsed_ms,
+            cached(결과 캐시에서 반환했는지 여부)
+
+        Raises:
+            SQLValidationError: 허용되지 않는 SQL 또는 예상 비용 초과
+            SQLExecutionError: 실행 실패 (시간 초과 포함)
+        """
+        validated = self.validate(sql)
+        limit = min(max_rows or self.max_rows, self.max_rows)
+        return self.result_cache.get_or_execute(
+            validated, params, limit, lambda: self._execute(validated, params, limit)
+        )
+
+    def _execute(self, validated: ValidatedSQL, params: Optional[Dict[str, Any]], limit: int) -> Dict[str, Any]:
+        """검증된 SQL을 읽기 전용 트랜잭션에서 실행 (캐시 미스 시)"""
+        import psycopg2
+
+        limited_sql = self._limited_sql(validated, limit + 1)
+
+        started = time.perf_counter()
+        connection = engine.raw_connection()
+        try:
+            dbapi_connection = connection.driver_connection
+            dbapi_connection.rollback()
+            # 읽기 전용 트랜잭션 (검증을 우회한 쓰기도 DB가 거부)
+            dbapi_connection.set_session(readonly=True)
+            try:
+                with dbapi_connection.cursor() as cursor:
+                    self._drop_privileges(cursor)
+                    cursor.execute(f"SET LOCAL statement_timeout = {int(self.statement_timeout_ms)}")
+                    # 스키마 없이 쓴 테이블 이름은 DB_SCHEMA에서 찾음
+                    cursor.execute(f'SET LOCAL search_path = "{self.schema}", public')
+
+                    estimated_cost = None
+                    if self.max_cost > 0:
+                        cursor.execute(f"EXPLAIN (FORMAT JSON) {limited_sql}", params)
+                        plan = cursor.fetchone()[0]
+                        estimated_cost = float(plan[0]["Plan"]["Total Cost"])
+                        if estimated_cost > self.max_cost:
+                            raise SQLValidationError(
+                                f"쿼리 예상 비용이 너무 큽니다 ({estimated_cost:.0f} > {self.max_cost:.0f}), "
+                                f"조건을 추가하거나 집계 쿼리를 사용하세요"
+                            )
+
+                # 서버 측 커서: 결과를 한 번에 전송받지 않고 fetch_size씩 가져옴
+                with dbapi_connection.cursor(name=f"sql_agent_{uuid.uuid4().hex[:12]}") as cursor:
+                    cursor.itersize = self.fetch_size
+                    cursor.execute(limited_sql, params)
+                    rows = cursor.fetchmany(limit + 1)
+                    columns = [column.name for column in cursor.description]
+            except psycopg2.errors.QueryCanceled:
+                raise SQLExecutionError(f"쿼리 실행 시간이 제한({self.statement_timeout_ms}ms)을 초과했습니다")
+            except psycopg2.Error as e:
+                raise SQLExecutionError(f"쿼리 실행 실패: {str(e).strip()}")
+            finally:
+                dbapi_connection.rollback()
+                dbapi_connection.set_session(readonly=False)
+        finally:
+            connection.close()
+
+        truncated = len(rows) > limit
+        rows = rows[:limit]
+        return {
+            "sql": validated.sql,
+            "columns": columns,
+            "rows": [{column: self._truncate(value) for column, value in zip(columns, row)} for row in rows],
+            "row_count": len(rows),
+            "truncated": truncated,
+            "estimated_cost": estimated_cost,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+
+
+# 싱글톤 인스턴스
+sql_executor = SafeSQLExecutor()
@@ -0,0 +1,171 @@
+"""
+SQL 결과 캐시
+SafeSQLExecutor가 실행한 SELECT 결과를 정규화된 SQL + 파라미터 + 참조 테이블의 캐시 버전을 키로 저장한다.
+applicant_info처럼 거의 바뀌지 않는 테이블에 같은 쿼리(템플릿/LLM 생성 SQL)가 반복될 때 DB 실행을 건너뛴다.
+
+테이블이 바뀌면 PostgreSQL 트리거(migrations/009)가 cache_versions의 "table:<스키마>.<테이블>" 버전을 올리고
+pg_notify로 알린다. 각 서버는 app.services.cache_versions로 최신 버전을 받아 캐시 키에 포함하므로
+이전 결과는 더 이상 조회되지 않고 LRU에서 밀려난다. 트리거가 없는 DB를 위해 TTL도 함께 적용한다.
+
+테이블을 참조하지 않는 쿼리(SELECT now() 등)와 실행 시점에 따라 결과가 달라지는 쿼리
+(now(), CURRENT_DATE, age(), 'today' 등)는 캐시하지 않는다.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from app.services.cache_versions import cache_versions
+from app.utils.lru_cache import SizedLRUCache
+from app.utils.sql_validator import ValidatedSQL, tokenize
+
+# 호출 시점에 따라 결과가 달라지는 함수 (인자 1개 age()는 현재 날짜 기준)
+# 검증기 허용 목록(ALLOWED_FUNCTIONS)에 추가될 수 있는 것까지 포함
+VOLATILE_FUNCTIONS = {
+    "now", "age", "random", "clock_timestamp", "statement_timestamp", "transaction_timestamp",
+    "timeofday", "gen_random_uuid",
+}
+# 괄호 없이 쓰는 현재 시각 키워드
+VOLATILE_KEYWORDS = {"current_date", "current_time", "current_timestamp", "localtime", "localtimestamp"}
+# 날짜/시각으로 변환되는 특수 문자열 ('today'::date 등)
+VOLATILE_LITERALS = {"'now'", "'today'", "'tomorrow'", "'yesterday'"}
+
+
+class SqlResultCache:
+    """테이블 버전 기반 SQL 결과 LRU 캐시"""
+
+    def __init__(self):
+        self.enabled = os.getenv("SQL_RESULT_CACHE_ENABLED", "true").lower() == "true"
+        self.schema = os.getenv("DB_SCHEMA", "public")
+        max_bytes = int(float(os.getenv("SQL_RESULT_CACHE_MAX_MB", "16")) * 1024 * 1024)
+        # 결과 하나의 최대 크기 (큰 결과가 캐시를 독차지하지 않도록, 초과 시 저장 안 함)
+        max_entry_bytes = int(float(os.getenv("SQL_RESULT_CACHE_MAX_ENTRY_KB", "256")) * 1024)
+        # 트리거 없이 변경된 경우를 대비한 최대 보관 시간 (초, 0이면 버전 변경 시에만 무효화)
+        self.ttl_seconds = float(os.getenv("SQL_RESULT_CACHE_TTL_SECONDS", "300"))
+        self._memory = SizedLRUCache(max_bytes=max_bytes, max_entry_bytes=max_entry_bytes)
+        self._stats_lock = threading.Lock()
+        self.saved_ms = 0.0
+        self.expired = 0
+        self.uncacheable = 0
+
+    @staticmethod
+    def normalize_sql(sql: str) -> str:
+        """
+        캐시 키용 SQL 정규화 (공백/주석 제거, 따옴표 없는 키워드/식별자는 소문자)
+
+        문자열 리터럴과 따옴표 식별자는 그대로 유지한다.
+        """
+        return " ".join(value.lower() if kind == "word" else value for kind, value in tokenize(sql))
+
+    @staticmethod
+    def is_cacheable(validated: ValidatedSQL) -> bool:
+        """테이블을 참조하고 실행 시점에 따라 결과가 달라지지 않는 쿼리인지"""
+        if not validated.tables:
+            return False
+        for kind, value in tokenize(validated.sql):
+            lowered = value.lower()
+            if kind == "word" and (lowered in VOLATILE_FUNCTIONS or lowered in VOLATILE_KEYWORDS):
+                return False
+            if kind == "string" and lowered.replace(" ", "") in VOLATILE_LITERALS:
+                return False
+        return True
+
+    def version_names(self, tables: Iterable[str]) -> List[str]:
+        """참조 테이블의 캐시 버전 이름 (스키마 없이 쓴 테이블은 DB_SCHEMA → public 순으로 찾으므로 둘 다 포함)"""
+        schemas = sorted({self.schema, "public"})
+        return [f"table:{schema}.{table}" for table in sorted(tables) for schema in schemas]
+
+    def make_key(self, validated: ValidatedSQL, params: Optional[Dict[str, Any]], limit: int) -> bytes:
+        """
+        캐시 키 (SHA-256)
+
+        Args:
+            validated: 검증된 SQL (참조 테이블 포함)
+            params: 쿼리 파라미터
+            limit: 최대 행 수
+        """
+        versions = [f"{name}={cache_versions.get(name)}" for name in self.version_names(validated.tables)]
+        digest = hashlib.sha256()
+        digest.update(self.normalize_sql(validated.sql).encode("utf-8"))
+        digest.update(b"\x00")
+        digest.update(json.dumps(params or {}, sort_keys=True, default=str, ensure_ascii=False).encode("utf-8"))
+        digest.update(f"\x00{int(limit)}\x00{','.join(versions)}".encode("utf-8"))
+        return digest.digest()
+
+    @staticmethod
+    def _copy(result: Dict[str, Any]) -> Dict[str, Any]:
+        # 호출 측이 결과를 수정해도 캐시된 값은 바뀌지 않도록 복사
+        return {**result, "columns": list(result["columns"]), "rows": [dict(row) for row in result["rows"]]}
+
+    @staticmethod
+    def _estimate_size(result: Dict[str, Any]) -> int:
+        return len(json.dumps(result, default=str, ensure_ascii=False).encode("utf-8"))
+
+    def get_or_execute(
+        self,
+        validated: ValidatedSQL,
+        params: Optional[Dict[str, Any]],
+        limit: int,
+        execute: Callable[[], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        캐시된 결과 반환, 없으면 실행 후 저장
+
+        버전은 실행 전에 읽으므로, 실행 중에 테이블이 바뀌어도 이전 버전 키로만 저장되어
+        변경 후의 조회에 오래된 결과가 반환되지 않는다.
+
+        Args:
+            validated: 검증된 SQL
+            params: 쿼리 파라미터
+            limit: 최대 행 수
+            execute: 실제 실행 함수 (SafeSQLExecutor 결과 dict 반환)
+
+        Returns:
+            실행 결과 + cached (캐시에서 반환했는지 여부)
+        """
+        if not self.enabled:
+            return {**execute(), "cached": False}
+        if not self.is_cacheable(validated):
+            with self._stats_lock:
+                self.uncacheable += 1
+            return {**execute(), "cached": False}
+
+        key = self.make_key(validated, params, limit)
+        entry = self._memory.get(key)
+        if entry is not None:
+            result, stored_at = entry
+            if not self.ttl_seconds or time.monotonic() - stored_at < self.ttl_seconds:
+                with self._stats_lock:
+                    self.saved_ms += result["elapsed_ms"]
+                return {**self._copy(result), "cached": True}
+            self._memory.pop(key)
+            with self._stats_lock:
+                self.expired += 1
+
+        result = execute()
+        self._memory.put(key, (self._copy(result), time.monotonic()), size=self._estimate_size(result))
+        return {**result, "cached": False}
+
+    def clear(self) -> None:
+        self._memory.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 히트율, 사용량, 절약한 실행 시간"""
+        stats = self._memory.get_stats()
+        # TTL이 지나 다시 실행한 조회는 미스로 집계
+        stats["hits"] -= self.expired
+        stats["misses"] += self.expired
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["enabled"] = self.enabled
+        stats["max_entry_bytes"] = self._memory.max_entry_bytes
+        stats["expired"] = self.expired
+        stats["uncacheable"] = self.uncacheable
+        stats["saved_ms"] = round(self.saved_ms, 1)
+        return stats
+
+
+# 싱글톤 인스턴스
+sql_result_cache = SqlResultCache()
@@ -0,0 +1,313 @@
+"""
+SQL 템플릿 빠른 경로
+자주 나오는 자연어 SQL 질의(전체 인원, N번 지원자, 최근 N명, 기술별 필터 등)를
+정규식 또는 예시 질의 임베딩 유사도로 매칭해 LLM 호출 없이 파라미터화 SQL을 실행하고
+답변 템플릿으로 바로 응답한다. 매칭되지 않은 질의만 SQLAgent의 LLM 경로로 넘어간다.
+
+정규식은 질의 전체를 덮어야 한다: 매칭 구간 밖에 요청/어미 표현(_FILLER_RE) 외의 말이 남으면
+("최근 지원자 10명", "Python 가진 지원자 중 최근 3명") 템플릿이 놓친 조건이 있는 것으로 보고 LLM 경로로 넘긴다.
+임베딩 유사도는 조건을 뽑아낼 수 없으므로 파라미터가 있는 템플릿에만, 숫자가 없는 질의에만 사용한다.
+
+템플릿은 sql_templates 테이블에서 관리하며(/api/sql-templates), 변경 시 즉시 다시 읽고
+다른 서버의 변경은 SQL_TEMPLATE_RELOAD_SECONDS마다 반영한다.
+"""
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from string import Formatter
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+import numpy as np
+from sqlmodel import Session, select
+
+from app.database import engine
+from app.models.sql_template import SqlTemplate
+from app.services.sql_executor import sql_executor
+
+
+# SQL 파라미터 자리 (%(이름)s)
+_PARAM_RE = re.compile(r"%\((\w+)\)s")
+
+# 파라미터 타입 변환
+PARAM_TYPES = {"int": int, "float": float, "str": str}
+
+# 정규식 매칭 구간 밖에 남아도 되는 말 (요청 표현, 어미, 조사, 문장 부호)
+_FILLER_RE = re.compile(r"""(?:
+    \s | [?.!~,]
+  | (?:보여|알려|찾아|조회해|출력해)\s*(?:줘|주세요|줄래|봐)
+  | 목록 | 리스트 | 명단 | 정보 | 조회 | 좀 | 전부 | 모두
+  | 이야 | 야 | 이에요 | 예요 | 인가요 | 입니까 | 요 | 은 | 는
+)*""", re.VERBOSE)
+
+
+@dataclass
+class _LoadedTemplate:
+    template: SqlTemplate
+    regex: Optional[Pattern]
+    params: List[str]
+    example_vectors: Optional[np.ndarray] = None
+
+
+@dataclass
+class TemplateMatch:
+    """질의와 매칭된 템플릿"""
+    template: SqlTemplate
+    params: Dict[str, Any]
+    method: str  # regex, embedding
+    score: float = 1.0
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """코사인 유사도 계산용 L2 정규화"""
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+class _FormatValues(dict):
+    """답변 템플릿에 없는 값은 그대로 남김"""
+
+    def __missing__(self, key):
+        return "{" + key + "}"
+
+
+class SqlTemplateService:
+    """SQL 템플릿 로드/매칭/실행"""
+
+    def __init__(self):
+        self.enabled = os.getenv("SQL_TEMPLATE_ENABLED", "true").lower() == "true"
+        # 임베딩 유사도 매칭 임계값 (코사인, 0이면 정규식 매칭만 사용)
+        self.similarity_threshold = float(os.getenv("SQL_TEMPLATE_SIMILARITY", "0.88"))
+        # 다른 서버에서 변경된 템플릿을 다시 읽는 간격 (초)
+        self.reload_seconds = float(os.getenv("SQL_TEMPLATE_RELOAD_SECONDS", "60"))
+        self._templates: Optional[List[_LoadedTemplate]] = None
+        self._loaded_at = 0.0
+        # 예시 질의 임베딩에 사용한 모델 (모델 교체 시 다시 임베딩)
+        self._embedding_model_name: Optional[str] = None
+        self._lock = threading.Lock()
+        # 여러 요청 스레드에서 함께 갱신
+        self._stats_lock = threading.Lock()
+        self.stats = {"regex_hits": 0, "embedding_hits": 0, "misses": 0, "errors": 0}
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            self.stats[name] += 1
+
+    # ===== 검증 =====
+
+    @staticmethod
+    def sql_params(sql_text: str) -> List[str]:
+        return sorted(set(_PARAM_RE.findall(sql_text)))
+
+    @classmethod
+    def validate_template(cls, template: SqlTemplate) -> None:
+        """
+        템플릿 검증 (저장 전 호출)
+
+        Raises:
+            ValueError: 정규식 오류, 허용되지 않는 SQL, 값을 얻을 수 없는 파라미터, 알 수 없는 타입
+        """
+        groups: set = set()
+        if template.pattern:
+            try:
+                groups = set(re.compile(template.pattern).groupindex)
+            except re.error as e:
+                raise ValueError(f"정규식 오류: {e}")
+        elif not template.example_queries:
+            raise ValueError("pattern 또는 example_queries 중 하나는 필요합니다")
+        elif not cls.sql_params(template.sql_text):
+            raise ValueError("파라미터가 없는 템플릿은 pattern이 필요합니다 (예시 질의 유사도 매칭은 파라미터가 있는 템플릿에만 사용)")
+
+        sql_executor.validate(template.sql_text)
+        for name in cls.sql_params(template.sql_text):
+            if name not in groups and name not in (template.param_defaults or {}):
+                raise ValueError(f"파라미터 '{name}'의 값을 정규식 그룹이나 기본값에서 얻을 수 없습니다")
+        for name, type_name in (template.param_types or {}).items():
+            if type_name not in PARAM_TYPES:
+                raise ValueError(f"지원하지 않는 파라미터 타입: {name}={type_name} ({', '.join(PARAM_TYPES)} 중 선택)")
+        try:
+            list(Formatter().parse(template.answer_template))
+        except ValueError as e:
+            raise ValueError(f"답변 템플릿 오류: {e}")
+
+    # ===== 로드 =====
+
+    def invalidate(self) -> None:
+        """템플릿 변경 후 호출 (다음 매칭 시 다시 읽음)"""
+        self._templates = None
+
+    def _fresh(self) -> bool:
+        from app.services.vector_store import vector_store
+
+        return (
+            self._templates is not None
+            and time.monotonic() - self._loaded_at < self.reload_seconds
+            and self._embedding_model_name == vector_store.embedding_model_name
+        )
+
+    def _load(self) -> List[_LoadedTemplate]:
+        templates = self._templates
+        if self._fresh():
+            return templates
+        with self._lock:
+            if self._fresh():
+                return self._templates
+            with Session(engine) as session:
+                rows = session.exec(
+                    select(SqlTemplate)
+                    .where(SqlTemplate.is_active == True)
+                    .order_by(SqlTemplate.priority.desc(), SqlTemplate.id)
+                ).all()
+            loaded = []
+            for row in rows:
+                try:
+                    regex = re.compile(row.pattern) if row.pattern else None
+                except re.error as e:
+                    print(f"⚠️  [sql-template] 정규식 오류로 건너뜀 ({row.name}): {e}")
+                    continue
+                loaded.append(_LoadedTemplate(template=row, regex=regex, params=self.sql_params(row.sql_text)))
+            self._embed_examples(loaded)
+            self._templates = loaded
+            self._loaded_at = time.monotonic()
+            return loaded
+
+    def _embed_examples(self, templates: List[_LoadedTemplate]) -> None:
+        from app.services.vector_store import vector_store
+
+        self._embedding_model_name = vector_store.embedding_model_name
+        if self.similarity_threshold <= 0:
+            return
+        for loaded in templates:
+            examples = loaded.template.example_queries or []
+            if not examples:
+                continue
+            try:
+                loaded.example_vectors = _normalize(np.vstack(vector_store.embed_texts(examples)))
+            except Exception as e:
+                print(f"⚠️  [sql-template] 예시 질의 임베딩 실패, 정규식 매칭만 사용 ({loaded.template.name}): {e}")
+                continue
+
+    # ===== 매칭/실행 =====
+
+    @staticmethod
+    def _covers(query: str, found: re.Match) -> bool:
+        """정규식 매칭 구간 밖에 요청/어미 표현만 남았는지 (다른 조건이 남아 있으면 False)"""
+        return _FILLER_RE.fullmatch(query[:found.start()] + " " + query[found.end():]) is not None
+
+    @staticmethod
+    def _convert(loaded: _LoadedTemplate, values: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """정규식 그룹 + 기본값으로 SQL 파라미터 구성 (값이 없거나 변환 실패 시 None)"""
+        template = loaded.template
+        params = {}
+        for name in set(loaded.params) | set(values):
+            value = values.get(name)
+            if value is None:
+                value = (template.param_defaults or {}).get(name)
+            if value is None:
+                if name in loaded.params:
+                    return None
+                continue
+            try:
+                params[name] = PARAM_TYPES[(template.param_types or {}).get(name, "str")](value)
+            except (ValueError, TypeError):
+                return None
+        return params
+
+    def match(self, query: str) -> Optional[TemplateMatch]:
+        """
+        질의와 매칭되는 템플릿 (우선순위 순으로 정규식 → 임베딩 유사도)
+
+        Returns:
+            TemplateMatch 또는 None (LLM 경로 사용)
+        """
+        if not self.enabled:
+            return None
+        templates = self._load()
+        if not templates:
+            return None
+
+        for loaded in templates:
+            if loaded.regex is None:
+                continue
+            found = loaded.regex.search(query)
+            if not found or not self._covers(query, found):
+                continue
+            params = self._convert(loaded, found.groupdict())
+            if params is not None:
+                self._count("regex_hits")
+                return TemplateMatch(template=loaded.template, params=params, method="regex")
+
+        # 파라미터 없는 템플릿은 조건이 붙은 질의("Python 지원자 수")에도 비슷하게 매칭되고,
+        # 숫자는 임베딩으로 구분되지 않으므로("최근 10명") 숫자가 있는 질의는 제외
+        candidates = [
+            loaded for loaded in templates if loaded.example_vectors is not None and loaded.params
+        ]
+        if candidates and not re.search(r"\d", query):
+            from app.services.vector_store import vector_store
+
+            query_vector = _normalize(np.asarray(vector_store.embed_query(query)))
+            best: Optional[Tuple[float, _LoadedTemplate]] = None
+            for loaded in candidates:
+                score = float(np.max(loaded.example_vectors @ query_vector))
+                if score >= self.similarity_threshold and (best is None or score > best[0]):
+                    best = (score, loaded)
+            if best is not None:
+                score, loaded = best
+                found = loaded.regex.search(query) if loaded.regex else None
+                params = self._convert(loaded, found.groupdict() if found else {})
+                if params is not None:
+                    self._count("embedding_hits")
+                    return TemplateMatch(template=loaded.template, params=params, method="embedding", score=round(score, 4))
+
+        self._count("misses")
+        return None
+
+    def execute(self, match: TemplateMatch) -> Dict[str, Any]:
+        """
+        매칭된 템플릿 실행 후 답변 생성
+
+        Returns:
+            sql_executor.execute() 결과 + answer
+
+        Raises:
+            ValueError: SQL 실행 실패
+        """
+        try:
+            execution = sql_executor.execute(match.template.sql_text, params=match.params)
+        except ValueError:
+            self._count("errors")
+            raise
+        execution["answer"] = self.render_answer(match, execution)
+        return execution
+
+    @staticmethod
+    def render_answer(match: TemplateMatch, execution: Dict[str, Any]) -> str:
+        rows = execution["rows"]
+        if not rows:
+            return "조회 결과가 없습니다."
+        # 첫 행 컬럼 < 파라미터 < row_count/rows 순으로 우선
+        values = _FormatValues(rows[0])
+        values.update(match.params)
+        values["row_count"] = execution["row_count"]
+        values["rows"] = "\n".join(
+            "- " + ", ".join(f"{column}: {value}" for column, value in row.items())
+            for row in rows
+        )
+        answer = match.template.answer_template.format_map(values)
+        if execution["truncated"]:
+            answer += f"\n(결과가 많아 {execution['row_count']}건까지만 표시했습니다)"
+        return answer
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            stats = dict(self.stats)
+        return {
+            "enabled": self.enabled,
+            "templates": len(self._templates) if self._templates is not None else None,
+            **stats,
+        }
+
+
+# 싱글톤 인스턴스
+sql_template_service = SqlTemplateService()
@@ -0,0 +1,107 @@
+"""
+서비스 워밍업 및 준비 상태(readiness) 관리
+벡터 저장소(Qdrant/pgvector) 연결, 임베딩 모델 로드, Ollama 모델 preload를 백그라운드에서 수행하고
+단계별 소요 시간을 기록
+"""
+import asyncio
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.services.vector_store import vector_store
+from app.services.ollama_service import ollama_service
+from app.services.reranker import reranker
+
+
+class ServiceWarmup:
+    """시작 단계(phase)별 상태를 추적하고 준비 완료 여부를 판단"""
+
+    def __init__(self):
+        # 실패한 단계 재시도 간격 (초)
+        self.retry_interval = float(os.getenv("WARMUP_RETRY_SECONDS", "10"))
+        # Ollama preload 실패를 준비 상태에 반영할지 여부
+        self.require_ollama = os.getenv("READINESS_REQUIRE_OLLAMA", "true").lower() == "true"
+
+        self.phases: Dict[str, Dict[str, Any]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._started_at: Optional[float] = None
+
+    def _steps(self) -> List[tuple]:
+        """(단계명, 실행 함수, 필수 여부)"""
+        steps = [
+            (vector_store.name, lambda: asyncio.to_thread(vector_store.connect), True),
+            ("embedding_model", lambda: asyncio.to_thread(vector_store.warmup), True),
+            ("ollama", ollama_service.preload, self.require_ollama),
+        ]
+        if reranker.enabled:
+            # 재순위 모델이 없어도 검색 순위로 동작하므로 필수 아님
+            steps.append(("reranker", lambda: asyncio.to_thread(reranker.warmup), False))
+        return steps
+
+    def start(self) -> None:
+        """백그라운드 워밍업 시작 (이벤트 루프를 막지 않음)"""
+        self._started_at = time.perf_counter()
+        for name, _, required in self._steps():
+            self.phases[name] = {"status": "pending", "required": required}
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """워밍업 태스크 종료"""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run_phase(self, name: str, func: Callable[[], Awaitable[Any]]) -> bool:
+        phase = self.phases[name]
+        phase["status"] = "running"
+        started = time.perf_counter()
+        try:
+            await func()
+        except Exception as e:
+            phase.update(status="failed", error=str(e),
+                         duration_ms=round((time.perf_counter() - started) * 1000, 1))
+            print(f"⚠️  [startup] {name} 실패 ({phase['duration_ms']}ms): {e}")
+            return False
+
+        phase.update(status="ok", duration_ms=round((time.perf_counter() - started) * 1000, 1))
+        phase.pop("error", None)
+        print(f"✅ [startup] {name} 완료 ({phase['duration_ms']}ms)")
+        return True
+
+    async def _run(self) -> None:
+        """모든 단계를 순서대로 실행하고, 실패한 단계는 주기적으로 재시도"""
+        pending = self._steps()
+        while True:
+            failed = []
+            for name, func, required in pending:
+                if not await self._run_phase(name, func):
+                    failed.append((name, func, required))
+
+            if not failed:
+                total_ms = round((time.perf_counter() - self._started_at) * 1000, 1)
+                print(f"✅ [startup] 워밍업 완료 (총 {total_ms}ms)")
+                return
+
+            pending = failed
+            await asyncio.sleep(self.retry_interval)
+
+    @property
+    def is_ready(self) -> bool:
+        """필수 단계가 모두 완료되었는지 여부"""
+        return bool(self.phases) and all(
+            phase["status"] == "ok" for phase in self.phases.values() if phase["required"]
+        )
+
+    def get_status(self) -> Dict[str, Any]:
+        """준비 상태 및 단계별 소요 시간"""
+        return {
+            "ready": self.is_ready,
+            "phases": self.phases,
+        }
+
+
+# 싱글톤 인스턴스
+service_warmup = ServiceWarmup()
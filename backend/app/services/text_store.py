@@ -0,0 +1,93 @@
+"""
+문서 청크 본문 저장소
+청크 전문은 zlib으로 압축하여 PostgreSQL(document_chunks)에 저장하고,
+Qdrant payload에는 스니펫과 필터용 메타데이터만 둔다.
+검색/목록 조회는 스니펫만 주고받고, 전문은 프롬프트에 들어가는 청크만 필요할 때 조회한다.
+"""
+import os
+import zlib
+from typing import Dict, Iterable, List, Tuple
+
+from sqlalchemy import delete
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session, select
+
+from app.database import engine
+from app.models.document_chunk import DocumentChunk
+
+
+class DocumentTextStore:
+    """청크 본문을 압축 저장/조회하는 저장소"""
+
+    def __init__(self):
+        # zlib 압축 레벨 (1: 빠름 ~ 9: 작음)
+        self.compression_level = int(os.getenv("TEXT_STORE_COMPRESSION_LEVEL", "6"))
+
+    def compress(self, text: str) -> bytes:
+        return zlib.compress(text.encode("utf-8"), self.compression_level)
+
+    @staticmethod
+    def decompress(content: bytes) -> str:
+        return zlib.decompress(content).decode("utf-8")
+
+    def put_chunks(self, doc_id: str, chunks: Iterable[Tuple[str, int, str]]) -> None:
+        """
+        청크 본문 저장 (같은 point_id가 있으면 덮어씀)
+
+        Args:
+            doc_id: 문서 ID
+            chunks: [(포인트 ID, 청크 순번, 청크 텍스트)]
+        """
+        rows = [
+            {"point_id": point_id, "doc_id": doc_id, "chunk_index": index, "content": self.compress(text)}
+            for point_id, index, text in chunks
+        ]
+        if not rows:
+            return
+        statement = insert(DocumentChunk.__table__).values(rows)
+        statement = statement.on_conflict_do_update(
+            index_elements=["point_id"],
+            set_={
+                "doc_id": statement.excluded.doc_id,
+                "chunk_index": statement.excluded.chunk_index,
+                "content": statement.excluded.content,
+            }
+        )
+        with Session(engine) as session:
+            session.exec(statement)
+            session.commit()
+
+    def get_texts(self, point_ids: List[str]) -> Dict[str, str]:
+        """
+        포인트 ID 목록의 청크 본문 조회
+
+        Returns:
+            {포인트 ID: 청크 텍스트} (저장소에 없는 ID는 제외)
+        """
+        if not point_ids:
+            return {}
+        with Session(engine) as session:
+            rows = session.exec(
+                select(DocumentChunk.point_id, DocumentChunk.content)
+                .where(DocumentChunk.point_id.in_(point_ids))
+            ).all()
+        return {point_id: self.decompress(content) for point_id, content in rows}
+
+    def delete_document(self, doc_id: str, keep_point_ids: List[str] = None) -> None:
+        """
+        문서의 청크 본문 삭제
+
+        Args:
+            doc_id: 문서 ID
+            keep_point_ids: 삭제하지 않을 포인트 ID (증분 재색인 시 현재 버전 청크)
+        """
+        statement = delete(DocumentChunk).where(DocumentChunk.doc_id == doc_id)
+        if keep_point_ids:
+            statement = statement.where(DocumentChunk.point_id.not_in(keep_point_ids))
+        with Session(engine) as session:
+            session.exec(statement)
+            session.commit()
+
+
+# 싱글톤 인스턴스
+text_store = DocumentTextStore()
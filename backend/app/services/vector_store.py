@@ -0,0 +1,50 @@
+"""
+벡터 저장소 선택
+VECTOR_STORE 환경 변수로 문서 검색 백엔드를 고른다.
+
+    qdrant    Qdrant (기본 - 하이브리드 검색, 스냅샷, 재색인 지원)
+    pgvector  기존 PostgreSQL의 pgvector 확장 (별도 벡터 DB 없이 운영)
+
+RAG/업로드/수집 서비스는 이 모듈의 vector_store만 사용한다.
+"""
+import os
+
+from dotenv import load_dotenv
+
+from app.services.vector_store_base import VectorStore
+
+load_dotenv()
+
+VECTOR_STORES = ("qdrant", "pgvector")
+
+
+def create_vector_store(name: str) -> VectorStore:
+    """
+    이름으로 벡터 저장소 싱글톤 선택 (선택한 백엔드 모듈만 import)
+
+    Raises:
+        ValueError: 지원하지 않는 저장소 이름
+    """
+    name = name.lower()
+    if name == "qdrant":
+        from app.services.qdrant_service import qdrant_service
+        return qdrant_service
+    if name == "pgvector":
+        from app.services.pgvector_store import pgvector_store
+        return pgvector_store
+    raise ValueError(f"지원하지 않는 VECTOR_STORE: {name} ({', '.join(VECTOR_STORES)} 중 선택)")
+
+
+def require_qdrant(feature: str) -> None:
+    """
+    Qdrant 전용 기능 사용 전 확인
+
+    Raises:
+        ValueError: VECTOR_STORE가 qdrant가 아닌 경우
+    """
+    if vector_store.name != "qdrant":
+        raise ValueError(f"{feature}은(는) VECTOR_STORE=qdrant 에서만 지원합니다 (현재: {vector_store.name})")
+
+
+# 싱글톤 인스턴스
+vector_store = create_vector_store(os.getenv("VECTOR_STORE", "qdrant"))
@@ -0,0 +1,352 @@
+"""
+벡터 저장소 공통 인터페이스
+문서 청크 임베딩 저장/검색 백엔드(Qdrant, pgvector)가 구현하며,
+RAG/업로드/수집 서비스는 이 인터페이스만 사용한다 (VECTOR_STORE로 선택 - app.services.vector_store).
+
+임베딩 모델, 쿼리 임베딩 캐시, 청크 분할기, 청크 본문 저장소는 백엔드와 무관하게 공유한다.
+"""
+import base64
+import hashlib
+import json
+import os
+import threading
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+from dotenv import load_dotenv
+
+from app.services.embedding_backends import EmbeddingBackend, create_embedding_backend, known_dimension
+from app.services.cache_versions import cache_versions
+from app.services.embedding_cache import EmbeddingCache
+from app.services.retrieval_cache import RetrievalCache
+from app.services.text_store import text_store
+from app.utils.text_chunker import TextChunker
+
+load_dotenv()
+
+# 오프라인 모드 강제 (폐쇄망 환경에서 HuggingFace Hub 접속 차단)
+# 반드시 TextEmbedding import 전에 설정되어야 함
+os.environ["HF_HUB_OFFLINE"] = "1"
+os.environ["TRANSFORMERS_OFFLINE"] = "1"
+os.environ["HF_DATASETS_OFFLINE"] = "1"
+
+
+def to_utc(value: Any) -> datetime:
+    """
+    업로드 시각 필터 값을 UTC datetime으로 변환 (upload_time은 UTC로 저장됨)
+
+    Args:
+        value: datetime 또는 ISO 문자열 (시간대가 없으면 UTC로 간주)
+
+    Raises:
+        ValueError: ISO 형식이 아닌 문자열
+    """
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+class VectorStore:
+    """
+    벡터 저장소 기본 클래스 (임베딩 모델/캐시/청크 본문 관리)
+
+    생성 시에는 설정만 읽고, 저장소 연결과 임베딩 모델 로드는
+    첫 사용 시점(또는 warmup) 에 지연 수행한다.
+    """
+
+    # 저장소 종류 (VECTOR_STORE 값)
+    name = "base"
+
+    def __init__(self):
+        # 임베딩 모델 (기본: FastEmbed 다국어 모델, onnx:/ollama: 접두어로 다른 백엔드 사용)
+        self.embedding_model_name = os.getenv("EMBEDDING_MODEL", "sentence-transformers/paraphrase-multilingual-mpnet-base-v2")
+
+        # FastEmbed 캐시 경로 설정 (폐쇄망 환경)
+        self.fastembed_cache = os.getenv("FASTEMBED_CACHE_PATH", "/app/fastembed_cache")
+
+        # 벡터 크기: 기존 컬렉션/테이블은 저장소 설정, 새로 만들 때는 모델에서 추론 (EMBEDDING_VECTOR_SIZE로 지정 가능)
+        self._vector_size = int(os.getenv("EMBEDDING_VECTOR_SIZE")) if os.getenv("EMBEDDING_VECTOR_SIZE") else None
+
+        # 쿼리 임베딩 캐시 (반복 질의의 재계산 방지)
+        self.embedding_cache = EmbeddingCache()
+
+        # 검색 결과 캐시 (문서 추가/삭제 시 캐시 버전 증가로 무효화)
+        self.retrieval_cache = RetrievalCache()
+
+        # 문서 청크 분할기 및 임베딩 배치 크기
+        self.chunker = TextChunker()
+        self.embedding_batch_size = int(os.getenv("EMBEDDING_BATCH_SIZE", "32"))
+
+        # 청크 전문은 압축 저장소에 두고 벡터 저장소에는 스니펫만 저장
+        self.text_store = text_store
+        self.snippet_length = int(os.getenv("PAYLOAD_SNIPPET_LENGTH", "200"))
+
+        self._embedding_model = None
+        self._model_lock = threading.Lock()
+
+    # ===== 임베딩 모델 =====
+
+    @property
+    def embedding_model(self) -> EmbeddingBackend:
+        """임베딩 백엔드 (첫 접근 시 로드)"""
+        return self._current_model()[1]
+
+    def _current_model(self) -> Tuple[str, EmbeddingBackend]:
+        """(모델 이름, 임베딩 백엔드) - 모델 교체 중에도 이름과 백엔드가 어긋나지 않도록 함께 조회"""
+        with self._model_lock:
+            if self._embedding_model is None:
+                self._embedding_model = self.load_embedding_model(self.embedding_model_name)
+            return self.embedding_model_name, self._embedding_model
+
+    def load_embedding_model(self, model_name: str, threads: Optional[int] = None) -> EmbeddingBackend:
+        """
+        임베딩 백엔드 로드 (무거운 import를 실제 사용 시점까지 지연)
+
+        Args:
+            model_name: EMBEDDING_MODEL 형식의 모델 지정 (FastEmbed 이름, onnx:<경로>, ollama:<모델>)
+            threads: ONNX 추론 스레드 수 (None이면 onnxruntime 기본값 - 재색인 작업은 제한해서 사용)
+        """
+        return create_embedding_backend(model_name, self.fastembed_cache, threads=threads)
+
+    @property
+    def vector_size(self) -> int:
+        """현재 컬렉션(또는 새로 만들 컬렉션)의 밀집 벡터 크기"""
+        if self._vector_size is None:
+            self._vector_size = known_dimension(self.embedding_model_name) or self.embedding_model.dimension
+        return self._vector_size
+
+    def activate_model(self, model_name: str, model, vector_size: int) -> None:
+        """
+        검색/업로드에 사용할 임베딩 모델 교체 (재색인 후 alias 전환/롤백 시 호출)
+
+        쿼리 임베딩 캐시는 모델 이름을 키에 포함하므로 따로 비우지 않아도 됨
+        """
+        with self._model_lock:
+            self.embedding_model_name = model_name
+            self._embedding_model = model
+            self._vector_size = vector_size
+        # 검색 대상 컬렉션이 바뀌었으므로 검색 결과 캐시 무효화
+        self.invalidate_search_cache()
+
+    def warmup(self) -> None:
+        """임베딩 모델 로드 후 더미 임베딩 1회 실행 (ONNX 세션 초기화)"""
+        list(self.embedding_model.embed(["warmup"]))
+
+    def embed_texts(self, texts: List[str]) -> List[np.ndarray]:
+        """여러 텍스트를 배치 단위로 임베딩"""
+        return list(self.embedding_model.embed(texts, batch_size=self.embedding_batch_size))
+
+    def embed_query(self, query: str) -> np.ndarray:
+        """
+        검색 쿼리 임베딩 (캐시 우선)
+
+        Args:
+            query: 검색 쿼리
+
+        Returns:
+            float32 임베딩 벡터
+        """
+        # 캐시 키의 모델 이름은 실제로 임베딩한 모델과 같아야 함 (다른 모델 벡터가 캐시에 남지 않도록)
+        model_name, model = self._current_model()
+        cached = self.embedding_cache.get(model_name, query)
+        if cached is not None:
+            return cached
+
+        embeddings = list(model.embed([query]))
+        return self.embedding_cache.put(model_name, query, embeddings[0])
+
+    # ===== 공통 유틸 =====
+
+    @staticmethod
+    def chunk_point_id(doc_id: str, chunk_key: str) -> str:
+        """청크 포인트 ID (문서 ID + 청크 내용 해시 기반 UUID5 - 내용이 같으면 같은 ID)"""
+        return str(uuid.uuid5(uuid.NAMESPACE_URL, f"{doc_id}:{chunk_key}"))
+
+    @staticmethod
+    def content_hash(text: str) -> str:
+        """텍스트 SHA-256 해시 (청크 동일성 판단용)"""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _join_chunks(chunks: List[Dict[str, Any]]) -> str:
+        """겹침(overlap)을 제거하며 청크를 원문 순서대로 결합"""
+        parts = []
+        covered = 0
+        for chunk in chunks:
+            start = chunk.get("char_start", covered)
+            text = chunk.get("text", "")
+            skip = max(0, covered - start)
+            if skip < len(text):
+                if parts and start > covered:
+                    parts.append("\n")
+                parts.append(text[skip:])
+            covered = max(covered, chunk.get("char_end", start + len(text)))
+        return "".join(parts)
+
+    @staticmethod
+    def encode_cursor(next_offset) -> Optional[str]:
+        """다음 페이지 시작 위치(포인트 ID 등)를 불투명 커서 문자열로 변환"""
+        if next_offset is None:
+            return None
+        raw = json.dumps({"o": next_offset}, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: Optional[str]):
+        """
+        커서 문자열을 다음 페이지 시작 위치로 변환
+
+        Raises:
+            ValueError: 올바르지 않은 커서
+        """
+        if not cursor:
+            return None
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            return json.loads(raw)["o"]
+        except (ValueError, KeyError, TypeError):
+            raise ValueError("올바르지 않은 커서입니다")
+
+    def hydrate_texts(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        검색 결과의 text를 청크 전문으로 교체 (프롬프트에 넣을 결과에만 호출)
+
+        Args:
+            results: search() 결과
+
+        Returns:
+            같은 리스트 (text가 전문으로 채워짐)
+        """
+        texts = self.text_store.get_texts([result["id"] for result in results])
+        for result in results:
+            result["text"] = texts.get(result["id"], result["text"])
+        return results
+
+    # ===== 검색 결과 캐시 =====
+
+    @property
+    def cache_namespace(self) -> str:
+        """검색 결과 캐시 버전 이름 (같은 컬렉션/테이블을 쓰는 서버끼리 공유)"""
+        return self.name
+
+    def cached_search(
+        self,
+        query_vector: np.ndarray,
+        limit: int,
+        filters: Optional[Dict[str, Any]],
+        search: Callable[[], List[Dict[str, Any]]],
+        variant: str = ""
+    ) -> List[Dict[str, Any]]:
+        """
+        캐시된 검색 결과 반환, 없으면 search() 실행 후 저장
+
+        Args:
+            query_vector: 쿼리 임베딩 (캐시 키)
+            limit: 결과 수
+            filters: 메타데이터 필터
+            search: 실제 검색 함수
+            variant: 벡터 외에 결과에 영향을 주는 값
+        """
+        key = self.retrieval_cache.make_key(
+            self.cache_namespace, cache_versions.get(self.cache_namespace), self.embedding_model_name,
+            query_vector, limit, filters, variant
+        )
+        return self.retrieval_cache.get_or_search(key, search)
+
+    def invalidate_search_cache(self) -> None:
+        """문서 추가/삭제 후 호출 - 이 서버와 같은 저장소를 쓰는 다른 서버의 검색 결과 캐시 무효화"""
+        cache_versions.bump(self.cache_namespace)
+
+    # ===== 저장소별 구현 =====
+
+    def connect(self) -> None:
+        """저장소 연결 및 컬렉션/테이블 확인 (warmup용)"""
+        raise NotImplementedError
+
+    def add_document(self, doc_id: str, text: str, metadata: Dict[str, Any] = None) -> int:
+        """
+        문서를 청크로 분할하고 벡터화하여 저장
+
+        Returns:
+            저장된 청크 개수
+        """
+        result = self.add_document_chunks(doc_id, self.chunker.iter_chunks([text]), metadata)
+        return result["chunk_count"]
+
+    def add_document_chunks(
+        self,
+        doc_id: str,
+        chunks: Iterable[Dict[str, Any]],
+        metadata: Dict[str, Any] = None,
+        doc_payload: Dict[str, Any] = None
+    ) -> Dict[str, int]:
+        """
+        청크 스트림을 배치 단위로 임베딩하여 저장 (내용이 같은 청크는 기존 벡터 재사용)
+
+        Returns:
+            chunk_count, text_length, chunks_reused, chunks_embedded
+        """
+        raise NotImplementedError
+
+    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        쿼리와 유사한 청크 검색
+
+        Returns:
+            검색 결과 리스트 (각 결과는 id, text(스니펫), score, metadata 포함)
+        """
+        raise NotImplementedError
+
+    def delete_document(self, doc_id: str) -> None:
+        raise NotImplementedError
+
+    def document_exists(self, doc_id: str) -> bool:
+        raise NotImplementedError
+
+    def find_document_by_hash(self, content_hash: str, applicant_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """지원자(None이면 지원자 없는 문서)와 원본 파일 SHA-256이 같은 문서의 대표 청크 메타데이터 (doc_id 포함)"""
+        raise NotImplementedError
+
+    def find_document_by_filename(self, filename: str, applicant_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """지원자(None이면 지원자 없는 문서)와 파일명이 같은 문서의 대표 청크 메타데이터 (doc_id 포함)"""
+        raise NotImplementedError
+
+    def count_documents(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        raise NotImplementedError
+
+    def get_all_documents(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        문서 목록 (커서 기반 페이징)
+
+        Returns:
+            (문서 리스트 - id, text(미리보기), metadata, 다음 페이지 커서)
+
+        Raises:
+            ValueError: 올바르지 않은 커서
+        """
+        raise NotImplementedError
+
+    def iter_chunks(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        include_text: bool = True,
+        batch_size: int = 256
+    ) -> Iterator[Dict[str, Any]]:
+        """모든 청크 순차 조회 (id, doc_id, text, payload)"""
+        raise NotImplementedError
+
+    def get_document_by_id(self, doc_id: str) -> Optional[Dict[str, Any]]:
+        """문서 조회 (청크를 결합하여 전체 텍스트 복원 - id, text, metadata)"""
+        raise NotImplementedError
+
+    def get_collection_info(self) -> Dict[str, Any]:
+        raise NotImplementedError
@@ -0,0 +1,107 @@
+"""
+메모리 크기 기반 LRU 캐시
+엔트리 개수가 아니라 바이트 크기로 용량을 제한하고 히트율 통계를 제공
+"""
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class SizedLRUCache:
+    """바이트 크기 상한을 가진 스레드 안전 LRU 캐시"""
+
+    # OrderedDict 엔트리 + 키 객체의 대략적인 오버헤드 (bytes)
+    ENTRY_OVERHEAD = 96
+
+    def __init__(
+        self,
+        max_bytes: int,
+        max_entry_bytes: Optional[int] = None,
+        sizeof: Optional[Callable[[Any], int]] = None
+    ):
+        """
+        Args:
+            max_bytes: 캐시 전체 최대 크기 (bytes)
+            max_entry_bytes: 단일 엔트리 최대 크기 (초과 시 저장하지 않음)
+            sizeof: 값의 크기를 계산하는 함수 (기본: sys.getsizeof)
+        """
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self._sizeof = sizeof or sys.getsizeof
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.rejected = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """값 조회 (없으면 None). 조회된 엔트리는 최근 사용으로 이동"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, size: Optional[int] = None) -> bool:
+        """
+        값 저장 (용량 초과 시 오래된 엔트리부터 제거)
+
+        Returns:
+            저장 여부 (엔트리 크기 제한 초과 시 False)
+        """
+        entry_size = (size if size is not None else self._sizeof(value)) + self.ENTRY_OVERHEAD
+        if entry_size > self.max_bytes or (self.max_entry_bytes and entry_size > self.max_entry_bytes):
+            with self._lock:
+                self.rejected += 1
+            return False
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= old[1]
+
+            self._entries[key] = (value, entry_size)
+            self.current_bytes += entry_size
+
+            while self.current_bytes > self.max_bytes and self._entries:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.evictions += 1
+        return True
+
+    def pop(self, key: Hashable) -> None:
+        """특정 엔트리 제거"""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.current_bytes -= entry[1]
+
+    def clear(self) -> None:
+        """전체 엔트리 제거 (통계는 유지)"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 (히트율, 사용량 등)"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "rejected": self.rejected,
+            }
@@ -0,0 +1,164 @@
+"""
+PDF 페이지 병렬 추출
+페이지를 프로세스 풀 워커에 나눠 추출하고, 완료된 결과를 페이지 순서대로 스트리밍한다.
+(PyPDF2는 순수 파이썬이라 스레드로는 GIL 때문에 병렬화되지 않음)
+
+워커는 페이지마다 PDF_PAGE_TIMEOUT_SECONDS 타이머를 걸어, 손상된 페이지 하나가
+전체 작업을 멈추지 않도록 시간 초과된 페이지는 빈 텍스트로 건너뛴다.
+"""
+import multiprocessing
+import os
+import signal
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import BinaryIO, Dict, Iterator, Optional, Tuple, Union
+
+
+class PageTimeout(BaseException):
+    """페이지 추출 시간 초과 (워커 내부용, PyPDF2의 except Exception에 잡히지 않도록 BaseException)"""
+
+
+# 워커 프로세스별로 마지막에 연 PDF (같은 파일의 다음 페이지 요청 시 재사용)
+_worker_reader: Dict[str, object] = {}
+
+
+def _on_alarm(signum, frame):
+    raise PageTimeout()
+
+
+def _open_reader(path: str):
+    import PyPDF2
+
+    key = f"{path}:{os.stat(path).st_mtime_ns}"
+    reader = _worker_reader.get(key)
+    if reader is None:
+        _worker_reader.clear()
+        reader = PyPDF2.PdfReader(path)
+        _worker_reader[key] = reader
+    return reader
+
+
+def extract_page(path: str, page_number: int, timeout: float) -> Tuple[str, bool]:
+    """
+    워커 프로세스에서 페이지 1개 추출
+
+    Returns:
+        (텍스트, 시간 초과 여부)
+    """
+    # 워커는 작업을 메인 스레드에서 실행하므로 SIGALRM으로 페이지별 시간 제한 가능
+    if timeout > 0:
+        signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        try:
+            text = _open_reader(path).pages[page_number].extract_text() or ""
+        finally:
+            if timeout > 0:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+    except PageTimeout:
+        # 중단된 지연 파싱 상태가 남지 않도록 다음 페이지는 PDF를 다시 열어 처리
+        _worker_reader.clear()
+        return "", True
+    return text, False
+
+
+class PdfPagePool:
+    """PDF 페이지 추출 프로세스 풀"""
+
+    def __init__(self):
+        # 워커 프로세스 수 (1 이하면 병렬 추출 사용 안 함)
+        self.workers = int(os.getenv("PDF_EXTRACT_WORKERS", str(min(4, os.cpu_count() or 1))))
+        # 이 페이지 수 미만의 PDF는 현재 스레드에서 순차 추출 (프로세스 간 전송 비용이 더 큼)
+        self.min_pages = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "16"))
+        # 페이지 1개 추출 시간 제한 (초, 0이면 제한 없음)
+        self.page_timeout = float(os.getenv("PDF_PAGE_TIMEOUT_SECONDS", "30"))
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 1
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # 멀티스레드 서버 프로세스에서 fork하면 잠금 상태가 복제될 수 있어 spawn 사용
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+
+    def _reset(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def shutdown(self) -> None:
+        """워커 프로세스 종료"""
+        self._reset()
+
+    def iter_pages(self, file: Union[BinaryIO, bytes], page_count: int) -> Iterator[str]:
+        """
+        페이지를 워커에 나눠 추출하고 페이지 순서대로 생성
+
+        진행 중인 페이지는 workers * 2개로 제한하여, 소비 측(청크 분할/임베딩)이 느려도
+        추출 결과가 메모리에 쌓이지 않는다.
+
+        Args:
+            file: PDF 파일 객체(디스크 파일이면 경로를 워커에 전달) 또는 bytes
+            page_count: 전체 페이지 수
+
+        Raises:
+            ValueError: 워커 프로세스 오류 또는 페이지 추출 실패
+        """
+        path, temporary = self._file_path(file)
+        in_flight = deque()
+        try:
+            executor = self.executor
+            next_page = 0
+            while next_page < page_count or in_flight:
+                while next_page < page_count and len(in_flight) < self.workers * 2:
+                    in_flight.append((next_page, executor.submit(extract_page, path, next_page, self.page_timeout)))
+                    next_page += 1
+                page_number, future = in_flight.popleft()
+                text, timed_out = future.result()
+                if timed_out:
+                    print(f"⚠️  PDF {page_number + 1}페이지 추출 시간 초과 ({self.page_timeout:g}초), 건너뜀")
+                yield text
+        except BrokenProcessPool as e:
+            # 워커가 비정상 종료된 경우 다음 요청을 위해 풀 재생성
+            self._reset()
+            raise ValueError(f"PDF 텍스트 추출 실패: 워커 프로세스 오류 ({e})")
+        except ValueError:
+            raise
+        except Exception as e:
+            raise ValueError(f"PDF 텍스트 추출 실패: {str(e)}")
+        finally:
+            # 소비 측이 중간에 중단한 경우 남은 페이지 취소
+            for _, future in in_flight:
+                future.cancel()
+            if temporary:
+                os.remove(path)
+
+    @staticmethod
+    def _file_path(file: Union[BinaryIO, bytes]) -> Tuple[str, bool]:
+        """워커가 열 PDF 경로 (디스크 파일이 아니면 임시 파일로 저장, 두 번째 값은 삭제 필요 여부)"""
+        name = getattr(file, "name", None)
+        if isinstance(name, str) and os.path.isfile(name):
+            return name, False
+        if not isinstance(file, bytes):
+            file.seek(0)
+            file = file.read()
+        fd, path = tempfile.mkstemp(prefix="pdf_", suffix=".pdf")
+        with os.fdopen(fd, "wb") as f:
+            f.write(file)
+        return path, True
+
+
+# 싱글톤 인스턴스
+pdf_page_pool = PdfPagePool()
@@ -0,0 +1,330 @@
+"""
+LLM이 생성한 SQL 검증기
+SQL을 토큰 단위로 분석하여 허용된 테이블만 읽는 단일 SELECT 문인지 확인한다.
+
+허용: SELECT / WITH ... SELECT (서브쿼리, JOIN, 집계, UNION 포함)
+거부: 여러 문장, 데이터/스키마 변경 키워드, SELECT INTO, TABLE/VALUES 문, FOR UPDATE/SHARE,
+      허용 목록 밖의 테이블(시스템 카탈로그 포함), 허용 목록 밖의 함수(ALLOWED_FUNCTIONS),
+      FROM 절 함수, 달러 인용/E''/U&'' 문자열과 U&"" 식별자(토큰 분석을 우회할 수 있는 형식)
+
+실행 단계(app.services.sql_executor)의 읽기 전용 트랜잭션 + 조회 전용 DB 역할과 함께 이중으로 보호한다.
+"""
+import re
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Set, Tuple
+
+
+class SQLValidationError(ValueError):
+    """허용되지 않는 SQL"""
+
+
+# 토큰: (종류, 값) - 종류는 word / quoted / string / number / op / punct
+_TOKEN_RE = re.compile(r"""
+    (?P<space>\s+)
+  | (?P<line_comment>--[^\n]*)
+  | (?P<block_comment>/\*.*?\*/)
+  | (?P<string>'(?:[^']|'')*')
+  | (?P<quoted>"(?:[^"]|"")+")
+  | (?P<dollar>\$[A-Za-z_]*\$)
+  | (?P<unicode>[Uu]&["'])
+  | (?P<number>\d+(?:\.\d*)?(?:[eE][+-]?\d+)?|\.\d+)
+  | (?P<param>\$\d+)
+  | (?P<word>[A-Za-z_][A-Za-z0-9_$]*)
+  | (?P<punct>[(),;.\[\]])
+  | (?P<op>::|<=|>=|<>|!=|\|\||[-+*/%<>=~!@#^&|?:])
+""", re.VERBOSE | re.DOTALL)
+
+# 어디에 있어도 거부하는 키워드 (문자열/인용 식별자 안은 제외)
+FORBIDDEN_KEYWORDS = {
+    "insert", "update", "delete", "merge", "upsert", "drop", "create", "alter", "truncate",
+    "grant", "revoke", "copy", "call", "do", "execute", "prepare", "deallocate", "listen",
+    "notify", "unlisten", "vacuum", "analyze", "cluster", "reindex", "refresh", "lock",
+    "set", "reset", "discard", "into", "comment", "security", "begin", "commit", "rollback",
+    "savepoint", "release", "import", "load", "table", "values",
+}
+
+# 호출을 허용하는 함수 (집계/윈도우/문자열/숫자/날짜/조건식), 그 외 함수는 모두 거부
+# 이름만 비교하므로 스키마를 붙여도(pg_catalog.lower) 같은 함수로 취급
+ALLOWED_FUNCTIONS = {
+    # 집계
+    "count", "sum", "avg", "min", "max", "string_agg", "array_agg", "bool_and", "bool_or", "every",
+    "stddev", "stddev_pop", "stddev_samp", "variance", "var_pop", "var_samp",
+    "percentile_cont", "percentile_disc", "mode",
+    # 윈도우
+    "row_number", "rank", "dense_rank", "percent_rank", "cume_dist", "ntile", "lag", "lead",
+    "first_value", "last_value", "nth_value",
+    # 문자열
+    "lower", "upper", "initcap", "length", "char_length", "character_length", "octet_length",
+    "substring", "substr", "left", "right", "trim", "ltrim", "rtrim", "btrim", "lpad", "rpad",
+    "replace", "translate", "position", "strpos", "split_part", "concat", "concat_ws", "reverse",
+    "starts_with", "regexp_replace", "regexp_match", "regexp_like", "regexp_count", "md5",
+    # 숫자
+    "abs", "round", "ceil", "ceiling", "floor", "trunc", "mod", "power", "sqrt", "sign",
+    "greatest", "least", "width_bucket",
+    # 날짜/시간
+    "now", "date_trunc", "date_part", "extract", "age", "to_char", "to_date", "to_timestamp",
+    "to_number", "make_date", "make_interval",
+    # 조건/형 변환 (함수처럼 괄호를 쓰는 구문 포함)
+    "coalesce", "nullif", "cast", "array", "row", "array_length", "cardinality", "unnest",
+}
+
+# 뒤에 괄호가 오지만 함수 호출이 아닌 키워드 (서브쿼리/조건식/윈도우 절 등)
+_NON_FUNCTION_KEYWORDS = {
+    "select", "with", "as", "from", "join", "on", "using", "where", "and", "or", "not", "in", "exists",
+    "any", "all", "some", "over", "filter", "within", "group", "by", "partition", "order", "having",
+    "when", "then", "else", "case", "between", "like", "ilike", "similar", "is", "distinct", "union",
+    "intersect", "except", "lateral", "materialized", "limit", "offset", "recursive", "escape",
+}
+
+# FROM 절 테이블 목록이 끝나는 키워드
+_CLAUSE_KEYWORDS = {
+    "where", "group", "having", "order", "limit", "offset", "union", "intersect", "except",
+    "window", "fetch", "on", "using",
+}
+_JOIN_MODIFIERS = {"inner", "left", "right", "full", "outer", "cross", "natural", "lateral"}
+
+# LLM 응답의 코드 블록 (```sql ... ```)
+_FENCE_RE = re.compile(r"```[A-Za-z]*[ \t]*\n?(.*?)```", re.DOTALL)
+# SQL 문 시작 (줄 맨 앞의 SELECT/WITH 우선)
+_LINE_START_RE = re.compile(r"^[ \t]*(?:SELECT|WITH)\b", re.IGNORECASE | re.MULTILINE)
+_WORD_START_RE = re.compile(r"\b(?:SELECT|WITH)\b", re.IGNORECASE)
+
+
+@dataclass
+class ValidatedSQL:
+    """검증을 통과한 SQL"""
+    sql: str  # 끝의 세미콜론을 제거한 원문
+    tables: Set[str] = field(default_factory=set)  # 참조한 테이블 (소문자)
+
+
+def tokenize(sql: str) -> List[Tuple[str, str]]:
+    """SQL 토큰 목록 (공백/주석 제외)"""
+    tokens = []
+    position = 0
+    while position < len(sql):
+        match = _TOKEN_RE.match(sql, position)
+        if not match:
+            raise SQLValidationError(f"해석할 수 없는 SQL 문자: {sql[position:position + 20]!r}")
+        kind = match.lastgroup
+        value = match.group()
+        position = match.end()
+        if kind in ("space", "line_comment", "block_comment"):
+            continue
+        if kind == "dollar":
+            raise SQLValidationError("달러 인용 문자열은 사용할 수 없습니다")
+        if kind == "unicode":
+            raise SQLValidationError("유니코드 이스케이프(U&\"...\", U&'...')는 사용할 수 없습니다")
+        if kind == "string" and tokens and tokens[-1][0] == "word" and tokens[-1][1].lower() == "e":
+            raise SQLValidationError("접두어가 있는 문자열(E'...' 등)은 사용할 수 없습니다")
+        tokens.append((kind, value))
+    return tokens
+
+
+def extract_sql(text: str) -> str:
+    """
+    LLM 응답에서 SQL 문 하나 추출 (검증 전 호출)
+
+    코드 블록(```sql ... ```)이 있으면 그 안에서, 첫 SELECT/WITH부터 문장 끝까지 잘라낸다.
+    문장 끝: 따옴표/주석 밖의 첫 세미콜론, 코드 블록 닫기(```), 빈 줄, 영문자가 아닌 글자로 시작하는 줄(설명 문장)
+
+    Args:
+        text: LLM 응답
+
+    Returns:
+        SQL 문 (세미콜론 제외, SELECT/WITH가 없으면 응답 그대로 - 검증에서 거부됨)
+    """
+    for block in _FENCE_RE.findall(text):
+        if _WORD_START_RE.search(block):
+            text = block
+            break
+    start = _LINE_START_RE.search(text) or _WORD_START_RE.search(text)
+    if not start:
+        return text.strip()
+    sql = text[start.start():]
+    return sql[:_statement_end(sql)].strip()
+
+
+def _statement_end(sql: str) -> int:
+    """extract_sql()의 문장 끝 위치"""
+    quote = None
+    position = 0
+    while position < len(sql):
+        char = sql[position]
+        if quote:
+            # ''/"" 이스케이프는 닫고 다시 여는 것으로 처리됨
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif sql.startswith("--", position) or sql.startswith("/*", position):
+            end = sql.find("\n" if char == "-" else "*/", position + 2)
+            if end < 0:
+                return len(sql)
+            position = end if char == "-" else end + 2
+            continue
+        elif char == ";" or sql.startswith("```", position):
+            return position
+        elif char == "\n":
+            following = sql[position + 1:].lstrip(" \t\r")
+            if not following or following[0] == "\n" or not following[0].isascii():
+                return position
+        position += 1
+    return len(sql)
+
+
+class SQLValidator:
+    """허용 테이블에 대한 읽기 전용 단일 SELECT 문만 통과시키는 검증기"""
+
+    def __init__(self, allowed_tables: Iterable[str], allowed_schemas: Iterable[str] = ("public",)):
+        """
+        Args:
+            allowed_tables: 조회를 허용할 테이블 이름
+            allowed_schemas: 테이블 이름 앞에 붙일 수 있는 스키마
+        """
+        self.allowed_tables = {name.strip().lower() for name in allowed_tables if name.strip()}
+        self.allowed_schemas = {name.strip().lower() for name in allowed_schemas if name.strip()}
+
+    @staticmethod
+    def _name(token: Tuple[str, str]) -> str:
+        kind, value = token
+        if kind == "quoted":
+            return value[1:-1].replace('""', '"').lower()
+        return value.lower()
+
+    def validate(self, sql: str) -> ValidatedSQL:
+        """
+        SQL 검증
+
+        Args:
+            sql: 검증할 SQL
+
+        Returns:
+            ValidatedSQL
+
+        Raises:
+            SQLValidationError: 허용되지 않는 SQL
+        """
+        tokens = tokenize(sql or "")
+        if tokens and tokens[-1] == ("punct", ";"):
+            tokens = tokens[:-1]
+            sql = sql.rstrip().rstrip(";")
+        if not tokens:
+            raise SQLValidationError("SQL이 비어 있습니다")
+        if ("punct", ";") in tokens:
+            raise SQLValidationError("여러 개의 SQL 문은 실행할 수 없습니다")
+
+        words = [value.lower() if kind == "word" else None for kind, value in tokens]
+        if words[0] not in ("select", "with"):
+            raise SQLValidationError("SELECT 문만 실행할 수 있습니다")
+
+        cte_names = self._cte_names(tokens, words)
+        tables: Set[str] = set()
+
+        # 괄호 깊이별 상태: [쿼리 여부, FROM 절 상태]
+        # FROM 절 상태 - "table": 다음 토큰이 테이블, "list": 테이블 목록 안(쉼표 뒤가 테이블), None: FROM 절 밖
+        # 함수 인자 괄호(EXTRACT(YEAR FROM x) 등)의 FROM은 테이블 참조가 아니므로 쿼리 괄호에서만 추적
+        levels: List[List] = [[True, None]]
+        index = 0
+        while index < len(tokens):
+            kind, value = tokens[index]
+            word = words[index]
+            next_token = tokens[index + 1] if index + 1 < len(tokens) else (None, None)
+            level = levels[-1]
+
+            if word in FORBIDDEN_KEYWORDS:
+                raise SQLValidationError(f"허용되지 않는 키워드: {value.upper()}")
+            if word == "for" and next_token[0] == "word" and next_token[1].lower() in ("update", "share", "no", "key"):
+                raise SQLValidationError("행 잠금(FOR UPDATE/SHARE)은 사용할 수 없습니다")
+            if kind in ("word", "quoted") and next_token == ("punct", "(") and self._is_function_call(tokens, words, index, cte_names):
+                name = self._name(tokens[index])
+                if name not in ALLOWED_FUNCTIONS:
+                    raise SQLValidationError(f"허용되지 않는 함수: {name}")
+
+            if value == "(":
+                is_query = next_token[0] == "word" and next_token[1].lower() in ("select", "with")
+                if level[1] == "table":
+                    # FROM (서브쿼리) 별칭 / FROM (a JOIN b ...) 괄호 안도 테이블 목록으로 검사
+                    level[1] = "list"
+                    levels.append([True, None if is_query else "table"])
+                else:
+                    levels.append([is_query, None])
+            elif value == ")":
+                levels.pop()
+                if not levels:
+                    raise SQLValidationError("괄호가 맞지 않습니다")
+            elif not level[0]:
+                pass
+            elif word in ("from", "join"):
+                level[1] = "table"
+            elif word in _CLAUSE_KEYWORDS or word == "select":
+                level[1] = None
+            elif value == "," and level[1] == "list":
+                level[1] = "table"
+            elif level[1] == "table" and word not in _JOIN_MODIFIERS and word != "only":
+                if kind not in ("word", "quoted"):
+                    raise SQLValidationError("FROM 절을 해석할 수 없습니다")
+                index = self._table_reference(tokens, index, cte_names, tables)
+                level[1] = "list"
+            index += 1
+
+        if len(levels) != 1:
+            raise SQLValidationError("괄호가 맞지 않습니다")
+        return ValidatedSQL(sql=sql.strip(), tables=tables)
+
+    @staticmethod
+    def _is_function_call(tokens: List[Tuple[str, str]], words: List[Optional[str]], index: int, cte_names: Set[str]) -> bool:
+        """이름( 형태가 함수 호출인지 (키워드, CTE 열 목록, 별칭 열 목록, 형 변환 타입 인자가 아니면 함수로 취급)"""
+        if tokens[index][0] == "word" and words[index] in _NON_FUNCTION_KEYWORDS:
+            return False
+        previous = tokens[index - 1] if index > 0 else (None, None)
+        # 별칭 열 목록(AS t(a, b)) / 형 변환 타입(CAST(x AS numeric(10, 2)), x::varchar(20))
+        if (previous[0] == "word" and previous[1].lower() == "as") or previous == ("op", "::"):
+            return False
+        # WITH 이름(열, ...) AS (...)
+        if tokens[index][0] == "word" and words[index] in cte_names and (
+            previous == ("punct", ",") or (previous[0] == "word" and previous[1].lower() in ("with", "recursive"))
+        ):
+            return False
+        return True
+
+    def _table_reference(self, tokens: List[Tuple[str, str]], index: int, cte_names: Set[str], tables: Set[str]) -> int:
+        """FROM/JOIN 뒤의 [스키마.]테이블 이름 검사 (마지막으로 읽은 토큰 위치 반환)"""
+        parts = [self._name(tokens[index])]
+        while index + 2 < len(tokens) and tokens[index + 1] == ("punct", ".") and tokens[index + 2][0] in ("word", "quoted"):
+            parts.append(self._name(tokens[index + 2]))
+            index += 2
+        if index + 1 < len(tokens) and tokens[index + 1] == ("punct", "("):
+            raise SQLValidationError(f"FROM 절에서 함수는 사용할 수 없습니다: {'.'.join(parts)}")
+
+        if len(parts) == 1 and parts[0] in cte_names:
+            return index
+        if len(parts) > 2 or (len(parts) == 2 and parts[0] not in self.allowed_schemas):
+            raise SQLValidationError(f"허용되지 않는 테이블: {'.'.join(parts)}")
+        table = parts[-1]
+        if table not in self.allowed_tables:
+            raise SQLValidationError(f"허용되지 않는 테이블: {'.'.join(parts)}")
+        tables.add(table)
+        return index
+
+    @staticmethod
+    def _cte_names(tokens: List[Tuple[str, str]], words: List[Optional[str]]) -> Set[str]:
+        """WITH 절에서 정의한 이름 (이름 [(...)] AS [NOT] [MATERIALIZED] ( ... ))"""
+        names = set()
+        if words[0] != "with":
+            return names
+        for index in range(1, len(tokens) - 2):
+            if tokens[index][0] not in ("word", "quoted") or words[index] in ("as", "recursive"):
+                continue
+            if index > 1 and not (words[index - 1] in ("with", "recursive") or tokens[index - 1] == ("punct", ",")):
+                continue
+            follow = index + 1
+            if tokens[follow] == ("punct", "("):
+                # 열 이름 목록 건너뜀
+                while follow < len(tokens) and tokens[follow] != ("punct", ")"):
+                    follow += 1
+                follow += 1
+            if follow + 1 < len(tokens) and words[follow] == "as" and (
+                tokens[follow + 1] == ("punct", "(") or words[follow + 1] in ("not", "materialized")
+            ):
+                names.add(SQLValidator._name(tokens[index]))
+        return names
@@ -0,0 +1,196 @@
+"""
+문서 텍스트를 검색용 청크로 분할하는 유틸리티
+문단 → 문장 경계를 우선으로 분할하고, 청크 사이에 겹침(overlap)을 둔다.
+
+청크 크기는 한글 기준 가중 길이로 계산한다.
+임베딩 모델 토크나이저에서 한글 음절은 영문/숫자보다 토큰 밀도가 높으므로
+한글(및 CJK) 문자는 1, 그 외 문자는 0.5로 센다.
+"""
+import os
+import re
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+
+# 문단 경계: 빈 줄
+_PARAGRAPH_RE = re.compile(r"\n\s*\n")
+# 문장 경계: 종결 부호(. ! ? 。 ！ ？ …) 뒤 공백, 또는 줄바꿈
+_SENTENCE_RE = re.compile(r"(?<=[.!?。！？…])\s+|\n")
+# 한글 음절/자모 및 CJK 문자
+_WIDE_CHAR_RE = re.compile(r"[ᄀ-ᇿ㄰-㆏가-힣一-鿿]")
+
+
+def weighted_length(text: str) -> float:
+    """한글 가중 길이 (한글/CJK 1, 그 외 0.5)"""
+    wide = len(_WIDE_CHAR_RE.findall(text))
+    return wide + (len(text) - wide) * 0.5
+
+
+class TextChunker:
+    """문단/문장 경계 기반 청크 분할기"""
+
+    def __init__(self, chunk_size: float = None, chunk_overlap: float = None):
+        """
+        Args:
+            chunk_size: 청크 최대 가중 길이 (기본: CHUNK_SIZE 환경 변수, 200)
+            chunk_overlap: 인접 청크 간 겹침 가중 길이 (기본: CHUNK_OVERLAP 환경 변수, 40)
+        """
+        self.chunk_size = chunk_size or float(os.getenv("CHUNK_SIZE", "200"))
+        self.chunk_overlap = chunk_overlap if chunk_overlap is not None else float(os.getenv("CHUNK_OVERLAP", "40"))
+        if self.chunk_overlap >= self.chunk_size:
+            raise ValueError("CHUNK_OVERLAP은 CHUNK_SIZE보다 작아야 합니다")
+
+    def _split_units(self, text: str) -> List[Tuple[int, int, bool]]:
+        """
+        텍스트를 문장 단위 (start, end, 문단 시작 여부) 목록으로 분할
+        chunk_size를 넘는 문장은 공백 위치 기준으로 다시 자른다.
+        """
+        units = []
+        para_start = 0
+        for para_match in list(_PARAGRAPH_RE.finditer(text)) + [None]:
+            para_end = para_match.start() if para_match else len(text)
+            first_in_para = True
+
+            sent_start = para_start
+            sentence_bounds = [m.start() for m in _SENTENCE_RE.finditer(text, para_start, para_end)]
+            for sent_end in sentence_bounds + [para_end]:
+                start, end = self._strip(text, sent_start, sent_end)
+                if start < end:
+                    for piece_start, piece_end in self._split_long(text, start, end):
+                        units.append((piece_start, piece_end, first_in_para))
+                        first_in_para = False
+                sent_start = sent_end
+
+            para_start = para_match.end() if para_match else len(text)
+        return units
+
+    @staticmethod
+    def _strip(text: str, start: int, end: int) -> Tuple[int, int]:
+        while start < end and text[start].isspace():
+            start += 1
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        return start, end
+
+    def _split_long(self, text: str, start: int, end: int) -> List[Tuple[int, int]]:
+        """chunk_size보다 긴 구간을 공백 경계 위주로 분할"""
+        pieces = []
+        while weighted_length(text[start:end]) > self.chunk_size:
+            # 가중 길이가 chunk_size에 도달하는 위치 탐색
+            cut, length = start, 0.0
+            while cut < end and length < self.chunk_size:
+                length += 1 if _WIDE_CHAR_RE.match(text[cut]) else 0.5
+                cut += 1
+            space = text.rfind(" ", start + 1, cut)
+            if space > start + (cut - start) // 2:
+                cut = space
+            pieces.append(self._strip(text, start, cut))
+            start, end = self._strip(text, cut, end)
+        if start < end:
+            pieces.append((start, end))
+        return pieces
+
+    def split(self, text: str) -> List[Dict]:
+        """
+        텍스트를 청크 목록으로 분할
+
+        Args:
+            text: 원본 텍스트
+
+        Returns:
+            청크 리스트 (각 청크는 text, start, end 포함 - start/end는 원문 내 문자 위치)
+        """
+        units = self._split_units(text)
+        chunks = []
+        current: List[Tuple[int, int, bool]] = []
+        current_len = 0.0
+
+        def unit_len(unit):
+            return weighted_length(text[unit[0]:unit[1]])
+
+        for unit in units:
+            length = unit_len(unit)
+            # 새 문단 시작이고 현재 청크가 절반 이상 찼으면 문단 경계에서 청크를 닫음
+            paragraph_break = unit[2] and current_len >= self.chunk_size / 2
+            if current and (current_len + length > self.chunk_size or paragraph_break):
+                chunks.append(self._make_chunk(text, current))
+
+                # 이전 청크 끝부분 문장을 overlap 한도 내에서 다음 청크로 이월
+                carried, carried_len = [], 0.0
+                for prev in reversed(current):
+                    prev_len = unit_len(prev)
+                    if carried_len + prev_len > self.chunk_overlap or carried_len + prev_len + length > self.chunk_size:
+                        break
+                    carried.insert(0, prev)
+                    carried_len += prev_len
+                current, current_len = carried, carried_len
+
+            current.append(unit)
+            current_len += length
+
+        if current:
+            chunks.append(self._make_chunk(text, current))
+        return chunks
+
+    def iter_chunks(self, segments: Iterable[str], separator: str = "\n") -> Iterator[Dict]:
+        """
+        텍스트 조각 스트림을 청크로 분할 (메모리 사용량 제한)
+
+        버퍼가 일정 크기를 넘으면 분할하여 마지막 청크를 제외한 청크를 내보내고,
+        마지막 청크 시작 위치부터 버퍼를 유지한다 (문장이 조각 경계에서 잘리지 않도록).
+        start/end는 전체 스트림(조각 + 구분자) 기준 문자 위치.
+
+        Args:
+            segments: 페이지/문단/행 단위 텍스트 조각
+            separator: 조각 사이에 넣을 구분자
+        """
+        buffer = ""
+        base = 0  # buffer[0]의 전체 스트림 내 위치
+        flush_length = self.chunk_size * 8
+        first = True
+
+        for segment in segments:
+            buffer += segment if first else separator + segment
+            first = False
+            if weighted_length(buffer) < flush_length:
+                continue
+
+            chunks = self.split(buffer)
+            if len(chunks) < 2:
+                continue
+            for chunk in chunks[:-1]:
+                yield {"text": chunk["text"], "start": base + chunk["start"], "end": base + chunk["end"]}
+            keep_from = chunks[-1]["start"]
+            buffer = buffer[keep_from:]
+            base += keep_from
+
+        for chunk in self.split(buffer):
+            yield {"text": chunk["text"], "start": base + chunk["start"], "end": base + chunk["end"]}
+
+    def iter_record_chunks(self, records: Iterable[Dict], separator: str = "\n") -> Iterator[Dict]:
+        """
+        레코드(표의 행/행 묶음) 스트림을 레코드 단위 청크로 변환
+
+        레코드끼리는 합치지 않으므로 검색 결과가 정확히 해당 행을 가리킨다.
+        chunk_size를 넘는 레코드만 split()으로 나누며, 나뉜 청크도 같은 레코드 메타데이터를 가진다.
+        start/end는 레코드 사이에 구분자를 넣어 이어붙인 전체 텍스트 기준 문자 위치.
+
+        Args:
+            records: text, metadata(시트/행 번호 등)를 가진 레코드
+            separator: 레코드 사이 구분자
+        """
+        base = 0
+        for record in records:
+            text = record["text"]
+            metadata = record.get("metadata") or {}
+            if weighted_length(text) <= self.chunk_size:
+                chunks = [{"text": text, "start": 0, "end": len(text)}]
+            else:
+                chunks = self.split(text)
+            for chunk in chunks:
+                yield {"text": chunk["text"], "start": base + chunk["start"], "end": base + chunk["end"], "metadata": metadata}
+            base += len(text) + len(separator)
+
+    @staticmethod
+    def _make_chunk(text: str, units: List[Tuple[int, int, bool]]) -> Dict:
+        start, end = units[0][0], units[-1][1]
+        return {"text": text[start:end], "start": start, "end": end}
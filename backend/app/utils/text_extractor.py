@@ -1,108 +1,232 @@
 """
 파일에서 텍스트를 추출하는 유틸리티
 지원 형식: PDF, DOCX, TXT, XLSX
+
+iter_* 메서드는 페이지/행/문단 단위로 텍스트를 순차 생성하여
+대용량 파일도 전체 텍스트를 메모리에 올리지 않고 처리할 수 있다.
 """
-from typing import BinaryIO, Union
+import codecs
+import os
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
 from io import BytesIO
-import PyPDF2
-from docx import Document
-import openpyxl
+
+from app.utils.pdf_pages import pdf_page_pool
+
+# PyPDF2 / python-docx / openpyxl은 import 비용이 커서 사용 시점에 import
 
 
 class TextExtractor:
     """파일 형식에 따라 텍스트를 추출하는 클래스"""
 
+    # 추출 결과 형식/내용이 바뀌면 올림 (추출 캐시 무효화 - app.services.extraction_cache)
+    EXTRACTOR_VERSION = "2"
+
+    # TXT 파일 순차 읽기 단위 (bytes)
+    TXT_BLOCK_SIZE = 64 * 1024
+
+    # XLSX 레코드(검색 단위) 1개로 묶을 행 수
+    XLSX_ROWS_PER_RECORD = int(os.getenv("XLSX_ROWS_PER_RECORD", "1"))
+
+    # 행 단위 레코드로 색인하는 표 형식 확장자
+    TABULAR_EXTENSIONS = {"xlsx", "xls"}
+
     @staticmethod
-    def extract_from_pdf(file: Union[BinaryIO, bytes]) -> str:
-        """PDF 파일에서 텍스트 추출"""
+    def _to_stream(file: Union[BinaryIO, bytes]) -> BinaryIO:
+        """bytes인 경우 BytesIO로 변환"""
+        if isinstance(file, bytes):
+            return BytesIO(file)
+        return file
+
+    @staticmethod
+    def iter_pdf_pages(file: Union[BinaryIO, bytes]) -> Iterator[str]:
+        """
+        PDF 파일에서 페이지 단위로 텍스트 추출
+
+        페이지가 PDF_PARALLEL_MIN_PAGES 이상이면 프로세스 풀에서 병렬 추출하고
+        (app.utils.pdf_pages), 완료된 페이지부터 순서대로 생성한다.
+        """
+        import PyPDF2
+
         try:
-            # bytes인 경우 BytesIO로 변환
-            if isinstance(file, bytes):
-                file = BytesIO(file)
+            pdf_reader = PyPDF2.PdfReader(TextExtractor._to_stream(file))
+            page_count = len(pdf_reader.pages)
+        except Exception as e:
+            raise ValueError(f"PDF 텍스트 추출 실패: {str(e)}")
+
+        if pdf_page_pool.enabled and page_count >= pdf_page_pool.min_pages:
+            yield from pdf_page_pool.iter_pages(file, page_count)
+            return
 
-            pdf_reader = PyPDF2.PdfReader(file)
-            text = ""
+        try:
             for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-            return text.strip()
+                yield page.extract_text() or ""
         except Exception as e:
             raise ValueError(f"PDF 텍스트 추출 실패: {str(e)}")
 
     @staticmethod
-    def extract_from_docx(file: Union[BinaryIO, bytes]) -> str:
-        """DOCX 파일에서 텍스트 추출"""
-        try:
-            # bytes인 경우 BytesIO로 변환
-            if isinstance(file, bytes):
-                file = BytesIO(file)
+    def iter_docx_paragraphs(file: Union[BinaryIO, bytes]) -> Iterator[str]:
+        """DOCX 파일에서 문단 단위로 텍스트 추출"""
+        from docx import Document
 
-            doc = Document(file)
-            text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
-            return text.strip()
+        try:
+            doc = Document(TextExtractor._to_stream(file))
+            for paragraph in doc.paragraphs:
+                yield paragraph.text
         except Exception as e:
             raise ValueError(f"DOCX 텍스트 추출 실패: {str(e)}")
 
     @staticmethod
-    def extract_from_txt(file: BinaryIO) -> str:
-        """TXT 파일에서 텍스트 추출"""
-        try:
-            # file이 이미 bytes인 경우 처리
-            if isinstance(file, bytes):
-                content = file
-            else:
-                content = file.read()
+    def iter_txt_blocks(file: Union[BinaryIO, bytes]) -> Iterator[str]:
+        """
+        TXT 파일에서 블록 단위로 텍스트 추출
 
-            # UTF-8로 시도, 실패하면 CP949(한글 윈도우)로 시도
+        UTF-8로 전체를 먼저 검증하고 실패하면 CP949(한글 윈도우)로 디코딩
+        (검증도 블록 단위로 수행하므로 메모리 사용량은 블록 크기로 제한됨)
+        """
+        file = TextExtractor._to_stream(file)
+        try:
+            start = file.tell()
+            encoding = "utf-8"
+            decoder = codecs.getincrementaldecoder("utf-8")()
             try:
-                return content.decode('utf-8').strip()
+                while True:
+                    block = file.read(TextExtractor.TXT_BLOCK_SIZE)
+                    decoder.decode(block, final=not block)
+                    if not block:
+                        break
             except UnicodeDecodeError:
-                return content.decode('cp949').strip()
+                encoding = "cp949"
+
+            file.seek(start)
+            decoder = codecs.getincrementaldecoder(encoding)()
+            while True:
+                block = file.read(TextExtractor.TXT_BLOCK_SIZE)
+                text = decoder.decode(block, final=not block)
+                if text:
+                    yield text
+                if not block:
+                    break
         except Exception as e:
             raise ValueError(f"TXT 텍스트 추출 실패: {str(e)}")
 
     @staticmethod
-    def extract_from_xlsx(file: Union[BinaryIO, bytes]) -> str:
-        """XLSX 파일에서 텍스트 추출 (모든 시트의 셀 내용)"""
+    def iter_xlsx_records(file: Union[BinaryIO, bytes], rows_per_record: int = None) -> Iterator[Dict[str, Any]]:
+        """
+        XLSX 파일에서 행(또는 행 묶음) 단위 레코드 추출 (read-only 모드로 순차 읽기)
+
+        시트마다 첫 번째 비어 있지 않은 행을 헤더로 보고, 이후 행은 "헤더: 값" 형태로 변환한다.
+        헤더가 비어 있는 열은 열 문자(A, B, ...)를 이름으로 사용한다.
+
+        Args:
+            file: 파일 객체
+            rows_per_record: 레코드 1개로 묶을 행 수 (기본 XLSX_ROWS_PER_RECORD)
+
+        Returns:
+            레코드 iterator (text, metadata: sheet, row_start, row_end - 행 번호는 엑셀 기준 1부터)
+        """
+        import openpyxl
+        from openpyxl.utils import get_column_letter
+
+        rows_per_record = rows_per_record or TextExtractor.XLSX_ROWS_PER_RECORD
+
+        def make_record(sheet_name: str, rows: List[Tuple[int, str]]) -> Dict[str, Any]:
+            row_start, row_end = rows[0][0], rows[-1][0]
+            label = f"{row_start}행" if row_start == row_end else f"{row_start}-{row_end}행"
+            return {
+                "text": f"[{sheet_name}] {label}\n" + "\n".join(row_text for _, row_text in rows),
+                "metadata": {"sheet": sheet_name, "row_start": row_start, "row_end": row_end},
+            }
+
         try:
-            # bytes인 경우 BytesIO로 변환
-            if isinstance(file, bytes):
-                file = BytesIO(file)
-
-            workbook = openpyxl.load_workbook(file)
-            text = ""
-            for sheet in workbook.worksheets:
-                for row in sheet.iter_rows(values_only=True):
-                    row_text = " ".join([str(cell) for cell in row if cell is not None])
-                    if row_text.strip():
-                        text += row_text + "\n"
-            return text.strip()
+            workbook = openpyxl.load_workbook(TextExtractor._to_stream(file), read_only=True, data_only=True)
+            try:
+                for sheet in workbook.worksheets:
+                    headers: List[str] = []
+                    header_row = 0
+                    has_data = False
+                    pending: List[Tuple[int, str]] = []
+                    for row_number, row in enumerate(sheet.iter_rows(values_only=True), start=1):
+                        values = ["" if cell is None else str(cell).strip() for cell in row]
+                        if not any(values):
+                            continue
+                        if not headers:
+                            headers = [value or get_column_letter(i + 1) for i, value in enumerate(values)]
+                            header_row = row_number
+                            continue
+                        has_data = True
+                        fields = [
+                            f"{headers[i] if i < len(headers) else get_column_letter(i + 1)}: {value}"
+                            for i, value in enumerate(values) if value
+                        ]
+                        pending.append((row_number, "; ".join(fields)))
+                        if len(pending) >= rows_per_record:
+                            yield make_record(sheet.title, pending)
+                            pending = []
+                    if pending:
+                        yield make_record(sheet.title, pending)
+                    elif headers and not has_data:
+                        # 헤더만 있는 시트는 헤더 행 자체를 레코드로 사용
+                        yield make_record(sheet.title, [(header_row, " ".join(headers))])
+            finally:
+                workbook.close()
         except Exception as e:
             raise ValueError(f"XLSX 텍스트 추출 실패: {str(e)}")
 
+    @staticmethod
+    def iter_xlsx_rows(file: Union[BinaryIO, bytes]) -> Iterator[str]:
+        """XLSX 파일에서 행 단위로 텍스트 추출 (헤더 이름이 붙은 레코드 텍스트)"""
+        for record in TextExtractor.iter_xlsx_records(file, rows_per_record=1):
+            yield record["text"]
+
+    @staticmethod
+    def extract_from_pdf(file: Union[BinaryIO, bytes]) -> str:
+        """PDF 파일에서 텍스트 추출"""
+        return "\n".join(TextExtractor.iter_pdf_pages(file)).strip()
+
+    @staticmethod
+    def extract_from_docx(file: Union[BinaryIO, bytes]) -> str:
+        """DOCX 파일에서 텍스트 추출"""
+        return "\n".join(TextExtractor.iter_docx_paragraphs(file)).strip()
+
+    @staticmethod
+    def extract_from_txt(file: BinaryIO) -> str:
+        """TXT 파일에서 텍스트 추출"""
+        return "".join(TextExtractor.iter_txt_blocks(file)).strip()
+
+    @staticmethod
+    def extract_from_xlsx(file: Union[BinaryIO, bytes]) -> str:
+        """XLSX 파일에서 텍스트 추출 (모든 시트의 셀 내용)"""
+        return "\n".join(TextExtractor.iter_xlsx_rows(file)).strip()
+
+    @staticmethod
+    def get_extension(filename: str) -> str:
+        """파일 확장자 (소문자)"""
+        return filename.lower().split('.')[-1]
+
     @classmethod
-    def extract_text(cls, file: Union[BinaryIO, bytes], filename: str) -> str:
+    def iter_text(cls, file: Union[BinaryIO, bytes], filename: str) -> Iterator[str]:
         """
-        파일 확장자에 따라 적절한 추출 메서드를 호출
+        파일 확장자에 따라 텍스트를 순차 생성 (페이지/문단/행/블록 단위)
 
         Args:
             file: 파일 객체
             filename: 파일명 (확장자 확인용)
 
         Returns:
-            추출된 텍스트
+            텍스트 조각 iterator (조각 사이 구분자는 포함되지 않음)
 
         Raises:
             ValueError: 지원하지 않는 파일 형식
         """
-        extension = filename.lower().split('.')[-1]
+        extension = cls.get_extension(filename)
 
         extractors = {
-            'pdf': cls.extract_from_pdf,
-            'docx': cls.extract_from_docx,
-            'doc': cls.extract_from_docx,
-            'txt': cls.extract_from_txt,
-            'xlsx': cls.extract_from_xlsx,
-            'xls': cls.extract_from_xlsx,
+            'pdf': cls.iter_pdf_pages,
+            'docx': cls.iter_docx_paragraphs,
+            'doc': cls.iter_docx_paragraphs,
+            'txt': cls.iter_txt_blocks,
+            'xlsx': cls.iter_xlsx_rows,
+            'xls': cls.iter_xlsx_rows,
         }
 
         extractor = extractors.get(extension)
@@ -110,3 +234,37 @@ class TextExtractor:
             raise ValueError(f"지원하지 않는 파일 형식: {extension}")
 
         return extractor(file)
+
+    @classmethod
+    def iter_records(cls, file: Union[BinaryIO, bytes], filename: str) -> Optional[Iterator[Dict[str, Any]]]:
+        """
+        표 형식 파일이면 행 단위 레코드 iterator, 아니면 None
+
+        레코드는 TextChunker.iter_record_chunks()로 청크를 만들어 행마다 별도 포인트로 색인한다.
+        """
+        if cls.get_extension(filename) in cls.TABULAR_EXTENSIONS:
+            return cls.iter_xlsx_records(file)
+        return None
+
+    @staticmethod
+    def segment_separator(filename: str) -> str:
+        """iter_text 조각 사이에 넣을 구분자 (TXT 블록은 원문 그대로 이어붙임)"""
+        return "" if TextExtractor.get_extension(filename) == "txt" else "\n"
+
+    @classmethod
+    def extract_text(cls, file: Union[BinaryIO, bytes], filename: str) -> str:
+        """
+        파일 확장자에 따라 적절한 추출 메서드를 호출
+
+        Args:
+            file: 파일 객체
+            filename: 파일명 (확장자 확인용)
+
+        Returns:
+            추출된 텍스트
+
+        Raises:
+            ValueError: 지원하지 않는 파일 형식
+        """
+        separator = cls.segment_separator(filename)
+        return separator.join(cls.iter_text(file, filename)).strip()
@@ -0,0 +1,162 @@
+"""
+임베딩 백엔드별 처리량 / 메모리 / 검색 recall 벤치마크
+
+업로드된 문서 청크(또는 지정한 파일)를 코퍼스로 사용한다. 청크 중간의 짧은 구간을 잘라
+의사 질의로 만들고, 원래 청크가 상위 k개 안에 검색되는 비율(recall@k)을 측정한다.
+첫 번째 모델을 기준으로 상위 k개 결과가 얼마나 겹치는지(overlap@k)도 함께 출력한다.
+모델마다 별도 프로세스에서 실행하므로 최대 RSS는 모델 1개 기준이다.
+
+사용법 (backend 디렉토리에서):
+    # 업로드된 문서 청크 5000개로 비교 (Qdrant + PostgreSQL 필요)
+    python benchmarks/bench_embedding.py --chunks 5000 \\
+        --models sentence-transformers/paraphrase-multilingual-mpnet-base-v2 \\
+                 onnx:/app/fastembed_cache/multilingual-e5-small \\
+                 onnx:/app/fastembed_cache/multilingual-e5-small-int8 \\
+                 ollama:bge-m3
+    # 로컬 파일로 비교
+    python benchmarks/bench_embedding.py --source files --files ./samples/*.pdf --models ...
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import resource
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+
+def collection_corpus(limit: int) -> List[str]:
+    """업로드된 문서 청크 본문 (본문 저장소에서 조회)"""
+    from app.services.qdrant_service import qdrant_service
+
+    texts = []
+    for chunk in qdrant_service.iter_chunks(include_text=True):
+        if chunk.get("text"):
+            texts.append(chunk["text"])
+        if len(texts) >= limit:
+            break
+    return texts
+
+
+def file_corpus(paths: List[str], limit: int) -> List[str]:
+    """파일을 업로드와 같은 방식으로 청크 분할"""
+    from app.utils.text_chunker import TextChunker
+    from app.utils.text_extractor import TextExtractor
+
+    chunker = TextChunker()
+    texts = []
+    for path in paths:
+        with open(path, "rb") as f:
+            segments = TextExtractor.iter_text(f, path)
+            for chunk in chunker.iter_chunks(segments, separator=TextExtractor.segment_separator(path)):
+                texts.append(chunk["text"])
+                if len(texts) >= limit:
+                    return texts
+    return texts
+
+
+def make_queries(texts: List[str], count: int, length: int, seed: int) -> List[tuple]:
+    """청크 중간 구간을 잘라 (질의, 정답 청크 번호) 생성"""
+    rng = random.Random(seed)
+    candidates = [i for i, text in enumerate(texts) if len(text) >= length * 2]
+    queries = []
+    for index in rng.sample(candidates, min(count, len(candidates))):
+        text = texts[index]
+        start = rng.randint(0, len(text) - length)
+        queries.append((text[start:start + length], index))
+    return queries
+
+
+def run_model(spec: str, texts: List[str], queries: List[str], k: int, batch_size: int, threads: int) -> Dict[str, Any]:
+    """모델 1개 측정 (별도 프로세스에서 실행)"""
+    from app.services.embedding_backends import create_embedding_backend
+
+    cache_dir = os.getenv("FASTEMBED_CACHE_PATH", "/app/fastembed_cache")
+    started = time.perf_counter()
+    backend = create_embedding_backend(spec, cache_dir, threads=threads or None)
+    list(backend.embed(["warmup"]))
+    load_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    corpus = np.asarray(list(backend.embed(texts, batch_size=batch_size)), dtype=np.float32)
+    embed_s = time.perf_counter() - started
+
+    latencies = []
+    query_vectors = []
+    for query in queries:
+        started = time.perf_counter()
+        query_vectors.append(next(iter(backend.embed([query]))))
+        latencies.append((time.perf_counter() - started) * 1000)
+    query_matrix = np.asarray(query_vectors, dtype=np.float32)
+
+    # 정규화 벡터이므로 내적 = 코사인 유사도 (전수 검색)
+    scores = query_matrix @ corpus.T
+    top_k = np.argsort(-scores, axis=1)[:, :k]
+
+    return {
+        "model": spec,
+        "dim": int(corpus.shape[1]),
+        "load_s": load_s,
+        "docs_per_s": len(texts) / embed_s if embed_s else float("nan"),
+        "query_p50_ms": float(np.percentile(latencies, 50)),
+        # Linux ru_maxrss 단위는 KB
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "top_k": top_k.tolist(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="임베딩 백엔드별 처리량/메모리/recall 벤치마크")
+    parser.add_argument("--models", nargs="+", required=True,
+                        help="EMBEDDING_MODEL 형식 (FastEmbed 이름, onnx:<경로>, ollama:<모델>) - 첫 번째가 기준")
+    parser.add_argument("--source", choices=["collection", "files"], default="collection")
+    parser.add_argument("--files", nargs="*", default=[])
+    parser.add_argument("--chunks", type=int, default=2000, help="코퍼스 청크 수")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--query-length", type=int, default=40, help="의사 질의 길이 (문자)")
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=int(os.getenv("EMBEDDING_BATCH_SIZE", "32")))
+    parser.add_argument("--threads", type=int, default=0, help="ONNX 추론 스레드 수 (0: 기본값)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    if args.source == "files":
+        texts = file_corpus(args.files, args.chunks)
+    else:
+        texts = collection_corpus(args.chunks)
+    queries = make_queries(texts, args.queries, args.query_length, args.seed)
+    if not queries:
+        raise SystemExit("❌ 질의를 만들 수 있는 청크가 없습니다 (--chunks / --query-length 확인)")
+    print(f"코퍼스 청크 {len(texts)}개, 질의 {len(queries)}개, k={args.k}")
+
+    rows = []
+    context = multiprocessing.get_context("spawn")
+    for spec in args.models:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            row = executor.submit(
+                run_model, spec, texts, [query for query, _ in queries], args.k, args.batch_size, args.threads
+            ).result()
+        row["recall"] = statistics.mean(
+            1.0 if answer in top_k else 0.0 for (_, answer), top_k in zip(queries, row["top_k"])
+        )
+        rows.append(row)
+
+    reference = rows[0]["top_k"]
+    print()
+    print(f"{'모델':<60} {'dim':>5} {'로드(s)':>8} {'청크/s':>9} {'질의 p50(ms)':>13} "
+          f"{'최대 RSS(MB)':>13} {'recall@' + str(args.k):>10} {'overlap@' + str(args.k):>11}")
+    for row in rows:
+        overlap = statistics.mean(len(set(a) & set(b)) / args.k for a, b in zip(row["top_k"], reference))
+        print(f"{row['model'][-60:]:<60} {row['dim']:>5} {row['load_s']:>8.1f} {row['docs_per_s']:>9.1f} "
+              f"{row['query_p50_ms']:>13.2f} {row['peak_rss_mb']:>13.0f} {row['recall']:>10.4f} {overlap:>11.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Qdrant 내장(local) 모드 vs 서버 모드 검색 지연 비교 (손익분기 포인트 수 확인)
+
+내장 모드(QDRANT_URL=":memory:" 또는 "path:<디렉토리>")는 네트워크 왕복이 없지만 전수 검색이라
+포인트 수에 비례해 느려지고, 서버 모드는 HNSW 인덱스 + HTTP 왕복 비용이 있다.
+포인트 수를 늘려가며 두 방식의 질의 지연(p50/p95)과 적재 시간을 측정한다.
+
+사용법 (backend 디렉토리에서):
+    python benchmarks/bench_local_mode.py --url http://localhost:6333 --sizes 1000 5000 20000 50000
+    # 서버 없이 내장 모드만 측정
+    python benchmarks/bench_local_mode.py --url none
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+import uuid
+from typing import Dict, List, Optional
+
+import numpy as np
+from qdrant_client import QdrantClient
+from qdrant_client.models import Distance, VectorParams, PointStruct, OptimizersConfigDiff
+
+from bench_quantization import synthetic_vectors, wait_until_indexed, percentile
+
+
+def load(client: QdrantClient, name: str, vectors: np.ndarray, index: bool, batch_size: int = 512) -> float:
+    """컬렉션 생성 + 적재 (서버는 인덱싱 완료까지 포함한 시간)"""
+    started = time.perf_counter()
+    client.create_collection(
+        collection_name=name,
+        vectors_config=VectorParams(size=vectors.shape[1], distance=Distance.COSINE),
+        # 작은 데이터셋도 HNSW 인덱스를 만들도록 임계값을 낮춤 (내장 모드는 무시)
+        optimizers_config=OptimizersConfigDiff(indexing_threshold=10) if index else None,
+    )
+    for start in range(0, len(vectors), batch_size):
+        client.upsert(name, points=[
+            PointStruct(id=start + i, vector=vector.tolist())
+            for i, vector in enumerate(vectors[start:start + batch_size])
+        ], wait=True)
+    if index:
+        wait_until_indexed(client, name)
+    return time.perf_counter() - started
+
+
+def query_latencies(client: QdrantClient, name: str, queries: np.ndarray, k: int) -> List[float]:
+    latencies = []
+    for query in queries:
+        started = time.perf_counter()
+        client.search(name, query_vector=query.tolist(), limit=k, with_payload=False)
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Qdrant 내장 모드 vs 서버 모드 검색 지연 비교")
+    parser.add_argument("--url", default=os.getenv("QDRANT_URL", "http://localhost:6333"),
+                        help="서버 주소 (none이면 내장 모드만 측정)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 20000, 50000])
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--disk", action="store_true", help="내장 모드를 메모리 대신 디스크(path:)로 측정")
+    args = parser.parse_args()
+
+    server: Optional[QdrantClient] = None if args.url == "none" else QdrantClient(url=args.url)
+    vectors = synthetic_vectors(max(args.sizes) + args.queries, args.dim)
+    queries, vectors = vectors[:args.queries], vectors[args.queries:]
+    print(f"dim={args.dim}, 질의 {len(queries)}개, k={args.k}, 내장 모드={'disk' if args.disk else 'memory'}")
+
+    rows: List[Dict] = []
+    for size in args.sizes:
+        subset = vectors[:size]
+        local_dir = tempfile.mkdtemp(prefix="qdrant_local_") if args.disk else None
+        local = QdrantClient(path=local_dir) if local_dir else QdrantClient(location=":memory:")
+        try:
+            load_s = load(local, "bench", subset, index=False)
+            latencies = query_latencies(local, "bench", queries, args.k)
+            rows.append({"size": size, "mode": "local", "load_s": load_s,
+                         "p50": percentile(latencies, 50), "p95": percentile(latencies, 95)})
+        finally:
+            local.close()
+            if local_dir:
+                shutil.rmtree(local_dir, ignore_errors=True)
+
+        if server is not None:
+            name = f"bench_local_{uuid.uuid4().hex[:8]}"
+            try:
+                load_s = load(server, name, subset, index=True)
+                latencies = query_latencies(server, name, queries, args.k)
+                rows.append({"size": size, "mode": "server", "load_s": load_s,
+                             "p50": percentile(latencies, 50), "p95": percentile(latencies, 95)})
+            finally:
+                server.delete_collection(name)
+
+    print()
+    print(f"{'포인트 수':>10} {'모드':>7} {'적재(s)':>8} {'p50(ms)':>9} {'p95(ms)':>9}")
+    for row in rows:
+        print(f"{row['size']:>10} {row['mode']:>7} {row['load_s']:>8.1f} {row['p50']:>9.2f} {row['p95']:>9.2f}")
+
+    if server is not None:
+        # p50 기준으로 서버가 처음 더 빨라지는 크기
+        by_size: Dict[int, Dict[str, float]] = {}
+        for row in rows:
+            by_size.setdefault(row["size"], {})[row["mode"]] = row["p50"]
+        crossover = next((size for size in args.sizes if by_size[size]["server"] < by_size[size]["local"]), None)
+        print()
+        if crossover is None:
+            print(f"✅ 측정 범위({max(args.sizes)}개) 안에서는 내장 모드가 더 빠름")
+        else:
+            print(f"✅ 포인트 {crossover}개부터 서버 모드가 더 빠름 (그 이하에서는 내장 모드 권장)")
+
+
+if __name__ == "__main__":
+    main()
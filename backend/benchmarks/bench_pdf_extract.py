@@ -0,0 +1,125 @@
+"""
+대용량 PDF 텍스트 추출 벤치마크 (순차 vs 페이지 병렬 프로세스 풀)
+
+워커 수별로 전체 추출 시간, 첫 페이지가 나오기까지의 시간(청크 분할/임베딩 시작 시점),
+페이지당 처리량을 측정한다. 결과 텍스트가 순차 추출과 같은지도 확인한다.
+PDF를 지정하지 않으면 텍스트 위주의 합성 PDF를 생성해 사용한다.
+
+사용법 (backend 디렉토리에서):
+    python benchmarks/bench_pdf_extract.py --pages 300 --workers 1 2 4 8
+    # 실제 파일로 측정
+    python benchmarks/bench_pdf_extract.py --files ./samples/*.pdf --workers 1 4
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+
+def synthetic_pdf(path: str, pages: int, lines_per_page: int = 60, seed: int = 7) -> None:
+    """텍스트 줄이 많은 합성 PDF 생성 (Helvetica, 페이지마다 별도 content stream)"""
+    import random
+
+    rng = random.Random(seed)
+    words = ("python backend fastapi postgres vector search embedding applicant interview "
+             "experience project team service latency throughput index cache").split()
+
+    objects: List[bytes] = []
+    page_ids = [4 + i * 2 for i in range(pages)]
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+    objects.append(f"<< /Type /Pages /Kids [{' '.join(f'{i} 0 R' for i in page_ids)}] /Count {pages} >>".encode())
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    for page in range(pages):
+        lines = [f"Page {page + 1}"] + [" ".join(rng.choice(words) for _ in range(12)) for _ in range(lines_per_page)]
+        content = "BT /F1 9 Tf 40 800 Td 11 TL " + " ".join(f"({line}) '" for line in lines) + " ET"
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] /Resources << /Font << /F1 3 0 R >> >> "
+            f"/Contents {page_ids[page] + 1} 0 R >>".encode()
+        )
+        stream = content.encode()
+        objects.append(b"<< /Length " + str(len(stream)).encode() + b" >>\nstream\n" + stream + b"\nendstream")
+
+    with open(path, "wb") as f:
+        f.write(b"%PDF-1.4\n")
+        offsets = []
+        for number, body in enumerate(objects, start=1):
+            offsets.append(f.tell())
+            f.write(f"{number} 0 obj\n".encode() + body + b"\nendobj\n")
+        xref = f.tell()
+        f.write(f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode())
+        for offset in offsets:
+            f.write(f"{offset:010d} 00000 n \n".encode())
+        f.write(f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode())
+
+
+def measure(path: str) -> Tuple[float, float, int, str]:
+    """(전체 시간 s, 첫 페이지 시간 ms, 페이지 수, 텍스트)"""
+    from app.utils.text_extractor import TextExtractor
+
+    started = time.perf_counter()
+    first_ms: Optional[float] = None
+    pages = []
+    with open(path, "rb") as file:
+        for text in TextExtractor.iter_pdf_pages(file):
+            if first_ms is None:
+                first_ms = (time.perf_counter() - started) * 1000
+            pages.append(text)
+    return time.perf_counter() - started, first_ms or 0.0, len(pages), "\n".join(pages)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="PDF 텍스트 추출 순차 vs 병렬 비교")
+    parser.add_argument("--files", nargs="*", default=[], help="측정할 PDF (없으면 합성 PDF 생성)")
+    parser.add_argument("--pages", type=int, default=300, help="합성 PDF 페이지 수")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="워커 수 후보 (1 = 순차)")
+    parser.add_argument("--repeat", type=int, default=2, help="설정별 반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    from app.utils.pdf_pages import pdf_page_pool
+
+    files = args.files
+    temp_dir = None
+    if not files:
+        temp_dir = tempfile.mkdtemp(prefix="bench_pdf_")
+        path = os.path.join(temp_dir, f"synthetic_{args.pages}p.pdf")
+        synthetic_pdf(path, args.pages)
+        files = [path]
+        print(f"합성 PDF 생성: {path} ({os.path.getsize(path) / 1024 / 1024:.1f}MB, {args.pages}페이지)")
+
+    rows: List[Dict] = []
+    try:
+        for path in files:
+            baseline: Optional[str] = None
+            for workers in args.workers:
+                pdf_page_pool.shutdown()
+                pdf_page_pool.workers = workers
+                pdf_page_pool.min_pages = 1
+                # 워커 프로세스 기동 비용은 서버에서 한 번만 발생하므로 측정에서 제외
+                if workers > 1:
+                    list(pdf_page_pool.executor.map(int, range(workers * 2)))
+                results = [measure(path) for _ in range(args.repeat)]
+                total_s, first_ms, pages, text = min(results, key=lambda r: r[0])
+                if baseline is None:
+                    baseline = text
+                rows.append({"file": os.path.basename(path), "workers": workers, "total_s": total_s,
+                             "first_ms": first_ms, "pages": pages, "same": text == baseline})
+    finally:
+        pdf_page_pool.shutdown()
+        if temp_dir:
+            for name in os.listdir(temp_dir):
+                os.remove(os.path.join(temp_dir, name))
+            os.rmdir(temp_dir)
+
+    print()
+    print(f"{'파일':<28} {'워커':>5} {'페이지':>7} {'전체(s)':>9} {'첫 페이지(ms)':>14} {'페이지/s':>9} {'결과 동일':>9}")
+    for row in rows:
+        print(f"{row['file'][:28]:<28} {row['workers']:>5} {row['pages']:>7} {row['total_s']:>9.2f} "
+              f"{row['first_ms']:>14.1f} {row['pages'] / row['total_s']:>9.1f} {str(row['same']):>9}")
+
+
+if __name__ == "__main__":
+    main()
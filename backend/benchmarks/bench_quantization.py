@@ -0,0 +1,185 @@
+"""
+벡터 양자화 / HNSW 설정별 recall@k 및 검색 지연 벤치마크
+
+설정마다 임시 컬렉션을 만들어 같은 벡터를 적재하고, 정확 검색(exact=True) 결과를
+정답으로 recall@k와 지연 시간(p50/p95)을 측정한다.
+
+사용법 (backend 디렉토리에서):
+    python benchmarks/bench_quantization.py --url http://localhost:6333 --points 50000
+    # 실제 문서 벡터로 측정 (documents 컬렉션에서 샘플링)
+    python benchmarks/bench_quantization.py --source collection --points 20000
+"""
+import argparse
+import os
+import statistics
+import time
+import uuid
+from typing import Dict, List, Optional
+
+import numpy as np
+from qdrant_client import QdrantClient
+from qdrant_client.models import (
+    Distance, VectorParams, HnswConfigDiff, OptimizersConfigDiff, ScalarQuantization,
+    ScalarQuantizationConfig, ScalarType, BinaryQuantization, BinaryQuantizationConfig,
+    SearchParams, QuantizationSearchParams, PointStruct, CollectionStatus
+)
+
+
+QUANTIZATIONS = {
+    "none": None,
+    "scalar": ScalarQuantization(scalar=ScalarQuantizationConfig(type=ScalarType.INT8, quantile=0.99, always_ram=True)),
+    "binary": BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=True)),
+}
+
+# 양자화 방식별 벡터 1개당 RAM 사용량 (bytes, 원본을 디스크에 두는 경우)
+BYTES_PER_DIM = {"none": 4.0, "scalar": 1.0, "binary": 1 / 8}
+
+
+def synthetic_vectors(count: int, dim: int, seed: int = 42) -> np.ndarray:
+    """임베딩과 비슷하게 군집을 이루는 정규화 벡터 생성"""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(max(count // 200, 8), dim)).astype(np.float32)
+    vectors = centers[rng.integers(0, len(centers), count)] + rng.normal(scale=0.6, size=(count, dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def collection_vectors(client: QdrantClient, collection: str, count: int) -> np.ndarray:
+    """기존 컬렉션에서 밀집 벡터 샘플링"""
+    vectors, offset = [], None
+    while len(vectors) < count:
+        points, offset = client.scroll(collection, limit=min(512, count - len(vectors)), offset=offset,
+                                       with_payload=False, with_vectors=True)
+        for point in points:
+            vector = point.vector.get("") if isinstance(point.vector, dict) else point.vector
+            vectors.append(vector)
+        if offset is None:
+            break
+    return np.asarray(vectors, dtype=np.float32)
+
+
+def wait_until_indexed(client: QdrantClient, collection: str, timeout: float = 600) -> None:
+    """옵티마이저가 인덱스/양자화를 끝낼 때까지 대기"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if client.get_collection(collection).status == CollectionStatus.GREEN:
+            return
+        time.sleep(1)
+    print(f"⚠️  {collection} 인덱싱 대기 시간 초과 - 결과가 부정확할 수 있음")
+
+
+def create_collection(client: QdrantClient, name: str, dim: int, quantization: str, m: int,
+                      ef_construct: int, vectors: np.ndarray, batch_size: int = 512) -> None:
+    client.create_collection(
+        collection_name=name,
+        vectors_config=VectorParams(size=dim, distance=Distance.COSINE, on_disk=quantization != "none"),
+        hnsw_config=HnswConfigDiff(m=m, ef_construct=ef_construct),
+        # 작은 데이터셋도 HNSW 인덱스를 만들도록 임계값을 낮춤
+        optimizers_config=OptimizersConfigDiff(indexing_threshold=10),
+        quantization_config=QUANTIZATIONS[quantization],
+    )
+    for start in range(0, len(vectors), batch_size):
+        batch = vectors[start:start + batch_size]
+        client.upsert(name, points=[
+            PointStruct(id=start + i, vector=vector.tolist()) for i, vector in enumerate(batch)
+        ], wait=True)
+    wait_until_indexed(client, name)
+
+
+def run_queries(client: QdrantClient, name: str, queries: np.ndarray, k: int,
+                params: Optional[SearchParams]) -> (List[List[int]], List[float]):
+    ids, latencies = [], []
+    for query in queries:
+        started = time.perf_counter()
+        hits = client.search(name, query_vector=query.tolist(), limit=k, search_params=params, with_payload=False)
+        latencies.append((time.perf_counter() - started) * 1000)
+        ids.append([hit.id for hit in hits])
+    return ids, latencies
+
+
+def recall_at_k(results: List[List[int]], truth: List[List[int]], k: int) -> float:
+    return statistics.mean(len(set(r[:k]) & set(t[:k])) / k for r, t in zip(results, truth))
+
+
+def percentile(values: List[float], pct: float) -> float:
+    return float(np.percentile(values, pct))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Qdrant 양자화/HNSW 설정별 recall@k, 지연 벤치마크")
+    parser.add_argument("--url", default=os.getenv("QDRANT_URL", "http://localhost:6333"))
+    parser.add_argument("--source", choices=["synthetic", "collection"], default="synthetic")
+    parser.add_argument("--collection", default=os.getenv("QDRANT_COLLECTION_NAME", "documents"),
+                        help="--source collection일 때 벡터를 가져올 컬렉션")
+    parser.add_argument("--points", type=int, default=20000)
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--m", type=int, default=16)
+    parser.add_argument("--ef-construct", type=int, default=100)
+    parser.add_argument("--ef", type=int, nargs="+", default=[32, 64, 128, 256], help="검색 시 hnsw_ef 후보")
+    parser.add_argument("--quantization", nargs="+", default=["none", "scalar", "binary"],
+                        choices=list(QUANTIZATIONS))
+    parser.add_argument("--oversampling", type=float, default=2.0)
+    parser.add_argument("--keep", action="store_true", help="벤치마크 컬렉션을 삭제하지 않음")
+    args = parser.parse_args()
+
+    client = QdrantClient(location=args.url) if args.url == ":memory:" else QdrantClient(url=args.url)
+
+    if args.source == "collection":
+        vectors = collection_vectors(client, args.collection, args.points + args.queries)
+    else:
+        vectors = synthetic_vectors(args.points + args.queries, args.dim)
+    dim = vectors.shape[1]
+    # 질의 벡터는 적재하지 않은 벡터에서 선택
+    queries, vectors = vectors[:args.queries], vectors[args.queries:]
+    print(f"벡터 {len(vectors)}개 (dim={dim}), 질의 {len(queries)}개, k={args.k}")
+
+    prefix = f"bench_{uuid.uuid4().hex[:8]}"
+    created = []
+    try:
+        rows: List[Dict] = []
+        truth = None
+        for quantization in args.quantization:
+            name = f"{prefix}_{quantization}"
+            started = time.perf_counter()
+            create_collection(client, name, dim, quantization, args.m, args.ef_construct, vectors)
+            created.append(name)
+            build_s = time.perf_counter() - started
+
+            if truth is None:
+                truth, exact_latencies = run_queries(client, name, queries, args.k, SearchParams(exact=True))
+                rows.append({"setting": "exact (full scan)", "recall": 1.0,
+                             "p50": percentile(exact_latencies, 50), "p95": percentile(exact_latencies, 95)})
+
+            for ef in args.ef:
+                rescore_options = [None] if quantization == "none" else [True, False]
+                for rescore in rescore_options:
+                    quant_params = None if rescore is None else QuantizationSearchParams(
+                        rescore=rescore, oversampling=args.oversampling if rescore else None
+                    )
+                    results, latencies = run_queries(
+                        client, name, queries, args.k, SearchParams(hnsw_ef=ef, quantization=quant_params)
+                    )
+                    label = f"{quantization} ef={ef}" + ("" if rescore is None else f" rescore={'on' if rescore else 'off'}")
+                    rows.append({
+                        "setting": label,
+                        "recall": recall_at_k(results, truth, args.k),
+                        "p50": percentile(latencies, 50),
+                        "p95": percentile(latencies, 95),
+                        "ram_mb": len(vectors) * dim * BYTES_PER_DIM[quantization] / (1024 * 1024),
+                        "build_s": build_s,
+                    })
+
+        print()
+        print(f"{'설정':<34} {'recall@' + str(args.k):>10} {'p50(ms)':>9} {'p95(ms)':>9} {'벡터RAM(MB)':>12} {'적재(s)':>8}")
+        for row in rows:
+            print(f"{row['setting']:<34} {row['recall']:>10.4f} {row['p50']:>9.2f} {row['p95']:>9.2f} "
+                  f"{row.get('ram_mb', float('nan')):>12.1f} {row.get('build_s', float('nan')):>8.1f}")
+    finally:
+        if not args.keep:
+            for name in created:
+                client.delete_collection(name)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""SQL 결과 캐시 대상 판별 단위 테스트 (테이블 미참조/시점 의존 쿼리는 캐시하지 않음)."""
+import pytest
+
+from app.services.sql_result_cache import SqlResultCache
+from app.utils.sql_validator import SQLValidator
+
+
+@pytest.fixture
+def validator():
+    return SQLValidator(["applicant_info"], allowed_schemas={"public"})
+
+
+CACHEABLE = [
+    "SELECT COUNT(*) FROM applicant_info",
+    "SELECT id, skill FROM applicant_info WHERE skill ILIKE '%now%' ORDER BY id DESC LIMIT 5",
+    "SELECT to_char(created_at, 'YYYY-MM') FROM applicant_info",
+]
+
+UNCACHEABLE = [
+    "SELECT now()",
+    "SELECT 1",
+    "SELECT id FROM applicant_info WHERE created_at > now() - make_interval(days => 7)",
+    "SELECT id FROM applicant_info WHERE created_at::date = CURRENT_DATE",
+    "SELECT id, age(created_at) FROM applicant_info",
+    "SELECT id FROM applicant_info WHERE created_at > 'today'::date",
+]
+
+
+@pytest.mark.parametrize("sql", CACHEABLE)
+def test_caches_table_queries(validator, sql):
+    assert SqlResultCache.is_cacheable(validator.validate(sql))
+
+
+@pytest.mark.parametrize("sql", UNCACHEABLE)
+def test_skips_volatile_or_tableless_queries(validator, sql):
+    assert not SqlResultCache.is_cacheable(validator.validate(sql))
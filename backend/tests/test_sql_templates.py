@@ -0,0 +1,124 @@
+"""SQL 템플릿 기본 시드(migrations/008) 정규식 매칭 단위 테스트 (DB/임베딩 없이)."""
+import json
+import re
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.models.sql_template import SqlTemplate
+from app.services.sql_templates import SqlTemplateService, _LoadedTemplate
+
+MIGRATION = Path(__file__).resolve().parents[2] / "migrations" / "008_create_sql_templates.sql"
+
+
+def _seed_templates():
+    """008 마이그레이션의 INSERT 값을 SqlTemplate으로 변환"""
+    source = MIGRATION.read_text(encoding="utf-8")
+    values = source[source.index("VALUES") + len("VALUES"):source.index("ON CONFLICT")]
+    items = []
+    for escaped, literal, number in re.findall(r"(E?)'((?:[^']|'')*)'|(\d+)\)?", values):
+        if number:
+            items.append(int(number))
+            continue
+        literal = literal.replace("''", "'")
+        items.append(literal.replace("\\n", "\n") if escaped else literal)
+    templates = []
+    for name, pattern, examples, sql_text, types, defaults, answer, priority, description in (
+        items[i:i + 9] for i in range(0, len(items), 9)
+    ):
+        templates.append(SqlTemplate(
+            name=name, pattern=pattern, example_queries=json.loads(examples), sql_text=sql_text,
+            param_types=json.loads(types), param_defaults=json.loads(defaults),
+            answer_template=answer, priority=priority, description=description,
+        ))
+    return sorted(templates, key=lambda template: -template.priority)
+
+
+@pytest.fixture(scope="module")
+def service():
+    from app.services.vector_store import vector_store
+
+    service = SqlTemplateService()
+    service.enabled = True
+    # 정규식 매칭만 검사
+    service.similarity_threshold = 0
+    service._templates = [
+        _LoadedTemplate(template=template, regex=re.compile(template.pattern), params=service.sql_params(template.sql_text))
+        for template in _seed_templates()
+    ]
+    service._loaded_at = time.monotonic()
+    service._embedding_model_name = vector_store.embedding_model_name
+    return service
+
+
+MATCHED = {
+    "Python 지원자는 몇 명이야?": ("skill_count", {"skill": "Python"}),
+    "C++ 가진 지원자 수": ("skill_count", {"skill": "C++"}),
+    "전체 지원자 수 알려줘": ("applicant_count", {}),
+    "지원자는 총 몇 명이야?": ("applicant_count", {}),
+    "지원한 사람이 모두 몇 명이야?": ("applicant_count", {}),
+    "3번 지원자 보여줘": ("applicant_by_id", {"id": 3}),
+    "5번 지원자 정보": ("applicant_by_id", {"id": 5}),
+    "최근 10명 지원자": ("recent_applicants", {"n": 10}),
+    "최근 지원자 보여줘": ("recent_applicants", {"n": 5}),
+    "Java를 사용하는 지원자 목록": ("skill_filter", {"skill": "Java"}),
+}
+
+# 템플릿이 놓치는 조건이 남아 있으면 LLM 경로로
+UNMATCHED = [
+    "최근 지원자 10명 보여줘",
+    "Python 가진 지원자 중 최근 3명",
+    "Python 경력 3년 이상 지원자 수",
+    "서울 거주 지원자는 몇 명이야?",
+    "3번 지원자와 비슷한 지원자",
+    "지원 동기에 열정이 들어간 사람 찾아줘",
+]
+
+
+def test_seed_templates_are_valid():
+    for template in _seed_templates():
+        SqlTemplateService.validate_template(template)
+
+
+@pytest.mark.parametrize("query,expected", MATCHED.items())
+def test_matches_seed_patterns(service, query, expected):
+    match = service.match(query)
+    assert match is not None and match.method == "regex"
+    assert (match.template.name, match.params) == expected
+
+
+@pytest.mark.parametrize("query", UNMATCHED)
+def test_leaves_partial_matches_to_llm(service, query):
+    assert service.match(query) is None
+
+
+def test_parameterless_template_requires_pattern():
+    template = SqlTemplate(
+        name="count", example_queries=["지원자 몇 명?"],
+        sql_text="SELECT COUNT(*) AS count FROM applicant_info", answer_template="{count}",
+    )
+    with pytest.raises(ValueError):
+        SqlTemplateService.validate_template(template)
+
+
+def test_embedding_failure_skips_only_that_template(monkeypatch):
+    from app.services.vector_store import vector_store
+
+    def embed_texts(texts):
+        if texts[0] == "broken":
+            raise RuntimeError("embedding failed")
+        return [np.ones(4) for _ in texts]
+
+    monkeypatch.setattr(vector_store, "embed_texts", embed_texts)
+    service = SqlTemplateService()
+    service.similarity_threshold = 0.5
+    loaded = [
+        _LoadedTemplate(template=SqlTemplate(name=name, example_queries=[example], sql_text="", answer_template=""),
+                        regex=None, params=["n"])
+        for name, example in (("first", "broken"), ("second", "최근 지원자"))
+    ]
+    service._embed_examples(loaded)
+    assert loaded[0].example_vectors is None
+    assert loaded[1].example_vectors is not None
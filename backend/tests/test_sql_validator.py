@@ -0,0 +1,113 @@
+"""SQLValidator 단위 테스트 (허용/거부 SQL, 알려진 우회 시도)."""
+import pytest
+
+from app.utils.sql_validator import SQLValidationError, SQLValidator, extract_sql, tokenize
+
+
+@pytest.fixture
+def validator():
+    return SQLValidator(["applicant_info"], allowed_schemas={"public"})
+
+
+ACCEPTED = [
+    "SELECT * FROM applicant_info",
+    "SELECT id, skill FROM applicant_info WHERE id = 3;",
+    "select count(*) from applicant_info where skill ilike '%python%'",
+    "SELECT COUNT(*) AS count FROM applicant_info WHERE skill ILIKE '%%' || %(skill)s || '%%'",
+    "SELECT id FROM public.applicant_info ORDER BY id DESC LIMIT 5",
+    'SELECT "id" FROM "applicant_info"',
+    "SELECT a.id, b.skill FROM applicant_info a JOIN applicant_info b ON a.id = b.id",
+    "SELECT id FROM applicant_info WHERE id IN (SELECT id FROM applicant_info WHERE skill IS NOT NULL)",
+    "SELECT * FROM (SELECT id, skill FROM applicant_info) AS t(a, b)",
+    "WITH recent AS (SELECT id FROM applicant_info ORDER BY id DESC LIMIT 10) SELECT COUNT(*) FROM recent",
+    "WITH r(x) AS NOT MATERIALIZED (SELECT id FROM applicant_info) SELECT x FROM r",
+    "SELECT EXTRACT(YEAR FROM now()), date_trunc('month', now())",
+    "SELECT lower(skill), length(reason), coalesce(experience, '-') FROM applicant_info",
+    "SELECT CAST(id AS numeric(10, 2)), skill::varchar(20) FROM applicant_info",
+    "SELECT id, row_number() OVER (PARTITION BY skill ORDER BY id) FROM applicant_info",
+    "SELECT percentile_cont(0.5) WITHIN GROUP (ORDER BY id) FROM applicant_info",
+    "SELECT COUNT(*) FILTER (WHERE skill LIKE '%Java%') FROM applicant_info",
+    "SELECT id FROM applicant_info WHERE EXISTS (SELECT 1 FROM applicant_info) -- 주석",
+    "SELECT 'DELETE FROM x; pg_read_file(1)' AS text FROM applicant_info",
+]
+
+REJECTED = [
+    "",
+    "DELETE FROM applicant_info",
+    "SELECT 1; DROP TABLE applicant_info",
+    "SELECT * INTO copy FROM applicant_info",
+    "SELECT * FROM applicant_info FOR UPDATE",
+    "TABLE applicant_info",
+    "SELECT * FROM (TABLE pg_authid) t",
+    "VALUES (1)",
+    "SELECT * FROM pg_authid",
+    "SELECT * FROM pg_catalog.pg_authid",
+    "SELECT * FROM other_schema.applicant_info",
+    "SELECT * FROM applicant_info, pg_shadow",
+    "SELECT * FROM (pg_authid CROSS JOIN applicant_info)",
+    "SELECT * FROM generate_series(1, 10)",
+    "SELECT pg_read_file('/etc/passwd')",
+    "SELECT pg_catalog.pg_read_file('/etc/passwd')",
+    "SELECT pg_sleep(10)",
+    "SELECT current_setting('data_directory')",
+    "SELECT dblink('host=x', 'select 1')",
+    "SELECT lo_import('/etc/passwd')",
+    "SELECT repeat('x', 1000000000)",
+    'SELECT "pg_read_file"(\'/etc/passwd\')',
+    # 유니코드 이스케이프로 함수 이름 숨기기
+    'SELECT U&"\\0070g_read_file"(\'/etc/passwd\')',
+    'SELECT U&"\\0070g_sleep"(10)',
+    "SELECT u&'\\0070' FROM applicant_info",
+    "SELECT $$x$$",
+    "SELECT E'\\x27' FROM applicant_info",
+    "SELECT set_config('role', 'admin', false)",
+    "SELECT id FROM applicant_info WHERE (id",
+]
+
+
+@pytest.mark.parametrize("sql", ACCEPTED)
+def test_accepts_read_only_select(validator, sql):
+    validated = validator.validate(sql)
+    assert not validated.sql.endswith(";")
+
+
+@pytest.mark.parametrize("sql", REJECTED)
+def test_rejects_unsafe_sql(validator, sql):
+    with pytest.raises(SQLValidationError):
+        validator.validate(sql)
+
+
+def test_collects_referenced_tables(validator):
+    assert validator.validate("SELECT 1 FROM public.applicant_info a JOIN applicant_info b ON true").tables == {"applicant_info"}
+    assert validator.validate("SELECT now()").tables == set()
+
+
+def test_tokenize_keeps_percent_parameters():
+    tokens = tokenize("WHERE id = %(id)s")
+    assert ("word", "id") in tokens and ("op", "%") in tokens
+
+
+EXTRACTED = {
+    "```sql\nSELECT count(*) FROM applicant_info;\n```": "SELECT count(*) FROM applicant_info",
+    "```\nSELECT id FROM applicant_info\n```\n위 쿼리는 ID를 조회합니다.": "SELECT id FROM applicant_info",
+    "다음은 SQL입니다:\n\nSELECT COUNT(*)\nFROM applicant_info\nWHERE skill ILIKE '%Python%';\n\n이 쿼리는 Python 지원자 수를 셉니다.":
+        "SELECT COUNT(*)\nFROM applicant_info\nWHERE skill ILIKE '%Python%'",
+    "SQL: SELECT id FROM applicant_info WHERE reason LIKE '%열정; 성장%' ORDER BY id; -- 최신순":
+        "SELECT id FROM applicant_info WHERE reason LIKE '%열정; 성장%' ORDER BY id",
+    "SELECT id FROM applicant_info\n설명: 모든 지원자 ID": "SELECT id FROM applicant_info",
+    "Here is the query:\n```sql\nWITH r AS (SELECT id FROM applicant_info)\nSELECT COUNT(*) FROM r\n```":
+        "WITH r AS (SELECT id FROM applicant_info)\nSELECT COUNT(*) FROM r",
+    "SELECT id -- 지원자 ID; 주석\nFROM applicant_info": "SELECT id -- 지원자 ID; 주석\nFROM applicant_info",
+}
+
+
+@pytest.mark.parametrize("text,expected", EXTRACTED.items())
+def test_extracts_sql_from_llm_output(validator, text, expected):
+    sql = extract_sql(text)
+    assert sql == expected
+    validator.validate(sql)
+
+
+def test_extract_without_select_is_rejected(validator):
+    with pytest.raises(SQLValidationError):
+        validator.validate(extract_sql("죄송합니다. 해당 질의는 SQL로 변환할 수 없습니다."))
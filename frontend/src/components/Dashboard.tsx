@@ -20,7 +20,7 @@ interface Document {
 interface DocumentsResponse {
   total: number;
   limit: number;
-  offset: number;
+  next_cursor: string | null;
   documents: Document[];
 }
 
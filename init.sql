@@ -170,3 +170,180 @@ CREATE TRIGGER few_shot_audit_trigger
     AFTER INSERT OR UPDATE OR DELETE ON few_shots
     FOR EACH ROW
     EXECUTE FUNCTION log_few_shot_audit();
+
+
+-- ===================================================
+-- 문서 일괄 업로드(ingestion) 작업 테이블 생성
+-- ===================================================
+
+-- 8. 일괄 업로드 작업 테이블
+CREATE TABLE IF NOT EXISTS ingest_jobs (
+    id VARCHAR(32) PRIMARY KEY,
+    status VARCHAR(20) NOT NULL DEFAULT 'pending' CHECK (status IN ('pending', 'running', 'completed', 'partial', 'failed')),
+    total_files INTEGER NOT NULL DEFAULT 0,
+    processed_files INTEGER NOT NULL DEFAULT 0,
+    failed_files INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_ingest_jobs_created_at ON ingest_jobs(created_at DESC);
+
+-- 9. 작업 파일별 처리 상태 테이블
+CREATE TABLE IF NOT EXISTS ingest_job_files (
+    id BIGSERIAL PRIMARY KEY,
+    job_id VARCHAR(32) NOT NULL REFERENCES ingest_jobs(id) ON DELETE CASCADE,
+    filename VARCHAR(500) NOT NULL,
+    spool_path TEXT NOT NULL,
+    file_size BIGINT NOT NULL DEFAULT 0,
+    status VARCHAR(20) NOT NULL DEFAULT 'pending' CHECK (status IN ('pending', 'running', 'completed', 'failed')),
+    attempts INTEGER NOT NULL DEFAULT 0,
+    doc_id VARCHAR(64),
+    chunk_count INTEGER,
+    error TEXT,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_ingest_job_files_job_id ON ingest_job_files(job_id);
+CREATE INDEX IF NOT EXISTS idx_ingest_job_files_status ON ingest_job_files(status);
+
+-- 10. 문서 청크 본문 테이블 (Qdrant payload에는 스니펫만 저장, 전문은 zlib 압축)
+CREATE TABLE IF NOT EXISTS document_chunks (
+    point_id VARCHAR(36) PRIMARY KEY,
+    doc_id VARCHAR(64) NOT NULL,
+    chunk_index INTEGER NOT NULL DEFAULT 0,
+    content BYTEA NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_document_chunks_doc_id ON document_chunks(doc_id, chunk_index);
+
+-- 11. 임베딩 컬렉션 버전 테이블 (재색인 후 Qdrant alias 전환/롤백용)
+CREATE TABLE IF NOT EXISTS embedding_collections (
+    id BIGSERIAL PRIMARY KEY,
+    collection_name VARCHAR(255) NOT NULL UNIQUE,
+    alias_name VARCHAR(255) NOT NULL,
+    embedding_model VARCHAR(255) NOT NULL,
+    vector_size INTEGER NOT NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'building' CHECK (status IN ('building', 'active', 'retired', 'failed', 'cancelled', 'deleted')),
+    total_points INTEGER NOT NULL DEFAULT 0,
+    processed_points INTEGER NOT NULL DEFAULT 0,
+    skipped_points INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    activated_at TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_embedding_collections_alias ON embedding_collections(alias_name, status);
+
+-- 12. 캐시 버전 테이블 (문서 추가/삭제 시 서버 간 검색 결과 캐시 무효화)
+CREATE TABLE IF NOT EXISTS cache_versions (
+    name VARCHAR(255) PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 13. SQL 템플릿 테이블 (자주 나오는 자연어 SQL 질의를 LLM 없이 처리)
+CREATE TABLE IF NOT EXISTS sql_templates (
+    id SERIAL PRIMARY KEY,
+    name VARCHAR(100) NOT NULL UNIQUE,
+    pattern TEXT,
+    example_queries JSONB NOT NULL DEFAULT '[]',
+    sql_text TEXT NOT NULL,
+    param_types JSONB NOT NULL DEFAULT '{}',
+    param_defaults JSONB NOT NULL DEFAULT '{}',
+    answer_template TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    is_active BOOLEAN NOT NULL DEFAULT true,
+    description VARCHAR(500),
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_sql_templates_priority ON sql_templates(is_active, priority DESC);
+
+DROP TRIGGER IF EXISTS update_sql_templates_updated_at ON sql_templates;
+CREATE TRIGGER update_sql_templates_updated_at
+    BEFORE UPDATE ON sql_templates
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+-- 기본 템플릿 (SQL 문자열 안의 %는 %%로 작성)
+INSERT INTO sql_templates (name, pattern, example_queries, sql_text, param_types, param_defaults, answer_template, priority, description) VALUES
+    ('skill_count',
+     '(?P<skill>[A-Za-z][A-Za-z0-9+#.]*)\s*(?:을|를|이|가)?\s*(?:가진|보유한|할 줄 아는|사용하는|다루는)?\s*지원자(?:는|가|의)?\s*(?:총\s*)?(?:몇\s*명|수)',
+     '[]',
+     'SELECT COUNT(*) AS count FROM applicant_info WHERE skill ILIKE ''%%'' || %(skill)s || ''%%''',
+     '{"skill": "str"}', '{}',
+     '{skill} 기술을 가진 지원자는 총 {count}명입니다.',
+     30, '기술별 지원자 수'),
+    ('applicant_by_id',
+     '(?P<id>\d+)\s*번\s*지원자',
+     '[]',
+     'SELECT id, reason, experience, skill FROM applicant_info WHERE id = %(id)s',
+     '{"id": "int"}', '{}',
+     E'{id}번 지원자 정보입니다.\n- 지원 동기: {reason}\n- 경력: {experience}\n- 기술: {skill}',
+     20, '지원자 ID로 조회'),
+    ('applicant_count',
+     '^\s*(?:전체\s*|총\s*)?(?:지원자|지원한\s*사람)(?:는|가|이|의)?\s*(?:총\s*|전체\s*|모두\s*)?(?:몇\s*명|수)',
+     '[]',
+     'SELECT COUNT(*) AS count FROM applicant_info',
+     '{}', '{}',
+     '전체 지원자는 총 {count}명입니다.',
+     20, '전체 지원자 수'),
+    ('recent_applicants',
+     '최근(?:\s*(?P<n>\d+)\s*명)?\s*(?:의\s*)?지원자',
+     '["최근 지원자 보여줘", "가장 최근에 지원한 사람들 알려줘"]',
+     'SELECT id, skill FROM applicant_info ORDER BY id DESC LIMIT %(n)s',
+     '{"n": "int"}', '{"n": 5}',
+     E'최근 지원자 {row_count}명입니다.\n{rows}',
+     10, '최근 지원자 목록'),
+    ('skill_filter',
+     '(?P<skill>[A-Za-z][A-Za-z0-9+#.]*)\s*(?:을|를)?\s*(?:가진|보유한|할 줄 아는|사용하는|다루는)\s*지원자',
+     '[]',
+     'SELECT id, skill FROM applicant_info WHERE skill ILIKE ''%%'' || %(skill)s || ''%%'' ORDER BY id',
+     '{"skill": "str"}', '{}',
+     E'{skill} 기술을 가진 지원자 {row_count}명입니다.\n{rows}',
+     10, '기술별 지원자 목록')
+ON CONFLICT (name) DO NOTHING;
+
+-- 14. 테이블 변경 시 캐시 버전 증가 트리거 (SQL 결과 캐시 서버 간 무효화)
+CREATE OR REPLACE FUNCTION bump_table_cache_version()
+RETURNS TRIGGER AS $$
+DECLARE
+    cache_name TEXT := 'table:' || TG_TABLE_SCHEMA || '.' || TG_TABLE_NAME;
+    new_version BIGINT;
+BEGIN
+    INSERT INTO cache_versions (name, version, updated_at) VALUES (cache_name, 1, CURRENT_TIMESTAMP)
+    ON CONFLICT (name) DO UPDATE SET version = cache_versions.version + 1, updated_at = CURRENT_TIMESTAMP
+    RETURNING version INTO new_version;
+    -- 커밋 시점에 전달되므로 롤백된 변경은 알리지 않음
+    PERFORM pg_notify('cache_versions', cache_name || ':' || new_version);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+-- 소유자 권한으로 실행 (applicant_info에 쓰는 외부 적재 계정 등에 cache_versions 쓰기 권한이 없어도 됨)
+SECURITY DEFINER
+SET search_path FROM CURRENT;
+
+DROP TRIGGER IF EXISTS applicant_info_cache_version ON applicant_info;
+CREATE TRIGGER applicant_info_cache_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON applicant_info
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION bump_table_cache_version();
+
+-- 15. 자연어 SQL 실행용 조회 전용 역할 (SQL_EXECUTOR_ROLE)
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_roles WHERE rolname = 'sql_agent_reader') THEN
+        CREATE ROLE sql_agent_reader NOLOGIN NOSUPERUSER NOINHERIT;
+    END IF;
+END
+$$;
+
+GRANT USAGE ON SCHEMA public TO sql_agent_reader;
+GRANT SELECT ON applicant_info TO sql_agent_reader;
+-- 앱 계정이 SET ROLE로 전환할 수 있도록 (슈퍼유저는 없어도 되지만 일반 계정 운영 시 필요)
+GRANT sql_agent_reader TO CURRENT_USER;
@@ -0,0 +1,37 @@
+-- Migration: 문서 일괄 업로드(ingestion) 작업 테이블 생성
+-- 서버 재시작 후에도 작업 상태/진행률을 유지하고 미완료 파일을 재처리하기 위함
+
+-- 1. 일괄 업로드 작업 테이블
+CREATE TABLE IF NOT EXISTS ingest_jobs (
+    id VARCHAR(32) PRIMARY KEY,
+    status VARCHAR(20) NOT NULL DEFAULT 'pending' CHECK (status IN ('pending', 'running', 'completed', 'partial', 'failed')),
+    total_files INTEGER NOT NULL DEFAULT 0,
+    processed_files INTEGER NOT NULL DEFAULT 0,
+    failed_files INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_ingest_jobs_created_at ON ingest_jobs(created_at DESC);
+
+-- 2. 작업 파일별 처리 상태 테이블
+CREATE TABLE IF NOT EXISTS ingest_job_files (
+    id BIGSERIAL PRIMARY KEY,
+    job_id VARCHAR(32) NOT NULL REFERENCES ingest_jobs(id) ON DELETE CASCADE,
+    filename VARCHAR(500) NOT NULL,
+    spool_path TEXT NOT NULL,
+    file_size BIGINT NOT NULL DEFAULT 0,
+    status VARCHAR(20) NOT NULL DEFAULT 'pending' CHECK (status IN ('pending', 'running', 'completed', 'failed')),
+    attempts INTEGER NOT NULL DEFAULT 0,
+    doc_id VARCHAR(64),
+    chunk_count INTEGER,
+    error TEXT,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_ingest_job_files_job_id ON ingest_job_files(job_id);
+CREATE INDEX IF NOT EXISTS idx_ingest_job_files_status ON ingest_job_files(status);
+
+-- 완료 메시지
+SELECT 'Migration 003 completed successfully' AS status;
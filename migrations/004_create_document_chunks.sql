@@ -0,0 +1,16 @@
+-- Migration: 문서 청크 본문 저장 테이블 생성
+-- Qdrant payload에는 스니펫/메타데이터만 두고 청크 전문은 압축하여 별도 저장
+
+-- 1. 문서 청크 본문 테이블 (point_id = Qdrant 포인트 ID)
+CREATE TABLE IF NOT EXISTS document_chunks (
+    point_id VARCHAR(36) PRIMARY KEY,
+    doc_id VARCHAR(64) NOT NULL,
+    chunk_index INTEGER NOT NULL DEFAULT 0,
+    content BYTEA NOT NULL,  -- zlib 압축된 UTF-8 텍스트
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_document_chunks_doc_id ON document_chunks(doc_id, chunk_index);
+
+-- 완료 메시지
+SELECT 'Migration 004 completed successfully' AS status;
@@ -0,0 +1,24 @@
+-- Migration: 임베딩 컬렉션 버전 관리 테이블 생성
+-- 임베딩 모델 변경 시 새 버전 컬렉션을 백그라운드로 재색인하고 Qdrant alias로 전환하기 위함
+
+-- 1. 버전별 Qdrant 컬렉션 목록 (alias_name = 검색/업로드에 사용하는 컬렉션 이름)
+CREATE TABLE IF NOT EXISTS embedding_collections (
+    id BIGSERIAL PRIMARY KEY,
+    collection_name VARCHAR(255) NOT NULL UNIQUE,
+    alias_name VARCHAR(255) NOT NULL,
+    embedding_model VARCHAR(255) NOT NULL,
+    vector_size INTEGER NOT NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'building' CHECK (status IN ('building', 'active', 'retired', 'failed', 'cancelled', 'deleted')),
+    total_points INTEGER NOT NULL DEFAULT 0,
+    processed_points INTEGER NOT NULL DEFAULT 0,
+    skipped_points INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    activated_at TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_embedding_collections_alias ON embedding_collections(alias_name, status);
+
+-- 완료 메시지
+SELECT 'Migration 005 completed successfully' AS status;
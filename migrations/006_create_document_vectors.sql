@@ -0,0 +1,37 @@
+-- Migration: pgvector 문서 청크 벡터 테이블 생성 (선택 - VECTOR_STORE=pgvector 사용 시)
+-- Qdrant 대신 기존 PostgreSQL에서 RAG 검색을 처리하기 위함
+-- pgvector 확장이 설치된 PostgreSQL 필요 (예: pgvector/pgvector:pg16 이미지)
+-- 백엔드가 첫 사용 시 같은 테이블을 자동 생성하므로, 확장 생성 권한이 없는 계정으로 운영할 때 DBA가 미리 실행
+-- vector(768)은 EMBEDDING_MODEL의 차원에 맞게 수정 (기본 모델 paraphrase-multilingual-mpnet-base-v2 = 768)
+
+CREATE EXTENSION IF NOT EXISTS vector;
+
+-- 1. 청크 벡터 (point_id = Qdrant 포인트 ID와 같은 규칙, 본문은 document_chunks에 저장)
+CREATE TABLE IF NOT EXISTS document_vectors (
+    point_id VARCHAR(36) PRIMARY KEY,
+    doc_id VARCHAR(255) NOT NULL,
+    chunk_index INTEGER NOT NULL DEFAULT 0,
+    embedding vector(768) NOT NULL,
+    -- 필터용 메타데이터 (나머지는 payload)
+    filename VARCHAR(500),
+    doc_type VARCHAR(50),
+    applicant_id INTEGER,
+    upload_time TIMESTAMP,
+    content_hash VARCHAR(64),
+    payload JSONB NOT NULL DEFAULT '{}'::jsonb
+);
+
+-- 2. 필터/조회 인덱스 (목록/중복 확인은 문서당 첫 청크만 조회)
+CREATE INDEX IF NOT EXISTS idx_document_vectors_doc_id ON document_vectors(doc_id, chunk_index);
+CREATE INDEX IF NOT EXISTS idx_document_vectors_filename ON document_vectors(filename) WHERE chunk_index = 0;
+CREATE INDEX IF NOT EXISTS idx_document_vectors_content_hash ON document_vectors(content_hash) WHERE chunk_index = 0;
+CREATE INDEX IF NOT EXISTS idx_document_vectors_applicant_id ON document_vectors(applicant_id);
+CREATE INDEX IF NOT EXISTS idx_document_vectors_upload_time ON document_vectors(upload_time);
+
+-- 3. 벡터 인덱스 (코사인 거리, PGVECTOR_INDEX=ivfflat이면 아래 대신
+--    USING ivfflat (embedding vector_cosine_ops) WITH (lists = 100) 을 데이터 적재 후 생성)
+CREATE INDEX IF NOT EXISTS idx_document_vectors_embedding_hnsw ON document_vectors
+    USING hnsw (embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64);
+
+-- 완료 메시지
+SELECT 'Migration 006 completed successfully' AS status;
@@ -0,0 +1,12 @@
+-- Migration: 캐시 버전 테이블 생성
+-- 문서 추가/삭제 시 버전을 올리고 pg_notify로 알려 모든 서버의 검색 결과 캐시를 무효화하기 위함
+
+-- 1. 캐시 이름별 버전 (예: qdrant:documents, pgvector:public.document_vectors)
+CREATE TABLE IF NOT EXISTS cache_versions (
+    name VARCHAR(255) PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 완료 메시지
+SELECT 'Migration 007 completed successfully' AS status;
@@ -0,0 +1,71 @@
+-- Migration: SQL 템플릿 테이블 생성
+-- 자주 나오는 자연어 SQL 질의(지원자 수, N번 지원자 등)를 LLM 호출 없이 파라미터화 SQL로 바로 처리하기 위함
+-- 템플릿은 /api/sql-templates 로 추가/수정 (update_updated_at_column 함수는 001 마이그레이션에서 생성)
+
+-- 1. 질의 패턴 → SQL + 답변 템플릿
+CREATE TABLE IF NOT EXISTS sql_templates (
+    id SERIAL PRIMARY KEY,
+    name VARCHAR(100) NOT NULL UNIQUE,
+    pattern TEXT,
+    example_queries JSONB NOT NULL DEFAULT '[]',
+    sql_text TEXT NOT NULL,
+    param_types JSONB NOT NULL DEFAULT '{}',
+    param_defaults JSONB NOT NULL DEFAULT '{}',
+    answer_template TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    is_active BOOLEAN NOT NULL DEFAULT true,
+    description VARCHAR(500),
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_sql_templates_priority ON sql_templates(is_active, priority DESC);
+
+-- 2. updated_at 자동 업데이트 트리거
+DROP TRIGGER IF EXISTS update_sql_templates_updated_at ON sql_templates;
+CREATE TRIGGER update_sql_templates_updated_at
+    BEFORE UPDATE ON sql_templates
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+-- 3. 기본 템플릿 (SQL 문자열 안의 %는 %%로 작성)
+INSERT INTO sql_templates (name, pattern, example_queries, sql_text, param_types, param_defaults, answer_template, priority, description) VALUES
+    ('skill_count',
+     '(?P<skill>[A-Za-z][A-Za-z0-9+#.]*)\s*(?:을|를|이|가)?\s*(?:가진|보유한|할 줄 아는|사용하는|다루는)?\s*지원자(?:는|가|의)?\s*(?:총\s*)?(?:몇\s*명|수)',
+     '[]',
+     'SELECT COUNT(*) AS count FROM applicant_info WHERE skill ILIKE ''%%'' || %(skill)s || ''%%''',
+     '{"skill": "str"}', '{}',
+     '{skill} 기술을 가진 지원자는 총 {count}명입니다.',
+     30, '기술별 지원자 수'),
+    ('applicant_by_id',
+     '(?P<id>\d+)\s*번\s*지원자',
+     '[]',
+     'SELECT id, reason, experience, skill FROM applicant_info WHERE id = %(id)s',
+     '{"id": "int"}', '{}',
+     E'{id}번 지원자 정보입니다.\n- 지원 동기: {reason}\n- 경력: {experience}\n- 기술: {skill}',
+     20, '지원자 ID로 조회'),
+    ('applicant_count',
+     '^\s*(?:전체\s*|총\s*)?(?:지원자|지원한\s*사람)(?:는|가|이|의)?\s*(?:총\s*|전체\s*|모두\s*)?(?:몇\s*명|수)',
+     '[]',
+     'SELECT COUNT(*) AS count FROM applicant_info',
+     '{}', '{}',
+     '전체 지원자는 총 {count}명입니다.',
+     20, '전체 지원자 수'),
+    ('recent_applicants',
+     '최근(?:\s*(?P<n>\d+)\s*명)?\s*(?:의\s*)?지원자',
+     '["최근 지원자 보여줘", "가장 최근에 지원한 사람들 알려줘"]',
+     'SELECT id, skill FROM applicant_info ORDER BY id DESC LIMIT %(n)s',
+     '{"n": "int"}', '{"n": 5}',
+     E'최근 지원자 {row_count}명입니다.\n{rows}',
+     10, '최근 지원자 목록'),
+    ('skill_filter',
+     '(?P<skill>[A-Za-z][A-Za-z0-9+#.]*)\s*(?:을|를)?\s*(?:가진|보유한|할 줄 아는|사용하는|다루는)\s*지원자',
+     '[]',
+     'SELECT id, skill FROM applicant_info WHERE skill ILIKE ''%%'' || %(skill)s || ''%%'' ORDER BY id',
+     '{"skill": "str"}', '{}',
+     E'{skill} 기술을 가진 지원자 {row_count}명입니다.\n{rows}',
+     10, '기술별 지원자 목록')
+ON CONFLICT (name) DO NOTHING;
+
+-- 완료 메시지
+SELECT 'Migration 008 completed successfully' AS status;
@@ -0,0 +1,35 @@
+-- Migration: 테이블 변경 시 캐시 버전 증가 트리거
+-- applicant_info가 바뀌면 cache_versions의 'table:<스키마>.<테이블>' 버전을 올리고 pg_notify로 알려
+-- 모든 서버의 SQL 결과 캐시(SQLAgent)를 무효화하기 위함 (007 마이그레이션의 cache_versions 테이블 필요)
+-- 함수는 생성 시점의 search_path로 cache_versions를 찾으므로 DB_SCHEMA를 search_path로 두고 실행
+-- SECURITY DEFINER: 함수 소유자(이 마이그레이션을 실행한 계정) 권한으로 cache_versions를 갱신
+-- 다른 테이블을 SQL_ALLOWED_TABLES에 추가하면 같은 방식으로 트리거를 추가
+
+-- 1. 문장 단위 트리거 함수 (여러 행을 바꿔도 버전은 한 번만 증가)
+CREATE OR REPLACE FUNCTION bump_table_cache_version()
+RETURNS TRIGGER AS $$
+DECLARE
+    cache_name TEXT := 'table:' || TG_TABLE_SCHEMA || '.' || TG_TABLE_NAME;
+    new_version BIGINT;
+BEGIN
+    INSERT INTO cache_versions (name, version, updated_at) VALUES (cache_name, 1, CURRENT_TIMESTAMP)
+    ON CONFLICT (name) DO UPDATE SET version = cache_versions.version + 1, updated_at = CURRENT_TIMESTAMP
+    RETURNING version INTO new_version;
+    -- 커밋 시점에 전달되므로 롤백된 변경은 알리지 않음
+    PERFORM pg_notify('cache_versions', cache_name || ':' || new_version);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+-- 소유자 권한으로 실행 (applicant_info에 쓰는 외부 적재 계정 등에 cache_versions 쓰기 권한이 없어도 됨)
+SECURITY DEFINER
+SET search_path FROM CURRENT;
+
+-- 2. applicant_info 트리거
+DROP TRIGGER IF EXISTS applicant_info_cache_version ON applicant_info;
+CREATE TRIGGER applicant_info_cache_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON applicant_info
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION bump_table_cache_version();
+
+-- 완료 메시지
+SELECT 'Migration 009 completed successfully' AS status;
@@ -0,0 +1,23 @@
+-- Migration: 자연어 SQL 실행용 조회 전용 역할 생성
+-- SQLAgent가 실행하는 SQL은 트랜잭션 안에서 SET LOCAL ROLE sql_agent_reader로 전환한 뒤 실행된다 (SQL_EXECUTOR_ROLE)
+-- 앱 계정이 슈퍼유저여도 서버 파일 읽기(pg_read_file 등), 시스템 함수, 허용 목록 밖 테이블 조회는 DB 권한에서 거부됨
+-- 백엔드 DB 계정으로 실행 (DB_SCHEMA가 public이 아니면 스키마 이름 수정)
+-- SQL_ALLOWED_TABLES에 테이블을 추가하면 같은 방식으로 SELECT 권한 부여
+
+-- 1. 로그인 불가 역할 (SELECT 권한만 부여)
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_roles WHERE rolname = 'sql_agent_reader') THEN
+        CREATE ROLE sql_agent_reader NOLOGIN NOSUPERUSER NOINHERIT;
+    END IF;
+END
+$$;
+
+-- 2. 허용 테이블 조회 권한
+GRANT USAGE ON SCHEMA public TO sql_agent_reader;
+GRANT SELECT ON applicant_info TO sql_agent_reader;
+-- 앱 계정이 SET ROLE로 전환할 수 있도록 (슈퍼유저는 없어도 되지만 일반 계정 운영 시 필요)
+GRANT sql_agent_reader TO CURRENT_USER;
+
+-- 완료 메시지
+SELECT 'Migration 010 completed successfully' AS status;